@@ -5,6 +5,14 @@ This package contains the fundamental components for the simulation engine:
 - SimulationEngine: Main simulation coordinator
 - State management: Centralized state handling with configuration integration
 - Event system: Event-driven architecture components
+- Scheduler: Discrete-event agenda for event-driven runs
+- Fleet: Vectorized multi-robot kinematic state
+- Kinematics: Allocation-free single-robot movement state
+- Batching: Multi-order wave picking tours
+- Engine bridge: Engine thread and state delta channel for web/analytics threads
+- Journal: Append-only event journal with replay
+- Checkpoints: Versioned binary engine state checkpoints for warm starts
+- Determinism: Seeded random streams and simulation clock for reproducible runs
 - Configuration: Robust configuration management with validation
 - Controls: Enhanced simulation controls and interactive interface
 - Validation: Input validation and error handling
@@ -13,6 +21,14 @@ This package contains the fundamental components for the simulation engine:
 from .engine import SimulationEngine
 from .state import SimulationState, SimulationStatus
 from .events import EventSystem, EventType, Event
+from .scheduler import DiscreteEventScheduler, ScheduledEventKind
+from .fleet import RobotFleet
+from .kinematics import RobotKinematics, WaypointPath
+from .batching import OrderBatcher, OrderBatch, BatchCandidate
+from .engine_bridge import StateChannel, ChannelReader, EngineThread
+from .journal import EventJournal, JournalReader
+from .checkpoint import CheckpointWriter, latest_checkpoint
+from .determinism import RandomStreams, SimulationClock, seed_simulation
 from .main_config import ConfigurationManager, ConfigSection, get_config
 from .controls import SimulationController, ControlCommand
 from .validation import SimulationValidator, ValidationError, ErrorSeverity
@@ -24,6 +40,24 @@ __all__ = [
     'EventSystem',
     'EventType',
     'Event',
+    'DiscreteEventScheduler',
+    'ScheduledEventKind',
+    'RobotFleet',
+    'RobotKinematics',
+    'WaypointPath',
+    'OrderBatcher',
+    'OrderBatch',
+    'BatchCandidate',
+    'StateChannel',
+    'ChannelReader',
+    'EngineThread',
+    'EventJournal',
+    'JournalReader',
+    'CheckpointWriter',
+    'latest_checkpoint',
+    'RandomStreams',
+    'SimulationClock',
+    'seed_simulation',
     'ConfigurationManager',
     'ConfigSection',
     'get_config',
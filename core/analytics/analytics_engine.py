@@ -5,7 +5,6 @@ This module provides the core analytics engine with real-time KPI calculations,
 event-driven data collection, and session-based storage for the warehouse simulation.
 """
 
-import time
 import json
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field
@@ -13,6 +12,7 @@ from collections import defaultdict, deque
 from enum import Enum
 import threading
 
+from core.determinism import SimulationClock, get_clock
 from core.events import EventSystem
 
 
@@ -55,17 +55,29 @@ class AnalyticsEngine:
     - Rolling average calculations
     - Memory-efficient data management
     - Thread-safe operations
+    
+    Timestamps, rolling windows and session durations read the simulation
+    clock, so seeded runs produce identical analytics. Create the engine
+    after seeding (or call clear_session_data()) so the session starts on
+    the seeded clock.
     """
     
-    def __init__(self, config_file: str = "config/analytics.json"):
-        """Initialize the analytics engine."""
+    def __init__(self, config_file: str = "config/analytics.json", clock: Optional[SimulationClock] = None):
+        """
+        Initialize the analytics engine.
+        
+        Args:
+            config_file: Analytics configuration file
+            clock: Simulation clock to read (default: the process-wide clock)
+        """
         self.config_file = config_file
         self.config = self._load_configuration()
+        self.clock = clock or get_clock()
         
         # Data storage
         self.metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
         self.kpi_cache: Dict[str, KPICalculation] = {}
-        self.session_start_time = time.time()
+        self.session_start_time = self.clock.time()
         
         # Event system integration
         self.event_system: Optional[EventSystem] = None
@@ -179,7 +191,7 @@ class AnalyticsEngine:
         """
         try:
             with self._lock:
-                timestamp = time.time()
+                timestamp = self.clock.time()
                 metric_data = MetricData(
                     name=name,
                     value=value,
@@ -233,7 +245,7 @@ class AnalyticsEngine:
         if window_seconds is None:
             window_seconds = self.rolling_window_seconds
         
-        current_time = time.time()
+        current_time = self.clock.time()
         cutoff_time = current_time - window_seconds
         
         recent_metrics = []
@@ -345,7 +357,7 @@ class AnalyticsEngine:
     
     def _track_calculation_performance(self):
         """Track calculation performance for monitoring."""
-        current_time = time.time()
+        current_time = self.clock.time()
         if self.last_calculation_time > 0:
             calculation_time = (current_time - self.last_calculation_time) * 1000  # Convert to ms
             self.calculation_times.append(calculation_time)
@@ -365,7 +377,7 @@ class AnalyticsEngine:
                 "avg_calculation_time_ms": avg_time,
                 "total_metrics": total_metrics,
                 "kpi_count": len(self.kpi_cache),
-                "session_duration_seconds": time.time() - self.session_start_time
+                "session_duration_seconds": self.clock.time() - self.session_start_time
             }
     
     def clear_session_data(self):
@@ -374,7 +386,8 @@ class AnalyticsEngine:
             self.metrics.clear()
             self.kpi_cache.clear()
             self.calculation_times.clear()
-            self.session_start_time = time.time()
+            self.session_start_time = self.clock.time()
+            self.last_calculation_time = 0.0
             print("🧹 Analytics session data cleared")
     
     def export_analytics_data(self) -> Dict[str, Any]:
@@ -383,7 +396,7 @@ class AnalyticsEngine:
             return {
                 "session_info": {
                     "start_time": self.session_start_time,
-                    "duration_seconds": time.time() - self.session_start_time,
+                    "duration_seconds": self.clock.time() - self.session_start_time,
                     "config": self.config
                 },
                 "kpis": {k: {
@@ -397,6 +410,50 @@ class AnalyticsEngine:
                 "performance_stats": self.get_performance_stats()
             }
     
+    def get_state(self) -> Dict[str, Any]:
+        """Get the metric buffers, KPI cache and session start as plain data (for checkpoints)."""
+        with self._lock:
+            return {
+                "session_start_time": self.session_start_time,
+                "metrics": {key: [(m.name, m.value, m.timestamp, m.metadata) for m in buffer]
+                            for key, buffer in self.metrics.items()},
+                "kpis": {key: (kpi.name, kpi.value, kpi.unit, kpi.timestamp, kpi.description, kpi.category)
+                         for key, kpi in self.kpi_cache.items()}
+            }
+
+    def set_state(self, state: Dict[str, Any]):
+        """Replace the metric buffers and KPI cache with a state returned by get_state()."""
+        with self._lock:
+            self.metrics.clear()
+            for key, entries in state.get("metrics", {}).items():
+                self.metrics[key].extend(MetricData(*entry) for entry in entries)
+            self.kpi_cache = {key: KPICalculation(*fields) for key, fields in state.get("kpis", {}).items()}
+            self.session_start_time = state.get("session_start_time", self.session_start_time)
+
+    def record_engine_change(self, topic: str, data: Dict[str, Any]):
+        """
+        Record a SimulationEngine change notification.
+        
+        Pass to SimulationEngine.subscribe_changes() to collect analytics
+        from an engine that runs without the web layer's event system.
+        
+        Args:
+            topic: Change topic (see core.engine.CHANGE_TOPICS)
+            data: Change payload
+        """
+        if topic == "orders":
+            status = data.get("status")
+            if status == "pending":
+                self._handle_order_created(data)
+            elif status == "assigned":
+                self._handle_order_assigned(data)
+            elif status == "completed":
+                self._handle_order_completed(data)
+        elif topic == "items":
+            self._handle_item_collected(data)
+        elif topic == "robots":
+            self._handle_robot_movement(data)
+
     # Event handlers
     def _handle_order_created(self, event_data: Dict[str, Any]):
         """Handle order created event."""
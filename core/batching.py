@@ -0,0 +1,207 @@
+"""
+Order batching (wave picking) for the simulation engine.
+
+Groups compatible pending orders into one robot tour so the robot returns to
+packout once per batch instead of once per order:
+- OrderBatcher decides which queued orders ride together, subject to tote
+  capacity, aisle overlap, travel saved and a maximum wait for the oldest order
+- OrderBatch tracks per-order pick progress inside one tour
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .layout.coordinate import Coordinate
+from .layout.pick_sequencer import PickSequencer
+
+
+@dataclass
+class BatchCandidate:
+    """A pending order as seen by the batcher."""
+    key: Hashable
+    locations: List[Coordinate]
+    arrival_time: float = 0.0
+
+    @property
+    def aisle_span(self) -> Tuple[int, int]:
+        """Lowest and highest aisle the order visits."""
+        aisles = [int(location.aisle) for location in self.locations]
+        return min(aisles), max(aisles)
+
+
+class OrderBatcher:
+    """
+    Forms multi-order batches from a FIFO list of pending orders.
+
+    The oldest pending order seeds each batch. Later orders join, in arrival
+    order, when they fit in the tote, visit aisles within aisle_window of the
+    batch's aisle span, and make the combined tour shorter than picking them
+    separately. A batch that could still grow is held back until its seed has
+    waited max_wait seconds.
+    """
+
+    # Pending orders considered for one batch, oldest first
+    LOOKAHEAD = 32
+
+    def __init__(self, sequencer: PickSequencer, tote_capacity: int = 8, max_orders: int = 4,
+                 aisle_window: int = 3, max_wait: float = 0.0,
+                 home: Coordinate = Coordinate(1, 1)):
+        """
+        Initialize order batcher.
+
+        Args:
+            sequencer: Pick sequencer used to cost candidate tours
+            tote_capacity: Maximum items a robot carries on one tour
+            max_orders: Maximum orders per batch
+            aisle_window: Aisles an order may lie outside the batch's aisle span
+            max_wait: Seconds the oldest order may wait for the batch to fill
+            home: Position tours start from and return to
+
+        Raises:
+            ValueError: If tote_capacity or max_orders is less than 1
+        """
+        if tote_capacity < 1 or max_orders < 1:
+            raise ValueError("tote_capacity and max_orders must be at least 1")
+
+        self.sequencer = sequencer
+        self.tote_capacity = tote_capacity
+        self.max_orders = max_orders
+        self.aisle_window = aisle_window
+        self.max_wait = max_wait
+        self.home = home
+        self.stats = {"batches_formed": 0, "orders_batched": 0, "distance_saved": 0}
+
+    @classmethod
+    def from_config(cls, sequencer: PickSequencer, settings: Dict[str, Any]) -> 'OrderBatcher':
+        """Create a batcher from an orders.batching configuration section."""
+        return cls(sequencer,
+                   tote_capacity=settings.get("tote_capacity", 8),
+                   max_orders=settings.get("max_orders", 4),
+                   aisle_window=settings.get("aisle_window", 3),
+                   max_wait=settings.get("max_wait", 0.0))
+
+    def select(self, pending: Sequence[BatchCandidate], now: float) -> Optional[List[Hashable]]:
+        """
+        Choose the next batch from pending orders.
+
+        Args:
+            pending: Pending orders, oldest first
+            now: Current simulated time
+
+        Returns:
+            Keys of the orders in the batch (seed first), or None to wait
+        """
+        if not pending:
+            return None
+
+        seed = pending[0]
+        batch = [seed]
+        locations = list(seed.locations)
+        low, high = seed.aisle_span if seed.locations else (0, 0)
+        tour = self._tour_distance(locations)
+        saved = 0
+
+        for candidate in pending[1:]:
+            if len(batch) >= self.max_orders:
+                break
+            if not candidate.locations or len(locations) + len(candidate.locations) > self.tote_capacity:
+                continue
+            candidate_low, candidate_high = candidate.aisle_span
+            if candidate_high < low - self.aisle_window or candidate_low > high + self.aisle_window:
+                continue
+
+            combined = self._tour_distance(locations + candidate.locations)
+            separate = tour + self._tour_distance(candidate.locations)
+            if combined >= separate:
+                continue
+
+            batch.append(candidate)
+            locations.extend(candidate.locations)
+            low, high = min(low, candidate_low), max(high, candidate_high)
+            saved += separate - combined
+            tour = combined
+
+        can_grow = len(batch) < self.max_orders and len(locations) < self.tote_capacity
+        if can_grow and now - seed.arrival_time < self.max_wait:
+            return None
+
+        self.stats["batches_formed"] += 1
+        self.stats["orders_batched"] += len(batch)
+        self.stats["distance_saved"] += saved
+        return [candidate.key for candidate in batch]
+
+    def _tour_distance(self, locations: List[Coordinate]) -> int:
+        """Length of the best tour from home through locations and back."""
+        if not locations:
+            return 0
+        order = self.sequencer.sequence(self.home, locations, end=self.home)
+        return self.sequencer.tour_distance(self.home, order, end=self.home)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get batching statistics."""
+        formed = self.stats["batches_formed"]
+        return {
+            **self.stats,
+            "average_batch_size": self.stats["orders_batched"] / formed if formed else 0.0
+        }
+
+
+@dataclass
+class OrderBatch:
+    """
+    Per-order pick progress for the orders on one robot tour.
+
+    Items are credited to the first order in the batch that still needs them,
+    so an item ID wanted by two orders is picked twice.
+    """
+    batch_id: str
+    order_items: Dict[int, List[str]]
+    remaining: Dict[int, List[str]] = field(init=False)
+    picked: Dict[int, List[str]] = field(init=False)
+
+    def __post_init__(self):
+        self.remaining = {index: list(items) for index, items in self.order_items.items()}
+        self.picked = {index: [] for index in self.order_items}
+
+    @property
+    def order_indices(self) -> List[int]:
+        """Orders on this tour, seed first."""
+        return list(self.order_items)
+
+    @property
+    def items(self) -> List[str]:
+        """Every item to pick on this tour."""
+        return [item for items in self.order_items.values() for item in items]
+
+    def needs(self, item: str) -> bool:
+        """Whether any order in the batch still needs an item."""
+        return any(item in remaining for remaining in self.remaining.values())
+
+    def record_pick(self, item: str) -> Optional[int]:
+        """
+        Credit a picked item to the first order that still needs it.
+
+        Args:
+            item: Picked item ID
+
+        Returns:
+            Index of the order this pick completed, or None
+        """
+        for index, remaining in self.remaining.items():
+            if item in remaining:
+                remaining.remove(item)
+                self.picked[index].append(item)
+                return index if not remaining else None
+        return None
+
+    def is_order_complete(self, order_index: int) -> bool:
+        """Whether every item of an order in the batch has been picked."""
+        return not self.remaining[order_index]
+
+    def is_complete(self) -> bool:
+        """Whether every order in the batch has been picked."""
+        return not any(self.remaining.values())
+
+    def get_progress(self) -> Dict[int, Tuple[int, int]]:
+        """Picked and total item counts per order."""
+        return {index: (len(self.picked[index]), len(items)) for index, items in self.order_items.items()}
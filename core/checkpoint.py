@@ -0,0 +1,256 @@
+"""
+Engine state checkpoints for warm starts.
+Provides a versioned binary checkpoint format made of named sections (engine,
+random streams, distance tracker and any registered component), functions to
+write and read it, and CheckpointWriter, which compresses and writes
+checkpoints on a background thread so the simulation loop only pays for
+taking the snapshot.
+
+File layout (little endian):
+    magic b"RBCKPT", uint16 format version, uint16 section count
+    per section: uint16 name length, uint32 raw length, uint32 stored length,
+                 uint32 CRC-32 of the raw bytes, name, zlib-compressed payload
+
+Section payloads are pickles of plain data (dicts, lists, tuples, sets,
+numbers, strings). They are read back with an unpickler that refuses every
+class or function reference, so a checkpoint cannot run code when loaded.
+"""
+
+import io
+import logging
+import os
+import pickle
+import struct
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_MAGIC = b"RBCKPT"
+CHECKPOINT_VERSION = 1
+CHECKPOINT_SUFFIX = ".ckpt"
+
+_HEADER = struct.Struct("<6sHH")
+_SECTION = struct.Struct("<HIII")
+
+
+class _PlainDataUnpickler(pickle.Unpickler):
+    """Unpickler for plain data only: any global lookup is an error."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        raise pickle.UnpicklingError(f"Checkpoints hold plain data only, found {module}.{name}")
+
+
+def encode_sections(sections: Dict[str, Any]) -> Dict[str, bytes]:
+    """
+    Serialize checkpoint sections.
+
+    Pickling copies the state, so this is the snapshot: the simulation may
+    change the objects as soon as it returns, while compression and writing
+    happen later.
+
+    Args:
+        sections: Section name -> plain data
+
+    Returns:
+        Section name -> serialized bytes
+    """
+    return {name: pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL) for name, data in sections.items()}
+
+
+def write_checkpoint(path: Union[str, Path], payloads: Dict[str, bytes], compression_level: int = 1) -> int:
+    """
+    Write encoded sections to a checkpoint file.
+
+    The file is written next to its final name and moved into place, so a
+    crash mid-write never leaves a truncated checkpoint behind.
+
+    Args:
+        path: Checkpoint file
+        payloads: Section name -> bytes from encode_sections()
+        compression_level: zlib level (1: fastest)
+
+    Returns:
+        Size of the written file in bytes
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as checkpoint:
+        checkpoint.write(_HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION, len(payloads)))
+        for name, raw in payloads.items():
+            encoded_name = name.encode("utf-8")
+            stored = zlib.compress(raw, compression_level)
+            checkpoint.write(_SECTION.pack(len(encoded_name), len(raw), len(stored), zlib.crc32(raw)))
+            checkpoint.write(encoded_name)
+            checkpoint.write(stored)
+        checkpoint.flush()
+        os.fsync(checkpoint.fileno())
+    os.replace(temp_path, path)
+    return path.stat().st_size
+
+
+def read_checkpoint(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read every section of a checkpoint file.
+
+    Args:
+        path: Checkpoint file
+
+    Returns:
+        Section name -> plain data
+
+    Raises:
+        ValueError: If the file is not a checkpoint, has a newer format
+            version or is corrupt
+    """
+    with open(path, "rb") as checkpoint:
+        data = checkpoint.read()
+
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is not a checkpoint")
+    magic, version, count = _HEADER.unpack_from(data)
+    if magic != CHECKPOINT_MAGIC:
+        raise ValueError(f"{path} is not a checkpoint")
+    if version > CHECKPOINT_VERSION:
+        raise ValueError(f"{path} has checkpoint format {version}, newest supported is {CHECKPOINT_VERSION}")
+
+    sections = {}
+    offset = _HEADER.size
+    for _ in range(count):
+        if offset + _SECTION.size > len(data):
+            raise ValueError(f"{path} is truncated")
+        name_length, raw_length, stored_length, crc = _SECTION.unpack_from(data, offset)
+        offset += _SECTION.size
+        name = data[offset:offset + name_length].decode("utf-8")
+        offset += name_length
+        stored = data[offset:offset + stored_length]
+        offset += stored_length
+        if len(stored) != stored_length:
+            raise ValueError(f"{path} is truncated")
+        try:
+            raw = zlib.decompress(stored)
+        except zlib.error as e:
+            raise ValueError(f"{path} section {name!r} is corrupt: {e}") from e
+        if len(raw) != raw_length or zlib.crc32(raw) != crc:
+            raise ValueError(f"{path} section {name!r} is corrupt")
+        sections[name] = _PlainDataUnpickler(io.BytesIO(raw)).load()
+    return sections
+
+
+def list_checkpoints(directory: Union[str, Path], prefix: str = "checkpoint") -> List[Path]:
+    """Checkpoint files in a directory, oldest first."""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob(f"{prefix}_*{CHECKPOINT_SUFFIX}"))
+
+
+def latest_checkpoint(directory: Union[str, Path], prefix: str = "checkpoint") -> Optional[Path]:
+    """Newest checkpoint file in a directory, or None."""
+    checkpoints = list_checkpoints(directory, prefix)
+    return checkpoints[-1] if checkpoints else None
+
+
+class CheckpointWriter:
+    """
+    Background writer for periodic checkpoints.
+
+    submit() encodes the sections on the caller's thread, so the caller's
+    only cost is the snapshot itself; compression, the file write and fsync
+    run on one worker thread. While a checkpoint is still being written
+    further submissions are skipped rather than queued, and only the newest
+    `keep` checkpoint files are kept.
+    """
+
+    def __init__(self, directory: Union[str, Path], prefix: str = "checkpoint",
+                 keep: Optional[int] = 3, compression_level: int = 1):
+        """
+        Initialize checkpoint writer.
+
+        Args:
+            directory: Directory holding the checkpoints (created if missing)
+            prefix: Checkpoint file name prefix
+            keep: Newest checkpoints to keep (None: keep all)
+            compression_level: zlib level (1: fastest)
+
+        Raises:
+            ValueError: If keep is less than 1
+        """
+        if keep is not None and keep < 1:
+            raise ValueError("keep must be at least 1")
+
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.keep = keep
+        self.compression_level = compression_level
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint-writer")
+        self._pending: Optional[Future] = None
+        self.stats = {"written": 0, "skipped": 0, "failed": 0, "bytes": 0, "last_write_ms": 0.0}
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> 'CheckpointWriter':
+        """Create a writer from an engine.checkpoints configuration section."""
+        return cls(settings.get("directory", "checkpoints"),
+                   prefix=settings.get("prefix", "checkpoint"),
+                   keep=settings.get("keep", 3),
+                   compression_level=settings.get("compression_level", 1))
+
+    @property
+    def busy(self) -> bool:
+        """True while a checkpoint is being written."""
+        return self._pending is not None and not self._pending.done()
+
+    def path_for(self, simulation_time: float) -> Path:
+        """Checkpoint file for a simulated time (names sort in time order)."""
+        return self.directory / f"{self.prefix}_{int(simulation_time * 1000):012d}{CHECKPOINT_SUFFIX}"
+
+    def submit(self, simulation_time: float, sections: Dict[str, Any]) -> Optional[Future]:
+        """
+        Snapshot sections and write them in the background.
+
+        Args:
+            simulation_time: Simulated time of the snapshot (names the file)
+            sections: Section name -> plain data (encoded before returning)
+
+        Returns:
+            Future resolving to the checkpoint path, or None if skipped
+            because the previous checkpoint is still being written
+        """
+        if self.busy:
+            self.stats["skipped"] += 1
+            return None
+        payloads = encode_sections(sections)
+        self._pending = self._executor.submit(self._write, self.path_for(simulation_time), payloads)
+        return self._pending
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait for the checkpoint being written, if any."""
+        if self._pending is not None:
+            self._pending.exception(timeout)
+
+    def close(self) -> None:
+        """Finish the pending write and stop the worker thread."""
+        self._executor.shutdown(wait=True)
+
+    def _write(self, path: Path, payloads: Dict[str, bytes]) -> Path:
+        """Write one checkpoint and prune old ones (worker thread)."""
+        start = time.perf_counter()
+        try:
+            size = write_checkpoint(path, payloads, self.compression_level)
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.error("❌ Checkpoint write failed: %s", e)
+            raise
+
+        self.stats["written"] += 1
+        self.stats["bytes"] = size
+        self.stats["last_write_ms"] = (time.perf_counter() - start) * 1000
+        if self.keep is not None:
+            for old in list_checkpoints(self.directory, self.prefix)[:-self.keep]:
+                old.unlink(missing_ok=True)
+        logger.debug("💾 Checkpoint written: %s (%d bytes)", path, size)
+        return path
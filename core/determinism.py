@@ -0,0 +1,196 @@
+"""
+Deterministic simulation mode: seeded random streams and a simulation clock.
+Provides RandomStreams, a registry of independent named random generators
+derived from one seed, and SimulationClock, which reads wall time until the
+simulation is seeded and then reads a fixed epoch plus simulated time. With
+the same seed and configuration two runs draw the same numbers and stamp the
+same times.
+
+Every SimulationEngine owns a clock and a stream registry and passes its
+clock to the components it creates, so engines in one process (tests,
+in-process sweeps) never reseed each other. The process-wide clock and
+streams below are the defaults for components created without an engine
+(order generators, inventory) and are switched by seed_simulation().
+"""
+
+import hashlib
+import logging
+import random
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Wall-clock origin of a seeded run: 2025-01-01T00:00:00Z
+DEFAULT_EPOCH = 1735689600.0
+
+# Stream names used by the simulation
+ORDER_STREAM = "orders"
+INVENTORY_STREAM = "inventory"
+ROBOT_STREAM = "robots"
+
+
+class RandomStreams:
+    """
+    Registry of named random number streams.
+
+    Each seeded stream is its own random.Random, seeded from a SHA-256 hash
+    of the master seed and the stream name, so streams are independent: the
+    numbers one subsystem draws do not depend on how many another drew.
+    Without a seed every stream is the global random module, which keeps
+    unseeded runs (and random.seed() in tests) behaving as before.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            seed: Master seed (None: unseeded, streams use the random module)
+        """
+        self._seed = seed
+        self._streams: Dict[str, random.Random] = {}
+
+    @property
+    def seed(self) -> Optional[int]:
+        """Master seed, or None when unseeded."""
+        return self._seed
+
+    def stream(self, name: str) -> Union[random.Random, Any]:
+        """
+        Get the stream for a subsystem.
+
+        Args:
+            name: Stream name, e.g. "orders"
+
+        Returns:
+            The seeded random.Random for the name, or the random module when unseeded
+        """
+        if self._seed is None:
+            return random
+        generator = self._streams.get(name)
+        if generator is None:
+            generator = self._streams[name] = random.Random(self._stream_seed(name))
+        return generator
+
+    def reseed(self, seed: Optional[int]) -> None:
+        """
+        Change the master seed and restart every stream.
+
+        Streams already handed out are reseeded in place, so callers that kept
+        a reference stay on the new sequence.
+
+        Args:
+            seed: New master seed (None: unseeded)
+        """
+        self._seed = seed
+        if seed is None:
+            self._streams.clear()
+            return
+        for name, generator in self._streams.items():
+            generator.seed(self._stream_seed(name))
+
+    def get_state(self) -> Dict[str, Any]:
+        """Seed and per-stream generator state (for checkpoints)."""
+        return {
+            "seed": self._seed,
+            "streams": {name: generator.getstate() for name, generator in self._streams.items()}
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Restore a state returned by get_state()."""
+        self.reseed(state.get("seed"))
+        if self._seed is None:
+            return
+        for name, generator_state in state.get("streams", {}).items():
+            self.stream(name).setstate(generator_state)
+
+    def _stream_seed(self, name: str) -> int:
+        """Stable per-stream seed (independent of PYTHONHASHSEED)."""
+        digest = hashlib.sha256(f"{self._seed}:{name}".encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big")
+
+
+class SimulationClock:
+    """
+    Clock for timestamps recorded by the simulation.
+
+    Unanchored it returns wall time. Anchored (seeded runs), time() is the
+    epoch plus the simulated seconds the engine sets each update, so
+    timestamps follow simulated time and repeat exactly between runs.
+    Durations measured for performance reporting keep using time.time() or
+    time.perf_counter() directly.
+    """
+
+    __slots__ = ("epoch", "simulation_time")
+
+    def __init__(self):
+        self.epoch: Optional[float] = None
+        self.simulation_time = 0.0
+
+    @property
+    def deterministic(self) -> bool:
+        """True when anchored to an epoch."""
+        return self.epoch is not None
+
+    def time(self) -> float:
+        """Current time in seconds since the Unix epoch."""
+        if self.epoch is None:
+            return time.time()
+        return self.epoch + self.simulation_time
+
+    def now(self) -> datetime:
+        """Current local time as a datetime."""
+        if self.epoch is None:
+            return datetime.now()
+        return datetime.fromtimestamp(self.epoch + self.simulation_time)
+
+    def anchor(self, epoch: float = DEFAULT_EPOCH, simulation_time: float = 0.0) -> None:
+        """Follow simulated time from an epoch (seconds since the Unix epoch)."""
+        self.epoch = epoch
+        self.simulation_time = simulation_time
+
+    def release(self) -> None:
+        """Go back to wall time."""
+        self.epoch = None
+        self.simulation_time = 0.0
+
+
+_streams = RandomStreams()
+_clock = SimulationClock()
+
+
+def get_random(name: str) -> Union[random.Random, Any]:
+    """Get the process-wide random stream for a subsystem (engines use their own)."""
+    return _streams.stream(name)
+
+
+def get_random_streams() -> RandomStreams:
+    """Get the process-wide random stream registry."""
+    return _streams
+
+
+def get_clock() -> SimulationClock:
+    """Get the process-wide simulation clock (engines use their own)."""
+    return _clock
+
+
+def seed_simulation(seed: Optional[int], epoch: float = DEFAULT_EPOCH) -> None:
+    """
+    Switch process-wide deterministic mode on (seed given) or off (None).
+
+    Reseeds every process-wide random stream and anchors the process-wide
+    clock at epoch with zero simulated time, or releases it back to wall
+    time. Engines are seeded separately with SimulationEngine.configure_seed().
+
+    Args:
+        seed: Master seed, or None for unseeded wall-clock runs
+        epoch: Clock origin of seeded runs (seconds since the Unix epoch)
+    """
+    _streams.reseed(seed)
+    if seed is None:
+        _clock.release()
+    else:
+        _clock.anchor(epoch)
+    logger.info("🎲 Simulation seed: %s", seed if seed is not None else "unseeded")
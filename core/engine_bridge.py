@@ -0,0 +1,615 @@
+"""
+Cross-thread bridge between the asyncio engine loop and its consumers.
+Provides a bounded single-producer/multi-consumer ring buffer of state deltas
+and an engine thread that owns one long-lived event loop, so web and analytics
+threads read published deltas and send commands without touching engine
+attributes or spawning a thread per command.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple
+
+from .events import Event, EventType
+
+logger = logging.getLogger(__name__)
+
+# Engine events forwarded to the channel, published under their value as topic
+DEFAULT_CHANNEL_EVENTS = (
+    EventType.SIMULATION_START,
+    EventType.SIMULATION_STOP,
+    EventType.SIMULATION_PAUSE,
+    EventType.SIMULATION_RESUME,
+    EventType.SIMULATION_COMPLETED,
+    EventType.ROBOT_STATE_CHANGED,
+    EventType.ORDER_CREATED,
+    EventType.ORDER_ASSIGNED,
+    EventType.ORDER_COMPLETED,
+    EventType.ITEM_COLLECTED,
+    EventType.INVENTORY_UPDATED,
+    EventType.FRAME_UPDATE,
+)
+
+Delta = Tuple[int, str, Any]
+ChangeListener = Callable[[Set[str], float], None]
+
+
+class StateChannel:
+    """
+    Bounded single-producer/multi-consumer ring buffer of state deltas.
+
+    The producer (the engine thread) never blocks and never takes a lock: it
+    writes the slot, then advances the head sequence. Each reader keeps its own
+    cursor; a reader that falls more than capacity deltas behind skips to the
+    oldest retained delta and counts the skipped ones as dropped. The newest
+    delta per topic is also kept so a new consumer can start from current state.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize state channel.
+
+        Args:
+            capacity: Deltas retained for readers (rounded up to a power of two)
+
+        Raises:
+            ValueError: If capacity is less than 1
+        """
+        if capacity < 1:
+            raise ValueError(f"Channel capacity must be at least 1, got {capacity}")
+
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self.capacity = size
+        self._mask = size - 1
+        self._slots: List[Optional[Delta]] = [None] * size
+        self._head = 0  # Sequence of the newest published delta (0: none yet)
+        self._latest: Dict[str, Tuple[int, Any]] = {}
+        self._readers: Dict[str, "ChannelReader"] = {}
+        self._readers_lock = threading.Lock()
+
+    @property
+    def head(self) -> int:
+        """Sequence number of the newest published delta."""
+        return self._head
+
+    def publish(self, topic: str, delta: Any) -> int:
+        """
+        Publish a delta (producer thread only).
+
+        Args:
+            topic: Topic name, e.g. "robots" or "order_completed"
+            delta: Delta payload; treated as immutable once published
+
+        Returns:
+            Sequence number of the delta
+        """
+        sequence = self._head + 1
+        self._slots[sequence & self._mask] = (sequence, topic, delta)
+        self._latest[topic] = (sequence, delta)
+        self._head = sequence  # Readers never look past the head
+        return sequence
+
+    def latest(self, topic: Optional[str] = None) -> Any:
+        """
+        Get the newest delta of a topic, or of every topic.
+
+        Args:
+            topic: Topic to look up (default: all topics)
+
+        Returns:
+            The delta (None if never published), or a topic-to-delta dict
+        """
+        if topic is not None:
+            entry = self._latest.get(topic)
+            return entry[1] if entry is not None else None
+        return {name: entry[1] for name, entry in dict(self._latest).items()}
+
+    def reader(self, name: str, from_oldest: bool = False) -> "ChannelReader":
+        """
+        Register a consumer.
+
+        Args:
+            name: Unique reader name (used in statistics)
+            from_oldest: Start at the oldest retained delta instead of the head
+
+        Returns:
+            Reader with its own cursor
+
+        Raises:
+            ValueError: If a reader with this name is already registered
+        """
+        with self._readers_lock:
+            if name in self._readers:
+                raise ValueError(f"Channel reader already registered: {name}")
+            head = self._head
+            start = max(0, head - self.capacity) if from_oldest else head
+            reader = ChannelReader(self, name, start)
+            self._readers[name] = reader
+        return reader
+
+    def remove_reader(self, name: str) -> bool:
+        """Unregister a consumer; returns True if it was registered."""
+        with self._readers_lock:
+            return self._readers.pop(name, None) is not None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get channel statistics.
+
+        Returns:
+            Dictionary with capacity, published count, drops and per-reader stats
+        """
+        with self._readers_lock:
+            readers = list(self._readers.values())
+        head = self._head
+        reader_stats = {reader.name: reader.get_statistics(head) for reader in readers}
+        return {
+            "capacity": self.capacity,
+            "published": head,
+            "topics": sorted(dict(self._latest)),
+            "dropped": sum(stats["dropped"] for stats in reader_stats.values()),
+            "readers": reader_stats
+        }
+
+
+class ChannelReader:
+    """One consumer's cursor into a StateChannel (use from a single thread)."""
+
+    def __init__(self, channel: StateChannel, name: str, cursor: int):
+        self.channel = channel
+        self.name = name
+        self.cursor = cursor  # Sequence of the last delta consumed
+        self.delivered = 0
+        self.dropped = 0
+        self.overruns = 0
+        self.max_lag = 0
+
+    @property
+    def lag(self) -> int:
+        """Deltas published but not yet consumed (may exceed capacity)."""
+        return self.channel._head - self.cursor
+
+    def poll(self, max_items: Optional[int] = None) -> List[Delta]:
+        """
+        Consume pending deltas without blocking.
+
+        Args:
+            max_items: Maximum deltas to return (default: all pending)
+
+        Returns:
+            List of (sequence, topic, delta) tuples in publish order
+        """
+        channel = self.channel
+        slots = channel._slots
+        mask = channel._mask
+        capacity = channel.capacity
+        deltas: List[Delta] = []
+
+        while True:
+            head = channel._head
+            cursor = self.cursor
+            lag = head - cursor
+            if lag > self.max_lag:
+                self.max_lag = lag
+            if lag > capacity:
+                # Lapped by the producer: skip to the oldest retained delta
+                self.dropped += lag - capacity
+                self.overruns += 1
+                cursor = head - capacity
+
+            end = head
+            if max_items is not None:
+                end = min(head, cursor + max_items - len(deltas))
+
+            lapped = False
+            for sequence in range(cursor + 1, end + 1):
+                entry = slots[sequence & mask]
+                if entry[0] != sequence:
+                    # Overwritten while reading; re-check the head and skip ahead
+                    lapped = True
+                    break
+                deltas.append(entry)
+                cursor = sequence
+            self.cursor = cursor
+            if not lapped:
+                break
+
+        self.delivered += len(deltas)
+        return deltas
+
+    def close(self) -> None:
+        """Unregister this reader from its channel."""
+        self.channel.remove_reader(self.name)
+
+    def get_statistics(self, head: Optional[int] = None) -> Dict[str, int]:
+        """Get reader statistics."""
+        if head is None:
+            head = self.channel._head
+        return {
+            "cursor": self.cursor,
+            "lag": head - self.cursor,
+            "max_lag": self.max_lag,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "overruns": self.overruns
+        }
+
+
+class EngineThread:
+    """
+    Runs a SimulationEngine on one dedicated thread with a long-lived event loop.
+
+    Other threads send commands with submit() (coroutines) and call() (plain
+    callables), both scheduled through loop.call_soon_threadsafe. While the
+    loop runs, the thread publishes engine events and, every publish_interval,
+    the robots and simulation status that changed since the last publish. All
+    engine reads happen on the engine thread, so the channel has one producer.
+
+    Engines with subscribe_changes() also trigger an immediate publish when
+    they report a change; change listeners then learn which topics changed,
+    after the channel already holds the new state.
+    """
+
+    def __init__(self, engine, channel: Optional[StateChannel] = None,
+                 publish_interval: float = 0.1,
+                 events: Tuple[EventType, ...] = DEFAULT_CHANNEL_EVENTS):
+        """
+        Initialize engine thread.
+
+        Args:
+            engine: SimulationEngine to run
+            channel: Channel to publish to (default: a new StateChannel)
+            publish_interval: Seconds between robot/status delta publishes
+            events: Engine event types forwarded to the channel
+        """
+        self.engine = engine
+        self.channel = channel if channel is not None else StateChannel()
+        self.publish_interval = publish_interval
+        self.events = tuple(events)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._publish_handle: Optional[asyncio.TimerHandle] = None
+        self._subscribed_to = None
+        self._last_robots: Dict[str, Tuple[Any, ...]] = {}
+        self._last_status: Optional[Tuple[Any, ...]] = None
+        self._last_published: Tuple[str, ...] = ()
+        self._change_listeners: List[ChangeListener] = []
+        self._changed_topics: Dict[str, float] = {}  # Topic -> time.monotonic() of its first unflushed change
+        self._changes_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._watching_changes = False
+        self._stats_lock = threading.Lock()
+        self.commands_sent = 0
+        self.commands_failed = 0
+
+    @property
+    def is_alive(self) -> bool:
+        """True while the engine thread's loop is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, run_engine: bool = True) -> bool:
+        """
+        Start the engine thread.
+
+        Args:
+            run_engine: Also start the engine and its main loop
+
+        Returns:
+            True if started, False if it was already running
+        """
+        if self.is_alive:
+            return False
+
+        self._subscribe_events()
+        self._subscribe_changes()
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, args=(ready,),
+                                        name="EngineThread", daemon=True)
+        self._thread.start()
+        ready.wait()
+
+        if run_engine:
+            self.submit(self._start_and_run())
+        logger.debug("✅ Engine thread started")
+        return True
+
+    def run_engine(self) -> concurrent.futures.Future:
+        """Start the engine and its main loop on the engine thread."""
+        return self.submit(self._start_and_run())
+
+    def submit(self, coroutine: Coroutine) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the engine loop from any thread.
+
+        Args:
+            coroutine: Coroutine to run, e.g. engine.pause()
+
+        Returns:
+            Future resolving to the coroutine's result
+
+        Raises:
+            RuntimeError: If the engine thread is not running
+        """
+        if not self.is_alive:
+            coroutine.close()
+            raise RuntimeError("Engine thread is not running")
+
+        with self._stats_lock:
+            self.commands_sent += 1
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        future.add_done_callback(self._command_done)
+        return future
+
+    def call(self, function: Callable[..., Any], *args: Any) -> concurrent.futures.Future:
+        """
+        Run a plain callable on the engine loop from any thread.
+
+        Args:
+            function: Callable to run, e.g. engine.set_simulation_speed
+            *args: Positional arguments for the callable
+
+        Returns:
+            Future resolving to the callable's result
+
+        Raises:
+            RuntimeError: If the engine thread is not running
+        """
+        if not self.is_alive:
+            raise RuntimeError("Engine thread is not running")
+
+        with self._stats_lock:
+            self.commands_sent += 1
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        future.add_done_callback(self._command_done)
+        self.loop.call_soon_threadsafe(self._run_call, future, function, args)
+        return future
+
+    def stop(self, timeout: float = 2.0) -> bool:
+        """
+        Stop the engine (if running) and the engine thread.
+
+        Args:
+            timeout: Seconds to wait for the engine and thread to finish
+
+        Returns:
+            True if the thread finished within the timeout
+        """
+        if not self.is_alive:
+            return True
+
+        if getattr(self.engine, 'is_running', False) and hasattr(self.engine, 'stop'):
+            try:
+                self.submit(self.engine.stop()).result(timeout)
+            except Exception as e:
+                logger.error("❌ Error stopping engine: %s", e)
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        self._unsubscribe_events()
+        self._unsubscribe_changes()
+        return not self._thread.is_alive()
+
+    def publish_state(self) -> int:
+        """
+        Publish robots and simulation status that changed since the last call.
+
+        Must run on the engine thread (it is scheduled there automatically).
+
+        Returns:
+            Number of deltas published
+        """
+        engine = self.engine
+        published = 0
+        topics = []
+
+        state = getattr(engine, 'state', None)
+        if hasattr(engine, 'get_simulation_speed'):
+            speed = engine.get_simulation_speed()
+        else:
+            speed = getattr(engine, 'simulation_speed', 1.0)
+        status = (
+            bool(getattr(engine, 'is_running', False)),
+            bool(state.is_paused()) if state is not None and hasattr(state, 'is_paused') else False,
+            getattr(engine, 'simulation_time', 0.0),
+            speed
+        )
+        if status != self._last_status:
+            self._last_status = status
+            self.channel.publish("simulation", {
+                "is_running": status[0],
+                "is_paused": status[1],
+                "simulation_time": status[2],
+                "speed": status[3]
+            })
+            published += 1
+            topics.append("simulation")
+
+        changed = []
+        for robot in getattr(engine, 'robots', None) or []:
+            robot_id = robot.robot_id
+            position = engine.get_robot_position(robot_id)
+            robot_state = getattr(robot.state, 'value', robot.state)
+            current_order = getattr(robot, 'current_order', None)
+            order_id = current_order.get('id') if isinstance(current_order, dict) else current_order
+            values = (position.aisle, position.rack, robot_state, order_id)
+            if self._last_robots.get(robot_id) != values:
+                self._last_robots[robot_id] = values
+                changed.append({
+                    "robot_id": robot_id,
+                    "aisle": values[0],
+                    "rack": values[1],
+                    "state": robot_state,
+                    "current_order": order_id
+                })
+        if changed:
+            self.channel.publish("robots", changed)
+            published += 1
+            topics.append("robots")
+
+        self._last_published = tuple(topics)
+        return published
+
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        """
+        Register a change listener.
+
+        Listeners run on the engine thread as listener(topics, since), where
+        topics are the engine change topics (see core.engine.CHANGE_TOPICS)
+        reported or published since the last call and since is the
+        time.monotonic() of the earliest of those changes. They should only
+        hand the notice to another thread.
+        """
+        self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: ChangeListener) -> bool:
+        """Remove a change listener; returns False if it was not registered."""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+            return True
+        return False
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get engine thread and channel statistics.
+
+        Returns:
+            Dictionary with thread status, command counts and channel stats
+        """
+        return {
+            "is_alive": self.is_alive,
+            "commands_sent": self.commands_sent,
+            "commands_failed": self.commands_failed,
+            "publish_interval": self.publish_interval,
+            "channel": self.channel.get_statistics()
+        }
+
+    async def _start_and_run(self) -> None:
+        """Start the engine, then run its main loop until stopped."""
+        await self.engine.start()
+        await self.engine.run()
+
+    def _run_loop(self, ready: threading.Event) -> None:
+        """Thread body: run the engine loop until stop()."""
+        loop = self.loop
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.call_soon(self._publish_tick)
+        try:
+            loop.run_forever()
+        finally:
+            if self._publish_handle is not None:
+                self._publish_handle.cancel()
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+            logger.debug("🏁 Engine thread loop closed")
+
+    def _publish_tick(self) -> None:
+        """Publish state deltas and re-arm the publish timer."""
+        try:
+            self.publish_state()
+            if self._last_published:
+                self._notify_listeners(set(self._last_published), time.monotonic())
+        except Exception as e:
+            logger.error("❌ Error publishing engine state: %s", e)
+        self._publish_handle = self.loop.call_later(self.publish_interval, self._publish_tick)
+
+    def _on_engine_change(self, topic: str, data: Dict[str, Any]) -> None:
+        """Record an engine change and schedule one publish for the changes of this frame."""
+        with self._changes_lock:
+            self._changed_topics.setdefault(topic, time.monotonic())
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        if self.is_alive:
+            self.loop.call_soon_threadsafe(self._flush_changes)
+        else:
+            # Engine driven directly (thread not running): nothing else publishes
+            self._flush_changes()
+
+    def _flush_changes(self) -> None:
+        """Publish the changed state, then tell listeners which topics changed."""
+        try:
+            self.publish_state()
+        except Exception as e:
+            logger.error("❌ Error publishing engine state: %s", e)
+        with self._changes_lock:
+            changes = self._changed_topics
+            self._changed_topics = {}
+            self._flush_scheduled = False
+        if changes:
+            self._notify_listeners(set(changes).union(self._last_published), min(changes.values()))
+
+    def _notify_listeners(self, topics: Set[str], since: float) -> None:
+        """Call every change listener."""
+        for listener in self._change_listeners:
+            try:
+                listener(topics, since)
+            except Exception as e:
+                logger.error("❌ Change listener failed: %s", e)
+
+    def _subscribe_changes(self) -> None:
+        """Subscribe to the engine's change notifications, if it has them."""
+        if not self._watching_changes and hasattr(self.engine, 'subscribe_changes'):
+            self.engine.subscribe_changes(self._on_engine_change)
+            self._watching_changes = True
+
+    def _unsubscribe_changes(self) -> None:
+        """Remove this thread's change subscription."""
+        if self._watching_changes:
+            self.engine.unsubscribe_changes(self._on_engine_change)
+            self._watching_changes = False
+        with self._changes_lock:
+            self._changed_topics = {}
+            self._flush_scheduled = False
+
+    def _publish_event(self, event: Event) -> None:
+        """Forward an engine event to the channel (runs on the engine thread)."""
+        self.channel.publish(event.event_type.value, event.data)
+
+    def _subscribe_events(self) -> None:
+        """Subscribe to the engine's current event system."""
+        event_system = getattr(self.engine, 'event_system', None)
+        if event_system is None or event_system is self._subscribed_to:
+            return
+        self._unsubscribe_events()
+        for event_type in self.events:
+            event_system.subscribe(event_type, self._publish_event)
+        self._subscribed_to = event_system
+
+    def _unsubscribe_events(self) -> None:
+        """Remove this thread's subscriptions."""
+        if self._subscribed_to is None:
+            return
+        for event_type in self.events:
+            self._subscribed_to.unsubscribe(event_type, self._publish_event)
+        self._subscribed_to = None
+
+    @staticmethod
+    def _run_call(future: concurrent.futures.Future, function: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+        """Run a call() command on the engine loop and resolve its future."""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(function(*args))
+        except Exception as e:
+            future.set_exception(e)
+
+    def _command_done(self, future: concurrent.futures.Future) -> None:
+        """Count and log failed commands."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            with self._stats_lock:
+                self.commands_failed += 1
+            logger.error("❌ Engine command failed: %s", error)
@@ -4,6 +4,9 @@ Provides event dispatcher, handlers, and basic event types with advanced feature
 """
 
 import asyncio
+import itertools
+import logging
+import time
 from typing import Dict, List, Callable, Any, Optional, Union
 from enum import Enum
 from dataclasses import dataclass, field
@@ -12,6 +15,9 @@ import json
 from collections import deque
 
 
+logger = logging.getLogger(__name__)
+
+
 class EventType(Enum):
     """Basic event types for the simulation."""
     
@@ -56,58 +62,113 @@ class EventPriority(Enum):
     LOW = 3      # Normal events (tick, frame updates, component updates)
 
 
-@dataclass
+# Default priority per event type; anything not listed is LOW
+_HIGH_PRIORITY_EVENTS = (
+    EventType.SIMULATION_STOP,
+    EventType.SYSTEM_ERROR,
+    EventType.PERFORMANCE_WARNING
+)
+_MEDIUM_PRIORITY_EVENTS = (
+    EventType.SIMULATION_START,
+    EventType.SIMULATION_PAUSE,
+    EventType.SIMULATION_RESUME,
+    EventType.CONFIG_LOADED,
+    EventType.CONFIG_CHANGED
+)
+DEFAULT_PRIORITIES: Dict[EventType, EventPriority] = {
+    event_type: (EventPriority.HIGH if event_type in _HIGH_PRIORITY_EVENTS
+                 else EventPriority.MEDIUM if event_type in _MEDIUM_PRIORITY_EVENTS
+                 else EventPriority.LOW)
+    for event_type in EventType
+}
+
+# Enum member access is slow on the hot path, so keep module-level aliases
+_HIGH = EventPriority.HIGH
+_MEDIUM = EventPriority.MEDIUM
+_LOW = EventPriority.LOW
+
+# Monotonic event sequence numbers, shared by all event systems in the process
+_event_sequence = itertools.count(1)
+
+# Wall-clock anchor for rendering perf_counter_ns timestamps as datetimes
+_WALL_CLOCK_ANCHOR = time.time()
+_PERF_COUNTER_ANCHOR = time.perf_counter_ns()
+
+
 class Event:
-    """Event data structure with enhanced features."""
+    """
+    Event data structure with enhanced features.
+    
+    Events are slotted and cheap to create: each gets a monotonic sequence
+    number and a time.perf_counter_ns() timestamp, and its priority comes from
+    the DEFAULT_PRIORITIES table. The datetime timestamp, string event_id and
+    to_dict() rendering are only computed when read.
+    """
     
-    event_type: EventType
-    timestamp: datetime
-    data: Dict[str, Any]
-    source: Optional[str] = None
-    priority: EventPriority = EventPriority.LOW
-    event_id: Optional[str] = None
-    processed: bool = False
+    __slots__ = ("event_type", "data", "source", "priority", "processed",
+                 "sequence", "timestamp_ns", "_timestamp", "_event_id")
     
-    def __post_init__(self):
-        """Post-initialization processing."""
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
-        
-        # Generate event ID if not provided
-        if self.event_id is None:
-            self.event_id = f"{self.event_type.value}_{self.timestamp.strftime('%Y%m%d_%H%M%S_%f')}"
+    def __init__(self, event_type: EventType, timestamp: Optional[datetime] = None,
+                 data: Optional[Dict[str, Any]] = None, source: Optional[str] = None,
+                 priority: Optional[EventPriority] = None, event_id: Optional[str] = None,
+                 processed: bool = False):
+        """
+        Initialize event.
         
-        # Set priority based on event type if not specified
-        if self.priority == EventPriority.LOW:
-            self.priority = self._get_default_priority()
+        Args:
+            event_type: Type of event
+            timestamp: Wall-clock time (rendered from timestamp_ns when omitted)
+            data: Event data dictionary
+            source: Source component name
+            priority: Event priority (LOW or None uses the event type's default)
+            event_id: Event ID (generated from the sequence number when omitted)
+            processed: Whether the event has been dispatched
+        """
+        self.event_type = event_type
+        self.data = data if data is not None else {}
+        self.source = source
+        # LOW is the historical "unspecified" value, so it also takes the default
+        if priority is None or priority is _LOW:
+            priority = DEFAULT_PRIORITIES[event_type]
+        self.priority = priority
+        self.processed = processed
+        self.sequence = next(_event_sequence)
+        self.timestamp_ns = time.perf_counter_ns()
+        self._timestamp = timestamp
+        self._event_id = event_id
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time the event was created."""
+        if self._timestamp is None:
+            elapsed = (self.timestamp_ns - _PERF_COUNTER_ANCHOR) / 1e9
+            self._timestamp = datetime.fromtimestamp(_WALL_CLOCK_ANCHOR + elapsed)
+        return self._timestamp
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
+    
+    @property
+    def event_id(self) -> str:
+        """Unique event ID: event type value and sequence number."""
+        if self._event_id is None:
+            self._event_id = f"{self.event_type.value}_{self.sequence}"
+        return self._event_id
+    
+    @event_id.setter
+    def event_id(self, value: str) -> None:
+        self._event_id = value
     
     def _get_default_priority(self) -> EventPriority:
         """Get default priority based on event type."""
-        high_priority_events = [
-            EventType.SIMULATION_STOP,
-            EventType.SYSTEM_ERROR,
-            EventType.PERFORMANCE_WARNING
-        ]
-        
-        medium_priority_events = [
-            EventType.SIMULATION_START,
-            EventType.SIMULATION_PAUSE,
-            EventType.SIMULATION_RESUME,
-            EventType.CONFIG_LOADED,
-            EventType.CONFIG_CHANGED
-        ]
-        
-        if self.event_type in high_priority_events:
-            return EventPriority.HIGH
-        elif self.event_type in medium_priority_events:
-            return EventPriority.MEDIUM
-        else:
-            return EventPriority.LOW
+        return DEFAULT_PRIORITIES[self.event_type]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary for logging."""
         return {
             "event_id": self.event_id,
+            "sequence": self.sequence,
             "event_type": self.event_type.value,
             "timestamp": self.timestamp.isoformat(),
             "priority": self.priority.name,
@@ -115,6 +176,11 @@ class Event:
             "data": self.data,
             "processed": self.processed
         }
+    
+    def __repr__(self) -> str:
+        """Detailed string representation."""
+        return (f"Event({self.event_type.value}, sequence={self.sequence}, "
+                f"priority={self.priority.name}, source={self.source!r})")
 
 
 @dataclass
@@ -151,11 +217,25 @@ class EventFilter:
 
 
 class EventMiddleware:
-    """Base class for event middleware."""
+    """
+    Base class for event middleware.
+    
+    A hook that a subclass does not override is a no-op, and EventSystem
+    leaves it out of its dispatch chain. Override handles_before/handles_after
+    to declare a hook a no-op explicitly.
+    """
     
     def __init__(self, name: str):
         self.name = name
     
+    def handles_before(self) -> bool:
+        """Whether before_process needs to run for each event."""
+        return type(self).before_process is not EventMiddleware.before_process
+    
+    def handles_after(self) -> bool:
+        """Whether after_process needs to run for each event."""
+        return type(self).after_process is not EventMiddleware.after_process
+    
     async def before_process(self, event: Event) -> Union[Event, None]:
         """
         Process event before it's dispatched to handlers.
@@ -183,7 +263,12 @@ class EventMiddleware:
 
 
 class EventLogger(EventMiddleware):
-    """Event logging middleware."""
+    """
+    Event logging middleware.
+    
+    History keeps the Event objects themselves; they are rendered to
+    dictionaries only when history is read.
+    """
     
     def __init__(self, max_history: int = 1000):
         super().__init__("EventLogger")
@@ -192,21 +277,25 @@ class EventLogger(EventMiddleware):
     
     async def before_process(self, event: Event) -> Union[Event, None]:
         """Log event before processing."""
-        self.event_history.append(event.to_dict())
+        self.event_history.append(event)
         
         # Print important events
-        if event.priority in [EventPriority.HIGH, EventPriority.MEDIUM]:
-            print(f"📋 Event Log: {event.event_type.value} ({event.priority.name}) from {event.source}")
+        if event.priority is not _LOW:
+            logger.debug("📋 Event Log: %s (%s) from %s", event.event_type.value, event.priority.name, event.source)
         
         return event
     
     def get_recent_events(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent events from history."""
-        return list(self.event_history)[-limit:]
+        if limit <= 0:
+            return []
+        history = self.event_history
+        start = max(len(history) - limit, 0)
+        return [history[index].to_dict() for index in range(start, len(history))]
     
     def get_events_by_type(self, event_type: EventType) -> List[Dict[str, Any]]:
         """Get events by type from history."""
-        return [event for event in self.event_history if event["event_type"] == event_type.value]
+        return [event.to_dict() for event in self.event_history if event.event_type is event_type]
 
 
 class EventValidator(EventMiddleware):
@@ -219,7 +308,7 @@ class EventValidator(EventMiddleware):
     def add_validation_rule(self, event_type: EventType, validator: Callable[[Dict[str, Any]], bool]) -> None:
         """Add validation rule for event type."""
         self.validation_rules[event_type] = validator
-        print(f"📝 Validation rule added for {event_type.value}")
+        logger.debug("📝 Validation rule added for %s", event_type.value)
     
     async def before_process(self, event: Event) -> Union[Event, None]:
         """Validate event before processing."""
@@ -229,15 +318,192 @@ class EventValidator(EventMiddleware):
             
             try:
                 if not validator(event.data):
-                    print(f"⚠️  Event validation failed for {event.event_type.value}: {event.data}")
+                    logger.warning("⚠️  Event validation failed for %s: %s", event.event_type.value, event.data)
                     return None  # Block invalid event
             except Exception as e:
-                print(f"❌ Error validating event {event.event_type.value}: {e}")
+                logger.error("❌ Error validating event %s: %s", event.event_type.value, e)
                 return None
         
         return event
 
 
+class CoalescePolicy(Enum):
+    """How pending events of one type are merged before dispatch."""
+    
+    LATEST = "latest"   # Keep only the newest event per key (e.g. per robot_id)
+    SUM = "sum"         # Merge into one event, summing numeric data fields
+    BATCH = "batch"     # Keep every event; deliver them together once per frame
+
+
+class EventCoalescer:
+    """
+    Pending events of one type, merged under a coalescing policy.
+    
+    Coalesced events bypass the bounded priority queues, so they are never
+    dropped; EventSystem drains them once per process_events() call.
+    """
+    
+    def __init__(self, event_type: EventType, policy: CoalescePolicy, key: Optional[str] = None):
+        """
+        Initialize coalescer.
+        
+        Args:
+            event_type: Event type being coalesced
+            policy: Coalescing policy
+            key: Data field that identifies a stream for LATEST (None keeps one event)
+        """
+        self.event_type = event_type
+        self.policy = policy
+        self.key = key
+        self.merged = 0
+        self._latest: Dict[Any, Event] = {}
+        self._pending: List[Event] = []
+    
+    def add(self, event: Event) -> None:
+        """Add an emitted event to the pending set."""
+        if self.policy is CoalescePolicy.LATEST:
+            key = event.data.get(self.key) if self.key is not None else None
+            if key in self._latest:
+                self.merged += 1
+            self._latest[key] = event
+        elif self.policy is CoalescePolicy.SUM and self._pending:
+            total = self._pending[0]
+            for name, value in event.data.items():
+                current = total.data.get(name)
+                if _is_number(value) and _is_number(current):
+                    total.data[name] = current + value
+                else:
+                    total.data[name] = value
+            total.data["coalesced_count"] += 1
+            self.merged += 1
+        elif self.policy is CoalescePolicy.SUM:
+            # Sum into a copy so the emitter's dictionary is left untouched
+            event.data = dict(event.data, coalesced_count=1)
+            self._pending.append(event)
+        else:
+            self._pending.append(event)
+    
+    def drain(self) -> List[Event]:
+        """Remove and return the events to deliver, oldest stream first."""
+        if self.policy is CoalescePolicy.LATEST:
+            events = list(self._latest.values())
+            self._latest.clear()
+        else:
+            events = self._pending
+            self._pending = []
+        return events
+    
+    def __len__(self) -> int:
+        return len(self._latest) if self.policy is CoalescePolicy.LATEST else len(self._pending)
+
+
+def _is_number(value: Any) -> bool:
+    """Whether a data value can be summed."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram in nanoseconds (HDR style).
+
+    Values below 16ns get a bucket each; above that, every power of two is
+    split into 8 linear sub-buckets, so any recorded value is reported within
+    12.5% using a fixed 512-slot count array. Recording only appends to
+    pending (the dispatch loop calls pending.append directly); pending values
+    are folded into the buckets by flush(), which reads call first.
+    """
+
+    __slots__ = ("counts", "count", "total", "max", "pending")
+
+    SUB_BUCKETS = 8
+
+    def __init__(self):
+        self.counts: List[int] = [0] * 512
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.pending: List[int] = []
+
+    def record(self, value: int) -> None:
+        """Record one value (nanoseconds)."""
+        self.pending.append(value)
+
+    def flush(self) -> None:
+        """Fold pending values into the buckets."""
+        pending = self.pending
+        if not pending:
+            return
+        counts = self.counts
+        for value in pending:
+            if value < 16:
+                counts[value if value > 0 else 0] += 1
+            else:
+                shift = value.bit_length() - 4
+                counts[(shift << 3) + (value >> shift)] += 1
+        self.count += len(pending)
+        self.total += sum(pending)
+        largest = max(pending)
+        if largest > self.max:
+            self.max = largest
+        pending.clear()  # Cleared in place: dispatch tables hold pending.append
+
+    @staticmethod
+    def bucket_floor(index: int) -> int:
+        """Smallest value counted in a bucket."""
+        if index < 16:
+            return index
+        return ((index & 7) | 8) << ((index >> 3) - 1)
+
+    def percentile(self, percent: float) -> int:
+        """
+        Value at or below which the given percentage of recordings fall.
+
+        Args:
+            percent: Percentile, 0-100
+
+        Returns:
+            Highest value of the matching bucket (capped at max), 0 when empty
+        """
+        self.flush()
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                return min(self.bucket_floor(index + 1) - 1, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Count, mean, p50, p99 and max in milliseconds."""
+        self.flush()
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count / 1e6 if self.count else 0.0,
+            "p50_ms": self.percentile(50) / 1e6,
+            "p99_ms": self.percentile(99) / 1e6,
+            "max_ms": self.max / 1e6
+        }
+
+    def reset(self) -> None:
+        """Forget all recordings."""
+        self.counts = [0] * 512
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.pending.clear()
+
+
+def _handler_name(handler: Callable) -> str:
+    """Readable name for a handler in statistics and warnings."""
+    name = getattr(handler, "__qualname__", None)
+    if name is None:
+        function = getattr(handler, "func", None)  # functools.partial
+        name = getattr(function, "__qualname__", type(handler).__name__)
+    return name
+
+
 class EventSystem:
     """
     Enhanced event dispatcher and handler system.
@@ -262,14 +528,26 @@ class EventSystem:
         self.event_handlers: Dict[EventType, List[Callable]] = {}
         self.filtered_handlers: Dict[EventType, List[tuple]] = {}  # (handler, filter)
         
+        # Dispatch tables compiled from the handler lists: per event type, a tuple
+        # of sync and a tuple of async (handler, filter) entries (filter may be None)
+        self._handler_tables: Dict[EventType, tuple] = {}
+        
+        # Coalesced event types and subscribers that receive one batch per frame
+        self._coalescers: Dict[EventType, EventCoalescer] = {}
+        self.batch_handlers: Dict[EventType, List[Callable]] = {}
+        self._batch_tables: Dict[EventType, tuple] = {}
+        
         # System state
         self.is_running = False
         self.event_count = 0
         self.processed_events = 0
         self.failed_events = 0
+        self.coalesced_events = 0
         
-        # Middleware
+        # Middleware, plus the chains of middleware whose hooks do something
         self.middleware: List[EventMiddleware] = []
+        self._before_chain: tuple = ()
+        self._after_chain: tuple = ()
         
         # Built-in middleware
         self.logger = EventLogger()
@@ -280,17 +558,205 @@ class EventSystem:
         # Performance tracking
         self.processing_times: deque = deque(maxlen=100)
         
-        print(f"🔌 Enhanced EventSystem initialized (max queue: {max_queue_size})")
+        # Per-(event type, handler) latency, aligned with the dispatch tables,
+        # queue wait from emit to dispatch, and drops per queue
+        self.handler_timing = True
+        self._slow_handler_ns = 5_000_000
+        self.slow_handler_warning_interval = 1.0
+        self.slow_handler_warnings = 0
+        self._handler_latency: Dict[tuple, LatencyHistogram] = {}
+        self._timing_tables: Dict[EventType, tuple] = {}
+        self._slow_warned: Dict[tuple, int] = {}
+        self.queue_wait: Dict[str, LatencyHistogram] = {
+            name: LatencyHistogram() for name in ("high", "medium", "low", "coalesced")
+        }
+        self.dropped_events: Dict[str, int] = {"high": 0, "medium": 0, "low": 0}
+        self._queue_wait_by_queue = {
+            self.high_priority_queue: self.queue_wait["high"],
+            self.medium_priority_queue: self.queue_wait["medium"],
+            self.low_priority_queue: self.queue_wait["low"]
+        }
+        
+        # Emit timestamps of the events put on each queue by _enqueue, oldest first;
+        # trimmed to the queue length, the first entry dates the oldest queued event
+        self._enqueued_ns: Dict[asyncio.Queue, deque] = {
+            queue: deque(maxlen=queue.maxsize or None)
+            for queue in (self.high_priority_queue, self.medium_priority_queue, self.low_priority_queue)
+        }
+        
+        # Time-budgeted frames (None: process max_concurrent_events per frame)
+        self.frame_budget: Optional[Dict[str, float]] = None
+        self._budget_ns = 0
+        self._base_budget_ns = 0
+        self._max_budget_ns = 0
+        self.budget_growth = 1.5
+        self.deferred_frames = 0
+        self.backlog_age_ns = 0
+        self.max_backlog_age_ns = 0
+        self.last_frame: Dict[str, Any] = {}
+        
+        logger.info("🔌 Enhanced EventSystem initialized (max queue: %s)", max_queue_size)
     
     def add_middleware(self, middleware: EventMiddleware) -> None:
         """Add event middleware."""
         self.middleware.append(middleware)
-        print(f"🔧 Middleware added: {middleware.name}")
+        self._compile_middleware()
+        logger.debug("🔧 Middleware added: %s", middleware.name)
     
     def remove_middleware(self, middleware_name: str) -> None:
         """Remove event middleware by name."""
         self.middleware = [m for m in self.middleware if m.name != middleware_name]
-        print(f"🗑️  Middleware removed: {middleware_name}")
+        self._compile_middleware()
+        logger.debug("🗑️  Middleware removed: %s", middleware_name)
+    
+    def _compile_middleware(self) -> None:
+        """Rebuild the middleware chains, skipping no-op hooks."""
+        self._before_chain = tuple(m for m in self.middleware if m.handles_before())
+        self._after_chain = tuple(m for m in self.middleware if m.handles_after())
+    
+    def _compile_handlers(self, event_type: EventType) -> None:
+        """Rebuild the dispatch table for an event type from its handler lists."""
+        entries = [(handler, None) for handler in self.event_handlers.get(event_type, [])]
+        entries.extend(self.filtered_handlers.get(event_type, []))
+        self._store_table(self._handler_tables, event_type, entries)
+        
+        # Unsubscribed handlers drop their statistics, so the histograms never keep them alive
+        subscribed = {handler for handler, _ in entries}
+        for key in [key for key in self._handler_latency if key[0] is event_type and key[1] not in subscribed]:
+            del self._handler_latency[key]
+        
+        table = self._handler_tables.get(event_type)
+        if table is None:
+            self._timing_tables.pop(event_type, None)
+        else:
+            self._timing_tables[event_type] = tuple(
+                tuple(self._handler_histogram(event_type, handler).pending.append for handler, _ in handlers)
+                for handlers in table
+            )
+        
+        batch_entries = [(handler, None) for handler in self.batch_handlers.get(event_type, [])]
+        self._store_table(self._batch_tables, event_type, batch_entries)
+    
+    def _handler_histogram(self, event_type: EventType, handler: Callable) -> LatencyHistogram:
+        """Latency histogram of one handler for one event type (kept while it is subscribed)."""
+        key = (event_type, handler)
+        histogram = self._handler_latency.get(key)
+        if histogram is None:
+            histogram = self._handler_latency[key] = LatencyHistogram()
+        return histogram
+    
+    @staticmethod
+    def _store_table(tables: Dict[EventType, tuple], event_type: EventType, entries: List[tuple]) -> None:
+        """Store (handler, filter) entries as separate sync and async tuples."""
+        if not entries:
+            tables.pop(event_type, None)
+            return
+        
+        sync_entries = tuple(entry for entry in entries if not asyncio.iscoroutinefunction(entry[0]))
+        async_entries = tuple(entry for entry in entries if asyncio.iscoroutinefunction(entry[0]))
+        tables[event_type] = (sync_entries, async_entries)
+    
+    def configure_frame_budget(self, target_frame_time_ms: Optional[float], budget_fraction: float = 0.25,
+                               max_budget_fraction: float = 0.75, growth: float = 1.5) -> None:
+        """
+        Process events for a time budget per frame instead of a fixed count.
+        
+        HIGH, MEDIUM and coalesced events are always delivered. LOW events are
+        processed until budget_fraction of the frame time is used (at least
+        one per frame); the rest stay queued for the next frame. While LOW
+        events are left over the budget grows by growth per frame, up to
+        max_budget_fraction, and it shrinks back once the queue is drained.
+        
+        Args:
+            target_frame_time_ms: Frame time in milliseconds, or None to go
+                back to max_concurrent_events per frame
+            budget_fraction: Share of the frame time normally spent on events
+            max_budget_fraction: Largest share while a backlog remains
+            growth: Budget multiplier per frame that leaves a backlog
+        
+        Raises:
+            ValueError: If the frame time, fractions or growth are out of range
+        """
+        if target_frame_time_ms is None:
+            self.frame_budget = None
+            return
+        if target_frame_time_ms <= 0:
+            raise ValueError(f"Frame time must be positive, got {target_frame_time_ms}")
+        if not 0 < budget_fraction <= max_budget_fraction <= 1:
+            raise ValueError(f"Budget fractions must satisfy 0 < {budget_fraction} <= {max_budget_fraction} <= 1")
+        if growth < 1:
+            raise ValueError(f"Budget growth must be at least 1, got {growth}")
+        
+        self.frame_budget = {
+            "target_frame_time_ms": target_frame_time_ms,
+            "budget_fraction": budget_fraction,
+            "max_budget_fraction": max_budget_fraction,
+            "growth": growth
+        }
+        self._base_budget_ns = int(target_frame_time_ms * budget_fraction * 1e6)
+        self._max_budget_ns = int(target_frame_time_ms * max_budget_fraction * 1e6)
+        self._budget_ns = self._base_budget_ns
+        self.budget_growth = growth
+        logger.debug("⏱️  Event budget %.2fms per frame (up to %.2fms)",
+                     self._base_budget_ns / 1e6, self._max_budget_ns / 1e6)
+    
+    def configure_coalescing(self, event_type: EventType, policy: Optional[CoalescePolicy],
+                             key: Optional[str] = None) -> None:
+        """
+        Set how pending events of one type are coalesced.
+        
+        Coalesced events skip the priority queues and are delivered once per
+        process_events() call, after HIGH and MEDIUM events.
+        
+        Args:
+            event_type: Event type to coalesce
+            policy: Coalescing policy, or None to queue the type normally again
+            key: Data field identifying a stream for LATEST (e.g. "robot_id")
+        """
+        previous = self._coalescers.pop(event_type, None)
+        if policy is not None:
+            self._coalescers[event_type] = EventCoalescer(event_type, policy, key)
+            if previous is not None:
+                for event in previous.drain():
+                    self._coalescers[event_type].add(event)
+            logger.debug("🧮 Coalescing %s events (%s, key=%s)", event_type.value, policy.value, key)
+        elif previous is not None:
+            # Pending events go back through the normal queues
+            for event in previous.drain():
+                self._enqueue(event)
+    
+    def subscribe_batch(self, event_type: EventType, handler: Callable) -> None:
+        """
+        Subscribe to one batched event per frame instead of individual events.
+        
+        The handler receives an event of the same type whose data holds
+        "events" (the delivered events, oldest first) and "count". Types with
+        no coalescing policy are switched to BATCH.
+        
+        Args:
+            event_type: Type of event to subscribe to
+            handler: Handler function to call with each batch
+        """
+        if event_type not in self._coalescers:
+            self.configure_coalescing(event_type, CoalescePolicy.BATCH)
+        self.batch_handlers.setdefault(event_type, []).append(handler)
+        self._compile_handlers(event_type)
+        logger.debug("📝 Subscribed to batched %s events", event_type.value)
+    
+    def unsubscribe_batch(self, event_type: EventType, handler: Callable) -> None:
+        """
+        Unsubscribe a batch handler.
+        
+        Args:
+            event_type: Type of event to unsubscribe from
+            handler: Handler function to remove
+        """
+        try:
+            self.batch_handlers.get(event_type, []).remove(handler)
+        except ValueError:
+            logger.warning("⚠️  Batch handler not found for %s event", event_type.value)
+            return
+        self._compile_handlers(event_type)
     
     def subscribe(self, event_type: EventType, handler: Callable, event_filter: Optional[EventFilter] = None) -> None:
         """
@@ -309,10 +775,12 @@ class EventSystem:
         
         if event_filter:
             self.filtered_handlers[event_type].append((handler, event_filter))
-            print(f"📝 Subscribed to {event_type.value} event with filter")
+            logger.debug("📝 Subscribed to %s event with filter", event_type.value)
         else:
             self.event_handlers[event_type].append(handler)
-            print(f"📝 Subscribed to {event_type.value} event")
+            logger.debug("📝 Subscribed to %s event", event_type.value)
+        
+        self._compile_handlers(event_type)
     
     def unsubscribe(self, event_type: EventType, handler: Callable) -> None:
         """
@@ -340,10 +808,12 @@ class EventSystem:
             if not removed:
                 removed = True
         
+        self._compile_handlers(event_type)
+        
         if removed:
-            print(f"🗑️  Unsubscribed from {event_type.value} event")
+            logger.debug("🗑️  Unsubscribed from %s event", event_type.value)
         else:
-            print(f"⚠️  Handler not found for {event_type.value} event")
+            logger.warning("⚠️  Handler not found for %s event", event_type.value)
     
     async def emit(self, event_type: EventType, data: Dict[str, Any] = None, source: str = None, 
                    priority: EventPriority = None) -> None:
@@ -356,45 +826,50 @@ class EventSystem:
             source: Source component name
             priority: Event priority (auto-determined if not specified)
         """
-        if data is None:
-            data = {}
+        event = Event(event_type, None, data, source, priority)
         
-        event = Event(
-            event_type=event_type,
-            timestamp=datetime.now(),
-            data=data,
-            source=source,
-            priority=priority or EventPriority.LOW
-        )
-        
-        # Set priority from event type if not specified
-        if priority is None:
-            event.priority = event._get_default_priority()
+        coalescer = self._coalescers.get(event_type)
+        if coalescer is not None:
+            coalescer.add(event)
+            self.event_count += 1
+            return
         
+        if self._enqueue(event):
+            self.event_count += 1
+    
+    def _enqueue(self, event: Event) -> bool:
+        """Put an event on its priority queue; False if the queue was full and it was dropped."""
         try:
             # Select appropriate queue based on priority
-            if event.priority == EventPriority.HIGH:
-                await self.high_priority_queue.put(event)
-            elif event.priority == EventPriority.MEDIUM:
-                await self.medium_priority_queue.put(event)
+            if event.priority is _HIGH:
+                queue = self.high_priority_queue
+            elif event.priority is _MEDIUM:
+                queue = self.medium_priority_queue
             else:
-                await self.low_priority_queue.put(event)
-            
-            self.event_count += 1
+                queue = self.low_priority_queue
+            queue.put_nowait(event)
+            self._enqueued_ns[queue].append(event.timestamp_ns)
             
-            # Debug print for important events
-            if event.priority in [EventPriority.HIGH, EventPriority.MEDIUM]:
-                print(f"📡 Event emitted: {event_type.value} ({event.priority.name}) from {source}")
+            # Debug log for important events
+            if event.priority is not _LOW:
+                logger.debug("📡 Event emitted: %s (%s) from %s", event.event_type.value, event.priority.name, event.source)
+            return True
             
         except asyncio.QueueFull:
-            print(f"⚠️  Event queue full, dropping event: {event_type.value} ({event.priority.name})")
+            logger.warning("⚠️  Event queue full, dropping event: %s (%s)", event.event_type.value, event.priority.name)
             self.failed_events += 1
+            self.dropped_events[event.priority.name.lower()] += 1
+            return False
     
     async def process_events(self) -> None:
         """Process events from queues with priority ordering."""
         if not self.is_running:
             return
         
+        if self.frame_budget is not None:
+            await self._process_budgeted()
+            return
+        
         # Process up to max_concurrent_events per frame
         max_concurrent = getattr(self, 'max_concurrent_events', 50)
         processed_count = 0
@@ -410,85 +885,342 @@ class EventSystem:
                 self.medium_priority_queue, max_concurrent - processed_count
             )
         
+        # Deliver coalesced events (never deferred, so never dropped)
+        if self._coalescers:
+            processed_count += await self._flush_coalesced()
+        
         # Process low priority events
         if processed_count < max_concurrent:
             processed_count += await self._process_priority_queue(
                 self.low_priority_queue, max_concurrent - processed_count
             )
+        
+        self._track_backlog(time.perf_counter_ns())
+        
+        # Bucket this frame's latency samples
+        if processed_count and self.handler_timing:
+            self._fold_latency()
     
-    async def _process_priority_queue(self, queue: asyncio.Queue, max_events: int) -> int:
-        """Process events from a specific priority queue."""
+    async def _process_budgeted(self) -> None:
+        """Process one frame of events within the time budget (see configure_frame_budget)."""
+        start_ns = time.perf_counter_ns()
+        budget_ns = self._budget_ns
+        
+        # HIGH and MEDIUM events are never deferred
+        processed_count = await self._process_priority_queue(self.high_priority_queue, self.max_queue_size)
+        processed_count += await self._process_priority_queue(self.medium_priority_queue, self.max_queue_size)
+        if self._coalescers:
+            processed_count += await self._flush_coalesced()
+        
+        low_count = await self._process_priority_queue(self.low_priority_queue, self.max_queue_size,
+                                                       start_ns + budget_ns)
+        processed_count += low_count
+        
+        # Grow the budget while LOW events are left over, shrink it once drained
+        now = time.perf_counter_ns()
+        backlog = self.low_priority_queue.qsize()
+        if backlog:
+            self.deferred_frames += 1
+            self._budget_ns = min(self._max_budget_ns, int(budget_ns * self.budget_growth))
+        else:
+            self._budget_ns = max(self._base_budget_ns, int(budget_ns / self.budget_growth))
+        self._track_backlog(now)
+        
+        self.last_frame = {
+            "processed": processed_count,
+            "low_processed": low_count,
+            "deferred": backlog,
+            "budget_ms": budget_ns / 1e6,
+            "elapsed_ms": (now - start_ns) / 1e6
+        }
+        if processed_count and self.handler_timing:
+            self._fold_latency()
+    
+    def _track_backlog(self, now: int) -> None:
+        """
+        Record the age of the oldest queued event at the end of a frame.
+        
+        Queues are first in, first out, so after dropping the timestamps of
+        events taken off a queue the first one left belongs to its oldest
+        event. Events put on a queue directly, not through emit(), are counted
+        in the queue length but not dated.
+        """
+        oldest = now
+        for queue, enqueued in self._enqueued_ns.items():
+            queued = queue.qsize()
+            while len(enqueued) > queued:
+                enqueued.popleft()
+            if queued and enqueued and enqueued[0] < oldest:
+                oldest = enqueued[0]
+        self.backlog_age_ns = now - oldest
+        if self.backlog_age_ns > self.max_backlog_age_ns:
+            self.max_backlog_age_ns = self.backlog_age_ns
+    
+    async def _flush_coalesced(self) -> int:
+        """Dispatch every pending coalesced event and the per-frame batches."""
         processed_count = 0
+        record_wait = self.queue_wait["coalesced"].pending.append
+        
+        for coalescer in tuple(self._coalescers.values()):
+            if not len(coalescer):
+                continue
+            merged = coalescer.merged
+            pending = coalescer.drain()
+            delivered = []
+            
+            for event in pending:
+                try:
+                    # Apply middleware before processing
+                    for middleware in self._before_chain:
+                        event = await middleware.before_process(event)
+                        if event is None:
+                            break  # Event blocked by middleware
+                    
+                    if event is not None:
+                        await self._dispatch_event(event, record_wait)
+                        delivered.append(event)
+                except Exception as e:
+                    logger.error("❌ Error processing event: %s", e)
+                    self.failed_events += 1
+            
+            self.coalesced_events += merged
+            coalescer.merged = 0
+            processed_count += len(delivered)
+            self.processed_events += len(delivered)
+            
+            table = self._batch_tables.get(coalescer.event_type)
+            if table is not None and delivered:
+                await self._dispatch_batch(coalescer.event_type, delivered, table)
         
-        while not queue.empty() and processed_count < max_events:
+        return processed_count
+    
+    async def _dispatch_batch(self, event_type: EventType, events: List[Event], table: tuple) -> None:
+        """Deliver one batched event to the batch subscribers of a type."""
+        batch = Event(event_type, None, {"events": events, "count": len(events)}, "EventSystem",
+                      events[0].priority)
+        sync_entries, async_entries = table
+        
+        for handler, _ in sync_entries:
+            try:
+                handler(batch)
+            except Exception as e:
+                self._handler_failed(batch, None, e)
+        
+        for handler, _ in async_entries:
+            try:
+                await handler(batch)
+            except Exception as e:
+                self._handler_failed(batch, None, e)
+        
+        batch.processed = True
+    
+    async def _process_priority_queue(self, queue: asyncio.Queue, max_events: int,
+                                      deadline_ns: Optional[int] = None) -> int:
+        """
+        Process events from a specific priority queue, recording their queue wait.
+        
+        Args:
+            queue: Queue to drain
+            max_events: Maximum events to process
+            deadline_ns: perf_counter_ns() time after which no further event
+                is started (at least one event is always processed)
+        """
+        processed_count = 0
+        queue_wait = self._queue_wait_by_queue.get(queue)
+        record_wait = queue_wait.pending.append if queue_wait is not None else None
+        
+        while processed_count < max_events:
+            if deadline_ns is not None and processed_count and time.perf_counter_ns() >= deadline_ns:
+                break
+            try:
+                event = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            
             try:
-                event = await asyncio.wait_for(queue.get(), timeout=0.001)
-                
                 # Apply middleware before processing
-                for middleware in self.middleware:
+                for middleware in self._before_chain:
                     event = await middleware.before_process(event)
                     if event is None:
                         break  # Event blocked by middleware
                 
                 if event is not None:
-                    await self._dispatch_event(event)
+                    await self._dispatch_event(event, record_wait)
                     processed_count += 1
                     self.processed_events += 1
                 
-            except asyncio.TimeoutError:
-                break
             except Exception as e:
-                print(f"❌ Error processing event: {e}")
+                logger.error("❌ Error processing event: %s", e)
                 self.failed_events += 1
         
         return processed_count
     
-    async def _dispatch_event(self, event: Event) -> None:
+    async def dispatch(self, event: Event) -> bool:
         """
-        Dispatch event to registered handlers with filtering.
+        Dispatch an event immediately, bypassing queues and coalescing.
+        
+        Used to replay recorded events in their original order; middleware
+        still applies.
         
         Args:
             event: Event to dispatch
+        
+        Returns:
+            True if dispatched, False if blocked by middleware
         """
-        start_time = asyncio.get_event_loop().time()
+        for middleware in self._before_chain:
+            event = await middleware.before_process(event)
+            if event is None:
+                return False
         
-        # Get regular handlers
-        handlers = self.event_handlers.get(event.event_type, [])
+        await self._dispatch_event(event)
+        self.event_count += 1
+        self.processed_events += 1
+        if not self.processed_events & 1023:
+            self._fold_latency()
+        return True
+    
+    async def _dispatch_event(self, event: Event, record_wait: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Dispatch event to registered handlers with filtering.
         
-        # Get filtered handlers
-        filtered_handlers = self.filtered_handlers.get(event.event_type, [])
+        Sync handlers are called directly, in subscription order, before any
+        async handler is awaited, so events with only sync handlers never
+        suspend or touch the event loop. With handler_timing on, each handler
+        call is timed into its latency histogram; clock reads are chained, so
+        a handler's end time is the next handler's start time.
         
-        # Dispatch to regular handlers
-        for handler in handlers:
-            try:
-                await self._call_handler(handler, event)
-            except Exception as e:
-                print(f"❌ Error in event handler for {event.event_type.value}: {e}")
-                self.failed_events += 1
+        Args:
+            event: Event to dispatch
+            record_wait: Records the event's queue wait (ns), when dequeued
+        """
+        start_ns = time.perf_counter_ns()
         
-        # Dispatch to filtered handlers
-        for handler, event_filter in filtered_handlers:
-            try:
-                if event_filter.matches(event):
-                    await self._call_handler(handler, event)
-            except Exception as e:
-                print(f"❌ Error in filtered handler for {event.event_type.value}: {e}")
-                self.failed_events += 1
+        table = self._handler_tables.get(event.event_type)
+        if self.handler_timing:
+            if record_wait is not None:
+                record_wait(start_ns - event.timestamp_ns)
+            
+            if table is not None:
+                sync_entries, async_entries = table
+                sync_timers, async_timers = self._timing_tables[event.event_type]
+                slow_ns = self._slow_handler_ns
+                perf_counter_ns = time.perf_counter_ns
+                started = start_ns
+                
+                for (handler, event_filter), record in zip(sync_entries, sync_timers):
+                    try:
+                        if event_filter is None or event_filter.matches(event):
+                            handler(event)
+                            ended = perf_counter_ns()
+                            record(ended - started)
+                            if ended - started > slow_ns:
+                                self._slow_handler(event, handler, ended - started)
+                            started = ended
+                    except Exception as e:
+                        self._handler_failed(event, event_filter, e)
+                        started = perf_counter_ns()
+                
+                for (handler, event_filter), record in zip(async_entries, async_timers):
+                    try:
+                        if event_filter is None or event_filter.matches(event):
+                            await handler(event)
+                            ended = perf_counter_ns()
+                            record(ended - started)
+                            if ended - started > slow_ns:
+                                self._slow_handler(event, handler, ended - started)
+                            started = ended
+                    except Exception as e:
+                        self._handler_failed(event, event_filter, e)
+                        started = perf_counter_ns()
+        elif table is not None:
+            sync_entries, async_entries = table
+            
+            # Dispatch to sync handlers
+            for handler, event_filter in sync_entries:
+                try:
+                    if event_filter is None or event_filter.matches(event):
+                        handler(event)
+                except Exception as e:
+                    self._handler_failed(event, event_filter, e)
+            
+            # Dispatch to async handlers
+            for handler, event_filter in async_entries:
+                try:
+                    if event_filter is None or event_filter.matches(event):
+                        await handler(event)
+                except Exception as e:
+                    self._handler_failed(event, event_filter, e)
         
         # Apply middleware after processing
-        for middleware in self.middleware:
+        for middleware in self._after_chain:
             try:
                 await middleware.after_process(event, None)
             except Exception as e:
-                print(f"❌ Error in middleware {middleware.name}: {e}")
+                logger.error("❌ Error in middleware %s: %s", middleware.name, e)
         
         # Track processing time
-        processing_time = asyncio.get_event_loop().time() - start_time
-        self.processing_times.append(processing_time)
+        self.processing_times.append((time.perf_counter_ns() - start_ns) / 1e9)
         
         # Mark event as processed
         event.processed = True
     
+    @property
+    def slow_handler_threshold_ms(self) -> float:
+        """Handler call time that triggers a PERFORMANCE_WARNING (0: never)."""
+        return self._slow_handler_ns / 1e6 if self._slow_handler_ns != float("inf") else 0.0
+    
+    @slow_handler_threshold_ms.setter
+    def slow_handler_threshold_ms(self, value: float) -> None:
+        self._slow_handler_ns = value * 1e6 if value and value > 0 else float("inf")
+    
+    def _fold_latency(self) -> None:
+        """Fold pending latency samples into their histograms."""
+        for histogram in self._handler_latency.values():
+            if histogram.pending:
+                histogram.flush()
+        for histogram in self.queue_wait.values():
+            if histogram.pending:
+                histogram.flush()
+    
+    def _slow_handler(self, event: Event, handler: Callable, elapsed_ns: int) -> None:
+        """
+        Emit a PERFORMANCE_WARNING naming a handler that exceeded the threshold.
+        
+        Warnings are rate-limited per (event type, handler), and handlers of
+        PERFORMANCE_WARNING itself never trigger one.
+        """
+        event_type = event.event_type
+        if event_type is EventType.PERFORMANCE_WARNING:
+            return
+        key = (event_type, handler)
+        now = time.perf_counter_ns()
+        last = self._slow_warned.get(key)
+        if last is not None and now - last < self.slow_handler_warning_interval * 1e9:
+            return
+        self._slow_warned[key] = now
+        
+        name = _handler_name(handler)
+        elapsed_ms = elapsed_ns / 1e6
+        logger.warning("🐢 Slow %s handler %s: %.2fms (threshold %.2fms)",
+                       event_type.value, name, elapsed_ms, self.slow_handler_threshold_ms)
+        self.slow_handler_warnings += 1
+        warning = Event(EventType.PERFORMANCE_WARNING, None, {
+            "warning": "slow_handler",
+            "handler": name,
+            "event_type": event_type.value,
+            "elapsed_ms": elapsed_ms,
+            "threshold_ms": self.slow_handler_threshold_ms
+        }, "EventSystem")
+        if self._enqueue(warning):
+            self.event_count += 1
+    
+    def _handler_failed(self, event: Event, event_filter: Optional[EventFilter], error: Exception) -> None:
+        """Record a handler exception."""
+        kind = "event" if event_filter is None else "filtered"
+        logger.error("❌ Error in %s handler for %s: %s", kind, event.event_type.value, error)
+        self.failed_events += 1
+    
     async def _call_handler(self, handler: Callable, event: Event) -> None:
         """Call event handler (sync or async)."""
         if asyncio.iscoroutinefunction(handler):
@@ -496,14 +1228,31 @@ class EventSystem:
         else:
             handler(event)
     
-    def configure(self, max_queue_size: int = None, max_concurrent_events: int = None) -> None:
+    def configure(self, max_queue_size: int = None, max_concurrent_events: int = None,
+                  coalescing: Optional[Dict[str, Dict[str, Any]]] = None,
+                  handler_timing: Optional[bool] = None,
+                  slow_handler_threshold_ms: Optional[float] = None,
+                  frame_budget: Optional[Dict[str, Any]] = None) -> None:
         """
         Configure event system parameters.
         
         Args:
             max_queue_size: Maximum queue size
             max_concurrent_events: Maximum concurrent events per frame
+            coalescing: Coalescing rules keyed by event type value, e.g.
+                {"robot_moved": {"policy": "latest", "key": "robot_id"}};
+                replaces the configured rules when given
+            handler_timing: Record per-handler latency and queue wait
+            slow_handler_threshold_ms: Handler call time that triggers a
+                PERFORMANCE_WARNING (0 disables the warning)
+            frame_budget: Time budget settings, e.g. {"enabled": True,
+                "target_frame_time": 16.67, "budget_fraction": 0.25}; see
+                configure_frame_budget()
         """
+        if handler_timing is not None:
+            self.handler_timing = handler_timing
+        if slow_handler_threshold_ms is not None:
+            self.slow_handler_threshold_ms = slow_handler_threshold_ms
         if max_queue_size:
             self.max_queue_size = max_queue_size
         if max_concurrent_events:
@@ -511,7 +1260,35 @@ class EventSystem:
         else:
             self.max_concurrent_events = 50
         
-        print(f"⚙️  EventSystem configured: queue={self.max_queue_size}, concurrent={self.max_concurrent_events}")
+        if coalescing is not None:
+            configured = set()
+            for type_value, rule in coalescing.items():
+                try:
+                    event_type = EventType(type_value)
+                    policy = CoalescePolicy(rule.get("policy", CoalescePolicy.LATEST.value))
+                except (ValueError, AttributeError):
+                    logger.warning("⚠️  Ignoring invalid coalescing rule for %s: %s", type_value, rule)
+                    continue
+                self.configure_coalescing(event_type, policy, rule.get("key"))
+                configured.add(event_type)
+            for event_type in [t for t in self._coalescers if t not in configured]:
+                if not self.batch_handlers.get(event_type):
+                    self.configure_coalescing(event_type, None)
+        
+        if frame_budget is not None:
+            try:
+                if frame_budget.get("enabled", True):
+                    self.configure_frame_budget(
+                        frame_budget.get("target_frame_time", 16.67),
+                        budget_fraction=frame_budget.get("budget_fraction", 0.25),
+                        max_budget_fraction=frame_budget.get("max_budget_fraction", 0.75),
+                        growth=frame_budget.get("growth", 1.5))
+                else:
+                    self.configure_frame_budget(None)
+            except (TypeError, ValueError) as e:
+                logger.warning("⚠️  Ignoring invalid event budget %s: %s", frame_budget, e)
+        
+        logger.info("⚙️  EventSystem configured: queue=%s, concurrent=%s", self.max_queue_size, self.max_concurrent_events)
     
     def add_validation_rule(self, event_type: EventType, validator: Callable[[Dict[str, Any]], bool]) -> None:
         """Add validation rule for event type."""
@@ -528,7 +1305,7 @@ class EventSystem:
     async def start(self) -> None:
         """Start the event system."""
         self.is_running = True
-        print("🚀 Enhanced EventSystem started")
+        logger.info("🚀 Enhanced EventSystem started")
         
         # Emit system start event
         await self.emit(EventType.SIMULATION_START, {"system": "event_system"}, "EventSystem")
@@ -540,18 +1317,21 @@ class EventSystem:
         # Process remaining events from all queues
         await self._drain_all_queues()
         
-        print("⏹️  Enhanced EventSystem stopped")
-        print(f"📊 Events processed: {self.processed_events}/{self.event_count} (failed: {self.failed_events})")
+        logger.info("⏹️  Enhanced EventSystem stopped")
+        logger.info("📊 Events processed: %s/%s (failed: %s)", self.processed_events, self.event_count, self.failed_events)
     
     async def _drain_all_queues(self) -> None:
         """Drain all event queues."""
+        for coalescer in self._coalescers.values():
+            for event in coalescer.drain():
+                await self._dispatch_event(event)
         for queue in [self.high_priority_queue, self.medium_priority_queue, self.low_priority_queue]:
-            while not queue.empty():
+            while True:
                 try:
-                    event = await asyncio.wait_for(queue.get(), timeout=0.1)
-                    await self._dispatch_event(event)
-                except asyncio.TimeoutError:
+                    event = queue.get_nowait()
+                except asyncio.QueueEmpty:
                     break
+                await self._dispatch_event(event)
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -576,16 +1356,62 @@ class EventSystem:
             "event_count": self.event_count,
             "processed_events": self.processed_events,
             "failed_events": self.failed_events,
-            "success_rate": (self.processed_events / self.event_count * 100) if self.event_count > 0 else 0,
+            "coalesced_events": self.coalesced_events,
+            "success_rate": ((self.processed_events + self.coalesced_events) / self.event_count * 100
+                             if self.event_count > 0 else 0),
             "handler_count": sum(len(handlers) for handlers in self.event_handlers.values()),
             "filtered_handler_count": sum(len(handlers) for handlers in self.filtered_handlers.values()),
+            "batch_handler_count": sum(len(handlers) for handlers in self.batch_handlers.values()),
+            "coalescing": {
+                event_type.value: {"policy": coalescer.policy.value, "key": coalescer.key,
+                                   "pending": len(coalescer)}
+                for event_type, coalescer in self._coalescers.items()
+            },
             "middleware_count": len(self.middleware),
+            "dropped_events": dict(self.dropped_events),
             "performance": {
                 "avg_processing_time": avg_processing_time,
-                "recent_processing_times": list(self.processing_times)[-10:]
+                "recent_processing_times": list(self.processing_times)[-10:],
+                "queue_wait": {name: histogram.snapshot() for name, histogram in self.queue_wait.items()},
+                "slow_handler_threshold_ms": self.slow_handler_threshold_ms,
+                "slow_handler_warnings": self.slow_handler_warnings
+            },
+            "handler_latency": self.get_handler_latency(),
+            "frame_budget": {
+                "mode": "time" if self.frame_budget is not None else "count",
+                "settings": dict(self.frame_budget) if self.frame_budget is not None else None,
+                "current_budget_ms": self._budget_ns / 1e6 if self.frame_budget is not None else None,
+                "deferred_frames": self.deferred_frames,
+                "backlog": (self.high_priority_queue.qsize() + self.medium_priority_queue.qsize() +
+                            self.low_priority_queue.qsize()),
+                "backlog_age_ms": self.backlog_age_ns / 1e6,
+                "max_backlog_age_ms": self.max_backlog_age_ns / 1e6,
+                "last_frame": dict(self.last_frame)
             }
         }
     
+    def get_handler_latency(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get per-handler latency.
+        
+        Returns:
+            Histogram snapshots (count, mean, p50, p99, max in ms) keyed by
+            event type value, then handler name
+        """
+        latency: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (event_type, handler), histogram in list(self._handler_latency.items()):
+            if not histogram.count:
+                continue
+            handlers = latency.setdefault(event_type.value, {})
+            name = _handler_name(handler)
+            if name in handlers:
+                index = 2
+                while f"{name} ({index})" in handlers:
+                    index += 1
+                name = f"{name} ({index})"
+            handlers[name] = histogram.snapshot()
+        return latency
+    
     def reset(self) -> None:
         """Reset event system state."""
         # Clear all queues
@@ -595,16 +1421,38 @@ class EventSystem:
                     queue.get_nowait()
                 except asyncio.QueueEmpty:
                     break
+        for enqueued in self._enqueued_ns.values():
+            enqueued.clear()
         
         # Clear all event handlers
         self.event_handlers.clear()
         self.filtered_handlers.clear()
+        self._handler_tables.clear()
+        self.batch_handlers.clear()
+        self._batch_tables.clear()
+        for coalescer in self._coalescers.values():
+            coalescer.drain()
+            coalescer.merged = 0
         
         # Reset counters
         self.event_count = 0
         self.processed_events = 0
         self.failed_events = 0
+        self.coalesced_events = 0
         self.is_running = False
+        self._handler_latency.clear()
+        self._timing_tables.clear()
+        self._slow_warned.clear()
+        self.slow_handler_warnings = 0
+        for histogram in self.queue_wait.values():
+            histogram.reset()
+        for name in self.dropped_events:
+            self.dropped_events[name] = 0
+        self._budget_ns = self._base_budget_ns
+        self.deferred_frames = 0
+        self.backlog_age_ns = 0
+        self.max_backlog_age_ns = 0
+        self.last_frame = {}
         
         # Clear processing times
         self.processing_times.clear()
@@ -612,4 +1460,4 @@ class EventSystem:
         # Reset middleware
         self.logger.event_history.clear()
         
-        print("🔄 Enhanced EventSystem reset") 
\ No newline at end of file
+        logger.info("🔄 Enhanced EventSystem reset") 
\ No newline at end of file
@@ -0,0 +1,194 @@
+"""
+Multi-robot fleet state for the simulation engine.
+Keeps per-robot kinematic state in NumPy arrays so one frame's interpolation
+step is a single vectorized update across the whole fleet.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .layout.coordinate import SmoothCoordinate
+
+
+class RobotFleet:
+    """
+    Struct-of-arrays kinematic state for a fleet of robots.
+
+    Row i of every array belongs to the robot in slot i. Robots are moved
+    along straight segments between waypoints; only robots whose segment
+    ends (or whose pick finishes) in a frame need per-robot Python work.
+    """
+
+    # Arrays saved and restored by get_state() / set_state()
+    _STATE_ARRAYS = ("positions", "start_positions", "targets", "segment_lengths", "move_start_times",
+                     "path_indices", "moving", "pick_end_times", "odometer", "trip_distance")
+
+    def __init__(self, robot_ids: List[str], start: Tuple[float, float] = (1.0, 1.0)):
+        """
+        Initialize fleet arrays.
+
+        Args:
+            robot_ids: Identifier for each robot slot
+            start: Initial (aisle, rack) position for every robot
+
+        Raises:
+            ValueError: If robot_ids is empty or contains duplicates
+        """
+        if not robot_ids:
+            raise ValueError("Fleet must contain at least one robot")
+        if len(set(robot_ids)) != len(robot_ids):
+            raise ValueError("Robot IDs must be unique")
+
+        self.robot_ids = list(robot_ids)
+        self.slot_by_id: Dict[str, int] = {robot_id: slot for slot, robot_id in enumerate(self.robot_ids)}
+        size = len(self.robot_ids)
+
+        # Current, segment start and segment end positions as (aisle, rack)
+        self.positions = np.empty((size, 2), dtype=np.float64)
+        self.start_positions = np.empty((size, 2), dtype=np.float64)
+        self.targets = np.empty((size, 2), dtype=np.float64)
+        # Segment length and simulated start time of the current segment
+        self.segment_lengths = np.zeros(size, dtype=np.float64)
+        self.move_start_times = np.zeros(size, dtype=np.float64)
+        self.path_indices = np.zeros(size, dtype=np.int64)
+        self.moving = np.zeros(size, dtype=bool)
+        # Simulated time at which the current pick finishes (inf when not picking)
+        self.pick_end_times = np.full(size, np.inf, dtype=np.float64)
+        # Distance travelled in total and since the current order was assigned
+        self.odometer = np.zeros(size, dtype=np.float64)
+        self.trip_distance = np.zeros(size, dtype=np.float64)
+
+        self.reset(start)
+
+    def __len__(self) -> int:
+        """Number of robots in the fleet."""
+        return len(self.robot_ids)
+
+    def reset(self, start: Tuple[float, float] = (1.0, 1.0)) -> None:
+        """Place every robot at the start position with no motion or picks pending."""
+        self.positions[:] = start
+        self.start_positions[:] = start
+        self.targets[:] = start
+        self.segment_lengths[:] = 0.0
+        self.move_start_times[:] = 0.0
+        self.path_indices[:] = 0
+        self.moving[:] = False
+        self.pick_end_times[:] = np.inf
+        self.odometer[:] = 0.0
+        self.trip_distance[:] = 0.0
+
+    def begin_segment(self, slot: int, target: Tuple[float, float], sim_time: float) -> float:
+        """
+        Start moving a robot from its current position towards a waypoint.
+
+        Args:
+            slot: Robot slot
+            target: Waypoint (aisle, rack)
+            sim_time: Simulated time the segment starts
+
+        Returns:
+            Segment length in grid units
+        """
+        self.start_positions[slot] = self.positions[slot]
+        self.targets[slot] = target
+        length = float(np.hypot(*(self.targets[slot] - self.start_positions[slot])))
+        self.segment_lengths[slot] = length
+        self.move_start_times[slot] = sim_time
+        self.moving[slot] = True
+        return length
+
+    def stop(self, slot: int) -> None:
+        """Stop a robot at its current position."""
+        self.moving[slot] = False
+
+    def begin_pick(self, slot: int, end_time: float) -> None:
+        """Hold a robot in place until a pick finishes."""
+        self.moving[slot] = False
+        self.pick_end_times[slot] = end_time
+
+    def end_pick(self, slot: int) -> None:
+        """Clear a robot's pending pick."""
+        self.pick_end_times[slot] = np.inf
+
+    def advance(self, sim_time: float, speed: float) -> np.ndarray:
+        """
+        Interpolate every moving robot to sim_time in one vectorized step.
+
+        Robots that reach their waypoint are snapped onto it, stopped and
+        credited with the segment length.
+
+        Args:
+            sim_time: Current simulated time
+            speed: Movement speed in grid units per second
+
+        Returns:
+            Slots of robots that arrived at their waypoint this step
+        """
+        moving = self.moving
+        if not moving.any():
+            return np.empty(0, dtype=np.int64)
+
+        travelled = (sim_time - self.move_start_times) * speed
+        with np.errstate(divide="ignore", invalid="ignore"):
+            progress = np.where(self.segment_lengths > 0.0,
+                                travelled / self.segment_lengths, 1.0)
+        np.clip(progress, 0.0, 1.0, out=progress)
+        progress[~moving] = 0.0
+
+        arrived = np.flatnonzero(moving & (progress >= 1.0))
+        in_transit = moving & (progress < 1.0)
+        start = self.start_positions[in_transit]
+        self.positions[in_transit] = start + (self.targets[in_transit] - start) * progress[in_transit, None]
+
+        if arrived.size:
+            self.positions[arrived] = self.targets[arrived]
+            self.moving[arrived] = False
+            self.odometer[arrived] += self.segment_lengths[arrived]
+            self.trip_distance[arrived] += self.segment_lengths[arrived]
+        return arrived
+
+    def due_picks(self, sim_time: float) -> np.ndarray:
+        """Slots of robots whose pick finishes at or before sim_time."""
+        return np.flatnonzero(self.pick_end_times <= sim_time)
+
+    def set_position(self, slot: int, aisle: float, rack: float) -> None:
+        """Teleport a robot, cancelling any segment in progress."""
+        self.positions[slot] = (aisle, rack)
+        self.moving[slot] = False
+
+    def position_of(self, slot: int) -> SmoothCoordinate:
+        """Get a robot's current position as a SmoothCoordinate."""
+        aisle, rack = self.positions[slot]
+        return SmoothCoordinate(float(aisle), float(rack))
+
+    def slot_of(self, robot_id: str) -> Optional[int]:
+        """Get the slot for a robot ID, or None if it is not in the fleet."""
+        return self.slot_by_id.get(robot_id)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Robot IDs and every fleet array as lists (for checkpoints)."""
+        return {"robot_ids": list(self.robot_ids),
+                **{name: getattr(self, name).tolist() for name in self._STATE_ARRAYS}}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a state returned by get_state().
+
+        Raises:
+            ValueError: If the state belongs to a fleet with other robots
+        """
+        if state["robot_ids"] != self.robot_ids:
+            raise ValueError("Fleet state is for different robots")
+        for name in self._STATE_ARRAYS:
+            array = getattr(self, name)
+            array[:] = np.asarray(state[name], dtype=array.dtype)
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Get fleet-wide movement statistics."""
+        return {
+            "robot_count": len(self),
+            "moving": int(self.moving.sum()),
+            "picking": int(np.isfinite(self.pick_end_times).sum()),
+            "total_distance": float(self.odometer.sum()),
+        }
@@ -5,10 +5,12 @@ This module provides the core InventoryItem class for representing inventory ite
 in the warehouse simulation with comprehensive validation and serialization capabilities.
 """
 
-import time
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from core.layout.coordinate import Coordinate
+from core.determinism import get_clock
+
+_clock = get_clock()
 
 
 @dataclass
@@ -29,8 +31,8 @@ class InventoryItem:
     location: Coordinate
     quantity: int = field(default=999999)  # Unlimited stock by default
     category: str = field(default="general")
-    created_at: float = field(default_factory=time.time)
-    last_updated: float = field(default_factory=time.time)
+    created_at: float = field(default_factory=_clock.time)
+    last_updated: float = field(default_factory=_clock.time)
     
     def __post_init__(self):
         """Validate item properties after initialization."""
@@ -99,7 +101,7 @@ class InventoryItem:
     
     def _validate_timestamps(self) -> None:
         """Validate timestamp values."""
-        current_time = time.time()
+        current_time = _clock.time()
         
         if not isinstance(self.created_at, (int, float)):
             raise ValueError(f"created_at must be a number, got {type(self.created_at)}")
@@ -133,7 +135,7 @@ class InventoryItem:
             raise ValueError(f"quantity cannot be negative, got {new_quantity}")
         
         self.quantity = new_quantity
-        self.last_updated = time.time()
+        self.last_updated = _clock.time()
     
     def update_location(self, new_location: Coordinate) -> None:
         """
@@ -155,7 +157,7 @@ class InventoryItem:
             raise ValueError(f"Item cannot be moved to packout zone: {new_location}")
         
         self.location = new_location
-        self.last_updated = time.time()
+        self.last_updated = _clock.time()
     
     def update_category(self, new_category: str) -> None:
         """
@@ -183,7 +185,7 @@ class InventoryItem:
             raise ValueError(f"category must be one of {valid_categories}, got {new_category}")
         
         self.category = new_category.lower()
-        self.last_updated = time.time()
+        self.last_updated = _clock.time()
     
     def is_available(self) -> bool:
         """
@@ -279,8 +281,8 @@ class InventoryItem:
             location=location,
             quantity=data["quantity"],
             category=data["category"],
-            created_at=data.get("created_at", time.time()),
-            last_updated=data.get("last_updated", time.time())
+            created_at=data.get("created_at", _clock.time()),
+            last_updated=data.get("last_updated", _clock.time())
         )
     
     def __str__(self) -> str:
@@ -14,6 +14,7 @@ from enum import Enum
 from .inventory_item import InventoryItem
 from .item_generator import ItemGenerator, ItemPlacementConfig
 from core.layout.coordinate import Coordinate
+from core.determinism import get_clock
 
 # Ensure Coordinate is hashable for use as dictionary key
 if not hasattr(Coordinate, '__hash__'):
@@ -21,6 +22,8 @@ if not hasattr(Coordinate, '__hash__'):
         return hash((self.x, self.y))
     Coordinate.__hash__ = coordinate_hash
 
+_clock = get_clock()
+
 
 class InventoryEventType(Enum):
     """Types of inventory events"""
@@ -217,7 +220,7 @@ class InventoryManager:
                 
                 # Update quantity
                 item.quantity = new_quantity
-                item.last_updated = time.time()
+                item.last_updated = _clock.time()
                 
                 processing_time = (time.time() - start_time) * 1000
                 
@@ -289,7 +292,7 @@ class InventoryManager:
                 
                 # Update category
                 item.category = new_category
-                item.last_updated = time.time()
+                item.last_updated = _clock.time()
                 
                 # Update category index
                 if old_category in self._items_by_category:
@@ -383,7 +386,7 @@ class InventoryManager:
                 
                 # Update location
                 item.location = new_location
-                item.last_updated = time.time()
+                item.last_updated = _clock.time()
                 
                 # Update location index
                 if old_location in self._items_by_location:
@@ -458,6 +461,41 @@ class InventoryManager:
         with self._lock:
             return self._performance_metrics.copy()
     
+    def get_state(self) -> Dict:
+        """
+        Get every item and the operation metrics as plain data (for checkpoints).
+
+        Returns:
+            Dictionary accepted by set_state()
+        """
+        with self._lock:
+            return {
+                "items": [item.to_dict() for item in self._items.values()],
+                "performance_metrics": self._performance_metrics.copy(),
+                "initialized": self._initialized
+            }
+
+    def set_state(self, state: Dict) -> None:
+        """
+        Replace the inventory with a state returned by get_state().
+
+        Event listeners are kept; no events are emitted for restored items.
+
+        Args:
+            state: Inventory state
+        """
+        items = [InventoryItem.from_dict(data) for data in state.get("items", [])]
+        with self._lock:
+            self._items = {}
+            self._items_by_location = {}
+            self._items_by_category = {}
+            for item in items:
+                self._items[item.item_id] = item
+                self._items_by_location.setdefault(item.location, []).append(item)
+                self._items_by_category.setdefault(item.category, []).append(item)
+            self._performance_metrics.update(state.get("performance_metrics", {}))
+            self._initialized = state.get("initialized", bool(items))
+
     def get_inventory_statistics(self) -> Dict:
         """
         Get comprehensive inventory statistics.
@@ -508,7 +546,7 @@ class InventoryManager:
         event = InventoryEvent(
             event_type=event_type,
             item_id=item_id,
-            timestamp=time.time(),
+            timestamp=_clock.time(),
             old_value=old_value,
             new_value=new_value
         )
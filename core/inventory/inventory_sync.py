@@ -14,6 +14,9 @@ from enum import Enum
 from .inventory_manager import InventoryManager, InventoryEventType, InventoryEvent
 from .inventory_item import InventoryItem
 from core.layout.coordinate import Coordinate
+from core.determinism import get_clock
+
+_clock = get_clock()
 
 
 class SyncEventType(Enum):
@@ -32,7 +35,7 @@ class SyncEvent:
     event_type: SyncEventType
     order_id: str
     item_id: Optional[str] = None
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = field(default_factory=_clock.time)
     metadata: Dict = field(default_factory=dict)
 
 
@@ -44,7 +47,7 @@ class OrderInventoryStatus:
     collected_items: List[str] = field(default_factory=list)
     missing_items: List[str] = field(default_factory=list)
     status: str = "pending"  # pending, in_progress, completed, cancelled
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=_clock.time)
     completion_time: Optional[float] = None
     robot_id: Optional[str] = None
 
@@ -217,7 +220,7 @@ class InventorySyncManager:
                 
                 order_status = self._order_status[order_id]
                 order_status.status = "cancelled"
-                order_status.completion_time = time.time()
+                order_status.completion_time = _clock.time()
                 
                 self._sync_metrics["cancelled_orders"] += 1
                 self._sync_metrics["last_sync_time"] = time.time()
@@ -381,7 +384,7 @@ class InventorySyncManager:
         try:
             order_status = self._order_status[order_id]
             order_status.status = "completed"
-            order_status.completion_time = time.time()
+            order_status.completion_time = _clock.time()
             
             self._sync_metrics["completed_orders"] += 1
             self._sync_metrics["last_sync_time"] = time.time()
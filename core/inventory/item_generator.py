@@ -5,13 +5,13 @@ This module provides the ItemGenerator class for creating 500 unique inventory i
 with proper placement, distribution, and category assignment.
 """
 
-import random
 import string
 from typing import List, Dict, Set, Tuple
 from dataclasses import dataclass
 
 from .inventory_item import InventoryItem
 from core.layout.coordinate import Coordinate
+from core.determinism import INVENTORY_STREAM, get_random
 
 
 @dataclass
@@ -109,7 +109,7 @@ class ItemGenerator:
         location = self._find_available_location()
         
         # Assign random category
-        category = random.choice(self.CATEGORIES)
+        category = get_random(INVENTORY_STREAM).choice(self.CATEGORIES)
         
         # Create inventory item
         item = InventoryItem(
@@ -162,10 +162,11 @@ class ItemGenerator:
         """
         max_attempts = 1000
         attempts = 0
+        rng = get_random(INVENTORY_STREAM)
         
         while attempts < max_attempts:
-            x = random.randint(0, self.config.warehouse_width - 1)
-            y = random.randint(0, self.config.warehouse_height - 1)
+            x = rng.randint(0, self.config.warehouse_width - 1)
+            y = rng.randint(0, self.config.warehouse_height - 1)
             
             # Check if location is in packout zone
             if self._is_in_packout_zone(x, y):
@@ -179,7 +180,7 @@ class ItemGenerator:
             
             # Location is available
             self._used_locations.add((x, y))
-            return Coordinate(x, y)
+            return Coordinate.of(x, y)
         
         raise ValueError(
             f"Unable to find available location after {max_attempts} attempts. "
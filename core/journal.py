@@ -0,0 +1,347 @@
+"""
+Append-only event journal for the event system.
+Provides EventJournal, a middleware that writes every processed event to
+size-rotated line-delimited JSON segments with batched writes and periodic
+fsync, and JournalReader, which reads the segments back and replays them into
+an event system or engine faster than real time.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .events import (Event, EventMiddleware, EventPriority, EventType, DEFAULT_PRIORITIES,
+                     _PERF_COUNTER_ANCHOR, _WALL_CLOCK_ANCHOR)
+
+logger = logging.getLogger(__name__)
+
+# Offset from Event.timestamp_ns (perf counter) to wall-clock epoch nanoseconds
+_WALL_OFFSET_NS = int(_WALL_CLOCK_ANCHOR * 1e9) - _PERF_COUNTER_ANCHOR
+
+_EVENT_TYPES = {event_type.value: event_type for event_type in EventType}
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON fallback for event data values that json cannot encode natively."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    return str(value)
+
+
+# Shared compact encoder (json.dumps with options builds a new encoder per call)
+_encode_line = json.JSONEncoder(separators=(",", ":"), default=_encode_value).encode
+
+
+class EventJournal(EventMiddleware):
+    """
+    Event journal middleware.
+
+    Each event reaching the middleware chain becomes one JSON line
+    {"seq", "t", "type", "source", "data"} (plus "priority" when it differs
+    from the type's default), where t is wall-clock epoch nanoseconds. Lines
+    are buffered and written in batches; files are fsynced at most every
+    fsync_interval seconds and a new segment starts once max_segment_bytes is
+    reached. Each journal opens a new segment, so earlier runs are kept.
+    """
+
+    def __init__(self, directory: Union[str, Path], prefix: str = "events",
+                 max_segment_bytes: int = 16 * 1024 * 1024, batch_size: int = 256,
+                 flush_interval: float = 0.5, fsync_interval: Optional[float] = 1.0):
+        """
+        Initialize event journal.
+
+        Args:
+            directory: Directory holding the journal segments (created if missing)
+            prefix: Segment file name prefix
+            max_segment_bytes: Segment size that triggers rotation
+            batch_size: Buffered events that trigger a write
+            flush_interval: Seconds after which buffered events are written anyway
+            fsync_interval: Minimum seconds between fsyncs (0: every write, None: never)
+
+        Raises:
+            ValueError: If max_segment_bytes or batch_size is not positive
+        """
+        super().__init__("EventJournal")
+        if max_segment_bytes <= 0 or batch_size <= 0:
+            raise ValueError("max_segment_bytes and batch_size must be positive")
+
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.max_segment_bytes = max_segment_bytes
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+
+        self._buffer: List[str] = []
+        self._file = None
+        self._segment_index = 0
+        self._segment_bytes = 0
+        self._last_flush = time.monotonic()
+        self._last_fsync = self._last_flush
+        self._dirty = False
+
+        # Statistics
+        self.events_written = 0
+        self.bytes_written = 0
+        self.segments_opened = 0
+        self.flushes = 0
+        self.fsyncs = 0
+        self.encode_errors = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        existing = JournalReader(self.directory, prefix).segment_indices()
+        self._segment_index = existing[-1] if existing else 0
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> "EventJournal":
+        """
+        Create a journal from the engine.event_journal configuration.
+
+        Args:
+            settings: Configuration dictionary (directory, prefix, max_segment_mb,
+                batch_size, flush_interval, fsync_interval)
+        """
+        return cls(settings.get("directory", "journal"),
+                   prefix=settings.get("prefix", "events"),
+                   max_segment_bytes=int(settings.get("max_segment_mb", 16) * 1024 * 1024),
+                   batch_size=settings.get("batch_size", 256),
+                   flush_interval=settings.get("flush_interval", 0.5),
+                   fsync_interval=settings.get("fsync_interval", 1.0))
+
+    @property
+    def segment_path(self) -> Optional[Path]:
+        """Path of the segment being written (None before the first write)."""
+        if self._file is None:
+            return None
+        return self.directory / f"{self.prefix}.{self._segment_index:06d}.jsonl"
+
+    async def before_process(self, event: Event) -> Union[Event, None]:
+        """Buffer the event's journal line; write the batch when due."""
+        self.record(event)
+        return event
+
+    def record(self, event: Event) -> None:
+        """Buffer one event (called by the middleware hook)."""
+        record = {
+            "seq": event.sequence,
+            "t": event.timestamp_ns + _WALL_OFFSET_NS,
+            "type": event.event_type.value,
+            "source": event.source,
+            "data": event.data
+        }
+        if event.priority is not DEFAULT_PRIORITIES[event.event_type]:
+            record["priority"] = event.priority.name
+        try:
+            line = _encode_line(record)
+        except (TypeError, ValueError) as e:
+            self.encode_errors += 1
+            logger.warning("⚠️  Event not journaled (%s): %s", event.event_type.value, e)
+            return
+
+        buffer = self._buffer
+        buffer.append(line)
+        if len(buffer) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self, fsync: bool = False) -> int:
+        """
+        Write buffered events.
+
+        Args:
+            fsync: Force an fsync after writing
+
+        Returns:
+            Number of events written
+        """
+        now = time.monotonic()
+        self._last_flush = now
+        buffer = self._buffer
+        count = len(buffer)
+        if count:
+            chunk = ("\n".join(buffer) + "\n").encode("utf-8")
+            buffer.clear()
+            if self._file is None or (self._segment_bytes and
+                                      self._segment_bytes + len(chunk) > self.max_segment_bytes):
+                self._rotate()
+            self._file.write(chunk)
+            self._file.flush()
+            self._segment_bytes += len(chunk)
+            self.bytes_written += len(chunk)
+            self.events_written += count
+            self.flushes += 1
+            self._dirty = True
+
+        if self._dirty and (fsync or (self.fsync_interval is not None and
+                                      now - self._last_fsync >= self.fsync_interval)):
+            os.fsync(self._file.fileno())
+            self._last_fsync = now
+            self._dirty = False
+            self.fsyncs += 1
+        return count
+
+    def close(self) -> None:
+        """Write and fsync buffered events and close the segment."""
+        if self._buffer or self._dirty:
+            self.flush(fsync=True)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get journal statistics.
+
+        Returns:
+            Dictionary with write, flush and segment counts
+        """
+        return {
+            "directory": str(self.directory),
+            "segment": str(self.segment_path) if self.segment_path else None,
+            "events_written": self.events_written,
+            "events_buffered": len(self._buffer),
+            "bytes_written": self.bytes_written,
+            "segments_opened": self.segments_opened,
+            "flushes": self.flushes,
+            "fsyncs": self.fsyncs,
+            "encode_errors": self.encode_errors
+        }
+
+    def _rotate(self) -> None:
+        """Close the current segment (fsynced) and open the next one."""
+        if self._file is not None:
+            if self._dirty:
+                os.fsync(self._file.fileno())
+                self.fsyncs += 1
+                self._dirty = False
+            self._file.close()
+        self._segment_index += 1
+        self._file = open(self.directory / f"{self.prefix}.{self._segment_index:06d}.jsonl", "ab")
+        self._segment_bytes = 0
+        self.segments_opened += 1
+
+    def __enter__(self) -> "EventJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class JournalReader:
+    """
+    Reads journal segments in order and replays them.
+
+    A truncated or unreadable line (e.g. from a crash mid-write) is skipped
+    and counted in corrupt_lines.
+    """
+
+    def __init__(self, directory: Union[str, Path], prefix: str = "events"):
+        """
+        Initialize journal reader.
+
+        Args:
+            directory: Directory holding the journal segments
+            prefix: Segment file name prefix
+        """
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.corrupt_lines = 0
+
+    def segment_indices(self) -> List[int]:
+        """Indices of the segments on disk, in order."""
+        indices = []
+        if self.directory.is_dir():
+            for path in self.directory.glob(f"{self.prefix}.*.jsonl"):
+                index = path.name[len(self.prefix) + 1:-len(".jsonl")]
+                if index.isdigit():
+                    indices.append(int(index))
+        return sorted(indices)
+
+    def segments(self) -> List[Path]:
+        """Segment paths, oldest first."""
+        return [self.directory / f"{self.prefix}.{index:06d}.jsonl" for index in self.segment_indices()]
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Yield raw journal records, oldest first."""
+        for path in self.segments():
+            with open(path, "rb") as segment:
+                for line in segment:
+                    try:
+                        record = json.loads(line)
+                        if record["type"] in _EVENT_TYPES:
+                            yield record
+                            continue
+                    except (ValueError, KeyError, TypeError):
+                        pass
+                    self.corrupt_lines += 1
+
+    def events(self) -> Iterator[Event]:
+        """Yield journaled events as new Event objects (original ID and timestamp kept)."""
+        for record in self.records():
+            yield self._event_from_record(record)
+
+    @staticmethod
+    def _event_from_record(record: Dict[str, Any]) -> Event:
+        """Rebuild an event from a journal record."""
+        event_type = _EVENT_TYPES[record["type"]]
+        priority = record.get("priority")
+        return Event(event_type,
+                     datetime.fromtimestamp(record["t"] / 1e9),
+                     record.get("data"),
+                     record.get("source"),
+                     EventPriority[priority] if priority else None,
+                     f"{event_type.value}_{record['seq']}")
+
+    async def replay(self, target: Any, speed: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Replay the journal into an event system, in journal order.
+
+        Args:
+            target: EventSystem, or an engine whose event_system receives the events
+            speed: Replay speed relative to the recorded pace (None: as fast as possible)
+
+        Returns:
+            Dictionary with events replayed, blocked, recorded span, replay
+            duration and speedup over real time
+        """
+        event_system = getattr(target, "event_system", target)
+        start = time.perf_counter()
+        first_ns = last_ns = None
+        replayed = blocked = 0
+
+        for record in self.records():
+            recorded_ns = record["t"]
+            if first_ns is None:
+                first_ns = recorded_ns
+            last_ns = recorded_ns
+            if speed:
+                delay = (recorded_ns - first_ns) / 1e9 / speed - (time.perf_counter() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            if await event_system.dispatch(self._event_from_record(record)):
+                replayed += 1
+            else:
+                blocked += 1
+
+        duration = time.perf_counter() - start
+        span = (last_ns - first_ns) / 1e9 if first_ns is not None else 0.0
+        return {
+            "events": replayed,
+            "blocked": blocked,
+            "corrupt_lines": self.corrupt_lines,
+            "recorded_span": span,
+            "duration": duration,
+            "speedup": span / duration if duration > 0 else 0.0
+        }
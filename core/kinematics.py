@@ -0,0 +1,150 @@
+"""
+Allocation-free kinematic state for the single-robot movement loop.
+Paths live in a reusable NumPy waypoint buffer and the robot's position and
+current segment endpoints are slotted coordinates updated in place, so a
+steady-state frame creates no objects.
+"""
+
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .layout.coordinate import SmoothCoordinate
+
+
+class WaypointPath:
+    """
+    Preallocated buffer of path waypoints.
+
+    Waypoints are rows of a float64 (aisle, rack) array. load() refills the
+    buffer in place and only grows it when a longer path arrives. Indexing
+    returns SmoothCoordinate copies for callers; the movement loop reads rows
+    straight into its own coordinates with read_into().
+    """
+
+    __slots__ = ("_points", "_length")
+
+    def __init__(self, points: Iterable[Any] = (), capacity: int = 64):
+        """
+        Initialize waypoint buffer.
+
+        Args:
+            points: Initial waypoints (objects with aisle and rack)
+            capacity: Initial number of waypoint rows to allocate
+        """
+        self._points = np.empty((max(capacity, 1), 2), dtype=np.float64)
+        self._length = 0
+        self.load(points)
+
+    @property
+    def capacity(self) -> int:
+        """Number of waypoints the buffer holds without growing."""
+        return len(self._points)
+
+    def load(self, points: Iterable[Any]) -> 'WaypointPath':
+        """
+        Replace the waypoints, reusing the buffer when it is large enough.
+
+        Args:
+            points: Waypoints in visiting order (objects with aisle and rack)
+
+        Returns:
+            This path
+        """
+        points = points if isinstance(points, Sequence) else list(points)
+        count = len(points)
+        if count > len(self._points):
+            self._points = np.empty((max(count, 2 * len(self._points)), 2), dtype=np.float64)
+        buffer = self._points
+        for row, point in enumerate(points):
+            buffer[row, 0] = point.aisle
+            buffer[row, 1] = point.rack
+        self._length = count
+        return self
+
+    def clear(self) -> None:
+        """Remove all waypoints (the buffer is kept)."""
+        self._length = 0
+
+    def read_into(self, index: int, target: SmoothCoordinate) -> None:
+        """Copy waypoint index into an existing coordinate without allocating."""
+        target.move_to(self._points.item(index, 0), self._points.item(index, 1))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[SmoothCoordinate, List[SmoothCoordinate]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("waypoint index out of range")
+        return SmoothCoordinate(self._points.item(index, 0), self._points.item(index, 1))
+
+    def __iter__(self) -> Iterator[SmoothCoordinate]:
+        for index in range(self._length):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        """Equal to any sequence of points with the same (aisle, rack) values."""
+        if isinstance(other, WaypointPath):
+            return self._length == other._length and bool(
+                (self._points[:self._length] == other._points[:other._length]).all())
+        if not isinstance(other, Sequence) or isinstance(other, str) or len(other) != self._length:
+            return NotImplemented if not isinstance(other, Sequence) else False
+        return all(point is not None and self._points.item(index, 0) == point.aisle
+                   and self._points.item(index, 1) == point.rack
+                   for index, point in enumerate(other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Detailed string representation."""
+        return f"WaypointPath({self._length} waypoints, capacity={len(self._points)})"
+
+
+class RobotKinematics:
+    """
+    In-place movement state owned by one robot.
+
+    position is the robot's live position; start and target hold the ends of
+    the current path segment. All three are updated in place by the movement
+    loop and never handed to path storage, so they are never aliased.
+    """
+
+    __slots__ = ("position", "start", "target")
+
+    def __init__(self, aisle: float = 1.0, rack: float = 1.0):
+        """
+        Initialize kinematic state at a position.
+
+        Args:
+            aisle: Initial aisle
+            rack: Initial rack
+        """
+        self.position = SmoothCoordinate(aisle, rack)
+        self.start = SmoothCoordinate(aisle, rack)
+        self.target = SmoothCoordinate(aisle, rack)
+
+    def begin_segment(self, path: Sequence[Any], index: int, current: Any) -> Optional[SmoothCoordinate]:
+        """
+        Load the segment from the current position to waypoint index.
+
+        Args:
+            path: Robot path (WaypointPath, or any sequence of points)
+            index: Waypoint the segment ends at
+            current: Current robot position
+
+        Returns:
+            Segment target, or None if the path holds no waypoint at index
+        """
+        self.start.move_to(current.aisle, current.rack)
+        if isinstance(path, WaypointPath):
+            path.read_into(index, self.target)
+            return self.target
+        point = path[index]
+        if point is None:
+            return None
+        self.target.move_to(point.aisle, point.rack)
+        return self.target
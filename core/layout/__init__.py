@@ -3,24 +3,33 @@ Warehouse layout and grid system package for Roibot simulation.
 
 This package contains the warehouse layout management components:
 - Coordinate: Grid coordinate system with validation
+- WarehouseLayout: Independent array-backed warehouse grid
 - WarehouseLayoutManager: Main layout manager with singleton pattern
 - SnakePattern: Bidirectional snake path navigation logic
 - DistanceTracker: Distance calculation and KPI tracking
+- RouteTable: Precomputed shortest distances and routes between all cells
+- PickSequencer: Shortest-tour ordering of pick locations
 """
 
 from .coordinate import Coordinate, CoordinateError
-from .warehouse_layout import WarehouseLayoutManager
+from .warehouse_layout import WarehouseLayout, WarehouseLayoutManager
 from .snake_pattern import SnakePattern, Direction
 from .packout_zone import PackoutZoneManager, PackoutZoneType
 from .distance_tracker import DistanceTracker
+from .route_table import RouteTable, get_route_table
+from .pick_sequencer import PickSequencer
 
 __all__ = [
     'Coordinate',
     'CoordinateError',
+    'WarehouseLayout',
     'WarehouseLayoutManager',
     'SnakePattern',
     'Direction',
     'PackoutZoneManager',
     'PackoutZoneType',
-    'DistanceTracker'
+    'DistanceTracker',
+    'RouteTable',
+    'get_route_table',
+    'PickSequencer'
 ] 
\ No newline at end of file
@@ -15,6 +15,7 @@ from core.layout.coordinate import Coordinate
 from core.layout.snake_pattern import SnakePattern
 from core.layout.warehouse_layout import WarehouseLayoutManager
 from core.layout.aisle_timing_manager import AisleTimingManager
+from core.layout.pick_sequencer import PickSequencer
 
 
 class Direction(Enum):
@@ -66,6 +67,9 @@ class BidirectionalPathCalculator:
         # Initialize timing manager
         self.timing_manager = AisleTimingManager(config)
         
+        # Pick sequencing over the shared route table
+        self.pick_sequencer = PickSequencer(warehouse_layout.get_route_table())
+        
         # Apply configuration if provided
         if config:
             self.configure(config)
@@ -160,7 +164,7 @@ class BidirectionalPathCalculator:
     
     def calculate_complete_path_for_items(self, start_pos: Coordinate, item_positions: List[Coordinate]) -> CompletePath:
         """
-        Calculate complete path for all items in ascending order.
+        Calculate complete path for all items in the shortest pick order.
         
         Args:
             start_pos: Starting position of robot
@@ -172,8 +176,9 @@ class BidirectionalPathCalculator:
         if not item_positions:
             return CompletePath([], 0.0, 0.0, 0, [], [])
         
-        # Sort items in ascending order (as per requirements)
-        sorted_items = sorted(item_positions, key=lambda pos: (pos.aisle, pos.rack))
+        # Order items for the shortest tour that ends back at packout
+        # (ascending order is kept unless another order is strictly shorter)
+        sorted_items = self.pick_sequencer.sequence(start_pos, item_positions, end=Coordinate(1, 1))
         
         complete_segments = []
         total_distance = 0.0
@@ -276,12 +276,18 @@ class CompletePathPlanner:
         """
         return self.path_calculator.get_path_statistics(path)
     
-    def optimize_item_order(self, item_positions: List[Coordinate]) -> List[Coordinate]:
+    def optimize_item_order(self, item_positions: List[Coordinate],
+                            start_pos: Optional[Coordinate] = None) -> List[Coordinate]:
         """
         Optimize the order of items for collection.
         
+        Solves the pick tour from start_pos back to packout exactly for small
+        orders and heuristically for large ones. Ascending (aisle, rack) order
+        is kept unless another order is strictly shorter.
+        
         Args:
             item_positions: List of item positions
+            start_pos: Starting position (default: packout)
             
         Returns:
             Optimized list of item positions
@@ -289,9 +295,8 @@ class CompletePathPlanner:
         if not item_positions:
             return []
         
-        # For now, use ascending order as per requirements
-        # In future phases, this could implement more sophisticated optimization
-        return sorted(item_positions, key=lambda pos: (pos.aisle, pos.rack))
+        packout = Coordinate(1, 1)
+        return self.path_calculator.pick_sequencer.sequence(start_pos or packout, item_positions, end=packout)
     
     def get_execution_statistics(self) -> Dict[str, Any]:
         """Get execution statistics."""
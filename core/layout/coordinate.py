@@ -3,6 +3,8 @@ Grid coordinate system for warehouse layout.
 
 This module provides the Coordinate class for representing warehouse grid positions
 with 1-based indexing (Aisle 1-25, Rack 1-20) and comprehensive validation.
+Coordinate.of() returns interned instances for the fixed grid, so hot paths can
+share one pre-validated, pre-hashed object per cell.
 """
 
 from dataclasses import dataclass
@@ -20,6 +22,10 @@ class Coordinate:
     """
     Represents a warehouse grid coordinate with 1-based indexing.
     
+    The hash and cell ID are computed once at construction. Use Coordinate.of()
+    for grid cells: it returns one shared instance per cell, so dictionary and
+    set lookups keyed by interned coordinates match on identity.
+    
     Attributes:
         aisle: Aisle number (1-25)
         rack: Rack number (1-20)
@@ -29,8 +35,37 @@ class Coordinate:
     rack: int
     
     def __post_init__(self):
-        """Validate coordinate bounds after initialization."""
+        """Validate coordinate bounds and precompute the hash after initialization."""
         self._validate_bounds()
+        object.__setattr__(self, "_hash", hash((self.aisle, self.rack)))
+        object.__setattr__(self, "_cell_id", (self.aisle - 1) * 20 + (self.rack - 1))
+    
+    @classmethod
+    def of(cls, aisle: int, rack: int) -> 'Coordinate':
+        """
+        Get the interned coordinate for a grid cell.
+        
+        Args:
+            aisle: Aisle number (1-25)
+            rack: Rack number (1-20)
+            
+        Returns:
+            Shared Coordinate instance for the cell
+            
+        Raises:
+            CoordinateError: If coordinate is invalid
+        """
+        if 1 <= aisle <= 25 and 1 <= rack <= 20:
+            try:
+                return _INTERNED[aisle][rack]
+            except TypeError:
+                pass  # Non-integer values are not interned
+        return cls(aisle, rack)
+    
+    @property
+    def cell_id(self) -> int:
+        """Row-major cell index on the 25x20 grid: (aisle - 1) * 20 + (rack - 1)."""
+        return self._cell_id
     
     def _validate_bounds(self):
         """Validate that coordinate is within warehouse bounds."""
@@ -133,30 +168,42 @@ class Coordinate:
     
     def __eq__(self, other) -> bool:
         """Equality comparison."""
+        if self is other:
+            return True
         if not isinstance(other, Coordinate):
             return False
         return self.aisle == other.aisle and self.rack == other.rack
     
     def __hash__(self) -> int:
-        """Hash for use in sets and dictionaries."""
-        return hash((self.aisle, self.rack))
+        """Hash for use in sets and dictionaries (precomputed)."""
+        return self._hash
+
+
+# Interned grid coordinates, indexed [aisle][rack]; index 0 is unused
+_INTERNED = [None] + [
+    [None] + [Coordinate(aisle, rack) for rack in range(1, 21)]
+    for aisle in range(1, 26)
+]
 
 
-@dataclass
 class SmoothCoordinate:
     """
     Represents a warehouse grid coordinate with floating-point precision for smooth movement.
     
+    Instances are slotted and mutable: the constructor validates bounds, while
+    move_to() updates a position in place without validation so per-frame
+    movement does not allocate.
+    
     Attributes:
         aisle: Aisle number (float for smooth interpolation)
         rack: Rack number (float for smooth interpolation)
     """
     
-    aisle: float
-    rack: float
+    __slots__ = ("aisle", "rack")
     
-    def __post_init__(self):
-        """Validate coordinate bounds after initialization."""
+    def __init__(self, aisle: float, rack: float):
+        self.aisle = aisle
+        self.rack = rack
         self._validate_bounds()
     
     def _validate_bounds(self):
@@ -166,14 +213,31 @@ class SmoothCoordinate:
         if not (1.0 <= self.rack <= 20.0):
             raise CoordinateError(f"Rack must be between 1.0 and 20.0, got {self.rack}")
     
+    def move_to(self, aisle: float, rack: float) -> None:
+        """Update the coordinate in place (unvalidated; callers keep it in bounds)."""
+        self.aisle = aisle
+        self.rack = rack
+    
+    def copy(self) -> 'SmoothCoordinate':
+        """Get an independent copy of this coordinate."""
+        return SmoothCoordinate(self.aisle, self.rack)
+    
     def to_coordinate(self) -> Coordinate:
         """Convert to integer Coordinate for grid operations."""
-        return Coordinate(int(self.aisle), int(self.rack))
+        return Coordinate.of(int(self.aisle), int(self.rack))
     
     def distance_to(self, other: 'SmoothCoordinate') -> float:
         """Calculate Manhattan distance to another coordinate."""
         return abs(self.aisle - other.aisle) + abs(self.rack - other.rack)
     
+    def __eq__(self, other) -> bool:
+        """Equality comparison."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.aisle == other.aisle and self.rack == other.rack
+    
+    __hash__ = None  # Mutable, so not hashable
+    
     def __str__(self) -> str:
         """String representation: (aisle, rack)."""
         return f"({self.aisle:.2f}, {self.rack:.2f})"
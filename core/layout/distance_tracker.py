@@ -15,6 +15,7 @@ from .coordinate import Coordinate
 from .warehouse_layout import WarehouseLayoutManager
 from .snake_pattern import SnakePattern, Direction
 from .packout_zone import PackoutZoneManager
+from core.determinism import SimulationClock, get_clock
 
 
 class DistanceEventType(Enum):
@@ -48,8 +49,14 @@ class DistanceTracker:
     with EventSystem integration.
     """
     
-    def __init__(self):
-        """Initialize the distance tracker."""
+    def __init__(self, clock: Optional[SimulationClock] = None):
+        """
+        Initialize the distance tracker.
+        
+        Args:
+            clock: Simulation clock for event timestamps (default: the process-wide clock)
+        """
+        self._clock = clock or get_clock()
         self._total_distance: float = 0.0
         self._order_distances: Dict[str, float] = {}
         self._robot_distances: Dict[str, float] = {}
@@ -60,6 +67,7 @@ class DistanceTracker:
         self._layout_manager = WarehouseLayoutManager()
         self._snake_navigator = SnakePattern()
         self._packout_manager = PackoutZoneManager(self._layout_manager)
+        self._route_table = self._layout_manager.get_route_table()
     
     @property
     def total_distance(self) -> float:
@@ -109,7 +117,7 @@ class DistanceTracker:
     def calculate_optimal_path_distance(self, from_coord: Coordinate, to_coord: Coordinate, 
                                      direction: Direction = Direction.FORWARD) -> float:
         """
-        Calculate optimal path distance using snake pattern navigation.
+        Calculate optimal path distance under the warehouse navigation rules.
         
         Args:
             from_coord: Starting coordinate
@@ -117,11 +125,9 @@ class DistanceTracker:
             direction: Robot movement direction
             
         Returns:
-            Optimal path distance using snake pattern
+            Number of moves on the shortest route (O(1) route table lookup)
         """
-
-        path = self._snake_navigator.get_path_to_target(from_coord, to_coord)
-        return len(path) - 1  # Distance is number of moves, not number of positions
+        return self._route_table.distance(from_coord, to_coord)
     
     def track_robot_move(self, robot_id: str, from_coord: Coordinate, to_coord: Coordinate,
                         direction: Direction = Direction.FORWARD) -> float:
@@ -157,7 +163,7 @@ class DistanceTracker:
             from_coord=from_coord,
             to_coord=to_coord,
             distance=distance,
-            timestamp=datetime.now(),
+            timestamp=self._clock.now(),
             robot_id=robot_id
         )
         self._events.append(event)
@@ -182,7 +188,7 @@ class DistanceTracker:
             from_coord=start_coord,
             to_coord=start_coord,
             distance=0.0,
-            timestamp=datetime.now(),
+            timestamp=self._clock.now(),
             order_id=order_id,
             robot_id=robot_id
         )
@@ -214,7 +220,7 @@ class DistanceTracker:
             from_coord=from_coord,
             to_coord=to_coord,
             distance=distance,
-            timestamp=datetime.now(),
+            timestamp=self._clock.now(),
             order_id=order_id,
             robot_id=robot_id
         )
@@ -249,7 +255,7 @@ class DistanceTracker:
             from_coord=from_coord,
             to_coord=packout_coord,
             distance=distance,
-            timestamp=datetime.now(),
+            timestamp=self._clock.now(),
             order_id=order_id,
             robot_id=robot_id
         )
@@ -282,7 +288,7 @@ class DistanceTracker:
             from_coord=from_coord,
             to_coord=start_coord,
             distance=distance,
-            timestamp=datetime.now(),
+            timestamp=self._clock.now(),
             robot_id=robot_id
         )
         self._events.append(event)
@@ -309,7 +315,7 @@ class DistanceTracker:
             from_coord=final_coord,
             to_coord=final_coord,
             distance=total_order_distance,
-            timestamp=datetime.now(),
+            timestamp=self._clock.now(),
             order_id=order_id,
             robot_id=robot_id,
             metadata={"total_order_distance": total_order_distance}
@@ -10,6 +10,7 @@ from enum import Enum
 
 from .coordinate import Coordinate, CoordinateError
 from .warehouse_layout import WarehouseLayoutManager, GridState
+from .pick_sequencer import PickSequencer
 
 
 class PackoutZoneType(Enum):
@@ -38,6 +39,8 @@ class PackoutZoneManager:
         self.packout_location = Coordinate(1, 1)
         self.restricted_zones: List[Coordinate] = []
         self.transit_zones: List[Coordinate] = []
+        self.route_table = warehouse_layout.get_route_table()
+        self.pick_sequencer = PickSequencer(self.route_table)
         
         # Initialize restricted zones (adjacent to packout)
         self._initialize_restricted_zones()
@@ -153,9 +156,9 @@ class PackoutZoneManager:
             coord: Target coordinate
             
         Returns:
-            Manhattan distance from packout to coordinate
+            Route distance from packout to coordinate
         """
-        return self.packout_location.distance_to(coord)
+        return self.route_table.distance(self.packout_location, coord)
     
     def get_euclidean_distance_from_packout(self, coord: Coordinate) -> float:
         """
@@ -234,9 +237,9 @@ class PackoutZoneManager:
             coord: Starting coordinate
             
         Returns:
-            Manhattan distance to packout
+            Route distance to packout
         """
-        return self.packout_location.distance_to(coord)
+        return self.route_table.distance(self.packout_location, coord)
     
     def get_packout_zone_statistics(self) -> Dict[str, any]:
         """
@@ -350,8 +353,8 @@ class PackoutZoneManager:
         if not is_valid:
             raise ValueError(f"Invalid pickup locations: {'; '.join(errors)}")
         
-        # Sort locations by distance from start for simple optimization
-        sorted_locations = sorted(pickup_locations, key=lambda coord: start.distance_to(coord))
+        # Visit locations in the shortest order that ends back at packout
+        sorted_locations = self.pick_sequencer.sequence(start, pickup_locations, end=self.packout_location)
         
         # Build route
         route = [start]
@@ -0,0 +1,245 @@
+"""
+Pick sequencing for multi-item orders.
+
+This module provides the PickSequencer class, which orders the pick locations
+of an order to minimize travel under the warehouse navigation rules. Distances
+come from the shared RouteTable, so the boundary-rack rule is respected.
+
+- Orders with up to exact_limit distinct locations are solved exactly with
+  Held-Karp dynamic programming (vectorized per subset size)
+- Larger orders start from the better of nearest-neighbour and ascending
+  (aisle, rack) order, then improve with 2-opt and Or-opt moves
+
+Results are memoized by (start, end, location set). The ascending order is
+kept whenever the optimized sequence is no shorter, so sequences only change
+when they save distance.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .coordinate import Coordinate
+from .route_table import RouteTable
+
+
+class PickSequencer:
+    """
+    Shortest-tour ordering of pick locations.
+
+    A tour starts at a start position, visits every location once and
+    optionally ends at an end position (e.g. packout).
+    """
+
+    def __init__(self, route_table: RouteTable, exact_limit: int = 12, cache_size: int = 1024):
+        """
+        Initialize pick sequencer.
+
+        Args:
+            route_table: Route table for the warehouse layout
+            exact_limit: Largest number of distinct locations solved exactly
+            cache_size: Number of memoized sequences to keep
+        """
+        self.route_table = route_table
+        self.exact_limit = exact_limit
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[int, int, Tuple[int, ...]], Tuple[int, ...]]" = OrderedDict()
+        self.stats = {"cache_hits": 0, "cache_misses": 0, "exact_solves": 0, "heuristic_solves": 0}
+
+    def sequence(self, start: Coordinate, locations: List[Coordinate],
+                 end: Optional[Coordinate] = None) -> List[Coordinate]:
+        """
+        Order pick locations to minimize travel distance.
+
+        Args:
+            start: Starting position
+            locations: Pick locations (duplicates are visited together)
+            end: Position the tour must finish at (None for an open tour)
+
+        Returns:
+            The given locations reordered
+        """
+        if len(locations) < 2:
+            return list(locations)
+
+        table = self.route_table
+        by_cell: Dict[int, List[Coordinate]] = {}
+        for location in locations:
+            by_cell.setdefault(table.cell_id(location), []).append(location)
+
+        cells = tuple(sorted(by_cell))
+        start_cell = table.cell_id(start)
+        end_cell = table.cell_id(end) if end is not None else -1
+        key = (start_cell, end_cell, cells)
+
+        order = self._cache.get(key)
+        if order is not None:
+            self._cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+        else:
+            self.stats["cache_misses"] += 1
+            order = self._solve(start_cell, end_cell, cells)
+            self._cache[key] = order
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return [location for cell in order for location in by_cell[cell]]
+
+    def tour_distance(self, start: Coordinate, locations: List[Coordinate],
+                      end: Optional[Coordinate] = None) -> int:
+        """
+        Get the travel distance visiting locations in the given order.
+
+        Args:
+            start: Starting position
+            locations: Pick locations in visiting order
+            end: Final position (None for an open tour)
+
+        Returns:
+            Total route distance
+        """
+        stops = [start] + list(locations) + ([end] if end is not None else [])
+        return self.route_table.path_distance(stops)
+
+    def clear_cache(self) -> None:
+        """Forget all memoized sequences."""
+        self._cache.clear()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get sequencing and cache statistics."""
+        return {**self.stats, "cached_sequences": len(self._cache)}
+
+    def _solve(self, start_cell: int, end_cell: int, cells: Tuple[int, ...]) -> Tuple[int, ...]:
+        """Order distinct cells, returning them as a tuple of cell IDs."""
+        distances = self.route_table.distances
+        index = np.array(cells)
+        between = distances[np.ix_(index, index)].astype(np.int64)
+        from_start = distances[start_cell, index].astype(np.int64)
+        to_end = (distances[index, end_cell].astype(np.int64) if end_cell >= 0
+                  else np.zeros(len(cells), dtype=np.int64))
+
+        # Ascending (aisle, rack) order is the baseline; cells are already sorted that way
+        baseline = list(range(len(cells)))
+        if len(cells) <= self.exact_limit:
+            self.stats["exact_solves"] += 1
+            order = self._held_karp(between, from_start, to_end)
+        else:
+            self.stats["heuristic_solves"] += 1
+            order = self._local_search(between, from_start, to_end, baseline)
+
+        if self._cost(order, between, from_start, to_end) >= self._cost(baseline, between, from_start, to_end):
+            order = baseline
+        return tuple(cells[i] for i in order)
+
+    @staticmethod
+    def _cost(order: List[int], between: np.ndarray, from_start: np.ndarray, to_end: np.ndarray) -> int:
+        """Tour length of an order of item indices."""
+        cost = int(from_start[order[0]]) + int(to_end[order[-1]])
+        for previous, following in zip(order, order[1:]):
+            cost += int(between[previous, following])
+        return cost
+
+    @staticmethod
+    def _held_karp(between: np.ndarray, from_start: np.ndarray, to_end: np.ndarray) -> List[int]:
+        """
+        Exact shortest tour by dynamic programming over subsets.
+
+        cost[mask, k] is the shortest route from the start through the items in
+        mask, ending at item k. Each (mask, k) has a single predecessor subset
+        mask without k, so a whole subset-size layer updates in one step.
+        """
+        count = len(from_start)
+        unreachable = np.iinfo(np.int64).max // 4
+        masks = np.arange(1 << count)
+        members = ((masks[:, None] >> np.arange(count)) & 1).astype(bool)
+        sizes = members.sum(axis=1)
+
+        cost = np.full((1 << count, count), unreachable, dtype=np.int64)
+        parent = np.full((1 << count, count), -1, dtype=np.int8)
+        singles = 1 << np.arange(count)
+        cost[singles, np.arange(count)] = from_start
+
+        for size in range(1, count):
+            layer = masks[sizes == size]
+            # candidates[m, j, k]: reach k next after ending subset layer[m] at j
+            candidates = cost[layer][:, :, None] + between[None, :, :]
+            previous = candidates.argmin(axis=1)
+            best = np.take_along_axis(candidates, previous[:, None, :], axis=1)[:, 0, :]
+            rows, items = np.nonzero(~members[layer])
+            extended = layer[rows] | (1 << items)
+            cost[extended, items] = best[rows, items]
+            parent[extended, items] = previous[rows, items]
+
+        full = (1 << count) - 1
+        last = int(np.argmin(cost[full] + to_end))
+        order = []
+        mask = full
+        while last >= 0:
+            order.append(last)
+            last, mask = int(parent[mask, last]), mask & ~(1 << last)
+        order.reverse()
+        return order
+
+    def _local_search(self, between: np.ndarray, from_start: np.ndarray, to_end: np.ndarray,
+                      baseline: List[int]) -> List[int]:
+        """Nearest-neighbour construction improved with 2-opt and Or-opt moves."""
+        count = len(from_start)
+        # Extend the matrix with the start (count) and end (count + 1) nodes
+        size = count + 2
+        matrix = np.zeros((size, size), dtype=np.int64)
+        matrix[:count, :count] = between
+        matrix[count, :count] = matrix[:count, count] = from_start
+        matrix[count + 1, :count] = matrix[:count, count + 1] = to_end
+        distance = matrix.tolist()
+
+        unvisited = set(range(count))
+        current = count
+        greedy = []
+        while unvisited:
+            current = min(unvisited, key=lambda item: (distance[current][item], item))
+            greedy.append(current)
+            unvisited.remove(current)
+
+        order = min((greedy, list(baseline)), key=lambda o: self._cost(o, between, from_start, to_end))
+        tour = [count] + order + [count + 1]
+
+        improved = True
+        while improved:
+            improved = self._two_opt(tour, distance) or self._or_opt(tour, distance)
+        return tour[1:-1]
+
+    @staticmethod
+    def _two_opt(tour: List[int], distance: List[List[int]]) -> bool:
+        """Apply the first improving segment reversal; the endpoints stay fixed."""
+        last = len(tour) - 1
+        for i in range(1, last - 1):
+            a, b = tour[i - 1], tour[i]
+            for j in range(i + 1, last):
+                c, d = tour[j], tour[j + 1]
+                if distance[a][c] + distance[b][d] < distance[a][b] + distance[c][d]:
+                    tour[i:j + 1] = reversed(tour[i:j + 1])
+                    return True
+        return False
+
+    @staticmethod
+    def _or_opt(tour: List[int], distance: List[List[int]]) -> bool:
+        """Apply the first improving move of a 1-3 item run to another position."""
+        last = len(tour) - 1
+        for length in (1, 2, 3):
+            for i in range(1, last - length + 1):
+                j = i + length - 1
+                before, first, final, after = tour[i - 1], tour[i], tour[j], tour[j + 1]
+                removed = distance[before][first] + distance[final][after] - distance[before][after]
+                for k in range(0, last):
+                    if i - 1 <= k <= j:
+                        continue
+                    left, right = tour[k], tour[k + 1]
+                    added = distance[left][first] + distance[final][right] - distance[left][right]
+                    if added < removed:
+                        segment = tour[i:j + 1]
+                        del tour[i:j + 1]
+                        insert_at = k + 1 if k < i else k + 1 - length
+                        tour[insert_at:insert_at] = segment
+                        return True
+        return False
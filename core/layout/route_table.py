@@ -0,0 +1,280 @@
+"""
+Precomputed all-pairs routing for the warehouse grid.
+
+This module provides the RouteTable class, which holds the shortest distance
+between every pair of grid cells under the warehouse navigation rules:
+- Movement along racks is allowed within any aisle
+- Movement across aisles is only allowed on the boundary racks (1 and max_rack)
+
+Distances are stored as a dense NumPy matrix indexed by cell ID, so lookups are
+O(1). Routes are encoded as the boundary rack used for each pair (0 when start
+and target share an aisle), which is enough to rebuild any route in O(path).
+Tables depend only on the layout dimensions and can be cached to disk.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .coordinate import Coordinate
+
+
+class RouteTable:
+    """
+    All-pairs shortest distances and routes for a warehouse layout.
+
+    Cells are numbered row-major by aisle: cell_id = (aisle - 1) * max_rack + (rack - 1).
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, max_aisle: int = 25, max_rack: int = 20):
+        """
+        Build route table for a warehouse layout.
+
+        Args:
+            max_aisle: Number of aisles
+            max_rack: Number of racks per aisle
+
+        Raises:
+            ValueError: If either dimension is less than 1
+        """
+        if max_aisle < 1 or max_rack < 1:
+            raise ValueError(f"Invalid layout dimensions: {max_aisle}x{max_rack}")
+
+        self.max_aisle = max_aisle
+        self.max_rack = max_rack
+        self.distances, self.boundary_racks = self._build(max_aisle, max_rack)
+
+    @staticmethod
+    def _build(max_aisle: int, max_rack: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute distance and boundary-rack matrices for every cell pair.
+
+        A cross-aisle route goes to a boundary rack, along it to the target
+        aisle, then along the target aisle. The cheaper boundary wins; ties go
+        to the boundary nearest the start (rack 1 if equidistant), which keeps
+        the choice stable at every cell along the chosen route.
+        """
+        cells = np.arange(max_aisle * max_rack)
+        aisles = cells // max_rack
+        racks = cells % max_rack
+        last = max_rack - 1
+
+        from_aisle, to_aisle = aisles[:, None], aisles[None, :]
+        from_rack, to_rack = racks[:, None], racks[None, :]
+
+        aisle_span = np.abs(from_aisle - to_aisle)
+        via_first = from_rack + to_rack + aisle_span
+        via_last = (last - from_rack) + (last - to_rack) + aisle_span
+        use_first = (via_first < via_last) | ((via_first == via_last) & (from_rack <= last - from_rack))
+
+        same_aisle = aisle_span == 0
+        distances = np.where(same_aisle, np.abs(from_rack - to_rack),
+                             np.where(use_first, via_first, via_last))
+        boundary_racks = np.where(same_aisle, 0, np.where(use_first, 1, max_rack))
+
+        distance_dtype = np.int16 if max_aisle + 2 * max_rack < np.iinfo(np.int16).max else np.int32
+        return distances.astype(distance_dtype), boundary_racks.astype(np.min_scalar_type(max_rack))
+
+    @property
+    def cell_count(self) -> int:
+        """Number of cells in the layout."""
+        return self.max_aisle * self.max_rack
+
+    def cell_id(self, coord: Coordinate) -> int:
+        """Get the cell ID of a coordinate."""
+        return (int(coord.aisle) - 1) * self.max_rack + (int(coord.rack) - 1)
+
+    def coordinate(self, cell_id: int) -> Coordinate:
+        """Get the coordinate of a cell ID."""
+        aisle, rack = divmod(int(cell_id), self.max_rack)
+        return Coordinate.of(aisle + 1, rack + 1)
+
+    def distance(self, start: Coordinate, target: Coordinate) -> int:
+        """
+        Get the shortest route distance between two coordinates.
+
+        Args:
+            start: Starting coordinate
+            target: Target coordinate
+
+        Returns:
+            Number of moves on the shortest rule-compliant route
+        """
+        return int(self.distances[self.cell_id(start), self.cell_id(target)])
+
+    def distances_from(self, start: Coordinate) -> np.ndarray:
+        """Get distances from a coordinate to every cell, indexed by cell ID."""
+        return self.distances[self.cell_id(start)]
+
+    def path_distance(self, points: List[Coordinate]) -> int:
+        """
+        Get the total route distance visiting points in order.
+
+        Args:
+            points: Coordinates to visit in order
+
+        Returns:
+            Sum of shortest route distances between consecutive points
+        """
+        if len(points) < 2:
+            return 0
+        cell_ids = np.fromiter((self.cell_id(point) for point in points), dtype=np.int64, count=len(points))
+        return int(self.distances[cell_ids[:-1], cell_ids[1:]].sum())
+
+    def waypoints(self, start: Coordinate, target: Coordinate) -> List[Coordinate]:
+        """
+        Get the corners of the shortest route, including start and target.
+
+        Args:
+            start: Starting coordinate
+            target: Target coordinate
+
+        Returns:
+            Start, any turning points, and target (just [start] if equal)
+        """
+        start = Coordinate.of(int(start.aisle), int(start.rack))
+        target = Coordinate.of(int(target.aisle), int(target.rack))
+        if start == target:
+            return [start]
+
+        boundary = int(self.boundary_racks[self.cell_id(start), self.cell_id(target)])
+        points = [start]
+        if boundary:
+            if start.rack != boundary:
+                points.append(Coordinate.of(start.aisle, boundary))
+            points.append(Coordinate.of(target.aisle, boundary))
+        if points[-1] != target:
+            points.append(target)
+        return points
+
+    def route(self, start: Coordinate, target: Coordinate) -> List[Coordinate]:
+        """
+        Get every cell on the shortest route, including start and target.
+
+        Args:
+            start: Starting coordinate
+            target: Target coordinate
+
+        Returns:
+            List of adjacent coordinates from start to target (just [start] if equal)
+        """
+        corners = self.waypoints(start, target)
+        path = [corners[0]]
+        for corner in corners[1:]:
+            current = path[-1]
+            if corner.aisle != current.aisle:
+                step = 1 if corner.aisle > current.aisle else -1
+                path.extend(Coordinate.of(aisle, current.rack)
+                            for aisle in range(current.aisle + step, corner.aisle + step, step))
+            else:
+                step = 1 if corner.rack > current.rack else -1
+                path.extend(Coordinate.of(current.aisle, rack)
+                            for rack in range(current.rack + step, corner.rack + step, step))
+        return path
+
+    @staticmethod
+    def cache_filename(max_aisle: int, max_rack: int) -> str:
+        """Get the cache file name for a layout."""
+        return f"route_table_{max_aisle}x{max_rack}_v{RouteTable.FORMAT_VERSION}.npz"
+
+    def save(self, path: str) -> None:
+        """
+        Save route table to a .npz file.
+
+        Args:
+            path: Destination file path
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial table
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as handle:
+            np.savez(handle,
+                     version=self.FORMAT_VERSION,
+                     dimensions=np.array([self.max_aisle, self.max_rack]),
+                     distances=self.distances,
+                     boundary_racks=self.boundary_racks)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'RouteTable':
+        """
+        Load route table from a .npz file.
+
+        Args:
+            path: Source file path
+
+        Returns:
+            Loaded route table
+
+        Raises:
+            ValueError: If the file has an unsupported version or inconsistent shape
+        """
+        with np.load(path) as data:
+            if int(data["version"]) != cls.FORMAT_VERSION:
+                raise ValueError(f"Unsupported route table version: {int(data['version'])}")
+            max_aisle, max_rack = (int(value) for value in data["dimensions"])
+            distances = data["distances"]
+            boundary_racks = data["boundary_racks"]
+
+        cell_count = max_aisle * max_rack
+        if distances.shape != (cell_count, cell_count) or boundary_racks.shape != distances.shape:
+            raise ValueError(f"Route table shape does not match {max_aisle}x{max_rack} layout")
+
+        table = cls.__new__(cls)
+        table.max_aisle = max_aisle
+        table.max_rack = max_rack
+        table.distances = distances
+        table.boundary_racks = boundary_racks
+        return table
+
+    def __str__(self) -> str:
+        """String representation of route table."""
+        return f"RouteTable({self.max_aisle}x{self.max_rack})"
+
+    def __repr__(self) -> str:
+        """Detailed string representation of route table."""
+        return f"RouteTable(max_aisle={self.max_aisle}, max_rack={self.max_rack})"
+
+
+_route_tables: Dict[Tuple[int, int], RouteTable] = {}
+
+
+def get_route_table(max_aisle: int = 25, max_rack: int = 20,
+                    cache_dir: Optional[str] = None) -> RouteTable:
+    """
+    Get the shared route table for a layout, building it at most once per process.
+
+    Args:
+        max_aisle: Number of aisles
+        max_rack: Number of racks per aisle
+        cache_dir: Optional directory for an on-disk cache keyed by layout dimensions
+
+    Returns:
+        Shared RouteTable instance
+    """
+    key = (max_aisle, max_rack)
+    table = _route_tables.get(key)
+    if table is not None:
+        return table
+
+    cache_path = os.path.join(cache_dir, RouteTable.cache_filename(*key)) if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            table = RouteTable.load(cache_path)
+        except (OSError, ValueError, KeyError):
+            table = None
+        if table is not None and (table.max_aisle, table.max_rack) != key:
+            table = None
+
+    if table is None:
+        table = RouteTable(max_aisle, max_rack)
+        if cache_path:
+            table.save(cache_path)
+
+    _route_tables[key] = table
+    return table
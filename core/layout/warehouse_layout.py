@@ -1,15 +1,21 @@
 """
 Warehouse layout manager for grid system management.
 
-This module provides the WarehouseLayoutManager singleton class for managing
-the 25x20 warehouse grid, coordinate validation, and grid state management.
+This module provides the WarehouseLayout class for managing a warehouse grid,
+coordinate validation, and grid state management, and the WarehouseLayoutManager
+singleton for the shared 25x20 warehouse. Cell states live in a uint8 NumPy
+array indexed by cell ID, so bulk queries are vectorized and any number of
+independent layouts can exist in one process.
 """
 
 from typing import Dict, List, Optional, Tuple, Set
 from enum import Enum
 import json
 
+import numpy as np
+
 from .coordinate import Coordinate, CoordinateError, get_warehouse_bounds
+from .route_table import RouteTable, get_route_table
 
 
 class GridState(Enum):
@@ -20,47 +26,80 @@ class GridState(Enum):
     RESERVED = "reserved"
 
 
-class WarehouseLayoutManager:
+# Cell state codes stored in the grid array, in GridState declaration order
+_STATES = tuple(GridState)
+_STATE_CODES = {state: code for code, state in enumerate(_STATES)}
+_EMPTY = _STATE_CODES[GridState.EMPTY]
+_OCCUPIED = _STATE_CODES[GridState.OCCUPIED]
+_PACKOUT = _STATE_CODES[GridState.PACKOUT]
+
+
+class WarehouseLayout:
     """
-    Singleton class for managing warehouse grid layout and state.
+    Warehouse grid layout and state.
     
-    Manages the 25x20 warehouse grid with coordinate validation,
-    grid state tracking, and integration with existing systems.
+    Cell states are stored as uint8 codes in the cells array, indexed by
+    cell_id = (aisle - 1) * max_rack + (rack - 1), the same numbering RouteTable
+    uses. Occupied cells are those holding an item or the packout station.
+    Layouts are independent: create one per simulated warehouse.
     """
     
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls):
-        """Ensure singleton pattern - only one instance exists."""
-        if cls._instance is None:
-            cls._instance = super(WarehouseLayoutManager, cls).__new__(cls)
-        return cls._instance
-    
-    def __init__(self):
-        """Initialize warehouse layout manager (only once)."""
-        if not self._initialized:
-            self._initialize_grid()
-            self._initialized = True
+    def __init__(self, max_aisle: Optional[int] = None, max_rack: Optional[int] = None):
+        """
+        Initialize warehouse layout.
+        
+        Args:
+            max_aisle: Number of aisles (defaults to the warehouse bounds)
+            max_rack: Number of racks per aisle (defaults to the warehouse bounds)
+        
+        Raises:
+            ValueError: If the dimensions exceed the coordinate bounds
+        """
+        bound_aisle, bound_rack = get_warehouse_bounds()
+        self.max_aisle = bound_aisle if max_aisle is None else max_aisle
+        self.max_rack = bound_rack if max_rack is None else max_rack
+        if not (1 <= self.max_aisle <= bound_aisle and 1 <= self.max_rack <= bound_rack):
+            raise ValueError(f"Layout must be between 1x1 and {bound_aisle}x{bound_rack}, "
+                             f"got {self.max_aisle}x{self.max_rack}")
+        
+        # Interned coordinate of every cell, indexed by cell ID
+        self._coordinates = [Coordinate.of(aisle, rack)
+                             for aisle in range(1, self.max_aisle + 1)
+                             for rack in range(1, self.max_rack + 1)]
+        self._initialize_grid()
     
     def _initialize_grid(self):
         """Initialize the warehouse grid and state."""
-        self.max_aisle, self.max_rack = get_warehouse_bounds()
-        self.grid_state: Dict[Coordinate, GridState] = {}
-        self.occupied_positions: Set[Coordinate] = set()
-        self.packout_location = Coordinate(1, 1)
-        
-        # Initialize all grid positions as empty
-        for aisle in range(1, self.max_aisle + 1):
-            for rack in range(1, self.max_rack + 1):
-                coord = Coordinate(aisle, rack)
-                if coord.is_packout_location():
-                    self.grid_state[coord] = GridState.PACKOUT
-                else:
-                    self.grid_state[coord] = GridState.EMPTY
-        
-        # Mark packout as occupied
-        self.occupied_positions.add(self.packout_location)
+        self.cells = np.full(self.max_aisle * self.max_rack, _EMPTY, dtype=np.uint8)
+        self.packout_location = Coordinate.of(1, 1)
+        self.cells[self.cell_id(self.packout_location)] = _PACKOUT
+    
+    @property
+    def grid_state(self) -> Dict[Coordinate, GridState]:
+        """State of every cell keyed by coordinate (built on demand)."""
+        return {coord: _STATES[code] for coord, code in zip(self._coordinates, self.cells.tolist())}
+    
+    @property
+    def occupied_positions(self) -> Set[Coordinate]:
+        """Occupied cells (built on demand)."""
+        return set(self._coordinates_where(self._occupied_mask()))
+    
+    def cell_id(self, coord: Coordinate) -> int:
+        """Get the cell ID of a coordinate (must be within bounds)."""
+        return (int(coord.aisle) - 1) * self.max_rack + (int(coord.rack) - 1)
+    
+    def coordinate(self, cell_id: int) -> Coordinate:
+        """Get the coordinate of a cell ID."""
+        return self._coordinates[cell_id]
+    
+    def _occupied_mask(self) -> np.ndarray:
+        """Boolean mask of occupied cells."""
+        return (self.cells == _OCCUPIED) | (self.cells == _PACKOUT)
+    
+    def _coordinates_where(self, mask: np.ndarray) -> List[Coordinate]:
+        """Coordinates of the cells selected by a boolean mask, in cell ID order."""
+        coordinates = self._coordinates
+        return [coordinates[cell_id] for cell_id in np.flatnonzero(mask).tolist()]
     
     def get_grid_dimensions(self) -> Tuple[int, int]:
         """
@@ -71,19 +110,28 @@ class WarehouseLayoutManager:
         """
         return (self.max_aisle, self.max_rack)
     
+    def get_route_table(self) -> RouteTable:
+        """
+        Get the shared route table for this layout.
+        
+        Returns:
+            RouteTable with shortest distances and routes between all cells
+        """
+        return get_route_table(self.max_aisle, self.max_rack)
+    
     def is_valid_coordinate(self, coord: Coordinate) -> bool:
         """
         Check if coordinate is within warehouse bounds.
         
         Args:
             coord: Coordinate to validate
-            
+        
         Returns:
             True if coordinate is valid, False otherwise
         """
         try:
             # Validate bounds directly without creating new object
-            return (1 <= coord.aisle <= self.max_aisle and 
+            return (1 <= coord.aisle <= self.max_aisle and
                     1 <= coord.rack <= self.max_rack)
         except AttributeError:
             return False
@@ -94,17 +142,17 @@ class WarehouseLayoutManager:
         
         Args:
             coord: Coordinate to check
-            
+        
         Returns:
             GridState of the position
-            
+        
         Raises:
             CoordinateError: If coordinate is invalid
         """
         if not self.is_valid_coordinate(coord):
             raise CoordinateError(f"Invalid coordinate: {coord}")
         
-        return self.grid_state.get(coord, GridState.EMPTY)
+        return _STATES[self.cells[self.cell_id(coord)]]
     
     def set_grid_state(self, coord: Coordinate, state: GridState) -> bool:
         """
@@ -113,26 +161,40 @@ class WarehouseLayoutManager:
         Args:
             coord: Coordinate to update
             state: New state for the position
-            
+        
         Returns:
             True if successful, False otherwise
-            
+        
         Raises:
             CoordinateError: If coordinate is invalid
         """
         if not self.is_valid_coordinate(coord):
             raise CoordinateError(f"Invalid coordinate: {coord}")
         
-        # Update grid state
-        self.grid_state[coord] = state
+        self.cells[self.cell_id(coord)] = _STATE_CODES[state]
+        return True
+    
+    def set_grid_states(self, coords: List[Coordinate], state: GridState) -> int:
+        """
+        Set the state of many grid positions in one array update.
+        
+        Args:
+            coords: Coordinates to update
+            state: New state for the positions
         
-        # Update occupied positions set
-        if state == GridState.OCCUPIED:
-            self.occupied_positions.add(coord)
-        elif state == GridState.EMPTY:
-            self.occupied_positions.discard(coord)
+        Returns:
+            Number of positions updated
         
-        return True
+        Raises:
+            CoordinateError: If any coordinate is invalid (nothing is updated)
+        """
+        for coord in coords:
+            if not self.is_valid_coordinate(coord):
+                raise CoordinateError(f"Invalid coordinate: {coord}")
+        
+        cell_ids = np.fromiter((self.cell_id(coord) for coord in coords), dtype=np.intp, count=len(coords))
+        self.cells[cell_ids] = _STATE_CODES[state]
+        return len(coords)
     
     def is_position_occupied(self, coord: Coordinate) -> bool:
         """
@@ -140,11 +202,14 @@ class WarehouseLayoutManager:
         
         Args:
             coord: Coordinate to check
-            
+        
         Returns:
             True if position is occupied, False otherwise
         """
-        return coord in self.occupied_positions
+        if not self.is_valid_coordinate(coord):
+            return False
+        code = self.cells[self.cell_id(coord)]
+        return code == _OCCUPIED or code == _PACKOUT
     
     def is_packout_location(self, coord: Coordinate) -> bool:
         """
@@ -152,7 +217,7 @@ class WarehouseLayoutManager:
         
         Args:
             coord: Coordinate to check
-            
+        
         Returns:
             True if coordinate is packout location, False otherwise
         """
@@ -174,11 +239,7 @@ class WarehouseLayoutManager:
         Returns:
             List of available coordinates
         """
-        available = []
-        for coord, state in self.grid_state.items():
-            if state == GridState.EMPTY:
-                available.append(coord)
-        return available
+        return self._coordinates_where(self.cells == _EMPTY)
     
     def get_occupied_positions(self) -> List[Coordinate]:
         """
@@ -187,7 +248,17 @@ class WarehouseLayoutManager:
         Returns:
             List of occupied coordinates
         """
-        return list(self.occupied_positions)
+        return self._coordinates_where(self._occupied_mask())
+    
+    def get_state_counts(self) -> Dict[GridState, int]:
+        """
+        Count cells in each state.
+        
+        Returns:
+            Dictionary mapping every GridState to its cell count
+        """
+        counts = np.bincount(self.cells, minlength=len(_STATES)).tolist()
+        return {state: counts[code] for code, state in enumerate(_STATES)}
     
     def get_grid_statistics(self) -> Dict[str, int]:
         """
@@ -196,8 +267,9 @@ class WarehouseLayoutManager:
         Returns:
             Dictionary with grid statistics
         """
+        counts = np.bincount(self.cells, minlength=len(_STATES)).tolist()
         total_positions = self.max_aisle * self.max_rack
-        occupied_count = len(self.occupied_positions)
+        occupied_count = counts[_OCCUPIED] + counts[_PACKOUT]
         empty_count = total_positions - occupied_count  # Don't subtract packout again
         
         return {
@@ -216,11 +288,11 @@ class WarehouseLayoutManager:
         Args:
             aisle: Aisle number to validate
             rack: Rack number to validate
-            
+        
         Returns:
             True if coordinates are within bounds, False otherwise
         """
-        return (1 <= aisle <= self.max_aisle and 
+        return (1 <= aisle <= self.max_aisle and
                 1 <= rack <= self.max_rack)
     
     def get_grid_snapshot(self) -> Dict[str, any]:
@@ -230,35 +302,29 @@ class WarehouseLayoutManager:
         Returns:
             Dictionary representation of grid state
         """
-        snapshot = {
+        values = [state.value for state in _STATES]
+        return {
             'dimensions': {
                 'max_aisle': self.max_aisle,
                 'max_rack': self.max_rack
             },
             'packout_location': self.packout_location.to_dict(),
-            'grid_state': {},
-            'occupied_positions': [],
+            'grid_state': {f"{coord.aisle},{coord.rack}": values[code]
+                           for coord, code in zip(self._coordinates, self.cells.tolist())},
+            'occupied_positions': [coord.to_dict() for coord in self.get_occupied_positions()],
             'statistics': self.get_grid_statistics()
         }
-        
-        # Convert grid state to serializable format
-        for coord, state in self.grid_state.items():
-            coord_str = f"{coord.aisle},{coord.rack}"
-            snapshot['grid_state'][coord_str] = state.value
-        
-        # Convert occupied positions to serializable format
-        for coord in self.occupied_positions:
-            snapshot['occupied_positions'].append(coord.to_dict())
-        
-        return snapshot
     
     def load_grid_snapshot(self, snapshot: Dict[str, any]) -> bool:
         """
         Load grid state from a snapshot.
         
+        The snapshot is parsed in full before the grid changes, so an invalid
+        snapshot leaves the current state untouched.
+        
         Args:
             snapshot: Grid state snapshot to load
-            
+        
         Returns:
             True if successful, False otherwise
         """
@@ -267,15 +333,18 @@ class WarehouseLayoutManager:
             if 'dimensions' not in snapshot or 'grid_state' not in snapshot:
                 return False
             
-            # Reset grid state
-            self._initialize_grid()
-            
-            # Load grid state
+            cell_ids = []
+            codes = []
             for coord_str, state_value in snapshot['grid_state'].items():
                 aisle, rack = map(int, coord_str.split(','))
-                coord = Coordinate(aisle, rack)
-                state = GridState(state_value)
-                self.set_grid_state(coord, state)
+                if not self.validate_coordinate_bounds(aisle, rack):
+                    raise CoordinateError(f"Invalid coordinate: ({aisle}, {rack})")
+                cell_ids.append((aisle - 1) * self.max_rack + (rack - 1))
+                codes.append(_STATE_CODES[GridState(state_value)])
+            
+            # Reset grid state, then load all cells at once
+            self._initialize_grid()
+            self.cells[np.array(cell_ids, dtype=np.intp)] = np.array(codes, dtype=np.uint8)
             
             return True
         except (ValueError, KeyError, CoordinateError):
@@ -291,7 +360,7 @@ class WarehouseLayoutManager:
         
         Args:
             robot_position: Optional robot position to highlight
-            
+        
         Returns:
             String representation of the grid
         """
@@ -307,16 +376,17 @@ class WarehouseLayoutManager:
         visualization.append("")
         
         # Grid rows
+        rows = self.cells.reshape(self.max_aisle, self.max_rack).tolist()
         for aisle in range(1, self.max_aisle + 1):
             row = f"{aisle:2d} |"
             for rack in range(1, self.max_rack + 1):
-                coord = Coordinate(aisle, rack)
+                code = rows[aisle - 1][rack - 1]
                 
-                if robot_position and coord == robot_position:
+                if robot_position and robot_position.aisle == aisle and robot_position.rack == rack:
                     row += " R "  # Robot
-                elif coord.is_packout_location():
+                elif aisle == 1 and rack == 1:
                     row += " P "  # Packout
-                elif self.is_position_occupied(coord):
+                elif code == _OCCUPIED or code == _PACKOUT:
                     row += " X "  # Occupied
                 else:
                     row += " . "  # Empty
@@ -330,16 +400,41 @@ class WarehouseLayoutManager:
         return "\n".join(visualization)
     
     def __str__(self) -> str:
-        """String representation of warehouse layout manager."""
+        """String representation of warehouse layout."""
         stats = self.get_grid_statistics()
-        return (f"WarehouseLayoutManager({self.max_aisle}x{self.max_rack}) - "
+        return (f"{type(self).__name__}({self.max_aisle}x{self.max_rack}) - "
                 f"Occupied: {stats['occupied_positions']}, "
                 f"Empty: {stats['empty_positions']}")
     
     def __repr__(self) -> str:
         """Detailed string representation."""
-        return f"WarehouseLayoutManager(dimensions=({self.max_aisle}, {self.max_rack}))"
+        return f"{type(self).__name__}(dimensions=({self.max_aisle}, {self.max_rack}))"
+
+
+class WarehouseLayoutManager(WarehouseLayout):
+    """
+    Singleton class for managing warehouse grid layout and state.
+    
+    Manages the 25x20 warehouse grid with coordinate validation,
+    grid state tracking, and integration with existing systems.
+    Create a WarehouseLayout directly for independent layouts.
+    """
+    
+    _instance = None
+    _initialized = False
+    
+    def __new__(cls):
+        """Ensure singleton pattern - only one instance exists."""
+        if cls._instance is None:
+            cls._instance = super(WarehouseLayoutManager, cls).__new__(cls)
+        return cls._instance
+    
+    def __init__(self):
+        """Initialize warehouse layout manager (only once)."""
+        if not self._initialized:
+            super().__init__()
+            self._initialized = True
 
 
 # Global instance for easy access
-warehouse_layout = WarehouseLayoutManager() 
\ No newline at end of file
+warehouse_layout = WarehouseLayoutManager()
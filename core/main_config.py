@@ -354,7 +354,8 @@ class ConfigurationManager:
             "simulation": {
                 "name": "Roibot Warehouse Simulation",
                 "version": "1.0.0",
-                "description": "E-commerce warehouse robot simulation with bidirectional snake path navigation"
+                "description": "E-commerce warehouse robot simulation with bidirectional snake path navigation",
+                "seed": None
             },
             "timing": {
                 "target_fps": 60,
@@ -365,6 +366,32 @@ class ConfigurationManager:
             "engine": {
                 "event_queue_size": 1000,
                 "max_concurrent_events": 50,
+                "event_coalescing": {
+                    "robot_moved": {"policy": "latest", "key": "robot_id"},
+                    "frame_update": {"policy": "latest"}
+                },
+                "handler_timing": True,
+                "slow_handler_threshold_ms": 5.0,
+                "event_budget": {
+                    "enabled": True,
+                    "budget_fraction": 0.25,
+                    "max_budget_fraction": 0.75,
+                    "growth": 1.5
+                },
+                "event_journal": {
+                    "enabled": False,
+                    "directory": "journal",
+                    "max_segment_mb": 16,
+                    "batch_size": 256,
+                    "flush_interval": 0.5,
+                    "fsync_interval": 1.0
+                },
+                "checkpoints": {
+                    "enabled": False,
+                    "directory": "checkpoints",
+                    "interval": 300.0,
+                    "keep": 3
+                },
                 "performance_monitoring": True,
                 "debug_prints": True
             },
@@ -384,12 +411,21 @@ class ConfigurationManager:
             "robot": {
                 "movement_speed": 2.0,
                 "animation_smoothing": 0.1,
-                "state_change_delay": 0.05
+                "state_change_delay": 0.05,
+                "fleet_size": 1
             },
             "orders": {
                 "generation_interval": 40,
                 "max_items_per_order": 4,
-                "continuous_assignment": True
+                "order_limit": 10,
+                "continuous_assignment": True,
+                "batching": {
+                    "enabled": False,
+                    "tote_capacity": 8,
+                    "max_orders": 4,
+                    "aisle_window": 3,
+                    "max_wait": 0.0
+                }
             }
         }
         
@@ -0,0 +1,185 @@
+"""
+Discrete-event scheduler for event-driven simulation runs.
+Provides a heap-ordered agenda of timestamped events that lets simulated time
+jump straight to the next state change instead of polling every frame.
+"""
+
+import heapq
+import itertools
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class ScheduledEventKind(Enum):
+    """Kinds of events that can be placed on the simulation agenda."""
+
+    ORDER_ARRIVAL = "order_arrival"
+    WAYPOINT_REACHED = "waypoint_reached"
+    PICK_COMPLETE = "pick_complete"
+    CUSTOM = "custom"
+
+
+class ScheduledEvent:
+    """Handle for an event placed on the agenda."""
+
+    __slots__ = ("time", "seq", "kind", "handler", "data", "cancelled")
+
+    def __init__(self, time: float, seq: int, kind: ScheduledEventKind,
+                 handler: Callable[["ScheduledEvent"], None], data: Optional[Dict[str, Any]]):
+        self.time = time
+        self.seq = seq
+        self.kind = kind
+        self.handler = handler
+        self.data = data
+        self.cancelled = False
+
+    def __repr__(self) -> str:
+        """Detailed string representation."""
+        return f"ScheduledEvent(time={self.time:.3f}, kind={self.kind.value}, seq={self.seq})"
+
+
+class DiscreteEventScheduler:
+    """
+    Heap-ordered agenda of timestamped simulation events.
+
+    Events scheduled for the same time fire in scheduling order. Cancellation
+    is lazy: cancelled entries stay in the heap and are skipped when popped.
+    """
+
+    def __init__(self, start_time: float = 0.0,
+                 on_advance: Optional[Callable[[float], None]] = None):
+        """
+        Initialize scheduler.
+
+        Args:
+            start_time: Initial simulated time
+            on_advance: Optional callback invoked with the new time whenever the clock moves
+        """
+        self.now = start_time
+        self.on_advance = on_advance
+        self._agenda: List[Tuple[float, int, ScheduledEvent]] = []
+        self._counter = itertools.count()
+        self._pending = 0
+        self.events_processed = 0
+        self.events_by_kind: Dict[ScheduledEventKind, int] = {}
+
+    def schedule(self, time: float, kind: ScheduledEventKind,
+                 handler: Callable[[ScheduledEvent], None],
+                 data: Optional[Dict[str, Any]] = None) -> ScheduledEvent:
+        """
+        Schedule an event at an absolute simulated time.
+
+        Args:
+            time: Simulated time at which the event fires
+            kind: Event kind
+            handler: Callable invoked with the event when it fires
+            data: Optional event payload
+
+        Returns:
+            Event handle usable for cancellation
+
+        Raises:
+            ValueError: If time lies in the past
+        """
+        if time < self.now:
+            raise ValueError(f"Cannot schedule event in the past: {time} < {self.now}")
+
+        event = ScheduledEvent(time, next(self._counter), kind, handler, data)
+        heapq.heappush(self._agenda, (time, event.seq, event))
+        self._pending += 1
+        return event
+
+    def schedule_in(self, delay: float, kind: ScheduledEventKind,
+                    handler: Callable[[ScheduledEvent], None],
+                    data: Optional[Dict[str, Any]] = None) -> ScheduledEvent:
+        """Schedule an event relative to the current simulated time."""
+        return self.schedule(self.now + max(0.0, delay), kind, handler, data)
+
+    def cancel(self, event: ScheduledEvent) -> bool:
+        """
+        Cancel a scheduled event.
+
+        Args:
+            event: Event handle returned by schedule()
+
+        Returns:
+            True if the event was pending and is now cancelled
+        """
+        if event.cancelled:
+            return False
+        event.cancelled = True
+        self._pending -= 1
+        return True
+
+    def peek_time(self) -> Optional[float]:
+        """Get the time of the next pending event, or None if the agenda is empty."""
+        agenda = self._agenda
+        while agenda and agenda[0][2].cancelled:
+            heapq.heappop(agenda)
+        return agenda[0][0] if agenda else None
+
+    def pop_next(self) -> Optional[ScheduledEvent]:
+        """Remove and return the next pending event, advancing the clock to it."""
+        agenda = self._agenda
+        while agenda:
+            _, _, event = heapq.heappop(agenda)
+            if event.cancelled:
+                continue
+            # Mark as consumed so late cancel() calls are no-ops
+            event.cancelled = True
+            self._pending -= 1
+            self._advance_to(event.time)
+            return event
+        return None
+
+    def run_until(self, end_time: float) -> int:
+        """
+        Fire all events with time <= end_time in order, then advance the clock.
+
+        Handlers may schedule further events; those are fired in the same call
+        if they fall within end_time.
+
+        Args:
+            end_time: Simulated time to advance to
+
+        Returns:
+            Number of events fired
+        """
+        fired = 0
+        while True:
+            next_time = self.peek_time()
+            if next_time is None or next_time > end_time:
+                break
+            event = self.pop_next()
+            event.handler(event)
+            fired += 1
+            self.events_processed += 1
+            self.events_by_kind[event.kind] = self.events_by_kind.get(event.kind, 0) + 1
+
+        if end_time > self.now:
+            self._advance_to(end_time)
+        return fired
+
+    def _advance_to(self, time: float) -> None:
+        """Move the clock forward and notify the listener."""
+        self.now = time
+        if self.on_advance is not None:
+            self.on_advance(time)
+
+    def __len__(self) -> int:
+        """Number of pending (non-cancelled) events."""
+        return self._pending
+
+    def clear(self) -> None:
+        """Remove all pending events."""
+        self._agenda.clear()
+        self._pending = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        return {
+            "now": self.now,
+            "pending_events": self._pending,
+            "events_processed": self.events_processed,
+            "events_by_kind": {kind.value: count for kind, count in self.events_by_kind.items()}
+        }
@@ -10,6 +10,7 @@ from enum import Enum
 from dataclasses import dataclass, field
 
 from .main_config import ConfigurationManager, get_config
+from .determinism import SimulationClock, get_clock
 
 
 class SimulationStatus(Enum):
@@ -68,8 +69,14 @@ class SimulationState:
     Integrates with configuration system for dynamic behavior.
     """
     
-    def __init__(self):
-        """Initialize simulation state."""
+    def __init__(self, clock: Optional[SimulationClock] = None):
+        """
+        Initialize simulation state.
+        
+        Args:
+            clock: Simulation clock for state history timestamps (default: the process-wide clock)
+        """
+        self.clock = clock or get_clock()
         self.status = SimulationStatus.STOPPED
         self.simulation_time = 0.0
         self.real_time_start = 0.0
@@ -360,7 +367,7 @@ class SimulationState:
             details = {}
         
         state_record = {
-            "timestamp": time.time(),
+            "timestamp": self.clock.time(),
             "action": action,
             "status": self.status.value,
             "simulation_time": self.simulation_time,
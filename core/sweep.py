@@ -0,0 +1,405 @@
+"""
+Parallel scenario sweeps over headless simulation engines.
+Provides ScenarioSweep, which expands a parameter grid into scenarios, runs
+each one in its own SimulationEngine across a process pool and appends one
+row of KPIs per finished scenario to a CSV results file, so an interrupted
+sweep resumes where it stopped. Also runnable as a command line tool:
+
+    python -m core.sweep grid.json results.csv --sim-seconds 3600 --replicates 3
+"""
+
+import argparse
+import asyncio
+import contextlib
+import csv
+import hashlib
+import itertools
+import json
+import logging
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Union
+
+from .layout.coordinate import Coordinate
+
+logger = logging.getLogger(__name__)
+
+# Parameters applied to the engine after its configuration is loaded; any
+# other name must be a "section.key" configuration override
+ENGINE_PARAMETERS = ("movement_speed", "aisle_traversal_time", "generation_interval",
+                     "min_items_per_order", "max_items_per_order", "order_limit", "fleet_size")
+
+KPI_COLUMNS = ("sim_seconds", "wall_seconds", "speedup", "orders_generated", "orders_completed",
+               "items_collected", "throughput_per_hour", "rolling_orders_per_hour", "mean_cycle_time",
+               "p95_cycle_time", "total_distance", "distance_per_order", "route_distance",
+               "route_distance_per_order", "direction_changes", "path_optimizations")
+
+_ID_COLUMNS = ("scenario_id", "replicate", "seed")
+_STATUS_COLUMNS = ("status", "error")
+
+
+def expand_grid(grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    Expand a parameter grid into the list of its combinations.
+
+    Args:
+        grid: Parameter name -> values to try (a single value is used as is)
+
+    Returns:
+        One dict per combination, varying the last parameter fastest
+    """
+    names = list(grid)
+    values = [value if isinstance(value, (list, tuple)) else [value] for value in grid.values()]
+    return [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+
+def scenario_id(parameters: Dict[str, Any], replicate: int, seed: int) -> str:
+    """Stable identifier of a scenario (same parameters, replicate and seed: same id)."""
+    key = json.dumps([sorted(parameters.items()), replicate, seed], default=str)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+def run_scenario(parameters: Dict[str, Any], seed: int, sim_seconds: float,
+                 time_step: float = 0.1, event_driven: bool = False) -> Dict[str, Any]:
+    """
+    Run one scenario in a fresh engine and measure its KPIs.
+
+    Runs seeded, so order cycle times are in simulated seconds and the same
+    scenario always gives the same row. The engine's DistanceTracker and an
+    AnalyticsEngine on the engine's clock are fed from its change
+    notifications. Configuration overrides are undone afterwards, since pool
+    workers run many scenarios.
+
+    Args:
+        parameters: Engine parameters and "section.key" configuration overrides
+        seed: Simulation seed
+        sim_seconds: Simulated seconds to run
+        time_step: Fixed simulated step in seconds
+        event_driven: Use the discrete-event scheduler instead of fixed steps
+
+    Returns:
+        KPI dict with the KPI_COLUMNS keys
+    """
+    from .analytics.analytics_engine import AnalyticsEngine
+    from .engine import SimulationEngine
+    from .main_config import get_config
+
+    config_manager = get_config()
+    overrides = {name: value for name, value in parameters.items() if name not in ENGINE_PARAMETERS}
+    previous = []
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        if not config_manager.is_loaded:
+            config_manager.load_configuration()
+        try:
+            for name, value in overrides.items():
+                section, _, key = name.partition(".")
+                if not key:
+                    raise ValueError(f"Unknown scenario parameter {name!r} (use an engine parameter or section.key)")
+                section_data = config_manager.config_data.get(section, {})
+                previous.append((section, key, key in section_data, section_data.get(key)))
+                config_manager.set_value(section, key, value)
+
+            engine = SimulationEngine()
+            asyncio.run(engine.load_config())
+            _apply_engine_parameters(engine, parameters, config_manager)
+            engine.configure_seed(seed)
+            analytics = AnalyticsEngine(clock=engine.clock)
+            engine.subscribe_changes(analytics.record_engine_change)
+            engine.subscribe_changes(_DistanceFeed(engine), topics=("orders", "robots"))
+            report = asyncio.run(engine.run_for(sim_seconds, time_step=time_step, event_driven=event_driven))
+        finally:
+            for section, key, existed, value in reversed(previous):
+                if existed:
+                    config_manager.config_data[section][key] = value
+                else:
+                    config_manager.config_data[section].pop(key, None)
+
+    return _scenario_kpis(engine, analytics, report)
+
+
+def _apply_engine_parameters(engine, parameters: Dict[str, Any], config_manager) -> None:
+    """Set the ENGINE_PARAMETERS given in a scenario on a configured engine."""
+    if "movement_speed" in parameters and "aisle_traversal_time" in parameters:
+        raise ValueError("Set movement_speed or aisle_traversal_time, not both")
+    if "movement_speed" in parameters:
+        engine.movement_speed = float(parameters["movement_speed"])
+    if "aisle_traversal_time" in parameters:
+        # Seconds to drive one aisle end to end (rack 1 to the last rack)
+        racks = config_manager.get_value("warehouse", "racks", 20)
+        engine.movement_speed = (racks - 1) / float(parameters["aisle_traversal_time"])
+    if "generation_interval" in parameters:
+        engine.order_interval = float(parameters["generation_interval"])
+    for name in ("min_items_per_order", "max_items_per_order", "order_limit"):
+        if name in parameters:
+            setattr(engine, name, int(parameters[name]))
+    if engine.min_items_per_order > engine.max_items_per_order:
+        raise ValueError("min_items_per_order cannot exceed max_items_per_order")
+    if parameters.get("fleet_size", 1) > 1:
+        engine.configure_fleet(int(parameters["fleet_size"]))
+
+
+class _DistanceFeed:
+    """
+    Change subscriber feeding an engine's DistanceTracker.
+
+    Every waypoint a robot reaches is tracked as a move from its previous
+    waypoint: as a pick move of its oldest open order, as a return to start,
+    or as a plain move. Distances are route table moves between grid cells.
+    """
+
+    def __init__(self, engine):
+        from .engine import RobotState
+
+        self.returning = RobotState.RETURNING
+        self.engine = engine
+        self.tracker = engine.distance_tracker
+        self.positions: Dict[str, Any] = {}
+        self.open_orders: Dict[str, List[str]] = {}
+
+    def __call__(self, topic: str, data: Dict[str, Any]) -> None:
+        robot_id = data.get("robot_id")
+        if robot_id is None:
+            return
+        robot = self._robot(robot_id)
+        position = self._cell(robot.position)
+        if topic == "orders":
+            status = data.get("status")
+            if status == "assigned":
+                self.positions.setdefault(robot_id, position)
+                self.open_orders.setdefault(robot_id, []).append(data["order_id"])
+                self.tracker.track_order_start(data["order_id"], robot_id, position)
+            elif status == "completed":
+                orders = self.open_orders.get(robot_id, [])
+                if data["order_id"] in orders:
+                    orders.remove(data["order_id"])
+                self.tracker.track_order_complete(data["order_id"], robot_id, position)
+        elif "path_index" in data:
+            previous = self.positions.get(robot_id, position)
+            self.positions[robot_id] = position
+            if previous == position:
+                return
+            orders = self.open_orders.get(robot_id)
+            if orders:
+                self.tracker.track_pickup_item(orders[0], robot_id, previous, position)
+            elif robot.state == self.returning:
+                self.tracker.track_return_to_start(robot_id, previous, position)
+            else:
+                self.tracker.track_robot_move(robot_id, previous, position)
+
+    def _robot(self, robot_id: str):
+        engine = self.engine
+        if engine.fleet is None:
+            return engine.robot
+        return engine.robots[engine.fleet.slot_of(robot_id)]
+
+    @staticmethod
+    def _cell(position) -> Coordinate:
+        return Coordinate.of(int(round(position.aisle)), int(round(position.rack)))
+
+
+def _scenario_kpis(engine, analytics, report: Dict[str, Any]) -> Dict[str, Any]:
+    """KPIs of a finished headless run, from the engine metrics, its DistanceTracker and analytics."""
+    returned = [order for order in engine.orders if order.get("return_completed")]
+    cycle_times = sorted(order["completed_time"] - order["created_time"] for order in returned)
+    completed = report["orders_completed"]
+    metrics = engine.performance_metrics
+    order_distances = list(metrics.get("order_distances", {}).values())
+    route = engine.distance_tracker.get_kpi_metrics()
+    return {
+        "sim_seconds": report["sim_seconds"],
+        "wall_seconds": report["wall_seconds"],
+        "speedup": report["sim_seconds_per_wall_second"],
+        "orders_generated": report["orders_generated"],
+        "orders_completed": completed,
+        "items_collected": report["items_collected"],
+        "throughput_per_hour": completed * 3600.0 / report["sim_seconds"],
+        "rolling_orders_per_hour": analytics.calculate_orders_per_hour(),
+        "mean_cycle_time": sum(cycle_times) / len(cycle_times) if cycle_times else None,
+        "p95_cycle_time": cycle_times[max(0, math.ceil(0.95 * len(cycle_times)) - 1)] if cycle_times else None,
+        "total_distance": metrics.get("total_distance", 0.0),
+        "distance_per_order": sum(order_distances) / len(order_distances) if order_distances else None,
+        "route_distance": route["total_distance"],
+        "route_distance_per_order": route["average_order_distance"] if route["total_orders"] else None,
+        "direction_changes": metrics.get("direction_changes", 0),
+        "path_optimizations": metrics.get("path_optimizations", 0)
+    }
+
+
+class ScenarioSweep:
+    """
+    Parameter sweep over headless engines.
+
+    Every grid combination runs `replicates` times with seeds seed,
+    seed + 1, ...; all combinations share the seeds of a replicate, so they
+    see the same random order stream and differences come from the
+    parameters. Rows are appended to the results file as scenarios finish;
+    scenarios already in the file with status "ok" are skipped, and failed
+    ones are retried on the next run.
+    """
+
+    def __init__(self, grid: Dict[str, Sequence[Any]], results_path: Union[str, Path],
+                 sim_seconds: float = 3600.0, time_step: float = 0.1, replicates: int = 1,
+                 seed: int = 0, workers: Optional[int] = None, event_driven: bool = False):
+        """
+        Initialize the sweep.
+
+        Args:
+            grid: Parameter name -> values (ENGINE_PARAMETERS or "section.key" overrides)
+            results_path: CSV results file (created, or resumed when it exists)
+            sim_seconds: Simulated seconds per scenario
+            time_step: Fixed simulated step in seconds
+            replicates: Seeded runs per grid combination
+            seed: Seed of the first replicate
+            workers: Worker processes (default: one per core)
+            event_driven: Use the discrete-event scheduler instead of fixed steps
+        """
+        if not grid:
+            raise ValueError("grid must name at least one parameter")
+        if sim_seconds <= 0 or time_step <= 0:
+            raise ValueError("sim_seconds and time_step must be positive")
+        if replicates < 1:
+            raise ValueError("replicates must be at least 1")
+        for name in grid:
+            if name not in ENGINE_PARAMETERS and "." not in name:
+                raise ValueError(f"Unknown scenario parameter {name!r} (use an engine parameter or section.key)")
+
+        self.grid = dict(grid)
+        self.results_path = Path(results_path)
+        self.sim_seconds = sim_seconds
+        self.time_step = time_step
+        self.replicates = replicates
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.event_driven = event_driven
+        self.columns = list(_ID_COLUMNS) + list(self.grid) + list(_STATUS_COLUMNS) + list(KPI_COLUMNS)
+
+    def scenarios(self) -> List[Dict[str, Any]]:
+        """All scenarios: {"scenario_id", "replicate", "seed", "parameters"}."""
+        scenarios = []
+        for replicate in range(self.replicates):
+            seed = self.seed + replicate
+            for parameters in expand_grid(self.grid):
+                scenarios.append({"scenario_id": scenario_id(parameters, replicate, seed),
+                                  "replicate": replicate, "seed": seed, "parameters": parameters})
+        return scenarios
+
+    def completed(self) -> Set[str]:
+        """Ids of scenarios already in the results file with status "ok"."""
+        return {row["scenario_id"] for row in self.load_results() if row.get("status") == "ok"}
+
+    def load_results(self) -> List[Dict[str, str]]:
+        """
+        Read the results file.
+
+        Raises:
+            ValueError: If the file was written for different columns
+        """
+        if not self.results_path.exists() or self.results_path.stat().st_size == 0:
+            return []
+        with open(self.results_path, newline="") as results:
+            reader = csv.DictReader(results)
+            if reader.fieldnames != self.columns:
+                raise ValueError(f"{self.results_path} has columns {reader.fieldnames}, expected {self.columns}")
+            # A row cut short by a crash has missing fields
+            return [row for row in reader if None not in row.values()]
+
+    def run(self, progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Run every scenario not yet in the results file.
+
+        Args:
+            progress: Called as progress(done, total, row) after each scenario
+
+        Returns:
+            Sweep report (scenarios, skipped, run, failed, wall_seconds)
+        """
+        scenarios = self.scenarios()
+        done_ids = self.completed()
+        pending = [scenario for scenario in scenarios if scenario["scenario_id"] not in done_ids]
+        total = len(scenarios)
+        done = total - len(pending)
+        failed = 0
+        logger.info("🧪 Scenario sweep: %d scenarios, %d already done, %d workers",
+                    total, done, min(self.workers, len(pending)))
+
+        start = time.perf_counter()
+        write_header = not self.results_path.exists() or self.results_path.stat().st_size == 0
+        self.results_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.results_path, "a", newline="") as results:
+            writer = csv.DictWriter(results, fieldnames=self.columns)
+            if write_header:
+                writer.writeheader()
+                results.flush()
+            if pending:
+                with ProcessPoolExecutor(max_workers=min(self.workers, len(pending))) as pool:
+                    futures = {pool.submit(run_scenario, scenario["parameters"], scenario["seed"],
+                                           self.sim_seconds, self.time_step, self.event_driven): scenario
+                               for scenario in pending}
+                    for future in as_completed(futures):
+                        scenario = futures[future]
+                        row = {"scenario_id": scenario["scenario_id"], "replicate": scenario["replicate"],
+                               "seed": scenario["seed"], **scenario["parameters"]}
+                        try:
+                            row.update(future.result(), status="ok", error="")
+                        except Exception as e:
+                            failed += 1
+                            row.update(status="error", error=f"{type(e).__name__}: {e}")
+                            logger.error("❌ Scenario %s failed: %s", scenario["scenario_id"], e)
+                        writer.writerow(row)
+                        results.flush()
+
+                        done += 1
+                        elapsed = time.perf_counter() - start
+                        finished_here = done - (total - len(pending))
+                        remaining = elapsed / finished_here * (total - done)
+                        logger.info("🧪 %d/%d scenarios done (%s), ~%.0fs remaining",
+                                    done, total, row["status"], remaining)
+                        if progress is not None:
+                            progress(done, total, row)
+
+        return {
+            "scenarios": total,
+            "skipped": total - len(pending),
+            "run": len(pending),
+            "failed": failed,
+            "wall_seconds": time.perf_counter() - start
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Run a parameter sweep over headless simulations.")
+    parser.add_argument("grid", help="JSON file mapping parameter names to lists of values")
+    parser.add_argument("results", help="CSV results file (resumed if it exists)")
+    parser.add_argument("--sim-seconds", type=float, default=3600.0, help="simulated seconds per scenario")
+    parser.add_argument("--time-step", type=float, default=0.1, help="fixed simulated step in seconds")
+    parser.add_argument("--replicates", type=int, default=1, help="seeded runs per grid combination")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first replicate")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--event-driven", action="store_true", help="use the discrete-event scheduler")
+    args = parser.parse_args(argv)
+
+    # Progress lines only; engine loggers keep their own levels and stay quiet
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    with open(args.grid) as grid_file:
+        grid = json.load(grid_file)
+
+    sweep = ScenarioSweep(grid, args.results, sim_seconds=args.sim_seconds, time_step=args.time_step,
+                          replicates=args.replicates, seed=args.seed, workers=args.workers,
+                          event_driven=args.event_driven)
+    report = sweep.run()
+    print(f"📊 {report['run']} scenarios run, {report['skipped']} resumed, {report['failed']} failed "
+          f"in {report['wall_seconds']:.1f}s -> {args.results}")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
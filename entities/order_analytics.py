@@ -1,3 +1,4 @@
+import logging
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, asdict
 import time
@@ -10,6 +11,8 @@ from .order_status_tracker import OrderStatusTracker
 from .robot_order_assigner import RobotOrderAssigner
 from .order_queue_manager import OrderQueueManager
 
+logger = logging.getLogger(__name__)
+
 class MetricType(Enum):
     """Enumeration for metric types."""
     COMPLETION_TIME = "completion_time"
@@ -107,7 +110,7 @@ class OrderAnalytics:
         self.export_directory = "exports"
         self.auto_export_interval = 300  # 5 minutes
         
-        print(f"📊 OrderAnalytics initialized")
+        logger.info("📊 OrderAnalytics initialized")
     
     def update_order_metrics(self, order: Order):
         """
@@ -141,10 +144,10 @@ class OrderAnalytics:
             # Update system metrics
             self._update_system_metrics()
             
-            print(f"📈 Updated metrics for order {order.order_id}")
+            logger.info("📈 Updated metrics for order %s", order.order_id)
             
         except Exception as e:
-            print(f"❌ Error updating order metrics: {e}")
+            logger.error("❌ Error updating order metrics: %s", e)
     
     def update_robot_metrics(self, robot_id: str, robot_data: Dict[str, Any]):
         """
@@ -176,7 +179,7 @@ class OrderAnalytics:
             self.robot_metrics[robot_id] = robot_metrics
             
         except Exception as e:
-            print(f"❌ Error updating robot metrics: {e}")
+            logger.error("❌ Error updating robot metrics: %s", e)
     
     def _calculate_direction_changes(self, order: Order) -> int:
         """
@@ -199,7 +202,7 @@ class OrderAnalytics:
             return estimated_changes
             
         except Exception as e:
-            print(f"❌ Error calculating direction changes: {e}")
+            logger.error("❌ Error calculating direction changes: %s", e)
             return 0
     
     def _calculate_path_optimization_savings(self, order: Order) -> float:
@@ -224,7 +227,7 @@ class OrderAnalytics:
             return 0.0
             
         except Exception as e:
-            print(f"❌ Error calculating path optimization savings: {e}")
+            logger.error("❌ Error calculating path optimization savings: %s", e)
             return 0.0
     
     def _calculate_robot_utilization(self, robot_id: str) -> float:
@@ -247,7 +250,7 @@ class OrderAnalytics:
             return 0.0
             
         except Exception as e:
-            print(f"❌ Error calculating robot utilization: {e}")
+            logger.error("❌ Error calculating robot utilization: %s", e)
             return 0.0
     
     def _update_system_metrics(self):
@@ -281,7 +284,7 @@ class OrderAnalytics:
             self.last_update_time = time.time()
             
         except Exception as e:
-            print(f"❌ Error updating system metrics: {e}")
+            logger.error("❌ Error updating system metrics: %s", e)
     
     def get_dashboard_data(self) -> Dict[str, Any]:
         """
@@ -323,7 +326,7 @@ class OrderAnalytics:
             }
             
         except Exception as e:
-            print(f"❌ Error getting dashboard data: {e}")
+            logger.error("❌ Error getting dashboard data: %s", e)
             return {}
     
     def export_to_json(self, filename: Optional[str] = None) -> str:
@@ -364,11 +367,11 @@ class OrderAnalytics:
             with open(filepath, 'w') as f:
                 json.dump(export_data, f, indent=2)
             
-            print(f"📊 Exported analytics to {filepath}")
+            logger.info("📊 Exported analytics to %s", filepath)
             return filepath
             
         except Exception as e:
-            print(f"❌ Error exporting to JSON: {e}")
+            logger.error("❌ Error exporting to JSON: %s", e)
             return ""
     
     def export_to_csv(self, filename: Optional[str] = None) -> str:
@@ -399,11 +402,11 @@ class OrderAnalytics:
                     for metrics in self.completed_orders_metrics:
                         writer.writerow(asdict(metrics))
             
-            print(f"📊 Exported analytics to {filepath}")
+            logger.info("📊 Exported analytics to %s", filepath)
             return filepath
             
         except Exception as e:
-            print(f"❌ Error exporting to CSV: {e}")
+            logger.error("❌ Error exporting to CSV: %s", e)
             return ""
     
     def get_real_time_metrics(self) -> Dict[str, Any]:
@@ -430,7 +433,7 @@ class OrderAnalytics:
             }
             
         except Exception as e:
-            print(f"❌ Error getting real-time metrics: {e}")
+            logger.error("❌ Error getting real-time metrics: %s", e)
             return {}
     
     def reset_analytics(self):
@@ -452,10 +455,10 @@ class OrderAnalytics:
             self.start_time = time.time()
             self.last_update_time = time.time()
             
-            print("📊 Analytics data reset")
+            logger.info("📊 Analytics data reset")
             
         except Exception as e:
-            print(f"❌ Error resetting analytics: {e}")
+            logger.error("❌ Error resetting analytics: %s", e)
     
     def get_analytics_summary(self) -> Dict[str, Any]:
         """
@@ -475,5 +478,5 @@ class OrderAnalytics:
             }
             
         except Exception as e:
-            print(f"❌ Error getting analytics summary: {e}")
+            logger.error("❌ Error getting analytics summary: %s", e)
             return {} 
\ No newline at end of file
@@ -17,16 +17,19 @@ Author: Roibot Development Team
 Version: 1.0
 """
 
-import time
+import logging
 import random
 import uuid
-from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 
 from .robot_orders import Order, OrderStatus
 from core.layout.warehouse_layout import WarehouseLayoutManager
 from core.layout.coordinate import Coordinate
+from core.determinism import ORDER_STREAM, get_clock, get_random
+
+logger = logging.getLogger(__name__)
+_clock = get_clock()
 
 
 class GenerationStatus(Enum):
@@ -72,7 +75,7 @@ class OrderGenerator:
         # Item pool for random selection
         self._initialize_item_pool()
         
-        print("📦 OrderGenerator initialized with 30-second generation interval")
+        logger.info("📦 OrderGenerator initialized with 30-second generation interval")
     
     def _initialize_item_pool(self):
         """Initialize the pool of available items for random selection."""
@@ -95,7 +98,7 @@ class OrderGenerator:
                     'available': True
                 })
         
-        print(f"📋 Item pool initialized with {len(self.item_pool)} items")
+        logger.info("📋 Item pool initialized with %s items", len(self.item_pool))
     
     def configure(self, config: Dict[str, Any]):
         """
@@ -121,50 +124,49 @@ class OrderGenerator:
         if self.max_items_per_order > 10:
             raise ValueError("Maximum items per order cannot exceed 10")
         
-        print(f"⚙️  OrderGenerator configured: {self.generation_interval}s interval, "
-              f"{self.min_items_per_order}-{self.max_items_per_order} items per order")
+        logger.info("⚙️  OrderGenerator configured: %ss interval, %s-%s items per order", self.generation_interval, self.min_items_per_order, self.max_items_per_order)
     
     def start_generation(self):
         """Start automatic order generation."""
         if self.is_generating:
-            print("⚠️  Order generation is already running")
+            logger.warning("⚠️  Order generation is already running")
             return
         
         self.is_generating = True
         self.status = GenerationStatus.RUNNING
-        self.generation_start_time = time.time()
-        self.last_generation_time = time.time()
+        self.generation_start_time = _clock.time()
+        self.last_generation_time = self.generation_start_time
         
-        print(f"🚀 Order generation started - generating orders every {self.generation_interval} seconds")
+        logger.info("🚀 Order generation started - generating orders every %s seconds", self.generation_interval)
     
     def stop_generation(self):
         """Stop automatic order generation."""
         if not self.is_generating:
-            print("⚠️  Order generation is not running")
+            logger.warning("⚠️  Order generation is not running")
             return
         
         self.is_generating = False
         self.status = GenerationStatus.STOPPED
         
-        print("⏹️  Order generation stopped")
+        logger.info("⏹️  Order generation stopped")
     
     def pause_generation(self):
         """Pause automatic order generation."""
         if not self.is_generating:
-            print("⚠️  Order generation is not running")
+            logger.warning("⚠️  Order generation is not running")
             return
         
         self.status = GenerationStatus.PAUSED
-        print("⏸️  Order generation paused")
+        logger.info("⏸️  Order generation paused")
     
     def resume_generation(self):
         """Resume automatic order generation."""
         if self.status != GenerationStatus.PAUSED:
-            print("⚠️  Order generation is not paused")
+            logger.warning("⚠️  Order generation is not paused")
             return
         
         self.status = GenerationStatus.RUNNING
-        print("▶️  Order generation resumed")
+        logger.info("▶️  Order generation resumed")
     
     def should_generate_order(self, current_time: float) -> bool:
         """
@@ -197,13 +199,13 @@ class OrderGenerator:
             order_id = self._generate_order_id()
             
             # Select random number of items
-            num_items = random.randint(self.min_items_per_order, self.max_items_per_order)
+            num_items = get_random(ORDER_STREAM).randint(self.min_items_per_order, self.max_items_per_order)
             
             # Select random items from pool
             selected_items = self._select_random_items(num_items)
             
             if not selected_items:
-                print("⚠️  No items available for order generation")
+                logger.warning("⚠️  No items available for order generation")
                 return None
             
             # Extract item IDs and positions
@@ -218,13 +220,13 @@ class OrderGenerator:
             self.orders_generated_this_session += 1
             self.last_generation_time = current_time
             
-            print(f"📦 Generated order {order_id} with {len(item_ids)} items")
+            logger.info("📦 Generated order %s with %s items", order_id, len(item_ids))
             
             return order
             
         except Exception as e:
             self.generation_errors += 1
-            print(f"❌ Error generating order: {e}")
+            logger.error("❌ Error generating order: %s", e)
             return None
     
     def _generate_order_id(self) -> str:
@@ -234,11 +236,15 @@ class OrderGenerator:
         Returns:
             Order ID in format ORD_YYYYMMDD_HHMMSS
         """
-        timestamp = datetime.now()
+        timestamp = _clock.now()
         order_id = f"ORD_{timestamp.strftime('%Y%m%d_%H%M%S')}"
         
-        # Add unique suffix to prevent collisions
-        unique_suffix = str(uuid.uuid4())[:8]
+        # Add unique suffix to prevent collisions (drawn from the order stream in seeded runs)
+        rng = get_random(ORDER_STREAM)
+        if rng is random:
+            unique_suffix = str(uuid.uuid4())[:8]
+        else:
+            unique_suffix = f"{rng.getrandbits(32):08x}"
         return f"{order_id}_{unique_suffix}"
     
     def _select_random_items(self, num_items: int) -> List[Dict[str, Any]]:
@@ -252,11 +258,11 @@ class OrderGenerator:
             List of selected item dictionaries
         """
         if num_items > len(self.item_pool):
-            print(f"⚠️  Requested {num_items} items but only {len(self.item_pool)} available")
+            logger.warning("⚠️  Requested %s items but only %s available", num_items, len(self.item_pool))
             num_items = len(self.item_pool)
         
         # Select random items without replacement
-        selected_items = random.sample(self.item_pool, num_items)
+        selected_items = get_random(ORDER_STREAM).sample(self.item_pool, num_items)
         
         return selected_items
     
@@ -291,7 +297,7 @@ class OrderGenerator:
             'total_orders_generated': self.total_orders_generated,
             'orders_generated_this_session': self.orders_generated_this_session,
             'generation_errors': self.generation_errors,
-            'time_since_last_generation': time.time() - self.last_generation_time if self.last_generation_time > 0 else None,
+            'time_since_last_generation': _clock.time() - self.last_generation_time if self.last_generation_time > 0 else None,
             'available_items': len(self.item_pool)
         }
     
@@ -299,7 +305,7 @@ class OrderGenerator:
         """Reset generation statistics."""
         self.orders_generated_this_session = 0
         self.generation_errors = 0
-        print("📊 Order generation statistics reset")
+        logger.info("📊 Order generation statistics reset")
     
     def get_debug_info(self) -> Dict[str, Any]:
         """
@@ -315,6 +321,6 @@ class OrderGenerator:
             'generation_timing': {
                 'last_generation': self.last_generation_time,
                 'generation_start': self.generation_start_time,
-                'time_since_last': time.time() - self.last_generation_time if self.last_generation_time > 0 else 0
+                'time_since_last': _clock.time() - self.last_generation_time if self.last_generation_time > 0 else 0
             }
         } 
\ No newline at end of file
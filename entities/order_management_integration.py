@@ -1,3 +1,4 @@
+import logging
 import asyncio
 import time
 from typing import Dict, Any, Optional, List
@@ -19,6 +20,8 @@ from core.events import EventSystem, EventType
 from core.state import SimulationState
 from core.layout.coordinate import Coordinate
 
+logger = logging.getLogger(__name__)
+
 class IntegrationEventType(Enum):
     """Order management specific event types."""
     ORDER_CREATED = "order_created"
@@ -96,7 +99,7 @@ class OrderManagementIntegration:
             IntegrationEventType.ANALYTICS_UPDATED: self._handle_analytics_updated
         }
         
-        print(f"🔗 OrderManagementIntegration initialized")
+        logger.info("🔗 OrderManagementIntegration initialized")
     
     async def integrate_with_simulation(self) -> bool:
         """
@@ -106,7 +109,7 @@ class OrderManagementIntegration:
             True if integration successful, False otherwise
         """
         try:
-            print("🔗 Starting order management integration...")
+            logger.info("🔗 Starting order management integration...")
             
             # Configure components with simulation settings
             await self._configure_components()
@@ -126,11 +129,11 @@ class OrderManagementIntegration:
             self.is_integrated = True
             self.integration_metrics.successful_integrations += 1
             
-            print("✅ Order management integration completed successfully")
+            logger.info("✅ Order management integration completed successfully")
             return True
             
         except Exception as e:
-            print(f"❌ Order management integration failed: {e}")
+            logger.error("❌ Order management integration failed: %s", e)
             self.integration_metrics.failed_integrations += 1
             return False
     
@@ -154,10 +157,10 @@ class OrderManagementIntegration:
             self.analytics.auto_export_interval = analytics_config.auto_export_interval
             self.analytics.export_directory = analytics_config.export_directory
             
-            print("⚙️ Components configured with simulation settings")
+            logger.info("⚙️ Components configured with simulation settings")
             
         except Exception as e:
-            print(f"❌ Error configuring components: {e}")
+            logger.error("❌ Error configuring components: %s", e)
             raise
     
     async def _setup_event_handlers(self):
@@ -176,10 +179,10 @@ class OrderManagementIntegration:
             # Set up status tracker event emission
             self.status_tracker.set_event_emitter(self._emit_status_event)
             
-            print("📡 Event handlers configured")
+            logger.info("📡 Event handlers configured")
             
         except Exception as e:
-            print(f"❌ Error setting up event handlers: {e}")
+            logger.error("❌ Error setting up event handlers: %s", e)
             raise
     
     async def _integrate_robot_state_machine(self):
@@ -202,10 +205,10 @@ class OrderManagementIntegration:
             # Start monitoring task
             asyncio.create_task(monitor_robot_state())
             
-            print("🤖 Robot state machine integration configured")
+            logger.info("🤖 Robot state machine integration configured")
             
         except Exception as e:
-            print(f"❌ Error integrating robot state machine: {e}")
+            logger.error("❌ Error integrating robot state machine: %s", e)
             raise
     
     async def _integrate_analytics(self):
@@ -222,10 +225,10 @@ class OrderManagementIntegration:
             # Register callback with simulation engine
             self.simulation_engine.register_analytics_callback(update_analytics_callback)
             
-            print("📊 Analytics integration configured")
+            logger.info("📊 Analytics integration configured")
             
         except Exception as e:
-            print(f"❌ Error integrating analytics: {e}")
+            logger.error("❌ Error integrating analytics: %s", e)
             raise
     
     async def _setup_real_time_monitoring(self):
@@ -246,10 +249,10 @@ class OrderManagementIntegration:
             # Start dashboard refresh task
             asyncio.create_task(refresh_dashboard())
             
-            print("📺 Real-time monitoring configured")
+            logger.info("📺 Real-time monitoring configured")
             
         except Exception as e:
-            print(f"❌ Error setting up real-time monitoring: {e}")
+            logger.error("❌ Error setting up real-time monitoring: %s", e)
             raise
     
     async def _emit_order_event(self, event_type: str, data: Dict[str, Any]):
@@ -278,7 +281,7 @@ class OrderManagementIntegration:
             self.integration_metrics.last_integration_time = time.time()
             
         except Exception as e:
-            print(f"❌ Error emitting order event: {e}")
+            logger.error("❌ Error emitting order event: %s", e)
     
     async def _emit_robot_event(self, event_type: str, data: Dict[str, Any]):
         """Emit robot-related events to simulation event system."""
@@ -301,7 +304,7 @@ class OrderManagementIntegration:
             })
             
         except Exception as e:
-            print(f"❌ Error emitting robot event: {e}")
+            logger.error("❌ Error emitting robot event: %s", e)
     
     async def _emit_status_event(self, event_type: str, data: Dict[str, Any]):
         """Emit status-related events to simulation event system."""
@@ -323,7 +326,7 @@ class OrderManagementIntegration:
             })
             
         except Exception as e:
-            print(f"❌ Error emitting status event: {e}")
+            logger.error("❌ Error emitting status event: %s", e)
     
     async def _handle_order_created(self, data: Dict[str, Any]):
         """Handle order created event."""
@@ -336,10 +339,10 @@ class OrderManagementIntegration:
                 # Update analytics
                 self.analytics.update_order_metrics(order)
                 
-                print(f"📋 Order {order.order_id} created and queued")
+                logger.info("📋 Order %s created and queued", order.order_id)
                 
         except Exception as e:
-            print(f"❌ Error handling order created: {e}")
+            logger.error("❌ Error handling order created: %s", e)
     
     async def _handle_order_assigned(self, data: Dict[str, Any]):
         """Handle order assigned event."""
@@ -355,10 +358,10 @@ class OrderManagementIntegration:
                 # Update status tracker
                 self.status_tracker.update_order_status(order_id, OrderStatus.IN_PROGRESS)
                 
-                print(f"🤖 Order {order_id} assigned to {robot_id}")
+                logger.info("🤖 Order %s assigned to %s", order_id, robot_id)
                 
         except Exception as e:
-            print(f"❌ Error handling order assigned: {e}")
+            logger.error("❌ Error handling order assigned: %s", e)
     
     async def _handle_order_started(self, data: Dict[str, Any]):
         """Handle order started event."""
@@ -370,10 +373,10 @@ class OrderManagementIntegration:
                 robot = self.simulation_engine.robot
                 robot.state = RobotState.COLLECTING
                 
-                print(f"🚀 Order {order_id} started")
+                logger.info("🚀 Order %s started", order_id)
                 
         except Exception as e:
-            print(f"❌ Error handling order started: {e}")
+            logger.error("❌ Error handling order started: %s", e)
     
     async def _handle_order_completed(self, data: Dict[str, Any]):
         """Handle order completed event."""
@@ -393,10 +396,10 @@ class OrderManagementIntegration:
                 # Remove from queue
                 self.queue_manager.remove_order(order_id)
                 
-                print(f"✅ Order {order_id} completed")
+                logger.info("✅ Order %s completed", order_id)
                 
         except Exception as e:
-            print(f"❌ Error handling order completed: {e}")
+            logger.error("❌ Error handling order completed: %s", e)
     
     async def _handle_robot_state_changed(self, data: Dict[str, Any]):
         """Handle robot state change event."""
@@ -422,10 +425,10 @@ class OrderManagementIntegration:
                 
                 self.analytics.update_robot_metrics('ROBOT_001', robot_data)
                 
-                print(f"🤖 Robot state changed: {old_state.value} → {new_state.value}")
+                logger.info("🤖 Robot state changed: %s → %s", old_state.value, new_state.value)
                 
         except Exception as e:
-            print(f"❌ Error handling robot state change: {e}")
+            logger.error("❌ Error handling robot state change: %s", e)
     
     async def _handle_analytics_updated(self, data: Dict[str, Any]):
         """Handle analytics update event."""
@@ -440,7 +443,7 @@ class OrderManagementIntegration:
             })
             
         except Exception as e:
-            print(f"❌ Error handling analytics update: {e}")
+            logger.error("❌ Error handling analytics update: %s", e)
     
     async def _handle_robot_state_change(self, old_state: RobotState, new_state: RobotState):
         """Handle robot state change from simulation."""
@@ -451,7 +454,7 @@ class OrderManagementIntegration:
             })
             
         except Exception as e:
-            print(f"❌ Error handling robot state change: {e}")
+            logger.error("❌ Error handling robot state change: %s", e)
     
     async def update_integration(self, delta_time: float):
         """Update integration components."""
@@ -478,7 +481,7 @@ class OrderManagementIntegration:
             self.integration_metrics.last_integration_time = time.time()
             
         except Exception as e:
-            print(f"❌ Error updating integration: {e}")
+            logger.error("❌ Error updating integration: %s", e)
     
     def get_integration_status(self) -> Dict[str, Any]:
         """Get integration status and metrics."""
@@ -505,13 +508,13 @@ class OrderManagementIntegration:
             }
             
         except Exception as e:
-            print(f"❌ Error getting integration status: {e}")
+            logger.error("❌ Error getting integration status: %s", e)
             return {'error': str(e)}
     
     async def shutdown_integration(self):
         """Shutdown integration components."""
         try:
-            print("🔄 Shutting down order management integration...")
+            logger.info("🔄 Shutting down order management integration...")
             
             # Stop order generator
             self.order_generator.stop()
@@ -527,10 +530,10 @@ class OrderManagementIntegration:
             
             self.is_integrated = False
             
-            print("✅ Order management integration shutdown complete")
+            logger.info("✅ Order management integration shutdown complete")
             
         except Exception as e:
-            print(f"❌ Error shutting down integration: {e}")
+            logger.error("❌ Error shutting down integration: %s", e)
     
     def get_dashboard_data(self) -> Dict[str, Any]:
         """Get dashboard data for integration monitoring."""
@@ -542,5 +545,5 @@ class OrderManagementIntegration:
             }
             
         except Exception as e:
-            print(f"❌ Error getting dashboard data: {e}")
+            logger.error("❌ Error getting dashboard data: %s", e)
             return {'error': str(e)} 
\ No newline at end of file
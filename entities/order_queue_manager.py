@@ -17,12 +17,16 @@ Author: Roibot Development Team
 Version: 1.0
 """
 
-import time
+import logging
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
 
 from .robot_orders import Order, OrderStatus
+from core.determinism import get_clock
+
+logger = logging.getLogger(__name__)
+_clock = get_clock()
 
 
 class QueueStatus(Enum):
@@ -68,12 +72,12 @@ class OrderQueueManager:
         
         # Statistics tracking
         self.statistics = QueueStatistics()
-        self.queue_start_time = time.time()
+        self.queue_start_time = _clock.time()
         
         # Performance tracking
         self.wait_times: List[float] = []
         
-        print(f"📋 OrderQueueManager initialized with max queue size: {max_queue_size}")
+        logger.info("📋 OrderQueueManager initialized with max queue size: %s", max_queue_size)
     
     def add_order(self, order: Order) -> bool:
         """
@@ -88,12 +92,12 @@ class OrderQueueManager:
         try:
             # Check if queue is full
             if len(self.queue) >= self.max_queue_size:
-                print(f"⚠️  Queue is full ({len(self.queue)}/{self.max_queue_size})")
+                logger.warning("⚠️  Queue is full (%s/%s)", len(self.queue), self.max_queue_size)
                 return False
             
             # Validate order
             if not self._validate_order(order):
-                print(f"❌ Invalid order: {order.order_id}")
+                logger.error("❌ Invalid order: %s", order.order_id)
                 return False
             
             # Keep order status as PENDING (don't change it)
@@ -107,11 +111,11 @@ class OrderQueueManager:
             self.statistics.current_queue_size = len(self.queue)
             self.statistics.peak_queue_size = max(self.statistics.peak_queue_size, len(self.queue))
             
-            print(f"📦 Added order {order.order_id} to queue (size: {len(self.queue)})")
+            logger.info("📦 Added order %s to queue (size: %s)", order.order_id, len(self.queue))
             return True
             
         except Exception as e:
-            print(f"❌ Error adding order to queue: {e}")
+            logger.error("❌ Error adding order to queue: %s", e)
             return False
     
     def remove_order(self, order: Order) -> bool:
@@ -130,14 +134,14 @@ class OrderQueueManager:
                 self.statistics.total_orders_removed += 1
                 self.statistics.current_queue_size = len(self.queue)
                 
-                print(f"🗑️  Removed order {order.order_id} from queue (size: {len(self.queue)})")
+                logger.info("🗑️  Removed order %s from queue (size: %s)", order.order_id, len(self.queue))
                 return True
             else:
-                print(f"⚠️  Order {order.order_id} not found in queue")
+                logger.warning("⚠️  Order %s not found in queue", order.order_id)
                 return False
                 
         except Exception as e:
-            print(f"❌ Error removing order from queue: {e}")
+            logger.error("❌ Error removing order from queue: %s", e)
             return False
     
     def get_next_order(self) -> Optional[Order]:
@@ -157,14 +161,14 @@ class OrderQueueManager:
         # next_order.status = OrderStatus.IN_PROGRESS
         
         # Calculate wait time
-        wait_time = time.time() - self.queue_start_time
+        wait_time = _clock.time() - self.queue_start_time
         self.wait_times.append(wait_time)
         
         # Update statistics
         self.statistics.average_wait_time = sum(self.wait_times) / len(self.wait_times)
         self.statistics.max_wait_time = max(self.statistics.max_wait_time, wait_time)
         
-        print(f"🎯 Next order: {next_order.order_id} (wait time: {wait_time:.2f}s)")
+        logger.info("🎯 Next order: %s (wait time: %.2fs)", next_order.order_id, wait_time)
         return next_order
     
     def peek_next_order(self) -> Optional[Order]:
@@ -203,11 +207,11 @@ class OrderQueueManager:
             # Update statistics
             self.statistics.total_orders_completed += 1
             
-            print(f"✅ Completed order {order.order_id}")
+            logger.info("✅ Completed order %s", order.order_id)
             return True
             
         except Exception as e:
-            print(f"❌ Error completing order: {e}")
+            logger.error("❌ Error completing order: %s", e)
             return False
     
     def fail_order(self, order: Order) -> bool:
@@ -234,11 +238,11 @@ class OrderQueueManager:
             # Update statistics
             self.statistics.total_orders_failed += 1
             
-            print(f"❌ Failed order {order.order_id}")
+            logger.error("❌ Failed order %s", order.order_id)
             return True
             
         except Exception as e:
-            print(f"❌ Error failing order: {e}")
+            logger.error("❌ Error failing order: %s", e)
             return False
     
     def is_empty(self) -> bool:
@@ -374,15 +378,15 @@ class OrderQueueManager:
         self.queue.clear()
         self.statistics.current_queue_size = 0
         
-        print(f"🧹 Cleared {cleared_count} orders from queue")
+        logger.info("🧹 Cleared %s orders from queue", cleared_count)
     
     def reset_statistics(self):
         """Reset queue statistics."""
         self.statistics = QueueStatistics()
         self.wait_times.clear()
-        self.queue_start_time = time.time()
+        self.queue_start_time = _clock.time()
         
-        print("📊 Queue statistics reset")
+        logger.info("📊 Queue statistics reset")
     
     def get_debug_info(self) -> Dict[str, Any]:
         """
@@ -398,7 +402,7 @@ class OrderQueueManager:
             'failed_orders': [order.order_id for order in self.failed_orders],
             'queue_timing': {
                 'queue_start_time': self.queue_start_time,
-                'current_time': time.time(),
-                'queue_duration': time.time() - self.queue_start_time
+                'current_time': _clock.time(),
+                'queue_duration': _clock.time() - self.queue_start_time
             }
         } 
\ No newline at end of file
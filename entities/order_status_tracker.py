@@ -1,11 +1,15 @@
+import logging
 from typing import List, Optional, Dict, Any, Callable
 from enum import Enum
-import time
 from dataclasses import dataclass
 from .robot_orders import Order, OrderStatus
 from .robot_order_assigner import RobotOrderAssigner
 from .order_queue_manager import OrderQueueManager
 from .robot_state import RobotState
+from core.determinism import get_clock
+
+logger = logging.getLogger(__name__)
+_clock = get_clock()
 
 class OrderStatusEvent(Enum):
     """Enumeration for order status events."""
@@ -71,7 +75,7 @@ class OrderStatusTracker:
         self.average_completion_time = 0.0
         self.average_efficiency_score = 0.0
         
-        print(f"📊 OrderStatusTracker initialized")
+        logger.info("📊 OrderStatusTracker initialized")
     
     def track_order(self, order: Order) -> bool:
         """
@@ -85,7 +89,7 @@ class OrderStatusTracker:
         """
         try:
             if order.order_id in self.active_orders:
-                print(f"⚠️  Order {order.order_id} is already being tracked")
+                logger.warning("⚠️  Order %s is already being tracked", order.order_id)
                 return False
             
             # Set initial status to IN_QUEUE
@@ -105,11 +109,11 @@ class OrderStatusTracker:
             # Emit order created event
             self._emit_status_event(OrderStatusEvent.ORDER_CREATED, order)
             
-            print(f"📋 Started tracking order {order.order_id}")
+            logger.info("📋 Started tracking order %s", order.order_id)
             return True
             
         except Exception as e:
-            print(f"❌ Error tracking order {order.order_id}: {e}")
+            logger.error("❌ Error tracking order %s: %s", order.order_id, e)
             return False
     
     def update_order_status(self, order_id: str, new_status: OrderStatus, 
@@ -129,7 +133,7 @@ class OrderStatusTracker:
         """
         try:
             if order_id not in self.active_orders:
-                print(f"⚠️  Order {order_id} not found in active orders")
+                logger.warning("⚠️  Order %s not found in active orders", order_id)
                 return False
             
             order = self.active_orders[order_id]
@@ -158,11 +162,11 @@ class OrderStatusTracker:
             # Emit status event
             self._emit_status_event(OrderStatusEvent.ORDER_IN_PROGRESS, order)
             
-            print(f"🔄 Updated order {order_id} status: {old_status.value} → {new_status.value}")
+            logger.info("🔄 Updated order %s status: %s → %s", order_id, old_status.value, new_status.value)
             return True
             
         except Exception as e:
-            print(f"❌ Error updating order {order_id} status: {e}")
+            logger.error("❌ Error updating order %s status: %s", order_id, e)
             return False
     
     def mark_item_collected(self, order_id: str, item_id: str, 
@@ -181,7 +185,7 @@ class OrderStatusTracker:
         """
         try:
             if order_id not in self.active_orders:
-                print(f"⚠️  Order {order_id} not found in active orders")
+                logger.warning("⚠️  Order %s not found in active orders", order_id)
                 return False
             
             order = self.active_orders[order_id]
@@ -205,14 +209,14 @@ class OrderStatusTracker:
                 if order.is_complete():
                     self._handle_order_completed(order)
                 
-                print(f"📦 Marked item {item_id} as collected for order {order_id}")
+                logger.info("📦 Marked item %s as collected for order %s", item_id, order_id)
                 return True
             else:
-                print(f"⚠️  Item {item_id} already collected or not in order {order_id}")
+                logger.warning("⚠️  Item %s already collected or not in order %s", item_id, order_id)
                 return False
                 
         except Exception as e:
-            print(f"❌ Error marking item {item_id} as collected: {e}")
+            logger.error("❌ Error marking item %s as collected: %s", item_id, e)
             return False
     
     def _handle_order_in_progress(self, order: Order, robot_id: Optional[str] = None):
@@ -221,18 +225,18 @@ class OrderStatusTracker:
             # Update assignment information
             if robot_id:
                 order.assigned_robot_id = robot_id
-                order.timestamp_assigned = time.time()
+                order.timestamp_assigned = _clock.time()
             
             # Emit order assigned event
             self._emit_status_event(OrderStatusEvent.ORDER_ASSIGNED, order, {
                 'robot_id': robot_id,
-                'assignment_time': time.time()
+                'assignment_time': _clock.time()
             })
             
-            print(f"🎯 Order {order.order_id} assigned to robot {robot_id}")
+            logger.info("🎯 Order %s assigned to robot %s", order.order_id, robot_id)
             
         except Exception as e:
-            print(f"❌ Error handling order in progress: {e}")
+            logger.error("❌ Error handling order in progress: %s", e)
     
     def _handle_order_completed(self, order: Order):
         """Handle order completion."""
@@ -240,7 +244,7 @@ class OrderStatusTracker:
             # Calculate completion metrics
             completion_time = 0.0
             if order.timestamp_assigned:
-                completion_time = time.time() - order.timestamp_assigned
+                completion_time = _clock.time() - order.timestamp_assigned
             
             # Calculate efficiency score
             efficiency_score = self._calculate_efficiency_score(order)
@@ -249,7 +253,7 @@ class OrderStatusTracker:
             total_distance = self._calculate_total_distance(order)
             
             # Update order completion
-            order.complete_order(time.time(), total_distance, efficiency_score)
+            order.complete_order(_clock.time(), total_distance, efficiency_score)
             
             # Update completion metrics
             metrics = self.completion_metrics[order.order_id]
@@ -276,10 +280,10 @@ class OrderStatusTracker:
                 'total_distance': total_distance
             })
             
-            print(f"✅ Order {order.order_id} completed (time: {completion_time:.2f}s, efficiency: {efficiency_score:.2f})")
+            logger.info("✅ Order %s completed (time: %.2fs, efficiency: %.2f)", order.order_id, completion_time, efficiency_score)
             
         except Exception as e:
-            print(f"❌ Error handling order completion: {e}")
+            logger.error("❌ Error handling order completion: %s", e)
     
     def _handle_order_failed(self, order: Order):
         """Handle order failure."""
@@ -300,10 +304,10 @@ class OrderStatusTracker:
             # Emit failure event
             self._emit_status_event(OrderStatusEvent.ORDER_FAILED, order)
             
-            print(f"❌ Order {order.order_id} failed")
+            logger.error("❌ Order %s failed", order.order_id)
             
         except Exception as e:
-            print(f"❌ Error handling order failure: {e}")
+            logger.error("❌ Error handling order failure: %s", e)
     
     def _calculate_efficiency_score(self, order: Order) -> float:
         """
@@ -335,7 +339,7 @@ class OrderStatusTracker:
             return min(1.0, max(0.0, efficiency))
             
         except Exception as e:
-            print(f"❌ Error calculating efficiency score: {e}")
+            logger.error("❌ Error calculating efficiency score: %s", e)
             return 0.0
     
     def _calculate_total_distance(self, order: Order) -> float:
@@ -355,7 +359,7 @@ class OrderStatusTracker:
             return base_distance
             
         except Exception as e:
-            print(f"❌ Error calculating total distance: {e}")
+            logger.error("❌ Error calculating total distance: %s", e)
             return 0.0
     
     def _update_average_metrics(self):
@@ -373,7 +377,7 @@ class OrderStatusTracker:
                 self.average_efficiency_score = total_efficiency / self.total_completions
                 
         except Exception as e:
-            print(f"❌ Error updating average metrics: {e}")
+            logger.error("❌ Error updating average metrics: %s", e)
     
     def _emit_status_event(self, event_type: OrderStatusEvent, order: Order, 
                           additional_data: Optional[Dict[str, Any]] = None):
@@ -383,7 +387,7 @@ class OrderStatusTracker:
                 'event_type': event_type.value,
                 'order_id': order.order_id,
                 'order_status': order.status.value,
-                'timestamp': time.time()
+                'timestamp': _clock.time()
             }
             
             if additional_data:
@@ -394,7 +398,7 @@ class OrderStatusTracker:
                 try:
                     callback(event_data)
                 except Exception as e:
-                    print(f"❌ Error in status callback: {e}")
+                    logger.error("❌ Error in status callback: %s", e)
             
             # Call completion callbacks for completion events
             if event_type in [OrderStatusEvent.ORDER_COMPLETED, OrderStatusEvent.ORDER_FAILED]:
@@ -402,10 +406,10 @@ class OrderStatusTracker:
                     try:
                         callback(event_data)
                     except Exception as e:
-                        print(f"❌ Error in completion callback: {e}")
+                        logger.error("❌ Error in completion callback: %s", e)
                     
         except Exception as e:
-            print(f"❌ Error emitting status event: {e}")
+            logger.error("❌ Error emitting status event: %s", e)
     
     def add_status_callback(self, callback: Callable):
         """Add a callback for status events."""
@@ -481,12 +485,12 @@ class OrderStatusTracker:
     def clear_completed_orders(self):
         """Clear completed orders from memory."""
         self.completed_orders.clear()
-        print("🧹 Cleared completed orders from memory")
+        logger.info("🧹 Cleared completed orders from memory")
     
     def clear_failed_orders(self):
         """Clear failed orders from memory."""
         self.failed_orders.clear()
-        print("🧹 Cleared failed orders from memory")
+        logger.info("🧹 Cleared failed orders from memory")
     
     def reset_statistics(self):
         """Reset all tracking statistics."""
@@ -497,7 +501,7 @@ class OrderStatusTracker:
         self.average_efficiency_score = 0.0
         self.completion_metrics.clear()
         
-        print("📊 Order status tracking statistics reset")
+        logger.info("📊 Order status tracking statistics reset")
     
     def get_debug_info(self) -> Dict[str, Any]:
         """
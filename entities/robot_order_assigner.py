@@ -17,7 +17,6 @@ Author: Roibot Development Team
 Version: 1.0
 """
 
-import time
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
@@ -25,6 +24,9 @@ from dataclasses import dataclass, field
 from .robot_orders import Order, OrderStatus
 from .order_queue_manager import OrderQueueManager
 from entities.robot_state import RobotState
+from core.determinism import get_clock
+
+_clock = get_clock()
 
 
 class AssignmentStatus(Enum):
@@ -69,7 +71,7 @@ class RobotOrderAssigner:
         
         # Statistics tracking
         self.statistics = AssignmentStatistics()
-        self.assigner_start_time = time.time()
+        self.assigner_start_time = _clock.time()
         
         # Performance tracking
         self.assignment_times: List[float] = []
@@ -115,12 +117,12 @@ class RobotOrderAssigner:
             
             # Assign order to robot
             self.current_assignment = order
-            self.assignment_start_time = time.time()
+            self.assignment_start_time = _clock.time()
             
             # Update order status
             order.status = OrderStatus.IN_PROGRESS
             order.assigned_robot_id = self.robot_id
-            order.timestamp_assigned = time.time()
+            order.timestamp_assigned = _clock.time()
             
             # Update statistics
             self.statistics.total_assignments += 1
@@ -129,7 +131,7 @@ class RobotOrderAssigner:
             assignment_record = {
                 'order_id': order.order_id,
                 'robot_id': self.robot_id,
-                'assignment_time': time.time(),
+                'assignment_time': _clock.time(),
                 'robot_state': robot_state.value,
                 'order_items': len(order.item_ids)
             }
@@ -195,7 +197,7 @@ class RobotOrderAssigner:
             
             # Update assignment duration
             if self.assignment_start_time:
-                self.statistics.current_assignment_duration = time.time() - self.assignment_start_time
+                self.statistics.current_assignment_duration = _clock.time() - self.assignment_start_time
             
             return True
             
@@ -217,7 +219,7 @@ class RobotOrderAssigner:
             # Calculate assignment time
             assignment_time = 0.0
             if self.assignment_start_time:
-                assignment_time = time.time() - self.assignment_start_time
+                assignment_time = _clock.time() - self.assignment_start_time
             
             # Update statistics
             self.statistics.total_completions += 1
@@ -226,7 +228,7 @@ class RobotOrderAssigner:
             
             # Update order completion
             self.current_assignment.complete_order(
-                time.time(),
+                _clock.time(),
                 self.current_assignment.total_distance,
                 self.current_assignment.efficiency_score
             )
@@ -302,7 +304,7 @@ class RobotOrderAssigner:
         Returns:
             Dictionary with assignment statistics
         """
-        total_time = time.time() - self.assigner_start_time
+        total_time = _clock.time() - self.assigner_start_time
         utilization_rate = 0.0
         if total_time > 0:
             utilization_rate = (self.statistics.current_assignment_duration / total_time) * 100
@@ -370,7 +372,7 @@ class RobotOrderAssigner:
         self.statistics = AssignmentStatistics()
         self.assignment_times.clear()
         self.completion_times.clear()
-        self.assigner_start_time = time.time()
+        self.assigner_start_time = _clock.time()
         
         print("📊 Assignment statistics reset")
     
@@ -392,7 +394,7 @@ class RobotOrderAssigner:
             'assignment_history': self.assignment_history[-5:] if self.assignment_history else [],  # Last 5 assignments
             'assigner_timing': {
                 'assigner_start_time': self.assigner_start_time,
-                'current_time': time.time(),
-                'assigner_duration': time.time() - self.assigner_start_time
+                'current_time': _clock.time(),
+                'assigner_duration': _clock.time() - self.assigner_start_time
             }
         } 
\ No newline at end of file
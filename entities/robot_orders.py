@@ -1,7 +1,9 @@
 from typing import List, Optional, Dict, Any
 from enum import Enum
-import time
 from .robot_state import RobotState
+from core.determinism import get_clock
+
+_clock = get_clock()
 
 class OrderStatus(Enum):
     """Enumeration for order status."""
@@ -131,7 +133,7 @@ class RobotOrders:
             return False
         
         # Assign order to robot
-        order.assign_to_robot(self.robot.robot_id, time.time())
+        order.assign_to_robot(self.robot.robot_id, _clock.time())
         self.current_order = order
         
         # Set up robot for order execution
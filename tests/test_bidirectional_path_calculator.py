@@ -313,9 +313,13 @@ class TestBidirectionalPathCalculator(unittest.TestCase):
         self.assertGreater(complete_path.total_duration, 0)
         self.assertEqual(len(complete_path.items_to_collect), 4)
         
-        # Verify items are sorted in ascending order
+        # Verify the optimized order visits every item and beats ascending order
         sorted_items = sorted(item_positions, key=lambda pos: (pos.aisle, pos.rack))
-        self.assertEqual(complete_path.optimized_order, sorted_items)
+        self.assertCountEqual(complete_path.optimized_order, item_positions)
+        sequencer = self.path_calculator.pick_sequencer
+        packout = Coordinate(1, 1)
+        self.assertLess(sequencer.tour_distance(start_pos, complete_path.optimized_order, packout),
+                        sequencer.tour_distance(start_pos, sorted_items, packout))
     
     def test_path_segment_creation(self):
         """Test path segment creation and properties."""
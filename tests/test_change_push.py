@@ -0,0 +1,265 @@
+"""
+Test suite for change-driven push.
+Tests the engine's change subscription API, the engine thread publishing and
+reporting changes as they happen, and the change pusher's per-topic rate
+limits, coalescing, bounded latency and idle behaviour.
+"""
+
+import asyncio
+import io
+import sys
+import os
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.engine import SimulationEngine
+from core.engine_bridge import EngineThread, StateChannel
+from web_interface.server.change_pusher import ChangePusher
+
+
+def wait_until(condition, timeout=5.0):
+    """Poll a condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
+class ChangingEngine:
+    """Minimal engine with one robot that reports its moves as changes."""
+
+    class Robot:
+        def __init__(self):
+            self.robot_id = "ROBOT_001"
+            self.state = "moving"
+            self.aisle = 1.0
+
+    def __init__(self):
+        self.is_running = True
+        self.simulation_time = 0.0
+        self.simulation_speed = 1.0
+        self.robots = [self.Robot()]
+        self.subscribers = []
+
+    def subscribe_changes(self, callback, topics=None):
+        self.subscribers.append(callback)
+
+    def unsubscribe_changes(self, callback):
+        self.subscribers.remove(callback)
+        return True
+
+    def move(self):
+        self.robots[0].aisle += 1.0
+        for callback in self.subscribers:
+            callback("robots", {"robot_id": "ROBOT_001"})
+
+    def get_robot_position(self, robot_id):
+        class Position:
+            aisle = self.robots[0].aisle
+            rack = 1.0
+        return Position()
+
+
+class TestEngineChanges(unittest.TestCase):
+    """Test SimulationEngine change notifications."""
+
+    def test_headless_run_reports_changes(self):
+        """Test that a run reports waypoints, orders, items and KPI changes."""
+        engine = SimulationEngine()
+        received = []
+        orders_only = []
+        engine.subscribe_changes(lambda topic, data: received.append((topic, data)))
+        engine.subscribe_changes(lambda topic, data: orders_only.append(topic), topics=["orders"])
+
+        with redirect_stdout(io.StringIO()):
+            report = asyncio.run(engine.run_for(120.0))
+
+        topics = {topic for topic, _ in received}
+        self.assertTrue({"robots", "orders", "items", "kpis"} <= topics)
+        self.assertGreaterEqual(sum(1 for topic, _ in received if topic == "items"), report["items_collected"])
+        statuses = [data["status"] for topic, data in received if topic == "orders"]
+        self.assertEqual(statuses.count("pending"), report["orders_generated"])
+        self.assertEqual(set(orders_only), {"orders"})
+        self.assertEqual(len(orders_only), len(statuses))
+
+        with self.assertRaises(ValueError):
+            engine.subscribe_changes(print, topics=["robots", "weather"])
+
+        print("✅ Engine change notification test passed")
+
+    def test_unsubscribe_and_failing_subscriber(self):
+        """Test that removed subscribers stop receiving and failures are contained."""
+        engine = SimulationEngine()
+        received = []
+
+        def failing(topic, data):
+            raise RuntimeError("subscriber failed")
+
+        engine.subscribe_changes(failing)
+        engine.subscribe_changes(lambda topic, data: received.append(topic))
+        engine.set_simulation_speed(2.0)
+        self.assertEqual(received, ["simulation"])
+
+        self.assertTrue(engine.unsubscribe_changes(failing))
+        self.assertFalse(engine.unsubscribe_changes(failing))
+
+        print("✅ Unsubscribe test passed")
+
+
+class TestEngineThreadChanges(unittest.TestCase):
+    """Test change-triggered publishing on the engine thread."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.engine = ChangingEngine()
+        self.bridge = EngineThread(self.engine, StateChannel(64), publish_interval=60.0)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.bridge.stop()
+
+    def test_change_is_published_before_listeners_run(self):
+        """Test that listeners learn of a change after the channel holds it."""
+        notices = []
+        self.bridge.add_change_listener(
+            lambda topics, since: notices.append((topics, since, self.bridge.channel.latest("robots"))))
+        self.bridge.start(run_engine=False)
+        self.assertTrue(wait_until(lambda: self.bridge.channel.head == 2))  # First tick: status and robots
+
+        self.assertTrue(wait_until(lambda: notices))  # The first tick's publish is reported too
+        notices.clear()
+        before = time.monotonic()
+        self.bridge.call(self.engine.move).result(1)
+        self.assertTrue(wait_until(lambda: notices))
+        topics, since, robots = notices[0]
+        self.assertEqual(topics, {"robots"})
+        self.assertGreaterEqual(since, before)
+        self.assertEqual(robots[0]["aisle"], 2.0)
+
+        self.bridge.stop()
+        self.assertEqual(self.engine.subscribers, [])
+
+        print("✅ Engine thread change publish test passed")
+
+
+class TestChangePusher(unittest.TestCase):
+    """Test rate-limited, coalescing pushes."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.pushes = []
+        self.pusher = ChangePusher(lambda topics: self.pushes.append((time.monotonic(), topics)),
+                                   {'robot_data': 20.0, 'kpi_data': 2.0})
+        self.pusher.start()
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.pusher.stop()
+
+    def test_changes_coalesce_within_rate(self):
+        """Test that a burst is pushed promptly once, then limited to the topic rate."""
+        self.pusher.notify('robot_data')
+        self.pusher.notify('kpi_data')
+        self.assertTrue(wait_until(lambda: self.pushes))
+        self.assertEqual(self.pushes[0][1], {'robot_data', 'kpi_data'})
+
+        end = time.monotonic() + 0.5
+        while time.monotonic() < end:
+            self.pusher.notify('robot_data')
+            self.pusher.notify('kpi_data')
+            time.sleep(0.001)
+        time.sleep(0.6)
+
+        robot_pushes = [at for at, topics in self.pushes if 'robot_data' in topics]
+        kpi_pushes = [at for at, topics in self.pushes if 'kpi_data' in topics]
+        self.assertLessEqual(len(robot_pushes), 13)  # 20/s over ~0.55s, plus the first
+        self.assertGreaterEqual(len(robot_pushes), 5)
+        self.assertLessEqual(len(kpi_pushes), 3)
+        intervals = [later - earlier for earlier, later in zip(robot_pushes, robot_pushes[1:])]
+        self.assertGreaterEqual(min(intervals), 0.05 - 0.005)
+
+        stats = self.pusher.get_statistics()
+        self.assertGreater(stats['topics']['robot_data']['notifications'], len(robot_pushes))
+        self.assertEqual(stats['topics']['robot_data']['pushes'], len(robot_pushes))
+        self.assertLess(stats['topics']['robot_data']['max_latency_ms'], 100)
+        self.assertEqual(stats['pending'], [])
+
+        print("✅ Coalescing and rate limit test passed")
+
+    def test_idle_pushes_nothing(self):
+        """Test that without changes nothing is pushed."""
+        time.sleep(0.2)
+        self.assertEqual(self.pushes, [])
+        self.assertTrue(self.pusher.is_running)
+        self.assertFalse(self.pusher.start())
+
+        self.pusher.stop()
+        self.assertFalse(self.pusher.is_running)
+        self.pusher.notify('robot_data')
+        time.sleep(0.05)
+        self.assertEqual(self.pushes, [])
+
+        print("✅ Idle test passed")
+
+    def test_failing_push_and_invalid_rate(self):
+        """Test that a failing push does not stop the pusher, and rate validation."""
+        calls = []
+
+        def failing(topics):
+            calls.append(topics)
+            raise RuntimeError("push failed")
+
+        self.pusher.push = failing
+        self.pusher.notify('robot_data')
+        self.assertTrue(wait_until(lambda: len(calls) == 1))
+        time.sleep(0.06)
+        self.pusher.notify('robot_data')
+        self.assertTrue(wait_until(lambda: len(calls) == 2))
+
+        with self.assertRaises(ValueError):
+            self.pusher.set_max_rate('robot_data', 0)
+        with self.assertRaises(ValueError):
+            ChangePusher(failing, default_rate=-1)
+
+        print("✅ Failing push and invalid rate test passed")
+
+
+class TestPushLatencyBenchmark(unittest.TestCase):
+    """Benchmark engine change to push latency."""
+
+    def test_change_to_push_latency(self):
+        """Measure latency from an engine change to the push through the engine thread."""
+        engine = ChangingEngine()
+        bridge = EngineThread(engine, StateChannel(1024), publish_interval=60.0)
+        pushes = []
+        pusher = ChangePusher(lambda topics: pushes.append(topics), {'robot_data': 1000.0})
+        bridge.add_change_listener(lambda topics, since: pusher.notify('robot_data', since))
+        bridge.start(run_engine=False)
+        pusher.start()
+        try:
+            changes = 50
+            for index in range(changes):
+                bridge.call(engine.move).result(1)
+                self.assertTrue(wait_until(lambda: len(pushes) > index, timeout=1.0))
+        finally:
+            pusher.stop()
+            bridge.stop()
+
+        stats = pusher.get_statistics()['topics']['robot_data']
+        self.assertEqual(stats['pushes'], changes)
+        self.assertLess(stats['avg_latency_ms'], 50)
+
+        print(f"📊 Change to push latency: {stats['avg_latency_ms']:.2f}ms avg, "
+              f"{stats['max_latency_ms']:.2f}ms max (polling at 100ms: up to 100ms)")
+        print("✅ Push latency benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,314 @@
+"""
+Test suite for per-client outbound queues and topic subscriptions.
+Tests coalescing of stale messages, bounded queues, per-client rate limits
+and slow-client detection in ClientOutbox, and that WebSocketHandler sends
+each client only its subscribed topics without letting a slow client stall
+broadcasts to the others.
+"""
+
+import json
+import sys
+import os
+import threading
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from web_interface.server.client_outbox import ClientOutbox
+from web_interface.server.snapshot_cache import SnapshotCache
+from web_interface.server.state_delta import snapshot_topics
+from web_interface.server.websocket_handler import WebSocketHandler
+
+
+class GatedSend:
+    """Send function that blocks until opened, recording what it sent."""
+
+    def __init__(self, open_gate=True):
+        self.sent = []
+        self.gate = threading.Event()
+        if open_gate:
+            self.gate.set()
+
+    def __call__(self, message):
+        self.gate.wait(5.0)
+        self.sent.append((time.monotonic(), message))
+
+
+class TestClientOutbox(unittest.TestCase):
+    """Test the bounded per-client queue."""
+
+    def setUp(self):
+        self.outboxes = []
+
+    def tearDown(self):
+        for outbox in self.outboxes:
+            outbox.close()
+
+    def make_outbox(self, send, **kwargs):
+        outbox = ClientOutbox(send, **kwargs)
+        self.outboxes.append(outbox)
+        return outbox
+
+    def test_stale_messages_are_replaced(self):
+        """Test that a newer keyed message replaces the unsent one, unkeyed ones are kept."""
+        send = GatedSend(open_gate=False)
+        dropped = []
+        outbox = self.make_outbox(send, on_drop=lambda key, meta: dropped.append((key, meta)))
+        outbox.put('blocker')
+        time.sleep(0.05)  # The sender thread is now blocked in send
+        for version in range(1, 6):
+            outbox.put(f'state {version}', key='state', meta=version)
+        outbox.put('pong')
+        self.assertEqual(outbox.peek('state'), 5)
+
+        send.gate.set()
+        self.assertTrue(outbox.flush())
+        self.assertEqual([message for _, message in send.sent], ['blocker', 'state 5', 'pong'])
+        self.assertEqual(dropped, [('state', 1), ('state', 2), ('state', 3), ('state', 4)])
+        self.assertEqual(outbox.get_statistics()['superseded'], 4)
+
+        print("✅ Stale message replacement test passed")
+
+    def test_overflow_drops_oldest_keyed(self):
+        """Test the queue bound and slow-client detection."""
+        send = GatedSend(open_gate=False)
+        dropped = []
+        outbox = self.make_outbox(send, max_size=3, on_drop=lambda key, meta: dropped.append(key), name='slow')
+        outbox.put('blocker')
+        time.sleep(0.05)
+        outbox.put('robots', key='robot_data')
+        outbox.put('reply 1')
+        outbox.put('orders', key='order_data')
+        outbox.put('reply 2')
+
+        stats = outbox.get_statistics()
+        self.assertEqual(stats['queue_length'], 3)
+        self.assertEqual(stats['overflowed'], 1)
+        self.assertTrue(stats['slow'])
+        self.assertEqual(dropped, ['robot_data'])
+
+        send.gate.set()
+        self.assertTrue(outbox.flush())
+        self.assertEqual([message for _, message in send.sent], ['blocker', 'reply 1', 'orders', 'reply 2'])
+        self.assertFalse(outbox.slow)
+
+        with self.assertRaises(ValueError):
+            ClientOutbox(send, max_size=0)
+        with self.assertRaises(ValueError):
+            outbox.set_max_rate(0)
+
+        print("✅ Overflow test passed")
+
+    def test_max_rate(self):
+        """Test that keyed messages are spaced by the rate and coalesced meanwhile."""
+        send = GatedSend()
+        outbox = self.make_outbox(send, max_rate=20.0)
+        end = time.monotonic() + 0.3
+        version = 0
+        while time.monotonic() < end:
+            version += 1
+            outbox.put(version, key='state')
+            time.sleep(0.002)
+        outbox.put('pong')
+        self.assertTrue(outbox.flush())
+
+        states = [(at, message) for at, message in send.sent if message != 'pong']
+        self.assertLessEqual(len(states), 8)  # 20/s over 0.3s, plus the first
+        self.assertEqual(states[-1][1], version)
+        gaps = [later[0] - earlier[0] for earlier, later in zip(states, states[1:])]
+        self.assertGreaterEqual(min(gaps), 0.045)
+        self.assertIn('pong', [message for _, message in send.sent])
+
+        print("✅ Max rate test passed")
+
+
+class ChangingDataBridge:
+    """DataBridge stand-in whose robots, KPIs and inventory change on demand."""
+
+    def __init__(self):
+        self.tick = 0
+        self.snapshot_cache = SnapshotCache({topic: getattr(self, f'get_{topic}') for topic in (
+            'simulation_state', 'robot_data', 'order_data', 'kpi_data', 'inventory_data', 'warehouse_data')},
+            tick_source=lambda: self.tick)
+
+    def get_simulation_state(self):
+        return {'status': 'running', 'time': float(self.tick)}
+
+    def get_robot_data(self):
+        return [{'id': 'ROBOT_001', 'position': f'B{self.tick % 20 + 1}', 'state': 'MOVING'}]
+
+    def get_order_data(self):
+        return {'pending': 0, 'in_progress': 0, 'completed': 0, 'total': 0, 'orders': []}
+
+    def get_kpi_data(self):
+        return {'orders_per_hour': self.tick}
+
+    def get_inventory_data(self):
+        return {'inventory': {'ITEM_A1': {'quantity': 100 - self.tick}}}
+
+    def get_warehouse_data(self):
+        return {'grid_size': {'width': 25, 'height': 20}}
+
+    def get_snapshot(self, topic):
+        return self.snapshot_cache.get(topic)
+
+    def get_state_topics(self):
+        cache = self.snapshot_cache
+        return snapshot_topics(cache.data('simulation_state'), cache.data('robot_data'), cache.data('order_data'),
+                               cache.data('kpi_data'), cache.data('inventory_data'))
+
+
+class ClientSocket:
+    """Socket acting as a browser: applies state frames and acknowledges them."""
+
+    def __init__(self, handler, client_id, delay=0.0):
+        self.handler = handler
+        self.client_id = client_id
+        self.delay = delay
+        self.gate = threading.Event()
+        self.gate.set()
+        self.frames = []
+        self.version = None
+        self.topics = {}
+
+    def send(self, message):
+        self.gate.wait(5.0)
+        time.sleep(self.delay)
+        message = json.loads(message)
+        if message['type'] != 'state_delta':
+            return
+        frame = message['data']
+        self.frames.append(frame)
+        if frame['keyframe']:
+            self.topics = {}
+        elif self.version is None or self.version < frame['base']:
+            raise AssertionError(f"{self.client_id} got a delta without its base")
+        for topic, change in frame['topics'].items():
+            values = self.topics.setdefault(topic, {})
+            for key in change['del']:
+                values.pop(key, None)
+            values.update(change['set'])
+        self.version = frame['version']
+        self.handler.handle_client_message(self.client_id, {'type': 'state_ack', 'data': {'version': frame['version']}})
+
+
+class TestPerClientStreams(unittest.TestCase):
+    """Test subscriptions, rate limits and slow clients in WebSocketHandler."""
+
+    def setUp(self):
+        self.bridge = ChangingDataBridge()
+        self.handler = WebSocketHandler(self.bridge)
+        self.sockets = {}
+
+    def tearDown(self):
+        for socket in self.sockets.values():
+            socket.gate.set()
+        for client_id in list(self.handler.connected_clients):
+            self.handler.unregister_client(client_id)
+
+    def connect(self, client_id, delay=0.0):
+        socket = self.sockets[client_id] = ClientSocket(self.handler, client_id, delay)
+        self.handler.register_client(client_id, socket)
+        return socket
+
+    def tick(self, count=1):
+        for _ in range(count):
+            self.bridge.tick += 1
+            self.handler.broadcast_updates()
+
+    def test_subscribed_topics_only(self):
+        """Test that a KPI wall gets only KPIs while other clients get everything."""
+        wall = self.connect('kpi-wall')
+        full = self.connect('dashboard')
+        self.handler.handle_client_message('kpi-wall', {'type': 'subscribe', 'data': {'data_types': ['kpi_data', 'weather']}})
+        self.assertEqual(self.handler.get_status()['client_subscriptions']['kpi-wall'], ['kpi_data'])
+
+        for _ in range(5):
+            self.tick()
+            self.assertTrue(self.handler.flush())
+
+        self.assertEqual({topic for frame in wall.frames for topic in frame['topics']}, {'kpis'})
+        self.assertEqual(wall.topics['kpis'], {'orders_per_hour': self.bridge.tick})
+        self.assertIn('inventory', full.topics)
+        self.assertEqual(wall.version, full.version)
+
+        # Unsubscribing from everything returns to all topics, starting from a keyframe
+        self.handler.handle_client_message('kpi-wall', {'type': 'unsubscribe', 'data': {'data_types': ['kpi_data']}})
+        self.tick()
+        self.assertTrue(self.handler.flush())
+        self.assertTrue(wall.frames[-1]['keyframe'])
+        self.assertEqual(wall.topics, full.topics)
+
+        print("✅ Topic subscription test passed")
+
+    def test_client_max_rate(self):
+        """Test that a rate-limited client gets fewer frames but ends up current."""
+        limited = self.connect('limited')
+        fast = self.connect('fast')
+        self.handler.handle_client_message('limited', {'type': 'subscribe', 'data': {'data_types': [], 'max_rate': 5}})
+
+        for _ in range(20):
+            self.tick()
+            time.sleep(0.02)
+        self.assertTrue(self.handler.flush(timeout=2.0))
+
+        self.assertLessEqual(len(limited.frames), 4)  # 5/s over ~0.4s, plus the first
+        self.assertGreater(len(fast.frames), len(limited.frames))
+        self.assertEqual(limited.topics, fast.topics)
+        self.assertEqual(self.handler.get_status()['client_outboxes']['limited']['max_rate'], 5.0)
+
+        print("✅ Client max rate test passed")
+
+    def test_slow_client_does_not_stall_others(self):
+        """Test that a blocked client skips stale frames while the rest keep up."""
+        slow = self.connect('slow')
+        slow.gate.clear()
+        others = [self.connect(f'client-{index}') for index in range(5)]
+
+        start = time.perf_counter()
+        for _ in range(50):
+            self.tick()
+            for socket in others:
+                self.assertTrue(self.handler.client_outboxes[socket.client_id].flush())
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 2.0)
+        self.assertTrue(all(socket.version == self.handler.state_stream.version for socket in others))
+        slow_stats = self.handler.get_status()['client_outboxes']['slow']
+        self.assertLessEqual(slow_stats['queue_length'], self.handler.max_queue_size)
+        self.assertGreater(self.handler.state_stream.stats['dropped'], 40)
+
+        slow.gate.set()
+        self.tick()
+        self.assertTrue(self.handler.flush(timeout=2.0))
+        self.assertEqual(slow.version, self.handler.state_stream.version)
+        self.assertEqual(slow.topics, others[0].topics)
+
+        print("✅ Slow client isolation test passed")
+
+    def test_broadcast_cost_with_slow_client(self):
+        """Benchmark a broadcast tick with and without a client that takes 50ms per send."""
+        timings = {}
+        for label, delay in (('fast clients', 0.0), ('one slow client', 0.05)):
+            self.tearDown()
+            self.setUp()
+            self.connect('slow', delay)
+            for index in range(20):
+                self.connect(f'client-{index}')
+            self.handler.flush(timeout=5.0)
+
+            ticks = 30
+            start = time.perf_counter()
+            self.tick(ticks)
+            timings[label] = (time.perf_counter() - start) * 1000 / ticks
+
+        self.assertLess(timings['one slow client'], 50)
+        print(f"📊 Broadcast tick with 21 clients: {timings['fast clients']:.2f}ms all fast, "
+              f"{timings['one slow client']:.2f}ms with one 50ms/send client")
+        print("✅ Slow client broadcast benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
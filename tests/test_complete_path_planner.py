@@ -248,14 +248,19 @@ class TestCompletePathPlanner(unittest.TestCase):
         
         optimized_items = self.path_planner.optimize_item_order(unsorted_items)
         
-        # Verify items are sorted in ascending order
+        # Verify items follow the shortest tour from packout and back
         expected_order = [
-            Coordinate(1, 15),
             Coordinate(2, 5),
-            Coordinate(3, 10)
+            Coordinate(3, 10),
+            Coordinate(1, 15)
         ]
         
         self.assertEqual(optimized_items, expected_order)
+        sequencer = self.path_planner.path_calculator.pick_sequencer
+        packout = Coordinate(1, 1)
+        ascending = sorted(unsorted_items, key=lambda pos: (pos.aisle, pos.rack))
+        self.assertLess(sequencer.tour_distance(packout, optimized_items, packout),
+                        sequencer.tour_distance(packout, ascending, packout))
         print("✅ Item order optimization passed")
         
         # Test empty list
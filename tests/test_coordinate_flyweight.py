@@ -0,0 +1,133 @@
+"""
+Test suite for interned grid coordinates.
+Tests Coordinate.of() identity and validation, precomputed hashes and cell IDs,
+interned keys in the layout and route table, and lookup speed against the
+previous tuple-hashing coordinate.
+"""
+
+from dataclasses import dataclass
+import pickle
+import random
+import sys
+import os
+import timeit
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.layout.coordinate import Coordinate, CoordinateError, SmoothCoordinate
+from core.layout.route_table import get_route_table
+from core.layout.warehouse_layout import WarehouseLayoutManager
+
+
+@dataclass(frozen=True)
+class TupleHashCoordinate:
+    """The previous Coordinate: validated on every construction, hashed through a tuple."""
+    aisle: int
+    rack: int
+
+    def __post_init__(self):
+        if not (1 <= self.aisle <= 25) or not (1 <= self.rack <= 20):
+            raise CoordinateError("out of bounds")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TupleHashCoordinate):
+            return False
+        return self.aisle == other.aisle and self.rack == other.rack
+
+    def __hash__(self) -> int:
+        return hash((self.aisle, self.rack))
+
+
+class TestCoordinateOf(unittest.TestCase):
+    """Test Coordinate.of() interning."""
+
+    def test_returns_shared_instance(self):
+        """Test that each grid cell has exactly one interned instance."""
+        self.assertIs(Coordinate.of(3, 7), Coordinate.of(3, 7))
+        self.assertIsNot(Coordinate.of(3, 7), Coordinate.of(7, 3))
+        self.assertEqual(Coordinate.of(3, 7), Coordinate(3, 7))
+        self.assertEqual(hash(Coordinate.of(3, 7)), hash(Coordinate(3, 7)))
+        self.assertIs(SmoothCoordinate(25.0, 20.0).to_coordinate(), Coordinate.of(25, 20))
+
+        print("✅ Interned coordinate identity test passed")
+
+    def test_validation(self):
+        """Test that out-of-range cells raise and non-integers are not interned."""
+        for aisle, rack in ((0, 1), (-1, 1), (26, 1), (1, 0), (1, -3), (1, 21)):
+            with self.assertRaises(CoordinateError):
+                Coordinate.of(aisle, rack)
+
+        fractional = Coordinate.of(2.5, 3)
+        self.assertEqual((fractional.aisle, fractional.rack), (2.5, 3))
+        self.assertIsNot(fractional, Coordinate.of(2.5, 3))
+
+        print("✅ Interned coordinate validation test passed")
+
+    def test_cell_id_and_pickling(self):
+        """Test row-major cell IDs and that copies keep their precomputed hash."""
+        table = get_route_table(25, 20)
+        for aisle in range(1, 26):
+            for rack in range(1, 21):
+                coord = Coordinate.of(aisle, rack)
+                self.assertEqual(coord.cell_id, table.cell_id(coord))
+                self.assertIs(table.coordinate(coord.cell_id), coord)
+
+        restored = pickle.loads(pickle.dumps(Coordinate.of(4, 9)))
+        self.assertEqual(restored, Coordinate.of(4, 9))
+        self.assertEqual(hash(restored), hash(Coordinate.of(4, 9)))
+
+        print("✅ Cell ID and pickling test passed")
+
+
+class TestInternedIndexes(unittest.TestCase):
+    """Test that grid and route indexes hold interned coordinates."""
+
+    def test_layout_and_routes_use_interned_keys(self):
+        """Test grid_state keys and route cells are the shared instances."""
+        layout = WarehouseLayoutManager()
+        for coord in layout.grid_state:
+            self.assertIs(coord, Coordinate.of(coord.aisle, coord.rack))
+
+        route = get_route_table(25, 20).route(Coordinate(3, 5), Coordinate(8, 12))
+        for coord in route:
+            self.assertIs(coord, Coordinate.of(coord.aisle, coord.rack))
+
+        print("✅ Interned index test passed")
+
+
+class TestCoordinateLookupBenchmark(unittest.TestCase):
+    """Benchmark grid lookups against the previous tuple-hashing coordinate."""
+
+    LOOKUPS = 20000
+
+    def test_lookup_speed(self):
+        """Report lookup times; interned keys must beat tuple-hashed keys."""
+        rng = random.Random(5)
+        cells = [(rng.randint(1, 25), rng.randint(1, 20)) for _ in range(self.LOOKUPS)]
+
+        legacy_grid = {TupleHashCoordinate(a, r): a for a in range(1, 26) for r in range(1, 21)}
+        legacy_keys = [TupleHashCoordinate(a, r) for a, r in cells]
+        grid = WarehouseLayoutManager().grid_state
+        interned_keys = [Coordinate.of(a, r) for a, r in cells]
+
+        def lookups(table, keys):
+            return min(timeit.repeat(lambda: [table[key] for key in keys], number=5, repeat=5)) / 5
+
+        legacy = lookups(legacy_grid, legacy_keys)
+        interned = lookups(grid, interned_keys)
+        build_legacy = min(timeit.repeat(lambda: [TupleHashCoordinate(a, r) for a, r in cells], number=1, repeat=3))
+        build_interned = min(timeit.repeat(lambda: [Coordinate.of(a, r) for a, r in cells], number=1, repeat=3))
+
+        print(f"📊 {self.LOOKUPS} grid lookups: tuple hash {legacy * 1e3:.2f}ms, "
+              f"interned {interned * 1e3:.2f}ms ({legacy / interned:.1f}x); key construction "
+              f"{build_legacy * 1e3:.2f}ms vs Coordinate.of {build_interned * 1e3:.2f}ms")
+        self.assertLess(interned, legacy)
+        self.assertLess(build_interned, build_legacy)
+
+        print("✅ Coordinate lookup benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+"""
+Test suite for deterministic simulation mode.
+Tests seeded random streams, the simulation clock, seeded order generation,
+and that two engines with the same seed produce identical runs and analytics.
+"""
+
+import asyncio
+import random
+import sys
+import os
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analytics.analytics_engine import AnalyticsEngine
+from core.determinism import (DEFAULT_EPOCH, ORDER_STREAM, RandomStreams, SimulationClock,
+                              get_clock, get_random, seed_simulation)
+from core.engine import SimulationEngine
+from entities.order_generator import OrderGenerator
+
+
+class TestRandomStreams(unittest.TestCase):
+    """Test named random streams."""
+
+    def test_streams_reproducible_and_independent(self):
+        """Test that a stream's sequence depends only on the seed and its own draws."""
+        first = RandomStreams(42)
+        second = RandomStreams(42)
+        for _ in range(100):
+            second.stream("inventory").random()  # Draws on another stream
+        orders = [first.stream("orders").random() for _ in range(5)]
+
+        self.assertEqual([second.stream("orders").random() for _ in range(5)], orders)
+        self.assertNotEqual([first.stream("inventory").random() for _ in range(5)], orders)
+        self.assertNotEqual([RandomStreams(43).stream("orders").random() for _ in range(5)], orders)
+
+        print("✅ Stream independence test passed")
+
+    def test_reseed_and_state(self):
+        """Test in-place reseeding and restoring a saved state."""
+        streams = RandomStreams(1)
+        generator = streams.stream("orders")
+        expected = [generator.random() for _ in range(3)]
+
+        streams.reseed(1)
+        self.assertIs(streams.stream("orders"), generator)
+        self.assertEqual([generator.random() for _ in range(3)], expected)
+
+        state = streams.get_state()
+        following = [generator.random() for _ in range(3)]
+        streams.set_state(state)
+        self.assertEqual([generator.random() for _ in range(3)], following)
+
+        print("✅ Reseed and state test passed")
+
+    def test_unseeded_uses_random_module(self):
+        """Test that unseeded streams are the random module, so random.seed() still applies."""
+        streams = RandomStreams()
+        self.assertIs(streams.stream("orders"), random)
+        self.assertIsNone(streams.get_state()["seed"])
+
+        print("✅ Unseeded stream test passed")
+
+
+class TestSimulationClock(unittest.TestCase):
+    """Test the simulation clock."""
+
+    def test_anchor_and_release(self):
+        """Test wall time when unanchored and epoch plus simulated time when anchored."""
+        clock = SimulationClock()
+        self.assertFalse(clock.deterministic)
+        self.assertLess(abs(clock.time() - time.time()), 1.0)
+
+        clock.anchor(DEFAULT_EPOCH)
+        clock.simulation_time = 90.5
+        self.assertTrue(clock.deterministic)
+        self.assertEqual(clock.time(), DEFAULT_EPOCH + 90.5)
+        self.assertEqual(clock.now().timestamp(), DEFAULT_EPOCH + 90.5)
+
+        clock.release()
+        self.assertLess(abs(clock.time() - time.time()), 1.0)
+
+        print("✅ Clock anchor test passed")
+
+
+class TestSeededSimulation(unittest.TestCase):
+    """Test seeded generators and engines."""
+
+    def tearDown(self):
+        """Go back to unseeded wall-clock runs."""
+        seed_simulation(None)
+
+    def test_seeded_generators(self):
+        """Test that order IDs and order items repeat under a seed."""
+        def generate():
+            seed_simulation(7)
+            get_clock().simulation_time = 12.0
+            orders = OrderGenerator(None)
+            orders.item_pool = [{"item_id": f"ITEM_{index}", "position": (index, 1)} for index in range(20)]
+            order = orders.generate_order(12.0)
+            return order.order_id, order.item_ids, order.item_positions
+
+        first = generate()
+        self.assertEqual(generate(), first)
+        self.assertTrue(first[0].startswith("ORD_20250101_"))
+
+        print("✅ Seeded generator test passed")
+
+    def test_engines_with_same_seed_match(self):
+        """Test that two engines with the same seed produce the same orders and timestamps."""
+        def run(seed):
+            engine = SimulationEngine()
+            engine.configure_seed(seed)
+            asyncio.run(engine.run_for(240.0, time_step=0.1))
+            return [(order["id"], order["items"], order["location"], order["priority"], order["created_time"],
+                     order["status"], order.get("completed_time")) for order in engine.orders]
+
+        first = run(42)
+        self.assertGreaterEqual(len(first), 3)
+        self.assertIn("completed", [order[5] for order in first])
+        self.assertEqual(run(42), first)
+        self.assertNotEqual(run(43), first)
+        self.assertEqual(first[0][4], DEFAULT_EPOCH)  # First order at simulated time 0
+
+        print("✅ Seeded engine reproducibility test passed")
+
+    def test_engines_with_same_seed_produce_same_analytics(self):
+        """Test that analytics fed by two engines with the same seed export identical data."""
+        def run(seed):
+            engine = SimulationEngine()
+            engine.configure_seed(seed)
+            analytics = AnalyticsEngine(clock=engine.clock)
+            engine.subscribe_changes(analytics.record_engine_change)
+            asyncio.run(engine.run_for(240.0, time_step=0.1))
+            return analytics.export_analytics_data(), analytics.get_state()
+
+        first = run(42)
+        kpis = first[0]["kpis"]
+        self.assertIn("order_processing.order_completed", kpis)
+        self.assertTrue(all(DEFAULT_EPOCH <= kpi["timestamp"] <= DEFAULT_EPOCH + 240.0 for kpi in kpis.values()))
+        self.assertEqual(first[0]["session_info"]["duration_seconds"], 240.0)
+        self.assertEqual(run(42), first)
+
+        print("✅ Seeded analytics reproducibility test passed")
+
+    def test_engine_seed_from_config(self):
+        """Test the configure_seed switch and the clock following simulated time."""
+        engine = SimulationEngine()
+        engine.configure_seed(5)
+        self.assertEqual(engine.random_streams.stream(ORDER_STREAM).__class__, random.Random)
+        asyncio.run(engine.run_for(2.0, time_step=0.5))
+        self.assertEqual(engine.clock.time(), DEFAULT_EPOCH + 2.0)
+        self.assertEqual(engine.state.clock, engine.clock)
+
+        engine.configure_seed(None)
+        self.assertIs(engine.random_streams.stream(ORDER_STREAM), random)
+        self.assertLess(abs(engine.clock.time() - time.time()), 1.0)
+
+        print("✅ Engine seed switch test passed")
+
+    def test_engines_in_one_process_are_independent(self):
+        """Test that seeding one engine leaves other engines and the process-wide clock alone."""
+        first = SimulationEngine()
+        first.configure_seed(1)
+        asyncio.run(first.run_for(30.0, time_step=0.5))
+        draws = first.random_streams.stream(ORDER_STREAM).getstate()
+
+        second = SimulationEngine()
+        second.configure_seed(2)
+        self.assertEqual(first.clock.time(), DEFAULT_EPOCH + 30.0)
+        self.assertEqual(first.random_streams.stream(ORDER_STREAM).getstate(), draws)
+        self.assertIsNot(first.clock, second.clock)
+        self.assertIs(first.distance_tracker._clock, first.clock)
+        self.assertFalse(get_clock().deterministic)
+        self.assertIs(get_random(ORDER_STREAM), random)
+
+        second.configure_seed(None)
+        self.assertTrue(first.clock.deterministic)
+
+        print("✅ Engine independence test passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,247 @@
+"""
+Test suite for the engine bridge.
+Tests the single-producer/multi-consumer state channel (ordering, overrun
+drops, latest-per-topic state, concurrent readers), and the engine thread's
+command routing and delta publishing without per-command threads.
+"""
+
+import asyncio
+import sys
+import os
+import threading
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.engine_bridge import EngineThread, StateChannel
+from core.events import EventSystem, EventType
+
+
+def wait_until(condition, timeout=5.0):
+    """Poll a condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class TestStateChannel(unittest.TestCase):
+    """Test the ring buffer."""
+
+    def test_publish_and_poll(self):
+        """Test ordered delivery, independent cursors and latest-per-topic state."""
+        channel = StateChannel(capacity=5)
+        self.assertEqual(channel.capacity, 8)
+
+        early = channel.reader("early")
+        channel.publish("robots", [{"robot_id": "R1"}])
+        late = channel.reader("late")
+        channel.publish("simulation", {"is_running": True})
+        channel.publish("robots", [{"robot_id": "R2"}])
+
+        self.assertEqual([(seq, topic) for seq, topic, _ in early.poll()],
+                         [(1, "robots"), (2, "simulation"), (3, "robots")])
+        self.assertEqual([seq for seq, _, _ in late.poll(max_items=1)], [2])
+        self.assertEqual([seq for seq, _, _ in late.poll()], [3])
+        self.assertEqual(early.poll(), [])
+
+        self.assertEqual(channel.latest("robots"), [{"robot_id": "R2"}])
+        self.assertIsNone(channel.latest("orders"))
+        self.assertEqual(set(channel.latest()), {"robots", "simulation"})
+
+        with self.assertRaises(ValueError):
+            channel.reader("early")
+        with self.assertRaises(ValueError):
+            StateChannel(capacity=0)
+
+        print("✅ Channel publish and poll test passed")
+
+    def test_overrun_drops_oldest(self):
+        """Test that a lapped reader skips to the oldest retained delta and counts drops."""
+        channel = StateChannel(capacity=4)
+        reader = channel.reader("slow")
+        for index in range(10):
+            channel.publish("tick", index)
+
+        self.assertEqual([delta for _, _, delta in reader.poll()], [6, 7, 8, 9])
+        stats = channel.get_statistics()
+        self.assertEqual(stats["published"], 10)
+        self.assertEqual(stats["dropped"], 6)
+        self.assertEqual(stats["readers"]["slow"]["overruns"], 1)
+        self.assertEqual(stats["readers"]["slow"]["max_lag"], 10)
+        self.assertEqual(stats["readers"]["slow"]["lag"], 0)
+
+        reader.close()
+        self.assertEqual(channel.get_statistics()["readers"], {})
+
+        print("✅ Channel overrun test passed")
+
+    def test_concurrent_readers(self):
+        """Test a producer thread against several reader threads: in order, nothing lost silently."""
+        channel = StateChannel(capacity=256)
+        readers = [channel.reader(f"reader_{index}") for index in range(3)]
+        published = 50000
+        results = {}
+
+        def consume(reader):
+            sequences = []
+            while not sequences or sequences[-1] < published:
+                sequences.extend(seq for seq, _, _ in reader.poll())
+            results[reader.name] = sequences
+
+        threads = [threading.Thread(target=consume, args=(reader,)) for reader in readers]
+        for thread in threads:
+            thread.start()
+        for index in range(published):
+            channel.publish("tick", index)
+        for thread in threads:
+            thread.join(10)
+
+        for reader in readers:
+            sequences = results[reader.name]
+            self.assertTrue(all(a < b for a, b in zip(sequences, sequences[1:])))
+            self.assertEqual(len(sequences) + reader.dropped, published)
+
+        print("✅ Concurrent channel readers test passed")
+
+
+class StubEngine:
+    """Minimal engine: async lifecycle, a frame loop and one robot."""
+
+    class Robot:
+        def __init__(self):
+            self.robot_id = "ROBOT_001"
+            self.state = "idle"
+            self.aisle = 1.0
+
+    def __init__(self):
+        self.event_system = EventSystem()
+        self.is_running = False
+        self.paused = False
+        self.simulation_time = 0.0
+        self.simulation_speed = 1.0
+        self.robots = [self.Robot()]
+        self.loop_threads = set()
+
+    async def start(self):
+        self.is_running = True
+        self.event_system.is_running = True
+        await self.event_system.emit(EventType.SIMULATION_START, {"source": "stub"})
+
+    async def run(self):
+        while self.is_running:
+            self.loop_threads.add(threading.get_ident())
+            if not self.paused:
+                self.simulation_time += 0.01
+                self.robots[0].aisle = min(25.0, self.robots[0].aisle + 0.5)
+            await self.event_system.process_events()
+            await asyncio.sleep(0.005)
+
+    async def pause(self):
+        self.paused = True
+
+    async def stop(self):
+        self.is_running = False
+
+    def set_simulation_speed(self, speed):
+        self.loop_threads.add(threading.get_ident())
+        self.simulation_speed = speed
+
+    def get_robot_position(self, robot_id):
+        class Position:
+            aisle = self.robots[0].aisle
+            rack = 1.0
+        return Position()
+
+
+class TestEngineThread(unittest.TestCase):
+    """Test commands and publishing through the engine thread."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.engine = StubEngine()
+        self.bridge = EngineThread(self.engine, StateChannel(64), publish_interval=0.01)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.bridge.stop()
+
+    def test_commands_run_on_engine_thread(self):
+        """Test that commands run on the single engine thread without new threads."""
+        reader = self.bridge.channel.reader("test")
+        self.assertTrue(self.bridge.start())
+        self.assertFalse(self.bridge.start())
+        self.assertTrue(wait_until(lambda: self.engine.is_running))
+
+        threads_before = threading.active_count()
+        for _ in range(20):
+            self.bridge.submit(self.engine.pause()).result(1)
+        self.assertEqual(self.bridge.call(self.engine.set_simulation_speed, 2.0).result(1), None)
+        self.assertEqual(threading.active_count(), threads_before)
+        self.assertEqual(self.engine.loop_threads, {self.bridge._thread.ident})
+
+        self.assertTrue(wait_until(lambda: self.bridge.channel.latest("simulation")["speed"] == 2.0))
+        topics = {topic for _, topic, _ in reader.poll()}
+        self.assertTrue({"simulation_start", "simulation", "robots"} <= topics)
+
+        self.assertTrue(self.bridge.stop())
+        self.assertFalse(self.engine.is_running)
+        self.assertEqual(self.bridge.commands_sent, 23)  # run, 20 pauses, speed, stop
+        self.assertEqual(self.bridge.commands_failed, 0)
+        with self.assertRaises(RuntimeError):
+            self.bridge.call(self.engine.set_simulation_speed, 1.0)
+
+        print("✅ Engine thread command test passed")
+
+    def test_only_changes_are_published(self):
+        """Test that unchanged robots and status are not republished."""
+        self.bridge.publish_interval = 60.0
+        self.bridge.start(run_engine=False)
+        channel = self.bridge.channel
+
+        # The first tick publishes status and robots as soon as the loop starts
+        self.assertTrue(wait_until(lambda: channel.head == 2))
+        self.assertEqual(self.bridge.call(self.bridge.publish_state).result(1), 0)
+        self.bridge.call(setattr, self.engine.robots[0], "state", "moving").result(1)
+        self.assertEqual(self.bridge.call(self.bridge.publish_state).result(1), 1)
+        self.assertEqual(channel.latest("robots"), [{"robot_id": "ROBOT_001", "aisle": 1.0, "rack": 1.0,
+                                                     "state": "moving", "current_order": None}])
+
+        failed = self.bridge.call(self.engine.set_simulation_speed)
+        with self.assertRaises(TypeError):
+            failed.result(1)
+        self.assertEqual(self.bridge.commands_failed, 1)
+
+        print("✅ Delta publishing test passed")
+
+
+class TestChannelBenchmark(unittest.TestCase):
+    """Benchmark channel throughput."""
+
+    DELTAS = 100000
+
+    def test_publish_poll_throughput(self):
+        """Report publish and per-reader poll throughput."""
+        channel = StateChannel(capacity=self.DELTAS)
+        readers = [channel.reader(f"reader_{index}") for index in range(3)]
+
+        start = time.perf_counter()
+        for index in range(self.DELTAS):
+            channel.publish("robots", index)
+        published = time.perf_counter()
+        for reader in readers:
+            self.assertEqual(len(reader.poll()), self.DELTAS)
+        polled = time.perf_counter()
+
+        print(f"📊 {self.DELTAS} deltas: publish {self.DELTAS / (published - start):,.0f}/s, "
+              f"poll {len(readers) * self.DELTAS / (polled - published):,.0f}/s across {len(readers)} readers")
+
+        print("✅ Channel benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,302 @@
+"""
+Test suite for engine checkpoints.
+Tests the checkpoint file format, fleet and component state, resuming seeded
+runs from a checkpoint exactly where the original run would be, periodic
+background checkpoints, and snapshot/restore times.
+"""
+
+import asyncio
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.checkpoint import (CHECKPOINT_VERSION, CheckpointWriter, encode_sections, latest_checkpoint,
+                             list_checkpoints, read_checkpoint, write_checkpoint)
+from core.determinism import seed_simulation
+from core.engine import SimulationEngine
+from core.fleet import RobotFleet
+from core.inventory.inventory_item import InventoryItem
+from core.inventory.inventory_manager import InventoryManager
+from core.layout.coordinate import Coordinate
+
+
+def order_outcomes(engine):
+    """Comparable summary of an engine's orders."""
+    return [(order["id"], order["items"], order["status"], order.get("created_time"),
+             order.get("completed_time"), order.get("total_distance")) for order in engine.orders]
+
+
+class TestCheckpointFormat(unittest.TestCase):
+    """Test writing and reading checkpoint files."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "state.ckpt")
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        """Test that sections of plain data come back unchanged."""
+        sections = {"meta": {"format_version": CHECKPOINT_VERSION},
+                    "engine": {"orders": [{"id": "ORDER_000", "items": ["ITEM_A_01"]}], "keys": {1: [2.5, None]},
+                               "slots": {3, 4}, "pick_end": float("inf"), "point": (1.0, 2.0)}}
+        size = write_checkpoint(self.path, encode_sections(sections))
+
+        self.assertEqual(size, os.path.getsize(self.path))
+        self.assertEqual(read_checkpoint(self.path), sections)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+        print("✅ Checkpoint round trip test passed")
+
+    def test_rejects_bad_files(self):
+        """Test wrong magic, newer versions, corruption, truncation and pickled objects."""
+        write_checkpoint(self.path, encode_sections({"engine": {"value": list(range(100))}}))
+        with open(self.path, "rb") as checkpoint:
+            data = checkpoint.read()
+
+        def rejected(content):
+            with open(self.path, "wb") as checkpoint:
+                checkpoint.write(content)
+            with self.assertRaises(ValueError):
+                read_checkpoint(self.path)
+
+        rejected(b"NOTCKP" + data[6:])
+        rejected(data[:6] + struct.pack("<H", CHECKPOINT_VERSION + 1) + data[8:])
+        rejected(data[:-3] + bytes(b ^ 0xFF for b in data[-3:]))
+        rejected(data[:-10])
+
+        # A section that references a class is refused instead of instantiated
+        write_checkpoint(self.path, {"engine": pickle.dumps(RobotFleet(["R1"]))})
+        with self.assertRaises(pickle.UnpicklingError):
+            read_checkpoint(self.path)
+
+        print("✅ Bad checkpoint rejection test passed")
+
+    def test_writer_skips_while_busy_and_prunes(self):
+        """Test background writes, skipped submissions and keeping the newest files."""
+        writer = CheckpointWriter(self.temp_dir.name, keep=2)
+        try:
+            for simulation_time in (10.0, 20.0, 30.0):
+                writer.submit(simulation_time, {"engine": {"time": simulation_time}}).result(timeout=5)
+
+            files = list_checkpoints(self.temp_dir.name)
+            self.assertEqual(len(files), 2)
+            self.assertEqual(latest_checkpoint(self.temp_dir.name), writer.path_for(30.0))
+            self.assertEqual(read_checkpoint(files[-1])["engine"]["time"], 30.0)
+
+            writer._pending = writer._executor.submit(time.sleep, 0.2)
+            self.assertIsNone(writer.submit(40.0, {"engine": {}}))
+            self.assertEqual(writer.stats["skipped"], 1)
+            self.assertEqual(writer.stats["written"], 3)
+        finally:
+            writer.close()
+
+        with self.assertRaises(ValueError):
+            CheckpointWriter(self.temp_dir.name, keep=0)
+
+        print("✅ Checkpoint writer test passed")
+
+
+class TestComponentState(unittest.TestCase):
+    """Test get_state/set_state of checkpointed components."""
+
+    def test_fleet_state(self):
+        """Test that fleet arrays round-trip and other fleets are refused."""
+        fleet = RobotFleet(["R1", "R2"])
+        fleet.begin_segment(1, (3.0, 4.0), 2.0)
+        fleet.begin_pick(0, 9.0)
+        state = pickle.loads(pickle.dumps(fleet.get_state()))
+
+        restored = RobotFleet(["R1", "R2"])
+        restored.set_state(state)
+        self.assertEqual(restored.targets.tolist(), fleet.targets.tolist())
+        self.assertEqual(restored.pick_end_times.tolist(), [9.0, float("inf")])
+        self.assertTrue(restored.moving[1])
+
+        with self.assertRaises(ValueError):
+            RobotFleet(["R1"]).set_state(state)
+
+        print("✅ Fleet state test passed")
+
+    def test_inventory_state(self):
+        """Test that stock levels and indices survive a restore."""
+        items = [InventoryItem(f"ITEM_{chr(65 + aisle)}{rack}", Coordinate(aisle + 2, rack), quantity=10 * rack,
+                               category="tools" if rack % 2 else "books")
+                 for aisle in range(3) for rack in range(1, 5)]
+        inventory = InventoryManager()
+        inventory.set_state({"items": [item.to_dict() for item in items], "initialized": True})
+        inventory.update_item_quantity("ITEM_B2", 7)
+        state = pickle.loads(pickle.dumps(inventory.get_state()))
+
+        restored = InventoryManager()
+        restored.set_state(state)
+        self.assertEqual(restored.get_item("ITEM_B2").quantity, 7)
+        self.assertEqual(len(restored.get_items_by_category("tools")), 6)
+        self.assertEqual([item.item_id for item in restored.get_items_by_location(Coordinate(3, 3))], ["ITEM_B3"])
+        self.assertEqual(restored.get_performance_metrics()["successful_operations"], 1)
+
+        print("✅ Inventory state test passed")
+
+
+class TestEngineCheckpoint(unittest.TestCase):
+    """Test saving and restoring engines."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "warm.ckpt")
+
+    def tearDown(self):
+        """Go back to unseeded wall-clock runs and clean up."""
+        seed_simulation(None)
+        self.temp_dir.cleanup()
+
+    def resume_matches(self, configure, event_driven=False, warm_up=157.3, extra=400.0):
+        """Run warm_up + extra in one go, and warm_up, checkpoint, restore into a new engine, extra."""
+        engine = SimulationEngine()
+        configure(engine)
+        asyncio.run(engine.run_for(warm_up, time_step=0.1, event_driven=event_driven))
+        report = engine.save_checkpoint(self.path)
+        asyncio.run(engine.run_for(extra, time_step=0.1, event_driven=event_driven))
+
+        seed_simulation(None)
+        restored = SimulationEngine()
+        meta = asyncio.run(restored.restore_checkpoint(self.path))
+        asyncio.run(restored.run_for(extra, time_step=0.1, event_driven=event_driven))
+
+        self.assertEqual(meta["format_version"], CHECKPOINT_VERSION)
+        self.assertAlmostEqual(restored.simulation_time, engine.simulation_time)
+        self.assertEqual(order_outcomes(restored), order_outcomes(engine))
+        self.assertEqual(restored.performance_metrics["orders_completed"],
+                         engine.performance_metrics["orders_completed"])
+        self.assertAlmostEqual(restored.performance_metrics["total_distance"],
+                               engine.performance_metrics["total_distance"])
+        return engine, restored, report, meta
+
+    def test_resume_single_robot(self):
+        """Test that a restored single-robot run continues exactly like the original."""
+        engine, restored, report, meta = self.resume_matches(lambda engine: engine.configure_seed(11))
+
+        self.assertGreater(report["bytes"], 0)
+        self.assertEqual(restored.seed, 11)
+        self.assertIn("completed", [order["status"] for order in engine.orders])
+        self.assertEqual(restored.robot.position.aisle, engine.robot.position.aisle)
+        self.assertIs(restored.robot.position, restored.robot.kinematics.position)
+
+        print("✅ Single-robot resume test passed")
+
+    def test_resume_event_driven(self):
+        """Test resuming an event-driven run with a segment or pick in progress."""
+        self.resume_matches(lambda engine: engine.configure_seed(5), event_driven=True)
+
+        print("✅ Event-driven resume test passed")
+
+    def test_resume_fleet_with_batching(self):
+        """Test that fleet arrays, batches and idle robots are restored."""
+        def configure(engine):
+            engine.configure_seed(3)
+            engine.configure_fleet(3)
+            engine.configure_batching(max_wait=20.0)
+            engine.order_interval = 15.0
+
+        engine, restored, _, meta = self.resume_matches(configure, warm_up=95.0, extra=300.0)
+
+        self.assertEqual(meta["robots"], 3)
+        self.assertEqual(len(restored.fleet), 3)
+        self.assertIsNotNone(restored.order_batcher)
+        self.assertEqual(restored.order_batcher.max_wait, 20.0)
+        self.assertEqual([robot.state for robot in restored.robots], [robot.state for robot in engine.robots])
+
+        print("✅ Fleet resume test passed")
+
+    def test_registered_components(self):
+        """Test that registered components ride along and reserved names are refused."""
+        class Counter:
+            def __init__(self, value=0):
+                self.value = value
+
+            def get_state(self):
+                return {"value": self.value}
+
+            def set_state(self, state):
+                self.value = state["value"]
+
+        engine = SimulationEngine()
+        engine.register_checkpoint_component("counter", Counter(42))
+        engine.save_checkpoint(self.path)
+
+        restored = SimulationEngine()
+        counter = Counter()
+        restored.register_checkpoint_component("counter", counter)
+        meta = asyncio.run(restored.restore_checkpoint(self.path))
+        self.assertEqual(counter.value, 42)
+        self.assertEqual(meta["components"], ["counter"])
+
+        with self.assertRaises(ValueError):
+            engine.register_checkpoint_component("engine", Counter())
+        with self.assertRaises(ValueError):
+            engine.register_checkpoint_component("plain", object())
+
+        print("✅ Checkpoint component test passed")
+
+    def test_periodic_checkpoints(self):
+        """Test background checkpoints every interval simulated seconds during a run."""
+        engine = SimulationEngine()
+        engine.configure_seed(2)
+        engine.configure_checkpoints(interval=60.0, directory=self.temp_dir.name, keep=2)
+        asyncio.run(engine.run_for(200.0, time_step=0.1))
+        engine.checkpoint_writer.flush(timeout=5)
+
+        files = list_checkpoints(self.temp_dir.name)
+        self.assertEqual(len(files), 2)
+        self.assertGreaterEqual(engine.checkpoint_writer.stats["written"], 3)
+        latest = read_checkpoint(files[-1])
+        self.assertAlmostEqual(latest["meta"]["simulation_time"], 180.0, delta=0.2)
+
+        engine.configure_checkpoints(enabled=False)
+        self.assertIsNone(engine.checkpoint_writer)
+
+        print("✅ Periodic checkpoint test passed")
+
+
+class TestCheckpointBenchmark(unittest.TestCase):
+    """Measure snapshot and restore times of a warmed-up engine."""
+
+    def tearDown(self):
+        """Go back to unseeded wall-clock runs."""
+        seed_simulation(None)
+
+    def test_checkpoint_timing(self):
+        """Report snapshot, write and restore times against re-simulating the warm-up."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "warm.ckpt")
+            engine = SimulationEngine()
+            engine.configure_seed(9)
+            warm_up = asyncio.run(engine.run_for(450.0, time_step=0.1))
+            report = engine.save_checkpoint(path)
+
+            restored = SimulationEngine()
+            asyncio.run(restored.load_config())
+            meta = asyncio.run(restored.restore_checkpoint(path))
+
+        print(f"📊 Checkpoint of {meta['orders']} orders: {report['bytes']} bytes, "
+              f"snapshot {report['snapshot_ms']:.2f}ms, write {report['write_ms']:.2f}ms, "
+              f"restore {meta['restore_ms']:.2f}ms vs {warm_up['wall_seconds'] * 1000:.0f}ms to re-simulate")
+        self.assertLess(report["snapshot_ms"], 100.0)
+        self.assertLess(meta["restore_ms"], 250.0)
+
+        print("✅ Checkpoint benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
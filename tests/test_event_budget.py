@@ -0,0 +1,189 @@
+"""
+Test suite for time-budgeted event processing.
+Tests that LOW events are deferred at the frame deadline while HIGH events are
+not, that the budget grows under a backlog and shrinks once drained, backlog
+age reporting, configuration, and frame times under a burst.
+"""
+
+import asyncio
+import sys
+import os
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.events import EventSystem, EventType
+
+
+def busy_handler(seconds):
+    """Handler that spins for the given time."""
+    def handler(event):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            pass
+    return handler
+
+
+class TestFrameBudget(unittest.TestCase):
+    """Test budgeted frames."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.events = EventSystem(max_queue_size=10000)
+        self.events.slow_handler_threshold_ms = 0  # No warnings when a loaded machine preempts a handler
+        self.events.configure_frame_budget(10.0, budget_fraction=0.2, max_budget_fraction=0.8, growth=2.0)
+        self.events.subscribe(EventType.ROBOT_MOVED, busy_handler(0.0001))
+        self.events.is_running = True
+
+    def test_low_events_deferred_at_deadline(self):
+        """Test that LOW events stop at the deadline and HIGH events are all delivered."""
+        errors = []
+        self.events.subscribe(EventType.SYSTEM_ERROR, busy_handler(0.0001))
+        self.events.subscribe(EventType.SYSTEM_ERROR, errors.append)
+
+        async def run():
+            for index in range(500):
+                await self.events.emit(EventType.ROBOT_MOVED, {"index": index})
+            for index in range(40):
+                await self.events.emit(EventType.SYSTEM_ERROR, {"index": index})
+            await self.events.process_events()
+
+        asyncio.run(run())
+
+        frame = self.events.last_frame
+        self.assertEqual(len(errors), 40)  # 4ms of HIGH events, over the 2ms budget
+        self.assertGreaterEqual(frame["low_processed"], 1)
+        self.assertLess(frame["low_processed"], 100)
+        self.assertEqual(frame["deferred"], 500 - frame["low_processed"])
+        self.assertEqual(frame["budget_ms"], 2.0)
+
+        print("✅ Deadline deferral test passed")
+
+    def test_budget_grows_and_shrinks(self):
+        """Test budget growth up to the maximum under a backlog, then decay to the base."""
+        budgets = []
+
+        async def run():
+            for index in range(300):
+                await self.events.emit(EventType.ROBOT_MOVED, {"index": index})
+            while self.events.low_priority_queue.qsize():
+                await self.events.process_events()
+                budgets.append(self.events.last_frame["budget_ms"])
+            for _ in range(4):
+                await self.events.process_events()
+                budgets.append(self.events.last_frame["budget_ms"])
+
+        asyncio.run(run())
+
+        self.assertEqual(budgets[:3], [2.0, 4.0, 8.0])
+        self.assertEqual(max(budgets), 8.0)
+        self.assertEqual(budgets[-1], 2.0)
+        self.assertEqual(self.events.processed_events, 300)
+
+        stats = self.events.get_statistics()["frame_budget"]
+        self.assertEqual(stats["mode"], "time")
+        self.assertEqual(stats["deferred_frames"], len(budgets) - 5)
+        self.assertGreater(stats["max_backlog_age_ms"], 2.0)
+        self.assertEqual(stats["backlog_age_ms"], 0.0)
+        self.assertEqual(stats["backlog"], 0)
+
+        print("✅ Budget growth test passed")
+
+    def test_sustained_load_does_not_starve(self):
+        """Test that a load above the base budget keeps up and drains once it stops."""
+        backlog = []
+
+        async def run():
+            for frame in range(40):
+                for index in range(30):  # ~3ms of handler time against a 2ms base budget
+                    await self.events.emit(EventType.ROBOT_MOVED, {"frame": frame})
+                await self.events.process_events()
+                backlog.append(self.events.low_priority_queue.qsize())
+            drain_frames = 0
+            while self.events.low_priority_queue.qsize():
+                await self.events.process_events()
+                drain_frames += 1
+            return drain_frames
+
+        drain_frames = asyncio.run(run())
+
+        self.assertGreater(max(backlog), 0)
+        self.assertLess(backlog[-1], 40 * 30 // 2)
+        self.assertLess(drain_frames, 40)
+        self.assertEqual(self.events.processed_events, 40 * 30)
+
+        print("✅ Sustained load test passed")
+
+    def test_configuration(self):
+        """Test enabling through configure(), validation, and falling back to counts."""
+        events = EventSystem()
+        events.configure(frame_budget={"enabled": True, "target_frame_time": 33.33, "budget_fraction": 0.5})
+        self.assertEqual(events.frame_budget["budget_fraction"], 0.5)
+        self.assertAlmostEqual(events._budget_ns / 1e6, 16.665)
+
+        events.configure(frame_budget={"target_frame_time": 33.33, "budget_fraction": 0.9,
+                                       "max_budget_fraction": 0.5})
+        self.assertEqual(events.frame_budget["budget_fraction"], 0.5)  # Invalid settings ignored
+        with self.assertRaises(ValueError):
+            events.configure_frame_budget(0)
+        with self.assertRaises(ValueError):
+            events.configure_frame_budget(16.67, growth=0.5)
+
+        events.configure(max_concurrent_events=10, frame_budget={"enabled": False})
+        self.assertIsNone(events.frame_budget)
+        events.is_running = True
+
+        async def run():
+            for index in range(25):
+                await events.emit(EventType.ROBOT_MOVED, {"index": index})
+            await events.process_events()
+
+        asyncio.run(run())
+        self.assertEqual(events.processed_events, 10)
+        stats = events.get_statistics()["frame_budget"]
+        self.assertEqual((stats["mode"], stats["backlog"]), ("count", 15))
+        self.assertGreaterEqual(stats["backlog_age_ms"], 0.0)
+
+        print("✅ Budget configuration test passed")
+
+
+class TestBudgetBenchmark(unittest.TestCase):
+    """Compare frame times under a burst."""
+
+    def _frame_times(self, budgeted):
+        """Process a 1000-event burst of 50us handlers; return frame times in ms."""
+        events = EventSystem(max_queue_size=4000)
+        events.configure(max_concurrent_events=500)
+        if budgeted:
+            events.configure_frame_budget(16.67)
+        events.subscribe(EventType.ROBOT_MOVED, busy_handler(0.00005))
+        events.is_running = True
+
+        async def run():
+            frames = []
+            for index in range(1000):
+                await events.emit(EventType.ROBOT_MOVED, {"index": index})
+            while events.low_priority_queue.qsize():
+                start = time.perf_counter()
+                await events.process_events()
+                frames.append((time.perf_counter() - start) * 1000)
+            return frames
+
+        return asyncio.run(run())
+
+    def test_burst_frame_times(self):
+        """Report the worst frame with a fixed count and with a time budget."""
+        counted = self._frame_times(False)
+        budgeted = self._frame_times(True)
+
+        print(f"📊 1000-event burst: fixed count worst frame {max(counted):.1f}ms over {len(counted)} frames, "
+              f"time budget worst frame {max(budgeted):.1f}ms over {len(budgeted)} frames")
+        self.assertLess(max(budgeted), max(counted))
+
+        print("✅ Burst benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+Test suite for event coalescing and batch delivery.
+Tests the LATEST, SUM and BATCH policies, per-frame batch subscribers,
+configuration from the engine section, and that a robot-move flood is neither
+dropped nor dispatched event by event.
+"""
+
+import asyncio
+import sys
+import os
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.events import CoalescePolicy, EventCoalescer, EventSystem, EventType, Event
+
+
+class TestEventCoalescer(unittest.TestCase):
+    """Test coalescing policies."""
+
+    def test_latest_per_key(self):
+        """Test that only the newest event per key is kept, in first-seen order."""
+        coalescer = EventCoalescer(EventType.ROBOT_MOVED, CoalescePolicy.LATEST, key="robot_id")
+        for robot_id, rack in (("R1", 1), ("R2", 1), ("R1", 2), ("R1", 3)):
+            coalescer.add(Event(EventType.ROBOT_MOVED, data={"robot_id": robot_id, "rack": rack}))
+
+        self.assertEqual(len(coalescer), 2)
+        self.assertEqual(coalescer.merged, 2)
+        self.assertEqual([event.data for event in coalescer.drain()],
+                         [{"robot_id": "R1", "rack": 3}, {"robot_id": "R2", "rack": 1}])
+        self.assertEqual(coalescer.drain(), [])
+
+        print("✅ Latest-per-key coalescing test passed")
+
+    def test_sum_counters(self):
+        """Test that numeric fields are summed without touching the emitter's data."""
+        coalescer = EventCoalescer(EventType.INVENTORY_UPDATED, CoalescePolicy.SUM)
+        first = {"picked": 2, "source_zone": "A"}
+        coalescer.add(Event(EventType.INVENTORY_UPDATED, data=first))
+        coalescer.add(Event(EventType.INVENTORY_UPDATED, data={"picked": 3, "source_zone": "B", "flag": True}))
+
+        (total,) = coalescer.drain()
+        self.assertEqual(total.data, {"picked": 5, "source_zone": "B", "flag": True, "coalesced_count": 2})
+        self.assertEqual(first, {"picked": 2, "source_zone": "A"})
+
+        print("✅ Sum coalescing test passed")
+
+    def test_batch_keeps_everything(self):
+        """Test that BATCH keeps every event in order."""
+        coalescer = EventCoalescer(EventType.ROBOT_MOVED, CoalescePolicy.BATCH)
+        for index in range(5):
+            coalescer.add(Event(EventType.ROBOT_MOVED, data={"index": index}))
+
+        self.assertEqual([event.data["index"] for event in coalescer.drain()], list(range(5)))
+        self.assertEqual(coalescer.merged, 0)
+
+        print("✅ Batch coalescing test passed")
+
+
+class TestEventSystemCoalescing(unittest.TestCase):
+    """Test coalesced delivery through EventSystem."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.events = EventSystem(max_queue_size=100)
+        self.events.is_running = True
+        self.received = []
+        self.batches = []
+
+    def emit_moves(self, robots, steps):
+        """Emit steps moves for each robot."""
+        async def run():
+            for step in range(steps):
+                for robot in range(robots):
+                    await self.events.emit(EventType.ROBOT_MOVED, {"robot_id": f"R{robot}", "step": step})
+        asyncio.run(run())
+
+    def test_flood_is_capped_and_not_dropped(self):
+        """Test that a move flood larger than the queue delivers the latest move per robot."""
+        self.events.configure_coalescing(EventType.ROBOT_MOVED, CoalescePolicy.LATEST, key="robot_id")
+        self.events.subscribe(EventType.ROBOT_MOVED, self.received.append)
+
+        self.emit_moves(robots=20, steps=50)  # 1000 events, queue holds 100
+        asyncio.run(self.events.process_events())
+
+        self.assertEqual(len(self.received), 20)
+        self.assertTrue(all(event.data["step"] == 49 for event in self.received))
+        stats = self.events.get_statistics()
+        self.assertEqual(stats["failed_events"], 0)
+        self.assertEqual(stats["coalesced_events"], 980)
+        self.assertEqual(stats["success_rate"], 100)
+        self.assertEqual(stats["coalescing"]["robot_moved"]["pending"], 0)
+
+        print("✅ Coalesced flood test passed")
+
+    def test_batch_subscribers_get_one_event_per_frame(self):
+        """Test batch delivery alongside individual subscribers."""
+        self.events.subscribe(EventType.ROBOT_MOVED, self.received.append)
+        self.events.subscribe_batch(EventType.ROBOT_MOVED, self.batches.append)
+
+        self.emit_moves(robots=3, steps=2)
+        asyncio.run(self.events.process_events())
+        asyncio.run(self.events.process_events())  # Nothing pending: no empty batch
+
+        self.assertEqual(len(self.received), 6)
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(self.batches[0].data["count"], 6)
+        self.assertEqual([event.data["step"] for event in self.batches[0].data["events"]], [0, 0, 0, 1, 1, 1])
+
+        self.events.unsubscribe_batch(EventType.ROBOT_MOVED, self.batches.append)
+        self.emit_moves(robots=1, steps=1)
+        asyncio.run(self.events.process_events())
+        self.assertEqual(len(self.batches), 1)
+
+        print("✅ Batch subscriber test passed")
+
+    def test_blocked_events_left_out_of_batch(self):
+        """Test that middleware still validates coalesced events."""
+        self.events.add_validation_rule(EventType.ROBOT_MOVED, lambda data: data["robot_id"] != "R1")
+        self.events.subscribe_batch(EventType.ROBOT_MOVED, self.batches.append)
+
+        self.emit_moves(robots=3, steps=1)
+        asyncio.run(self.events.process_events())
+
+        self.assertEqual([event.data["robot_id"] for event in self.batches[0].data["events"]], ["R0", "R2"])
+
+        print("✅ Coalesced validation test passed")
+
+    def test_configure_rules(self):
+        """Test rules from configuration and turning coalescing off."""
+        self.events.configure(coalescing={
+            "robot_moved": {"policy": "latest", "key": "robot_id"},
+            "frame_update": {"policy": "latest"},
+            "not_an_event": {"policy": "latest"},
+        })
+        self.assertEqual(set(self.events.get_statistics()["coalescing"]), {"robot_moved", "frame_update"})
+
+        self.emit_moves(robots=2, steps=3)
+        self.events.configure(coalescing={"frame_update": {"policy": "latest"}})
+
+        # Pending moves return to the normal queue when their rule is removed
+        self.assertEqual(set(self.events.get_statistics()["coalescing"]), {"frame_update"})
+        self.assertEqual(self.events.low_priority_queue.qsize(), 2)
+        self.assertEqual(self.events.get_statistics()["event_count"], 6)
+
+        print("✅ Coalescing configuration test passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
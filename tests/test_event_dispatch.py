@@ -0,0 +1,222 @@
+"""
+Test suite for EventSystem fast-path dispatch.
+Tests compiled sync/async handler tables, no-op middleware skipping, dispatch
+without touching the event loop for sync-only handlers, and throughput against
+the previous wait_for-based dispatch.
+"""
+
+import asyncio
+import sys
+import os
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.events import Event, EventFilter, EventMiddleware, EventSystem, EventType
+
+
+def run_without_loop(coroutine):
+    """Run a coroutine that must finish without ever suspending."""
+    try:
+        coroutine.send(None)
+    except StopIteration as finished:
+        return finished.value
+    coroutine.close()
+    raise AssertionError("coroutine suspended")
+
+
+class LegacyDispatchEventSystem(EventSystem):
+    """The previous dispatch path: wait_for per event, per-event handler inspection."""
+
+    async def _process_priority_queue(self, queue, max_events):
+        processed_count = 0
+        while not queue.empty() and processed_count < max_events:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=0.001)
+                for middleware in self.middleware:
+                    event = await middleware.before_process(event)
+                    if event is None:
+                        break
+                if event is not None:
+                    await self._dispatch_event(event)
+                    processed_count += 1
+                    self.processed_events += 1
+            except asyncio.TimeoutError:
+                break
+        return processed_count
+
+    async def _dispatch_event(self, event):
+        start_time = asyncio.get_event_loop().time()
+        for handler in self.event_handlers.get(event.event_type, []):
+            await self._call_handler(handler, event)
+        for handler, event_filter in self.filtered_handlers.get(event.event_type, []):
+            if event_filter.matches(event):
+                await self._call_handler(handler, event)
+        for middleware in self.middleware:
+            await middleware.after_process(event, None)
+        self.processing_times.append(asyncio.get_event_loop().time() - start_time)
+        event.processed = True
+
+
+class TestHandlerTables(unittest.TestCase):
+    """Test handler tables compiled at subscribe time."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.events = EventSystem()
+        self.calls = []
+
+    def sync_handler(self, event):
+        self.calls.append(("sync", event.source))
+
+    async def async_handler(self, event):
+        self.calls.append(("async", event.source))
+
+    def test_tables_split_sync_and_async(self):
+        """Test that subscribe and unsubscribe rebuild the sync and async tuples."""
+        source_filter = EventFilter(sources=["wanted"])
+        self.events.subscribe(EventType.ROBOT_MOVED, self.async_handler)
+        self.events.subscribe(EventType.ROBOT_MOVED, self.sync_handler)
+        self.events.subscribe(EventType.ROBOT_MOVED, self.sync_handler, source_filter)
+
+        sync_entries, async_entries = self.events._handler_tables[EventType.ROBOT_MOVED]
+        self.assertEqual(sync_entries, ((self.sync_handler, None), (self.sync_handler, source_filter)))
+        self.assertEqual(async_entries, ((self.async_handler, None),))
+
+        self.events.unsubscribe(EventType.ROBOT_MOVED, self.sync_handler)
+        self.assertEqual(self.events._handler_tables[EventType.ROBOT_MOVED], ((), ((self.async_handler, None),)))
+        self.events.unsubscribe(EventType.ROBOT_MOVED, self.async_handler)
+        self.assertNotIn(EventType.ROBOT_MOVED, self.events._handler_tables)
+
+        print("✅ Handler table compilation test passed")
+
+    def test_sync_handlers_run_without_event_loop(self):
+        """Test that sync-only dispatch completes without suspending."""
+        self.events.subscribe(EventType.ROBOT_MOVED, self.sync_handler)
+        self.events.subscribe(EventType.ROBOT_MOVED, self.sync_handler, EventFilter(sources=["wanted"]))
+        self.events.is_running = True
+        for source in ("wanted", "other"):
+            self.events.low_priority_queue.put_nowait(Event(EventType.ROBOT_MOVED, source=source))
+
+        run_without_loop(self.events.process_events())
+
+        self.assertEqual(self.calls, [("sync", "wanted"), ("sync", "wanted"), ("sync", "other")])
+        self.assertEqual(self.events.processed_events, 2)
+
+        print("✅ Loop-free sync dispatch test passed")
+
+    def test_async_handlers_after_sync(self):
+        """Test that async handlers are awaited after the event's sync handlers."""
+        self.events.subscribe(EventType.ORDER_CREATED, self.async_handler)
+        self.events.subscribe(EventType.ORDER_CREATED, self.sync_handler)
+
+        async def run():
+            self.events.is_running = True
+            await self.events.emit(EventType.ORDER_CREATED, {}, "test")
+            await self.events.process_events()
+
+        asyncio.run(run())
+
+        self.assertEqual(self.calls, [("sync", "test"), ("async", "test")])
+
+        print("✅ Async handler ordering test passed")
+
+    def test_handler_errors_are_counted(self):
+        """Test that a failing handler does not stop the others."""
+        def failing(event):
+            raise RuntimeError("boom")
+
+        self.events.subscribe(EventType.ROBOT_MOVED, failing)
+        self.events.subscribe(EventType.ROBOT_MOVED, self.sync_handler)
+        self.events.is_running = True
+        self.events.low_priority_queue.put_nowait(Event(EventType.ROBOT_MOVED, source="test"))
+
+        run_without_loop(self.events.process_events())
+
+        self.assertEqual(self.calls, [("sync", "test")])
+        self.assertEqual(self.events.failed_events, 1)
+
+        print("✅ Handler error test passed")
+
+
+class TestMiddlewareChains(unittest.TestCase):
+    """Test that no-op middleware hooks are skipped."""
+
+    def test_noop_hooks_skipped(self):
+        """Test chain membership from overridden and declared hooks."""
+        class AfterOnly(EventMiddleware):
+            def __init__(self):
+                super().__init__("AfterOnly")
+                self.seen = []
+
+            async def after_process(self, event, result):
+                self.seen.append(event.event_type)
+                return result
+
+        class Disabled(EventMiddleware):
+            async def before_process(self, event):
+                raise AssertionError("declared no-op hook was called")
+
+            def handles_before(self):
+                return False
+
+        events = EventSystem()
+        after_only = AfterOnly()
+        events.add_middleware(after_only)
+        events.add_middleware(Disabled("Disabled"))
+
+        self.assertEqual([m.name for m in events._before_chain], ["EventLogger", "EventValidator"])
+        self.assertEqual(events._after_chain, (after_only,))
+
+        events.is_running = True
+        events.low_priority_queue.put_nowait(Event(EventType.ROBOT_MOVED))
+        run_without_loop(events.process_events())
+        self.assertEqual(after_only.seen, [EventType.ROBOT_MOVED])
+
+        events.remove_middleware("AfterOnly")
+        self.assertEqual(events._after_chain, ())
+
+        print("✅ Middleware chain test passed")
+
+
+class TestDispatchBenchmark(unittest.TestCase):
+    """Benchmark event throughput before and after the fast path."""
+
+    EVENTS = 20000
+
+    def _throughput(self, system_class):
+        """Emit and dispatch EVENTS events; return (emit/s, dispatch/s)."""
+        system = system_class(max_queue_size=4 * self.EVENTS)
+        system.configure(max_concurrent_events=self.EVENTS)
+        system.subscribe(EventType.ROBOT_MOVED, lambda event: None)
+        system.subscribe(EventType.ROBOT_MOVED, lambda event: None, EventFilter(sources=["bench"]))
+        system.is_running = True
+
+        async def run():
+            start = time.perf_counter()
+            for index in range(self.EVENTS):
+                await system.emit(EventType.ROBOT_MOVED, {"index": index}, "bench")
+            emitted = time.perf_counter()
+            await system.process_events()
+            return emitted - start, time.perf_counter() - emitted
+
+        emit_time, dispatch_time = asyncio.run(run())
+        self.assertEqual(system.processed_events, self.EVENTS)
+        return self.EVENTS / emit_time, self.EVENTS / dispatch_time
+
+    def test_dispatch_throughput(self):
+        """Report dispatch throughput; the fast path must beat the previous path."""
+        _, before = self._throughput(LegacyDispatchEventSystem)
+        _, after = self._throughput(EventSystem)
+
+        print(f"📊 {self.EVENTS} events, 2 sync handlers: dispatch before {before:,.0f}/s, "
+              f"after {after:,.0f}/s ({after / before:.1f}x)")
+        self.assertGreater(after, 2 * before)
+
+        print("✅ Dispatch benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
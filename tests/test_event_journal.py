@@ -0,0 +1,238 @@
+"""
+Test suite for the event journal.
+Tests journaled records, batched writes and fsync, segment rotation, recovery
+from a truncated line, replay into a fresh engine faster than real time, and
+journaling overhead on event throughput.
+"""
+
+import asyncio
+import json
+import sys
+import os
+import tempfile
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.engine import SimulationEngine
+from core.events import EventPriority, EventSystem, EventType
+from core.journal import EventJournal, JournalReader
+from core.layout.coordinate import Coordinate
+
+
+class TestEventJournal(unittest.TestCase):
+    """Test journal writing."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self.temp_dir.name
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.temp_dir.cleanup()
+
+    def journaled_system(self, **settings):
+        """Event system with a journal middleware."""
+        events = EventSystem(max_queue_size=1000)
+        journal = EventJournal(self.directory, **settings)
+        events.add_middleware(journal)
+        events.is_running = True
+        return events, journal
+
+    def test_records_round_trip(self):
+        """Test that processed events are journaled in order with their data."""
+        events, journal = self.journaled_system()
+
+        async def run():
+            await events.emit(EventType.ORDER_CREATED, {"order_id": "ORD_1", "items": ("A", "B")}, "OrderGenerator")
+            await events.emit(EventType.ROBOT_MOVED, {"position": Coordinate.of(3, 4)}, "Robot",
+                              EventPriority.HIGH)
+            await events.process_events()
+
+        asyncio.run(run())
+        journal.close()
+
+        reader = JournalReader(self.directory)
+        records = list(reader.records())
+        self.assertEqual([record["type"] for record in records], ["robot_moved", "order_created"])
+        self.assertEqual(records[0]["priority"], "HIGH")
+        self.assertNotIn("priority", records[1])
+        self.assertEqual(records[0]["data"]["position"], {"aisle": 3, "rack": 4})
+        self.assertEqual(records[1]["data"]["items"], ["A", "B"])
+        self.assertLess(abs(records[1]["t"] / 1e9 - time.time()), 5.0)
+
+        replayed = list(reader.events())
+        self.assertEqual(replayed[1].event_id, f"order_created_{records[1]['seq']}")
+        self.assertEqual(replayed[0].priority, EventPriority.HIGH)
+
+        print("✅ Journal round trip test passed")
+
+    def test_batched_writes_and_fsync(self):
+        """Test that writes happen per batch and fsync follows fsync_interval."""
+        events, journal = self.journaled_system(batch_size=10, flush_interval=60.0, fsync_interval=None)
+
+        async def run():
+            for index in range(25):
+                await events.emit(EventType.ROBOT_MOVED, {"index": index})
+            await events.process_events()
+
+        events.configure(max_concurrent_events=100)
+        asyncio.run(run())
+        self.assertEqual((journal.flushes, journal.events_written, journal.fsyncs), (2, 20, 0))
+
+        journal.fsync_interval = 0
+        journal.close()
+        stats = journal.get_statistics()
+        self.assertEqual((stats["flushes"], stats["events_written"], stats["fsyncs"]), (3, 25, 1))
+        self.assertEqual(len(list(JournalReader(self.directory).records())), 25)
+
+        print("✅ Batched write test passed")
+
+    def test_rotation_and_truncated_line(self):
+        """Test size rotation, a new segment per journal, and skipping a torn last line."""
+        journal = EventJournal(self.directory, max_segment_bytes=400, batch_size=1)
+        events = EventSystem()
+        events.add_middleware(journal)
+        events.is_running = True
+
+        async def run(system, count):
+            for index in range(count):
+                await system.emit(EventType.ITEM_COLLECTED, {"index": index})
+            await system.process_events()
+
+        asyncio.run(run(events, 20))
+        journal.close()
+        self.assertGreater(journal.segments_opened, 2)
+
+        second = EventJournal(self.directory)
+        events.remove_middleware("EventJournal")
+        events.add_middleware(second)
+        asyncio.run(run(events, 1))
+        second.close()
+        self.assertEqual(second.segments_opened, 1)
+
+        reader = JournalReader(self.directory)
+        with open(reader.segments()[-1], "ab") as segment:
+            segment.write(b'{"seq":99,"t":1,"ty')  # Crash mid-write
+        indices = [record["data"]["index"] for record in reader.records()]
+        self.assertEqual(indices, list(range(20)) + [0])
+        self.assertEqual(reader.corrupt_lines, 1)
+        self.assertEqual(len(reader.segments()), journal.segments_opened + 1)
+
+        print("✅ Rotation and recovery test passed")
+
+
+class TestJournalReplay(unittest.TestCase):
+    """Test replaying journals."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self.temp_dir.name
+        # A 60-second recording of 600 robot moves
+        start_ns = time.time_ns()
+        with open(os.path.join(self.directory, "events.000001.jsonl"), "w") as segment:
+            for index in range(600):
+                segment.write(json.dumps({"seq": index + 1, "t": start_ns + index * 100_000_000,
+                                          "type": "robot_moved", "source": "Robot",
+                                          "data": {"robot_id": "ROBOT_001", "step": index}}) + "\n")
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.temp_dir.cleanup()
+
+    def test_replay_into_fresh_engine(self):
+        """Test that replay reaches the engine's subscribers in order, faster than real time."""
+        engine = SimulationEngine()
+        steps = []
+        engine.event_system.subscribe(EventType.ROBOT_MOVED, lambda event: steps.append(event.data["step"]))
+
+        report = asyncio.run(JournalReader(self.directory).replay(engine))
+
+        self.assertEqual(steps, list(range(600)))
+        self.assertEqual(report["events"], 600)
+        self.assertAlmostEqual(report["recorded_span"], 59.9)
+        self.assertGreater(report["speedup"], 100)
+        self.assertEqual(engine.event_system.processed_events, 600)
+
+        print(f"📊 Replayed {report['events']} events ({report['recorded_span']:.1f}s recorded) "
+              f"in {report['duration'] * 1e3:.1f}ms ({report['speedup']:,.0f}x real time)")
+        print("✅ Engine replay test passed")
+
+    def test_paced_replay(self):
+        """Test that a replay speed paces events by their recorded times."""
+        events = EventSystem()
+        report = asyncio.run(JournalReader(self.directory).replay(events, speed=300.0))
+
+        self.assertGreaterEqual(report["duration"], 59.9 / 300.0)
+        self.assertLess(report["speedup"], 330.0)
+
+        print("✅ Paced replay test passed")
+
+    def test_engine_journal_config(self):
+        """Test attaching and detaching the journal on an engine."""
+        engine = SimulationEngine()
+        engine.configure_journal(directory=self.directory, prefix="run", batch_size=1)
+        self.assertIn("EventJournal", [middleware.name for middleware in engine.event_system.middleware])
+
+        engine.event_system.is_running = True
+
+        async def run():
+            await engine.event_system.emit(EventType.CONFIG_LOADED, {"source": "test"})
+            await engine.event_system.process_events()
+
+        asyncio.run(run())
+        engine.configure_journal(enabled=False)
+        self.assertIsNone(engine.journal)
+        self.assertNotIn("EventJournal", [middleware.name for middleware in engine.event_system.middleware])
+        self.assertEqual([record["type"] for record in JournalReader(self.directory, "run").records()],
+                         ["config_loaded"])
+
+        print("✅ Engine journal configuration test passed")
+
+
+class TestJournalBenchmark(unittest.TestCase):
+    """Benchmark journaling overhead."""
+
+    EVENTS = 20000
+
+    def _throughput(self, directory):
+        """Emit and process EVENTS events; return events per second."""
+        events = EventSystem(max_queue_size=4 * self.EVENTS)
+        events.configure(max_concurrent_events=self.EVENTS)
+        journal = None
+        if directory is not None:
+            journal = EventJournal(directory)
+            events.add_middleware(journal)
+        events.is_running = True
+
+        async def run():
+            start = time.perf_counter()
+            for index in range(self.EVENTS):
+                await events.emit(EventType.ROBOT_MOVED, {"robot_id": "ROBOT_001", "aisle": index % 25, "rack": 3})
+            await events.process_events()
+            if journal is not None:
+                journal.close()
+            return time.perf_counter() - start
+
+        return self.EVENTS / asyncio.run(run())
+
+    def test_journal_overhead(self):
+        """Report event throughput with and without the journal."""
+        with tempfile.TemporaryDirectory() as directory:
+            plain = self._throughput(None)
+            journaled = self._throughput(directory)
+            size = sum(os.path.getsize(path) for path in JournalReader(directory).segments())
+
+        print(f"📊 {self.EVENTS} events: {plain:,.0f}/s without journal, {journaled:,.0f}/s journaled "
+              f"({size / self.EVENTS:.0f} bytes/event)")
+        self.assertGreater(journaled * 4, plain)
+
+        print("✅ Journal benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
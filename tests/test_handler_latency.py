@@ -0,0 +1,249 @@
+"""
+Test suite for event system latency instrumentation.
+Tests the log-bucketed latency histogram, per-handler latency statistics,
+slow-handler warnings, queue wait and per-queue drop counts, and the cost of
+timing handlers on dispatch throughput.
+"""
+
+import asyncio
+import gc
+import sys
+import os
+import time
+import unittest
+import weakref
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.events import CoalescePolicy, EventSystem, EventType, LatencyHistogram
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test histogram bucketing and percentiles."""
+
+    def test_buckets_are_contiguous(self):
+        """Test that every value lands in the bucket whose range contains it."""
+        for value in list(range(0, 4096)) + [10 ** 6, 10 ** 9, 2 ** 63 - 1]:
+            histogram = LatencyHistogram()
+            histogram.record(value)
+            histogram.flush()
+            index = histogram.counts.index(1)
+            self.assertLessEqual(LatencyHistogram.bucket_floor(index), value)
+            self.assertLess(value, LatencyHistogram.bucket_floor(index + 1))
+
+        print("✅ Histogram bucket test passed")
+
+    def test_percentiles(self):
+        """Test p50/p99/max within the bucket precision, and an empty histogram."""
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.snapshot()["p99_ms"], 0.0)
+
+        for value in range(1, 10001):
+            histogram.record(value * 1000)  # 1us .. 10ms
+
+        self.assertAlmostEqual(histogram.percentile(50) / 5_000_000, 1.0, delta=0.125)
+        self.assertAlmostEqual(histogram.percentile(99) / 9_900_000, 1.0, delta=0.125)
+        self.assertEqual(histogram.percentile(100), 10_000_000)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 10000)
+        self.assertEqual(snapshot["max_ms"], 10.0)
+        self.assertAlmostEqual(snapshot["mean_ms"], 5.0005)
+
+        histogram.reset()
+        self.assertEqual((histogram.count, histogram.max, sum(histogram.counts), histogram.pending), (0, 0, 0, []))
+
+        print("✅ Histogram percentile test passed")
+
+
+class TestHandlerLatency(unittest.TestCase):
+    """Test per-handler statistics and slow-handler warnings."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.events = EventSystem()
+        self.events.is_running = True
+
+    def fast_handler(self, event):
+        pass
+
+    def slow_handler(self, event):
+        time.sleep(0.004)
+
+    def test_per_handler_statistics(self):
+        """Test that each (event type, handler) pair gets its own histogram."""
+        self.events.configure(slow_handler_threshold_ms=0)
+        self.events.subscribe(EventType.ROBOT_MOVED, self.fast_handler)
+        self.events.subscribe(EventType.ROBOT_MOVED, self.slow_handler)
+        self.events.subscribe(EventType.ORDER_CREATED, self.fast_handler)
+
+        async def async_handler(event):
+            await asyncio.sleep(0)
+
+        self.events.subscribe(EventType.ORDER_CREATED, async_handler)
+
+        async def run():
+            for _ in range(5):
+                await self.events.emit(EventType.ROBOT_MOVED, {"robot_id": "ROBOT_001"})
+            await self.events.emit(EventType.ORDER_CREATED, {"order_id": "ORD_1"})
+            await self.events.process_events()
+
+        asyncio.run(run())
+
+        latency = self.events.get_statistics()["handler_latency"]
+        moved = latency["robot_moved"]
+        self.assertEqual(set(moved), {"TestHandlerLatency.fast_handler", "TestHandlerLatency.slow_handler"})
+        self.assertEqual(moved["TestHandlerLatency.slow_handler"]["count"], 5)
+        self.assertGreaterEqual(moved["TestHandlerLatency.slow_handler"]["p50_ms"], 3.5)
+        self.assertLess(moved["TestHandlerLatency.fast_handler"]["p99_ms"],
+                        moved["TestHandlerLatency.slow_handler"]["p50_ms"])
+        self.assertEqual(latency["order_created"]["TestHandlerLatency.test_per_handler_statistics."
+                                                  "<locals>.async_handler"]["count"], 1)
+        self.assertEqual(self.events.slow_handler_warnings, 0)
+
+        self.events.reset()
+        self.assertEqual(self.events.get_handler_latency(), {})
+
+        print("✅ Per-handler latency test passed")
+
+    def test_unsubscribed_handlers_are_released(self):
+        """Test that unsubscribing drops the handler's histogram and its reference."""
+        class Subscriber:
+            def on_moved(self, event):
+                pass
+
+        subscriber = Subscriber()
+        self.events.subscribe(EventType.ROBOT_MOVED, subscriber.on_moved)
+        self.events.subscribe(EventType.ROBOT_MOVED, self.fast_handler)
+        asyncio.run(self.events.emit(EventType.ROBOT_MOVED, {"robot_id": "ROBOT_001"}))
+        asyncio.run(self.events.process_events())
+        self.assertIn("TestHandlerLatency.test_unsubscribed_handlers_are_released.<locals>.Subscriber.on_moved",
+                      self.events.get_handler_latency()["robot_moved"])
+
+        self.events.unsubscribe(EventType.ROBOT_MOVED, subscriber.on_moved)
+        released = weakref.ref(subscriber)
+        del subscriber
+        gc.collect()
+        self.assertIsNone(released())
+        self.assertEqual(set(self.events.get_handler_latency()["robot_moved"]), {"TestHandlerLatency.fast_handler"})
+
+        print("✅ Unsubscribed handler release test passed")
+
+    def test_slow_handler_warning(self):
+        """Test that a slow handler emits a rate-limited PERFORMANCE_WARNING naming it."""
+        warnings = []
+        self.events.configure(slow_handler_threshold_ms=2.0)
+        self.events.subscribe(EventType.ROBOT_MOVED, self.fast_handler)
+        self.events.subscribe(EventType.ROBOT_MOVED, self.slow_handler)
+        self.events.subscribe(EventType.PERFORMANCE_WARNING, warnings.append)
+
+        async def run():
+            for _ in range(3):
+                await self.events.emit(EventType.ROBOT_MOVED, {"robot_id": "ROBOT_001"})
+            await self.events.process_events()
+            await self.events.process_events()
+
+        asyncio.run(run())
+
+        self.assertEqual(len(warnings), 1)
+        warning = warnings[0].data
+        self.assertEqual(warning["handler"], "TestHandlerLatency.slow_handler")
+        self.assertEqual(warning["event_type"], "robot_moved")
+        self.assertGreater(warning["elapsed_ms"], 2.0)
+        self.assertEqual(warnings[0].source, "EventSystem")
+        self.assertEqual(self.events.get_statistics()["performance"]["slow_handler_warnings"], 1)
+
+        # The rate limit is per handler and per interval
+        self.events.slow_handler_warning_interval = 0
+        asyncio.run(run())
+        self.assertEqual(len(warnings), 4)
+
+        print("✅ Slow handler warning test passed")
+
+    def test_timing_disabled(self):
+        """Test that handler_timing=False records nothing and still dispatches."""
+        calls = []
+        self.events.configure(handler_timing=False)
+        self.events.subscribe(EventType.ROBOT_MOVED, calls.append)
+
+        async def run():
+            await self.events.emit(EventType.ROBOT_MOVED, {})
+            await self.events.process_events()
+
+        asyncio.run(run())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.events.get_handler_latency(), {})
+        self.assertEqual(self.events.queue_wait["low"].count, 0)
+
+        print("✅ Timing disabled test passed")
+
+
+class TestQueueMetrics(unittest.TestCase):
+    """Test queue wait and drop counts."""
+
+    def test_queue_wait_and_drops(self):
+        """Test emit-to-dispatch wait per queue and drops counted per queue."""
+        events = EventSystem(max_queue_size=8)  # HIGH queue holds 2, LOW holds 8
+        events.configure_coalescing(EventType.FRAME_UPDATE, CoalescePolicy.LATEST)
+        events.is_running = True
+
+        async def run():
+            for _ in range(10):
+                await events.emit(EventType.ROBOT_MOVED, {})
+            for _ in range(3):
+                await events.emit(EventType.SYSTEM_ERROR, {})
+            await events.emit(EventType.FRAME_UPDATE, {})
+            await asyncio.sleep(0.01)
+            await events.process_events()
+
+        asyncio.run(run())
+
+        stats = events.get_statistics()
+        self.assertEqual(stats["dropped_events"], {"high": 1, "medium": 0, "low": 2})
+        self.assertEqual(stats["failed_events"], 3)
+        wait = stats["performance"]["queue_wait"]
+        self.assertEqual((wait["high"]["count"], wait["low"]["count"], wait["coalesced"]["count"]), (2, 8, 1))
+        self.assertEqual(wait["medium"]["count"], 0)
+        self.assertGreaterEqual(wait["low"]["p50_ms"], 8.75)  # 10ms within bucket precision
+
+        print("✅ Queue wait and drop test passed")
+
+
+class TestTimingBenchmark(unittest.TestCase):
+    """Benchmark the cost of handler timing."""
+
+    EVENTS = 20000
+
+    def _throughput(self, handler_timing):
+        """Emit and dispatch EVENTS events; return dispatches per second."""
+        events = EventSystem(max_queue_size=4 * self.EVENTS)
+        events.configure(max_concurrent_events=self.EVENTS, handler_timing=handler_timing)
+        events.subscribe(EventType.ROBOT_MOVED, lambda event: None)
+        events.subscribe(EventType.ROBOT_MOVED, lambda event: None)
+        events.is_running = True
+
+        async def run():
+            for index in range(self.EVENTS):
+                await events.emit(EventType.ROBOT_MOVED, {"index": index})
+            start = time.perf_counter()
+            await events.process_events()
+            return time.perf_counter() - start
+
+        return self.EVENTS / asyncio.run(run())
+
+    def test_timing_overhead(self):
+        """Report dispatch throughput with and without handler timing (best of 3 runs)."""
+        untimed = timed = 0.0
+        for _ in range(3):
+            untimed = max(untimed, self._throughput(False))
+            timed = max(timed, self._throughput(True))
+
+        print(f"📊 {self.EVENTS} events, 2 sync handlers: {untimed:,.0f}/s untimed, "
+              f"{timed:,.0f}/s timed ({timed / untimed:.0%})")
+        self.assertGreater(timed * 2, untimed)
+
+        print("✅ Timing benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
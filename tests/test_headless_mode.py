@@ -0,0 +1,93 @@
+"""
+Test suite for the headless fast-forward mode of the simulation engine.
+Tests fixed-step advancement, run reports and output suppression.
+"""
+
+import asyncio
+import logging
+import unittest
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.engine import SimulationEngine
+
+
+class TestHeadlessMode(unittest.TestCase):
+    """Test SimulationEngine.run_for headless execution."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.engine = SimulationEngine()
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        if self.engine.is_running:
+            asyncio.run(self.engine.stop())
+    
+    def test_run_for_advances_simulated_time(self):
+        """Test that run_for advances exactly the requested simulated time."""
+        report = asyncio.run(self.engine.run_for(10.0, time_step=0.1))
+        
+        self.assertAlmostEqual(report["sim_seconds"], 10.0, places=6)
+        self.assertEqual(report["frames"], 100)
+        self.assertAlmostEqual(self.engine.simulation_time, 10.0, places=6)
+        
+        print("✅ Headless time advancement test passed")
+    
+    def test_run_for_report(self):
+        """Test run report contents."""
+        report = asyncio.run(self.engine.run_for(120.0))
+        
+        for key in ("sim_seconds", "wall_seconds", "frames", "time_step",
+                    "sim_seconds_per_wall_second", "orders_generated",
+                    "orders_completed", "items_collected"):
+            self.assertIn(key, report)
+        
+        # Headless mode must run much faster than real time
+        self.assertGreater(report["sim_seconds_per_wall_second"], 10.0)
+        self.assertGreaterEqual(report["orders_generated"], 1)
+        
+        print("✅ Headless run report test passed")
+    
+    def test_run_for_is_resumable(self):
+        """Test that consecutive run_for calls continue the same run."""
+        asyncio.run(self.engine.run_for(5.0, time_step=0.5))
+        report = asyncio.run(self.engine.run_for(5.0, time_step=0.5))
+        
+        self.assertAlmostEqual(report["sim_seconds"], 5.0, places=6)
+        self.assertAlmostEqual(self.engine.simulation_time, 10.0, places=6)
+        
+        print("✅ Headless resumable run test passed")
+    
+    def test_run_for_quiet_suppresses_output(self):
+        """Test that quiet mode silences the engine logger for the run only."""
+        asyncio.run(self.engine.load_config())
+        engine_logger = logging.getLogger("core.engine")
+        engine_logger.setLevel(logging.DEBUG)
+        try:
+            with self.assertNoLogs("core.engine", level="INFO"):
+                asyncio.run(self.engine.run_for(2.0, quiet=True))
+            self.assertEqual(engine_logger.level, logging.DEBUG)
+            
+            with self.assertLogs("core.engine", level="INFO"):
+                asyncio.run(self.engine.run_for(2.0, quiet=False))
+        finally:
+            engine_logger.setLevel(logging.NOTSET)
+        
+        print("✅ Headless quiet output test passed")
+    
+    def test_run_for_invalid_arguments(self):
+        """Test argument validation."""
+        with self.assertRaises(ValueError):
+            asyncio.run(self.engine.run_for(0))
+        with self.assertRaises(ValueError):
+            asyncio.run(self.engine.run_for(1.0, time_step=-1.0))
+        
+        print("✅ Headless argument validation test passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Test suite for lightweight events.
+Tests slotted Event objects, sequence IDs, the default priority table, lazy
+timestamp and history rendering, and event creation throughput against the
+previous datetime-based events.
+"""
+
+import asyncio
+from collections import deque
+from datetime import datetime
+import sys
+import os
+import time
+import timeit
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.events import DEFAULT_PRIORITIES, Event, EventLogger, EventPriority, EventSystem, EventType
+
+
+class TestEvent(unittest.TestCase):
+    """Test slotted Event objects."""
+
+    def test_slotted_with_sequence_ids(self):
+        """Test that events have no instance dict and increasing sequence numbers."""
+        first = Event(EventType.ROBOT_MOVED)
+        second = Event(EventType.ROBOT_MOVED, data={"robot_id": "ROBOT_001"})
+
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertEqual(second.sequence, first.sequence + 1)
+        self.assertLessEqual(first.timestamp_ns, second.timestamp_ns)
+        self.assertEqual(first.data, {})
+        self.assertEqual(second.event_id, f"robot_moved_{second.sequence}")
+
+        print("✅ Slotted event test passed")
+
+    def test_priority_table(self):
+        """Test table priorities, explicit priorities and the LOW default rule."""
+        self.assertEqual(DEFAULT_PRIORITIES[EventType.SYSTEM_ERROR], EventPriority.HIGH)
+        self.assertEqual(DEFAULT_PRIORITIES[EventType.CONFIG_CHANGED], EventPriority.MEDIUM)
+        self.assertEqual(len(DEFAULT_PRIORITIES), len(EventType))
+
+        self.assertEqual(Event(EventType.FRAME_UPDATE, priority=EventPriority.MEDIUM).priority,
+                         EventPriority.MEDIUM)
+        self.assertEqual(Event(EventType.SIMULATION_STOP, priority=EventPriority.LOW).priority,
+                         EventPriority.HIGH)
+
+        print("✅ Priority table test passed")
+
+    def test_lazy_rendering(self):
+        """Test that timestamps render from the monotonic clock and explicit values win."""
+        before = datetime.now()
+        event = Event(EventType.ORDER_CREATED, source="OrderGenerator")
+        self.assertIsNone(event._timestamp)
+        self.assertIsNone(event._event_id)
+
+        rendered = event.to_dict()
+        self.assertLess(abs((event.timestamp - before).total_seconds()), 1.0)
+        self.assertEqual(rendered["timestamp"], event.timestamp.isoformat())
+        self.assertEqual(rendered["sequence"], event.sequence)
+
+        fixed = datetime(2024, 1, 1, 12, 0)
+        explicit = Event(EventType.ORDER_CREATED, fixed, event_id="custom")
+        self.assertEqual((explicit.timestamp, explicit.event_id), (fixed, "custom"))
+
+        print("✅ Lazy rendering test passed")
+
+    def test_logger_renders_on_read(self):
+        """Test that history stores events and renders dictionaries when read."""
+        logger = EventLogger(max_history=3)
+        for event_type in (EventType.ROBOT_MOVED, EventType.ORDER_CREATED,
+                           EventType.ROBOT_MOVED, EventType.ROBOT_MOVED):
+            asyncio.run(logger.before_process(Event(event_type)))
+
+        self.assertIsInstance(logger.event_history[0], Event)
+        recent = logger.get_recent_events(2)
+        self.assertEqual([entry["event_type"] for entry in recent], ["robot_moved", "robot_moved"])
+        self.assertEqual(len(logger.get_recent_events(10)), 3)
+        self.assertEqual(logger.get_recent_events(0), [])
+        self.assertEqual(len(logger.get_events_by_type(EventType.ROBOT_MOVED)), 2)
+
+        print("✅ Lazy history test passed")
+
+
+class TestEventBenchmark(unittest.TestCase):
+    """Benchmark event creation and emit+dispatch throughput."""
+
+    EVENTS = 20000
+
+    def test_event_creation_throughput(self):
+        """Report event creation+logging cost against the previous datetime-based events."""
+        high = [EventType.SIMULATION_STOP, EventType.SYSTEM_ERROR, EventType.PERFORMANCE_WARNING]
+        medium = [EventType.SIMULATION_START, EventType.SIMULATION_PAUSE, EventType.SIMULATION_RESUME,
+                  EventType.CONFIG_LOADED, EventType.CONFIG_CHANGED]
+        history = deque(maxlen=1000)
+        event_type = EventType.ROBOT_MOVED
+
+        def previous():
+            # datetime.now(), strftime event ID, list-scan priority, to_dict() per logged event
+            timestamp = datetime.now()
+            event_id = f"{event_type.value}_{timestamp.strftime('%Y%m%d_%H%M%S_%f')}"
+            priority = (EventPriority.HIGH if event_type in high
+                        else EventPriority.MEDIUM if event_type in medium else EventPriority.LOW)
+            history.append({"event_id": event_id, "event_type": event_type.value,
+                            "timestamp": timestamp.isoformat(), "priority": priority.name,
+                            "source": "bench", "data": {}, "processed": False})
+
+        def current():
+            history.append(Event(event_type, None, {}, "bench"))
+
+        old = min(timeit.repeat(previous, number=self.EVENTS, repeat=5))
+        new = min(timeit.repeat(current, number=self.EVENTS, repeat=5))
+
+        print(f"📊 {self.EVENTS} events created and logged: datetime-based {old * 1e3:.1f}ms, "
+              f"slotted {new * 1e3:.1f}ms ({old / new:.1f}x)")
+        self.assertLess(new * 2, old)
+
+        print("✅ Event creation benchmark passed")
+
+    def test_emit_dispatch_throughput(self):
+        """Report end-to-end emit and dispatch throughput."""
+        system = EventSystem(max_queue_size=4 * self.EVENTS)
+        system.configure(max_concurrent_events=self.EVENTS)
+        system.subscribe(EventType.ROBOT_MOVED, lambda event: None)
+        system.is_running = True
+
+        async def run():
+            start = time.perf_counter()
+            for index in range(self.EVENTS):
+                await system.emit(EventType.ROBOT_MOVED, {"index": index}, "bench")
+            emitted = time.perf_counter()
+            await system.process_events()
+            return emitted - start, time.perf_counter() - emitted
+
+        emit_time, dispatch_time = asyncio.run(run())
+
+        print(f"📊 {self.EVENTS} events: emit {self.EVENTS / emit_time:,.0f}/s, "
+              f"dispatch {self.EVENTS / dispatch_time:,.0f}/s, "
+              f"end to end {self.EVENTS / (emit_time + dispatch_time):,.0f}/s")
+        self.assertEqual(system.processed_events, self.EVENTS)
+
+        print("✅ Emit and dispatch benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
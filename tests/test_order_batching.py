@@ -0,0 +1,207 @@
+"""
+Test suite for order batching (wave picking).
+Tests batch selection limits, per-order completion inside a batch, engine
+dispatch of batched tours and the travel saved under a heavy order backlog.
+"""
+
+import asyncio
+import random
+import sys
+import os
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.batching import BatchCandidate, OrderBatch, OrderBatcher
+from core.engine import SimulationEngine
+from core.layout.coordinate import Coordinate
+from core.layout.pick_sequencer import PickSequencer
+from core.layout.route_table import get_route_table
+
+
+def make_order(order_id, items):
+    """Build an engine order dict."""
+    return {
+        "id": order_id,
+        "items": items,
+        "status": "pending",
+        "created_time": time.time()
+    }
+
+
+def candidate(key, *cells, arrival_time=0.0):
+    """Build a batch candidate from (aisle, rack) pairs."""
+    return BatchCandidate(key, [Coordinate(aisle, rack) for aisle, rack in cells], arrival_time)
+
+
+class TestOrderBatcher(unittest.TestCase):
+    """Test OrderBatcher batch selection."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.sequencer = PickSequencer(get_route_table(25, 20))
+
+    def test_groups_nearby_orders(self):
+        """Test that orders sharing aisles ride together and distant ones do not."""
+        batcher = OrderBatcher(self.sequencer, aisle_window=2)
+        pending = [
+            candidate("A", (3, 10)),
+            candidate("B", (4, 12)),
+            candidate("C", (24, 5)),
+            candidate("D", (3, 15)),
+        ]
+
+        self.assertEqual(batcher.select(pending, now=0.0), ["A", "B", "D"])
+        stats = batcher.get_statistics()
+        self.assertEqual((stats["batches_formed"], stats["orders_batched"]), (1, 3))
+        self.assertGreater(stats["distance_saved"], 0)
+
+        print("✅ Batch grouping test passed")
+
+    def test_respects_tote_capacity_and_order_limit(self):
+        """Test that batches never exceed the tote or the order limit."""
+        pending = [candidate(key, (5, rack), (5, rack + 1)) for key, rack in zip("ABCD", (2, 6, 10, 14))]
+
+        self.assertEqual(OrderBatcher(self.sequencer, tote_capacity=5).select(pending, 0.0), ["A", "B"])
+        self.assertEqual(OrderBatcher(self.sequencer, max_orders=3).select(pending, 0.0), ["A", "B", "C"])
+        self.assertEqual(OrderBatcher(self.sequencer, max_orders=1).select(pending, 0.0), ["A"])
+        with self.assertRaises(ValueError):
+            OrderBatcher(self.sequencer, tote_capacity=0)
+
+        print("✅ Batch capacity test passed")
+
+    def test_waits_for_batch_to_fill(self):
+        """Test that a growable batch is held until the oldest order has waited max_wait."""
+        batcher = OrderBatcher(self.sequencer, max_wait=30.0)
+        pending = [candidate("A", (3, 10), arrival_time=100.0), candidate("B", (3, 12), arrival_time=110.0)]
+
+        self.assertIsNone(batcher.select(pending, now=120.0))
+        self.assertEqual(batcher.select(pending, now=130.0), ["A", "B"])
+        self.assertIsNone(batcher.select([], now=130.0))
+
+        # A full batch leaves immediately
+        full = OrderBatcher(self.sequencer, max_orders=2, max_wait=30.0)
+        self.assertEqual(full.select(pending, now=110.0), ["A", "B"])
+
+        print("✅ Batch wait test passed")
+
+
+class TestOrderBatch(unittest.TestCase):
+    """Test per-order progress inside one tour."""
+
+    def test_orders_complete_independently(self):
+        """Test that each order completes when its own items are picked."""
+        batch = OrderBatch("BATCH_001", {3: ["ITEM_A_05", "ITEM_B_02"], 7: ["ITEM_B_02"]})
+
+        self.assertEqual(batch.items, ["ITEM_A_05", "ITEM_B_02", "ITEM_B_02"])
+        self.assertIsNone(batch.record_pick("ITEM_A_05"))
+        self.assertEqual(batch.record_pick("ITEM_B_02"), 3)
+        self.assertTrue(batch.is_order_complete(3))
+        self.assertTrue(batch.needs("ITEM_B_02"))
+        self.assertEqual(batch.record_pick("ITEM_B_02"), 7)
+        self.assertTrue(batch.is_complete())
+        self.assertIsNone(batch.record_pick("ITEM_Z_01"))
+        self.assertEqual(batch.get_progress(), {3: (2, 2), 7: (1, 1)})
+
+        print("✅ Order batch progress test passed")
+
+
+class TestEngineBatching(unittest.TestCase):
+    """Test batched tours in SimulationEngine."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.engine = SimulationEngine()
+        asyncio.run(self.engine.load_config())
+
+    def test_configure_batching(self):
+        """Test that batching switches a single robot to fleet dispatch."""
+        self.assertIsNone(self.engine.order_batcher)
+
+        self.engine.configure_batching(tote_capacity=6, max_orders=3)
+
+        self.assertEqual(len(self.engine.robots), 1)
+        self.assertEqual(self.engine.order_batcher.tote_capacity, 6)
+        self.engine.configure_batching(enabled=False)
+        self.assertIsNone(self.engine.order_batcher)
+
+        print("✅ Batching configuration test passed")
+
+    def test_batched_orders_complete_on_one_tour(self):
+        """Test that one robot picks several orders in one trip and tracks each."""
+        # The engine also generates a random order at start; keep it out of this batch
+        self.engine.configure_batching(max_orders=3)
+        self.engine.orders = [
+            make_order("ORDER_A", ["ITEM_C_05", "ITEM_C_12"]),
+            make_order("ORDER_B", ["ITEM_C_08"]),
+            make_order("ORDER_C", ["ITEM_D_12", "ITEM_C_12"]),
+        ]
+
+        asyncio.run(self.engine.run_for(1.0, time_step=0.1))
+        snapshot = self.engine.get_fleet_state()[0]
+        self.assertEqual(snapshot["batch_orders"], ["ORDER_A", "ORDER_B", "ORDER_C"])
+
+        asyncio.run(self.engine.run_for(200.0, time_step=0.1))
+        batch_ids = {order["batch_id"] for order in self.engine.orders[:3]}
+        self.assertEqual(len(batch_ids), 1)
+        for order in self.engine.orders[:3]:
+            self.assertEqual(order["status"], "completed")
+            self.assertTrue(order.get("return_completed"))
+            self.assertEqual(sorted(order["items_picked"]), sorted(order["items"]))
+        # The shared item is picked once per order on the same trip
+        self.assertEqual({order["robot_id"] for order in self.engine.orders[:3]}, {"ROBOT_001"})
+
+        print("✅ Engine batched tour test passed")
+
+
+class TestBatchingBenchmark(unittest.TestCase):
+    """Benchmark travel with and without batching under a heavy backlog."""
+
+    ORDER_COUNT = 60
+    ROBOTS = 2
+
+    def _run(self, batching):
+        """Run a preloaded backlog to completion and return (travel, sim seconds, engine)."""
+        rng = random.Random(11)
+        engine = SimulationEngine()
+
+        async def run():
+            await engine.load_config()
+            engine.configure_fleet(self.ROBOTS)
+            if batching:
+                engine.configure_batching()
+            for index in range(self.ORDER_COUNT):
+                items = [f"ITEM_{chr(65 + rng.randint(0, 24))}_{rng.randint(1, 20):02d}"
+                         for _ in range(rng.randint(1, 3))]
+                engine.orders.append(make_order(f"ORDER_{index:03d}", items))
+
+            elapsed = 0.0
+            while any(order.get("status") != "completed" or not order.get("return_completed")
+                      for order in engine.orders) and elapsed < 20000.0:
+                await engine.run_for(100.0)
+                elapsed += 100.0
+            return elapsed
+
+        elapsed = asyncio.run(run())
+        return float(engine.fleet.odometer.sum()), elapsed, engine
+
+    def test_travel_saved(self):
+        """Report travel and makespan; batching must cut travel for the same orders."""
+        single_travel, single_time, _ = self._run(batching=False)
+        batched_travel, batched_time, engine = self._run(batching=True)
+        stats = engine.order_batcher.get_statistics()
+
+        saved = 1.0 - batched_travel / single_travel
+        print(f"📊 {self.ORDER_COUNT} orders, {self.ROBOTS} robots: one order per tour {single_travel:.0f} units "
+              f"(~{single_time:.0f}s), batched {batched_travel:.0f} units (~{batched_time:.0f}s), "
+              f"{saved:.1%} travel saved, {stats['average_batch_size']:.2f} orders/batch")
+        self.assertLess(batched_travel, single_travel)
+        self.assertGreater(stats["average_batch_size"], 1.0)
+
+        print("✅ Batching benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Test suite for multi-item pick sequencing.
+Tests exact Held-Karp tours, the 2-opt/Or-opt heuristic, memoization and the
+distance saved against ascending (aisle, rack) order.
+"""
+
+import itertools
+import os
+import random
+import sys
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.layout.coordinate import Coordinate
+from core.layout.route_table import get_route_table
+from core.layout.pick_sequencer import PickSequencer
+from core.engine import SimulationEngine
+
+
+PACKOUT = Coordinate(1, 1)
+
+
+def ascending(locations):
+    """The previous pick order: sorted by aisle, then rack."""
+    return sorted(locations, key=lambda pos: (pos.aisle, pos.rack))
+
+
+def random_order(rng, size):
+    """Random pick locations."""
+    return [Coordinate(rng.randint(1, 25), rng.randint(1, 20)) for _ in range(size)]
+
+
+class TestPickSequencer(unittest.TestCase):
+    """Test PickSequencer tours."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.sequencer = PickSequencer(get_route_table(25, 20))
+        self.rng = random.Random(42)
+
+    def test_exact_matches_brute_force(self):
+        """Test Held-Karp tours against every permutation."""
+        for _ in range(60):
+            locations = random_order(self.rng, self.rng.randint(2, 6))
+            start = Coordinate(self.rng.randint(1, 25), self.rng.randint(1, 20))
+            end = self.rng.choice([None, PACKOUT])
+
+            order = self.sequencer.sequence(start, locations, end)
+            best = min(self.sequencer.tour_distance(start, list(p), end)
+                       for p in itertools.permutations(locations))
+
+            self.assertCountEqual(order, locations)
+            self.assertEqual(self.sequencer.tour_distance(start, order, end), best)
+
+        print("✅ Held-Karp optimality test passed")
+
+    def test_boundary_rule_changes_order(self):
+        """Test an order where ascending sort wastes a boundary crossing."""
+        locations = [Coordinate(3, 10), Coordinate(1, 15), Coordinate(2, 5)]
+
+        order = self.sequencer.sequence(PACKOUT, locations, PACKOUT)
+
+        self.assertEqual(order, [Coordinate(2, 5), Coordinate(3, 10), Coordinate(1, 15)])
+        self.assertEqual(self.sequencer.tour_distance(PACKOUT, order, PACKOUT), 50)
+        self.assertEqual(self.sequencer.tour_distance(PACKOUT, ascending(locations), PACKOUT), 58)
+
+        print("✅ Boundary-aware order test passed")
+
+    def test_keeps_ascending_order_on_ties(self):
+        """Test that ascending order is kept when nothing is shorter."""
+        locations = [Coordinate(5, 1), Coordinate(3, 1), Coordinate(4, 1)]
+
+        self.assertEqual(self.sequencer.sequence(PACKOUT, locations, PACKOUT), ascending(locations))
+
+        print("✅ Tie-breaking test passed")
+
+    def test_duplicates_and_small_orders(self):
+        """Test repeated locations and trivial orders."""
+        locations = [Coordinate(4, 12), Coordinate(2, 3), Coordinate(4, 12)]
+
+        order = self.sequencer.sequence(PACKOUT, locations, PACKOUT)
+
+        self.assertCountEqual(order, locations)
+        # Repeated locations are picked on the same visit
+        repeats = [i for i, pos in enumerate(order) if pos == Coordinate(4, 12)]
+        self.assertEqual(repeats[1] - repeats[0], 1)
+        self.assertEqual(self.sequencer.sequence(PACKOUT, [], PACKOUT), [])
+        self.assertEqual(self.sequencer.sequence(PACKOUT, [Coordinate(9, 9)]), [Coordinate(9, 9)])
+
+        print("✅ Duplicate location test passed")
+
+    def test_heuristic_for_large_orders(self):
+        """Test that large orders use local search and beat ascending order."""
+        locations = random_order(self.rng, 40)
+
+        order = self.sequencer.sequence(PACKOUT, locations, PACKOUT)
+
+        self.assertCountEqual(order, locations)
+        self.assertEqual(self.sequencer.get_statistics()["heuristic_solves"], 1)
+        self.assertLess(self.sequencer.tour_distance(PACKOUT, order, PACKOUT),
+                        self.sequencer.tour_distance(PACKOUT, ascending(locations), PACKOUT))
+
+        print("✅ Heuristic sequencing test passed")
+
+    def test_memoized_by_item_set(self):
+        """Test that the same item set is solved once regardless of input order."""
+        locations = random_order(self.rng, 8)
+
+        first = self.sequencer.sequence(PACKOUT, locations, PACKOUT)
+        second = self.sequencer.sequence(PACKOUT, list(reversed(locations)), PACKOUT)
+        stats = self.sequencer.get_statistics()
+
+        self.assertEqual(first, second)
+        self.assertEqual((stats["cache_misses"], stats["cache_hits"]), (1, 1))
+
+        small = PickSequencer(get_route_table(25, 20), cache_size=2)
+        for size in (2, 3, 4):
+            small.sequence(PACKOUT, locations[:size], PACKOUT)
+        self.assertEqual(small.get_statistics()["cached_sequences"], 2)
+
+        print("✅ Sequence memoization test passed")
+
+    def test_engine_paths_use_sequencer(self):
+        """Test that engine multi-item paths visit items in sequenced order."""
+        engine = SimulationEngine()
+        targets = [Coordinate(3, 10), Coordinate(1, 15), Coordinate(2, 5)]
+
+        path = engine._calculate_snake_path(PACKOUT, targets)
+        visits = [path.index(target) for target in (Coordinate(2, 5), Coordinate(3, 10), Coordinate(1, 15))]
+
+        self.assertEqual(visits, sorted(visits))
+        self.assertEqual(len(path) - 1, 50 - 14)  # Return leg to packout is planned separately
+
+        print("✅ Engine sequencing test passed")
+
+
+class TestPickSequencerBenchmark(unittest.TestCase):
+    """Benchmark distance saved against ascending order."""
+
+    ORDER_SIZES = (2, 4, 8, 12, 20, 40)
+    ORDERS_PER_SIZE = 40
+
+    def test_distance_saved(self):
+        """Report travel saved per order size; optimized tours are never longer."""
+        rng = random.Random(7)
+        sequencer = PickSequencer(get_route_table(25, 20))
+
+        for size in self.ORDER_SIZES:
+            baseline_total = optimized_total = 0
+            start = time.perf_counter()
+            for _ in range(self.ORDERS_PER_SIZE):
+                locations = random_order(rng, size)
+                order = sequencer.sequence(PACKOUT, locations, PACKOUT)
+                optimized = sequencer.tour_distance(PACKOUT, order, PACKOUT)
+                baseline = sequencer.tour_distance(PACKOUT, ascending(locations), PACKOUT)
+                self.assertLessEqual(optimized, baseline)
+                baseline_total += baseline
+                optimized_total += optimized
+            elapsed = (time.perf_counter() - start) / self.ORDERS_PER_SIZE
+
+            saved = 1.0 - optimized_total / baseline_total
+            print(f"📊 {size:2d} items: ascending {baseline_total / self.ORDERS_PER_SIZE:6.1f}, "
+                  f"sequenced {optimized_total / self.ORDERS_PER_SIZE:6.1f} "
+                  f"({saved:5.1%} saved, {elapsed * 1e3:.2f}ms/order)")
+            if size >= 8:
+                self.assertGreater(saved, 0.0)
+
+        print("✅ Pick sequencing benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+"""
+Test suite for multi-robot fleet support.
+Tests vectorized fleet kinematics, engine order dispatch across robots and
+frame-time scaling from 1 to 500 robots.
+"""
+
+import asyncio
+import time
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.fleet import RobotFleet
+from core.engine import SimulationEngine, RobotState
+
+
+def make_order(order_id, items):
+    """Build an engine order dict."""
+    return {
+        "id": order_id,
+        "items": items,
+        "status": "pending",
+        "created_time": time.time()
+    }
+
+
+class TestRobotFleet(unittest.TestCase):
+    """Test RobotFleet vectorized kinematics."""
+
+    def test_rejects_invalid_fleets(self):
+        """Test validation of robot IDs."""
+        with self.assertRaises(ValueError):
+            RobotFleet([])
+        with self.assertRaises(ValueError):
+            RobotFleet(["R1", "R1"])
+
+        print("✅ Fleet validation test passed")
+
+    def test_advance_interpolates_all_robots(self):
+        """Test that one advance call moves every robot along its segment."""
+        fleet = RobotFleet(["R1", "R2", "R3"])
+        fleet.begin_segment(0, (5.0, 1.0), 0.0)
+        fleet.begin_segment(1, (1.0, 3.0), 0.0)
+
+        arrived = fleet.advance(1.0, speed=1.0)
+
+        self.assertEqual(arrived.tolist(), [])
+        np.testing.assert_allclose(fleet.positions[0], [2.0, 1.0])
+        np.testing.assert_allclose(fleet.positions[1], [1.0, 2.0])
+        np.testing.assert_allclose(fleet.positions[2], [1.0, 1.0])
+
+        print("✅ Fleet interpolation test passed")
+
+    def test_advance_reports_arrivals(self):
+        """Test arrival snapping, stopping and distance accounting."""
+        fleet = RobotFleet(["R1", "R2"])
+        fleet.begin_segment(0, (3.0, 1.0), 0.0)
+        fleet.begin_segment(1, (1.0, 10.0), 0.0)
+
+        arrived = fleet.advance(5.0, speed=1.0)
+
+        self.assertEqual(arrived.tolist(), [0])
+        np.testing.assert_allclose(fleet.positions[0], [3.0, 1.0])
+        self.assertFalse(fleet.moving[0])
+        self.assertTrue(fleet.moving[1])
+        self.assertAlmostEqual(fleet.odometer[0], 2.0)
+
+        print("✅ Fleet arrival test passed")
+
+    def test_picks(self):
+        """Test pick scheduling and completion lookup."""
+        fleet = RobotFleet(["R1", "R2"])
+        fleet.begin_pick(1, 3.0)
+
+        self.assertEqual(fleet.due_picks(2.9).tolist(), [])
+        self.assertEqual(fleet.due_picks(3.0).tolist(), [1])
+        fleet.end_pick(1)
+        self.assertEqual(fleet.due_picks(10.0).tolist(), [])
+
+        print("✅ Fleet pick test passed")
+
+
+class TestEngineFleet(unittest.TestCase):
+    """Test SimulationEngine multi-robot mode."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.engine = SimulationEngine()
+        asyncio.run(self.engine.load_config())
+
+    def test_configure_fleet(self):
+        """Test fleet creation and primary robot aliasing."""
+        self.engine.configure_fleet(3)
+
+        self.assertEqual([r.robot_id for r in self.engine.robots], ["ROBOT_001", "ROBOT_002", "ROBOT_003"])
+        self.assertIs(self.engine.robot, self.engine.robots[0])
+        self.assertEqual(len(self.engine.fleet), 3)
+        with self.assertRaises(ValueError):
+            self.engine.configure_fleet(0)
+
+        print("✅ Fleet configuration test passed")
+
+    def test_orders_are_spread_across_robots(self):
+        """Test that idle robots each take a different order and complete it."""
+        self.engine.configure_fleet(3)
+        self.engine.orders = [
+            make_order("ORDER_A", ["ITEM_B_05"]),
+            make_order("ORDER_B", ["ITEM_D_10"]),
+            make_order("ORDER_C", ["ITEM_F_15", "ITEM_F_18"]),
+        ]
+
+        asyncio.run(self.engine.run_for(1.0, time_step=0.1))
+        served = {robot.current_order for robot in self.engine.robots}
+        self.assertEqual(served, {"ORDER_A", "ORDER_B", "ORDER_C"})
+
+        asyncio.run(self.engine.run_for(200.0, time_step=0.1))
+        for order in self.engine.orders[:3]:
+            self.assertEqual(order["status"], "completed")
+            self.assertTrue(order.get("return_completed"))
+            self.assertEqual(sorted(order["items_picked"]), sorted(order["items"]))
+        self.assertEqual({o["robot_id"] for o in self.engine.orders[:3]},
+                         {"ROBOT_001", "ROBOT_002", "ROBOT_003"})
+
+        print("✅ Fleet order dispatch test passed")
+
+    def test_positions_come_from_fleet_arrays(self):
+        """Test that viewers read interpolated positions for each robot."""
+        # The engine also generates an order at t=0, so one robot stays idle with three
+        self.engine.configure_fleet(3)
+        self.engine.orders = [make_order("ORDER_A", ["ITEM_A_10"])]
+
+        asyncio.run(self.engine.run_for(2.5, time_step=0.1))
+
+        position = self.engine.get_robot_position("ROBOT_001")
+        self.assertAlmostEqual(position.aisle, 1.0)
+        # Dispatched on the first frame (t=0.1), then 2.4s at 1 unit/s up aisle A
+        self.assertAlmostEqual(position.rack, 3.4)
+        idle = self.engine.get_robot_position("ROBOT_003")
+        self.assertEqual((idle.aisle, idle.rack), (1.0, 1.0))
+        with self.assertRaises(KeyError):
+            self.engine.get_robot_position("ROBOT_999")
+
+        snapshot = self.engine.get_fleet_state()
+        self.assertEqual(len(snapshot), 3)
+        self.assertEqual(snapshot[0]["state"], RobotState.MOVING.value)
+
+        print("✅ Fleet position test passed")
+
+    def test_event_driven_runs_reject_fleets(self):
+        """Test that event-driven runs stay single-robot."""
+        self.engine.configure_fleet(2)
+        with self.assertRaises(ValueError):
+            asyncio.run(self.engine.run_for(10.0, event_driven=True))
+
+        print("✅ Fleet event-driven guard test passed")
+
+
+class TestFleetScaling(unittest.TestCase):
+    """Benchmark frame time as the fleet grows."""
+
+    FLEET_SIZES = (1, 10, 100, 500)
+
+    def _frame_time(self, robot_count):
+        """Run a loaded fleet headless and return wall seconds per frame."""
+        engine = SimulationEngine()
+
+        async def run():
+            await engine.load_config()
+            engine.configure_fleet(robot_count)
+            # Enough work to keep every robot busy for the whole run
+            for index in range(robot_count * 6):
+                aisle = chr(65 + index % 25)
+                rack = 1 + (index * 7) % 20
+                engine.orders.append(make_order(f"ORDER_{index}", [f"ITEM_{aisle}_{rack:02d}"]))
+            return await engine.run_for(120.0)
+
+        report = asyncio.run(run())
+        return report["wall_seconds"] / report["frames"], engine
+
+    def test_frame_time_scaling(self):
+        """Test that frame time grows far slower than the robot count."""
+        results = {}
+        for robot_count in self.FLEET_SIZES:
+            frame_time, engine = self._frame_time(robot_count)
+            results[robot_count] = frame_time
+            busy = sum(1 for robot in engine.robots if robot.state != RobotState.IDLE)
+            print(f"📊 {robot_count:4d} robots: {frame_time * 1e6:8.1f}µs/frame "
+                  f"({busy} busy, {engine.performance_metrics['items_collected']} items)")
+
+        # 500x the robots must cost well under 500x the frame time
+        self.assertLess(results[500], results[1] * 50)
+
+        print("✅ Fleet scaling benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
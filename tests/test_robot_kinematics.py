@@ -0,0 +1,189 @@
+"""
+Test suite for allocation-free robot kinematics.
+Tests slotted in-place coordinates, the preallocated waypoint buffer, engine
+movement through robot-owned buffers and, with tracemalloc, that steady-state
+movement frames allocate nothing.
+"""
+
+import asyncio
+import logging
+import sys
+import os
+import time
+import tracemalloc
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.engine import SimulationEngine, RobotState
+from core.kinematics import RobotKinematics, WaypointPath
+from core.layout.coordinate import Coordinate, CoordinateError, SmoothCoordinate
+
+
+class TestSmoothCoordinate(unittest.TestCase):
+    """Test slotted, in-place SmoothCoordinate."""
+
+    def test_slotted_and_mutable(self):
+        """Test that coordinates have no instance dict and move in place."""
+        position = SmoothCoordinate(1.0, 1.0)
+
+        self.assertFalse(hasattr(position, "__dict__"))
+        position.move_to(2.5, 7.25)
+        self.assertEqual((position.aisle, position.rack), (2.5, 7.25))
+        copy = position.copy()
+        self.assertEqual(copy, position)
+        self.assertIsNot(copy, position)
+
+        print("✅ Slotted coordinate test passed")
+
+    def test_validation_only_on_construction(self):
+        """Test that the constructor validates bounds and move_to does not."""
+        with self.assertRaises(CoordinateError):
+            SmoothCoordinate(0.5, 1.0)
+        with self.assertRaises(CoordinateError):
+            SmoothCoordinate(1.0, 21.0)
+
+        position = SmoothCoordinate(1.0, 1.0)
+        position.move_to(30.0, 1.0)  # Internal update: callers keep it in bounds
+        self.assertEqual(position.aisle, 30.0)
+        self.assertNotEqual(SmoothCoordinate(1.0, 1.0), Coordinate(1, 1))
+
+        print("✅ Coordinate validation boundary test passed")
+
+
+class TestWaypointPath(unittest.TestCase):
+    """Test the preallocated waypoint buffer."""
+
+    def test_load_reuses_buffer(self):
+        """Test that shorter paths reuse the buffer and longer ones grow it."""
+        path = WaypointPath(capacity=4)
+        buffer = path._points
+
+        path.load([Coordinate(1, 1), Coordinate(1, 2), Coordinate(1, 3)])
+        self.assertIs(path._points, buffer)
+        self.assertEqual(len(path), 3)
+
+        path.load([Coordinate(1, rack) for rack in range(1, 11)])
+        self.assertEqual(len(path), 10)
+        self.assertGreaterEqual(path.capacity, 10)
+
+        path.clear()
+        self.assertEqual(len(path), 0)
+        self.assertEqual(path, [])
+
+        print("✅ Waypoint buffer reuse test passed")
+
+    def test_sequence_access(self):
+        """Test indexing, slicing, iteration and comparison with point lists."""
+        points = [Coordinate(1, 1), Coordinate(2, 1), Coordinate(2, 2)]
+        path = WaypointPath(points)
+
+        self.assertEqual(path[1], SmoothCoordinate(2.0, 1.0))
+        self.assertEqual(path[-1], SmoothCoordinate(2.0, 2.0))
+        self.assertEqual(path[:2], [SmoothCoordinate(1.0, 1.0), SmoothCoordinate(2.0, 1.0)])
+        self.assertEqual(list(path), [SmoothCoordinate(c.aisle, c.rack) for c in points])
+        self.assertEqual(path, points)
+        self.assertNotEqual(path, points[:2])
+        with self.assertRaises(IndexError):
+            path[3]
+
+        target = SmoothCoordinate(1.0, 1.0)
+        path.read_into(2, target)
+        self.assertEqual((target.aisle, target.rack), (2.0, 2.0))
+
+        print("✅ Waypoint access test passed")
+
+    def test_kinematics_segment(self):
+        """Test that segment endpoints are copied, not aliased."""
+        kinematics = RobotKinematics()
+        path = [Coordinate(1, 2)]
+
+        target = kinematics.begin_segment(path, 0, kinematics.position)
+
+        self.assertIs(target, kinematics.target)
+        self.assertEqual((target.aisle, target.rack), (1, 2))
+        self.assertIsNone(kinematics.begin_segment([None], 0, kinematics.position))
+
+        print("✅ Kinematic segment test passed")
+
+
+class TestEngineKinematics(unittest.TestCase):
+    """Test engine movement through robot-owned buffers."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.engine = SimulationEngine()
+        asyncio.run(self.engine.load_config())
+        self.engine.is_running = True
+        self.engine.orders = [{"id": "ORDER_A", "items": ["ITEM_A_20", "ITEM_Y_20"],
+                               "status": "pending", "created_time": time.time()}]
+        self.log_level = logging.getLogger("core.engine").level
+        # Steady state means diagnostics off: emitted DEBUG records allocate by design
+        logging.getLogger("core.engine").setLevel(logging.INFO)
+
+    def tearDown(self):
+        """Restore logging level."""
+        logging.getLogger("core.engine").setLevel(self.log_level)
+
+    def frame(self, delta_time=1 / 60):
+        """Advance the robot by one frame."""
+        self.engine.simulation_time += delta_time
+        self.engine._update_robot_snake_movement(delta_time)
+
+    def test_position_updated_in_place(self):
+        """Test that frames move one position object and viewers get snapshots."""
+        for _ in range(5):
+            self.frame()
+        robot = self.engine.robot
+        position = robot.position
+
+        for _ in range(20):
+            self.frame()
+
+        self.assertIs(robot.position, position)
+        self.assertIsInstance(robot.current_path, WaypointPath)
+        self.assertGreater(position.rack, 1.0)
+        snapshot = self.engine.get_robot_position()
+        self.assertEqual(snapshot, position)
+        self.assertIsNot(snapshot, position)
+
+        # A replaced position is adopted back into the robot's buffer
+        robot.position = SmoothCoordinate(1.0, 1.0)
+        self.frame()
+        self.assertIs(robot.position, robot.kinematics.position)
+
+        print("✅ In-place position test passed")
+
+    def test_steady_state_frames_do_not_allocate(self):
+        """Test with tracemalloc that moving frames allocate no memory at all."""
+        for _ in range(30):
+            self.frame()
+
+        tracemalloc.start()
+        try:
+            moving_frames = 0
+            worst = 0
+            for _ in range(600):
+                state = self.engine.robot.state
+                segment_start = self.engine.robot.movement_start_time is None
+                current = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                self.frame()
+                peak = tracemalloc.get_traced_memory()[1]
+                # Frames that plan a path or finish a pick do real work and may allocate
+                if state == RobotState.MOVING and self.engine.robot.state == RobotState.MOVING:
+                    moving_frames += 1
+                    worst = max(worst, peak - current)
+        finally:
+            tracemalloc.stop()
+
+        print(f"📊 {moving_frames} moving frames (including segment starts): peak allocation {worst} bytes/frame")
+        self.assertGreater(moving_frames, 300)
+        self.assertEqual(worst, 0)
+
+        print("✅ Allocation-free frame test passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+"""
+Test suite for the binary robot position wire format.
+Tests frame round trips, the id table, headings and state codes, malformed
+frames, binary streaming to opted-in Socket.IO clients, and payload size and
+encode time against JSON.
+"""
+
+import json
+import math
+import sys
+import os
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from web_interface.server.robot_wire import (HEADER, RECORD, RobotWireEncoder, UNKNOWN_STATE,
+                                             decode_robot_frame, state_code)
+from web_interface.server.snapshot_cache import SnapshotCache
+
+
+def fleet(count, step=0):
+    """Robot kinematics for a fleet moving diagonally."""
+    states = ('idle', 'moving', 'picking', 'returning')
+    return [{'id': f'ROBOT_{index:03d}', 'x': 1.0 + index % 25 + step * 0.1, 'y': 1.0 + index % 20 + step * 0.1,
+             'state': states[index % len(states)]} for index in range(1, count + 1)]
+
+
+class TestRobotWire(unittest.TestCase):
+    """Test encoding and decoding robot frames."""
+
+    def test_round_trip(self):
+        """Test that positions, states and time survive a round trip."""
+        encoder = RobotWireEncoder()
+        robots = fleet(5)
+        decoded = decode_robot_frame(encoder.encode(robots, simulation_time=12.5))
+
+        self.assertEqual(decoded['sequence'], 1)
+        self.assertEqual(decoded['time'], 12.5)
+        self.assertEqual([robot['id'] for robot in decoded['robots']], [robot['id'] for robot in robots])
+        for sent, received in zip(robots, decoded['robots']):
+            self.assertAlmostEqual(received['x'], sent['x'], places=5)
+            self.assertAlmostEqual(received['y'], sent['y'], places=5)
+            self.assertEqual(received['state'], sent['state'].upper())
+
+        print("✅ Robot frame round trip test passed")
+
+    def test_id_table_only_when_needed(self):
+        """Test that the id table is sent for new robots or on request only."""
+        encoder = RobotWireEncoder()
+        first = encoder.encode(fleet(3))
+        ids = decode_robot_frame(first)['robot_ids']
+
+        plain = encoder.encode(fleet(3, step=1))
+        self.assertEqual(len(plain), HEADER.size + 3 * RECORD.size)
+        self.assertEqual(decode_robot_frame(plain)['robots'][0]['id'], None)
+        self.assertEqual(decode_robot_frame(plain, ids)['robots'][2]['id'], 'ROBOT_003')
+
+        self.assertGreater(len(encoder.encode(fleet(3, step=2), with_ids=True)), len(plain))
+        grown = decode_robot_frame(encoder.encode(fleet(4, step=3)))
+        self.assertEqual(grown['robot_ids'], ['ROBOT_001', 'ROBOT_002', 'ROBOT_003', 'ROBOT_004'])
+        self.assertEqual(encoder.stats['id_tables'], 3)
+
+        print("✅ Id table test passed")
+
+    def test_heading_and_states(self):
+        """Test headings from movement and state codes."""
+        encoder = RobotWireEncoder()
+        encoder.encode([{'id': 'R1', 'x': 2.0, 'y': 2.0, 'state': 'moving'}])
+        up = decode_robot_frame(encoder.encode([{'id': 'R1', 'x': 2.0, 'y': 3.0, 'state': 'moving'}]))
+        self.assertEqual(up['robots'][0]['heading'], 90.0)
+        still = decode_robot_frame(encoder.encode([{'id': 'R1', 'x': 2.0, 'y': 3.0, 'state': 'picking'}]))
+        self.assertEqual(still['robots'][0]['heading'], 90.0)
+        back = decode_robot_frame(encoder.encode([{'id': 'R1', 'x': 1.0, 'y': 2.0, 'state': 'moving'}]))
+        self.assertEqual(back['robots'][0]['heading'], round(math.degrees(math.atan2(-1, -1)) % 360, 2))
+
+        from core.engine import RobotState
+        self.assertEqual(state_code(RobotState.RETURNING), state_code('returning'))
+        self.assertEqual(state_code('charging'), UNKNOWN_STATE)
+        weird = decode_robot_frame(encoder.encode([{'id': 'R1', 'x': 1.0, 'y': 2.0, 'state': 'charging'}]))
+        self.assertEqual(weird['robots'][0]['state'], 'UNKNOWN')
+
+        print("✅ Heading and state code test passed")
+
+    def test_malformed_frames(self):
+        """Test that truncated or foreign frames raise ValueError."""
+        frame = RobotWireEncoder().encode(fleet(2))
+        for bad in (frame[:10], frame[:-3], b'XX' + frame[2:], frame[:2] + b'\x09' + frame[3:]):
+            with self.assertRaises(ValueError):
+                decode_robot_frame(bad)
+        with self.assertRaises(ValueError):
+            RobotWireEncoder().encode([{'id': 'R' * 300, 'x': 1, 'y': 1, 'state': 'idle'}])
+
+        print("✅ Malformed frame test passed")
+
+
+class RobotFrameDataBridge:
+    """DataBridge stand-in serving snapshots and binary robot frames."""
+
+    def __init__(self):
+        self.step = 0
+        self.robot_wire = RobotWireEncoder()
+        self.snapshot_cache = SnapshotCache({
+            'simulation_state': lambda: {'status': 'running', 'time': 0.0},
+            'robot_data': lambda: [],
+            'order_data': lambda: {'pending': 0, 'orders': []},
+            'kpi_data': lambda: {},
+            'inventory_data': lambda: {'inventory': {}},
+            'warehouse_data': lambda: {'grid_size': {'width': 25, 'height': 20}}
+        }, max_age=60.0)
+
+    def get_snapshot(self, topic):
+        return self.snapshot_cache.get(topic)
+
+    def get_robot_frame(self, with_ids=False):
+        return self.robot_wire.encode(fleet(3, self.step), float(self.step), with_ids)
+
+
+class TestBinaryStream(unittest.TestCase):
+    """Test robot frames reaching Socket.IO clients that opted in."""
+
+    def setUp(self):
+        from web_interface.server.web_server import WebServer
+        self.server = WebServer()
+        self.server.data_bridge = RobotFrameDataBridge()
+
+    def test_opted_in_clients_get_frames(self):
+        """Test that only binary clients get frames, and new ones get the id table."""
+        binary = self.server.socketio.test_client(self.server.app)
+        plain = self.server.socketio.test_client(self.server.app)
+        binary.get_received()
+        plain.get_received()
+
+        binary.emit('robot_stream', {'format': 'binary'})
+        self.server.handle_pushed_topics({'robot_frame'})
+        self.server.data_bridge.step += 1
+        self.server.handle_pushed_topics({'robot_frame'})
+
+        frames = [event['args'][0] for event in binary.get_received() if event['name'] == 'robot_frame']
+        self.assertEqual(len(frames), 2)
+        first = decode_robot_frame(frames[0])
+        self.assertEqual(first['robot_ids'], ['ROBOT_001', 'ROBOT_002', 'ROBOT_003'])
+        second = decode_robot_frame(frames[1], first['robot_ids'])
+        self.assertEqual(len(frames[1]), HEADER.size + 3 * RECORD.size)
+        self.assertEqual(second['robots'][1]['id'], 'ROBOT_002')
+        self.assertEqual([event['name'] for event in plain.get_received() if event['name'] == 'robot_frame'], [])
+
+        binary.emit('robot_stream', {'format': 'json'})
+        self.server.handle_pushed_topics({'robot_frame'})
+        self.assertEqual(binary.get_received(), [])
+        binary.disconnect()
+        plain.disconnect()
+
+        print("✅ Binary stream opt-in test passed")
+
+
+class TestWireBenchmark(unittest.TestCase):
+    """Benchmark binary frames against JSON robot updates."""
+
+    def test_size_and_encode_time(self):
+        """Compare payload size and encode time for a 100-robot fleet."""
+        robots_per_frame = 100
+        ticks = 200
+        encoder = RobotWireEncoder()
+        encoder.encode(fleet(robots_per_frame))  # The id table goes out once
+
+        def as_json(robots):
+            # Nested-dict format of the JSON robot updates
+            return json.dumps([{'id': robot['id'], 'position': {'aisle': robot['x'], 'rack': robot['y']},
+                                'state': robot['state'].upper(), 'heading': 0.0} for robot in robots])
+
+        frames = [fleet(robots_per_frame, step) for step in range(ticks)]
+        start = time.perf_counter()
+        json_bytes = sum(len(as_json(robots).encode('utf-8')) for robots in frames)
+        json_ms = (time.perf_counter() - start) * 1000 / ticks
+
+        start = time.perf_counter()
+        binary_bytes = sum(len(encoder.encode(robots, float(step))) for step, robots in enumerate(frames))
+        binary_ms = (time.perf_counter() - start) * 1000 / ticks
+
+        self.assertLess(binary_bytes * 4, json_bytes)
+        print(f"📊 {robots_per_frame} robots per tick: JSON {json_bytes / ticks:.0f} bytes in {json_ms:.3f}ms, "
+              f"binary {binary_bytes / ticks:.0f} bytes in {binary_ms:.3f}ms "
+              f"({json_bytes / binary_bytes:.1f}x smaller)")
+        print("✅ Wire format benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
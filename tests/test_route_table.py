@@ -0,0 +1,208 @@
+"""
+Test suite for the precomputed warehouse route table.
+Tests shortest distances under the boundary-rack rule, route reconstruction,
+the on-disk cache and lookup speed against per-call path building.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from collections import deque
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.layout.coordinate import Coordinate
+from core.layout.route_table import RouteTable, get_route_table
+from core.layout.warehouse_layout import WarehouseLayoutManager
+from core.engine import SimulationEngine
+
+
+def neighbours(aisle, rack, max_aisle, max_rack):
+    """Cells reachable in one move under the warehouse navigation rules."""
+    if rack > 1:
+        yield aisle, rack - 1
+    if rack < max_rack:
+        yield aisle, rack + 1
+    if rack in (1, max_rack):
+        if aisle > 1:
+            yield aisle - 1, rack
+        if aisle < max_aisle:
+            yield aisle + 1, rack
+
+
+def bfs_distances(start, max_aisle, max_rack):
+    """Reference shortest distances from one cell by breadth-first search."""
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        cell = queue.popleft()
+        for neighbour in neighbours(*cell, max_aisle, max_rack):
+            if neighbour not in distances:
+                distances[neighbour] = distances[cell] + 1
+                queue.append(neighbour)
+    return distances
+
+
+class TestRouteTable(unittest.TestCase):
+    """Test RouteTable distances and routes."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.table = get_route_table(25, 20)
+
+    def test_dimensions(self):
+        """Test matrix shape, dtypes and cell numbering."""
+        self.assertEqual(self.table.distances.shape, (500, 500))
+        self.assertEqual(self.table.distances.itemsize, 2)
+        self.assertEqual(self.table.boundary_racks.itemsize, 1)
+        self.assertEqual(self.table.cell_id(Coordinate(1, 1)), 0)
+        self.assertEqual(self.table.cell_id(Coordinate(2, 1)), 20)
+        self.assertEqual(self.table.coordinate(499), Coordinate(25, 20))
+
+        print("✅ Route table dimensions test passed")
+
+    def test_distances_match_breadth_first_search(self):
+        """Test every distance against BFS on the movement graph."""
+        for aisle in range(1, 26):
+            for rack in range(1, 21):
+                reference = bfs_distances((aisle, rack), 25, 20)
+                row = self.table.distances_from(Coordinate(aisle, rack))
+                for (to_aisle, to_rack), distance in reference.items():
+                    self.assertEqual(row[self.table.cell_id(Coordinate(to_aisle, to_rack))], distance)
+
+        print("✅ Route table BFS distance test passed")
+
+    def test_routes_are_rule_compliant(self):
+        """Test that routes are adjacent moves of the tabled length."""
+        pairs = [
+            (Coordinate(1, 1), Coordinate(1, 1)),
+            (Coordinate(3, 5), Coordinate(3, 17)),
+            (Coordinate(2, 10), Coordinate(7, 19)),
+            (Coordinate(25, 20), Coordinate(1, 1)),
+            (Coordinate(12, 10), Coordinate(4, 11)),
+        ]
+        for start, target in pairs:
+            route = self.table.route(start, target)
+            self.assertEqual(route[0], start)
+            self.assertEqual(route[-1], target)
+            self.assertEqual(len(route) - 1, self.table.distance(start, target))
+            for current, following in zip(route, route[1:]):
+                self.assertIn((following.aisle, following.rack),
+                              set(neighbours(current.aisle, current.rack, 25, 20)))
+
+        print("✅ Route table route test passed")
+
+    def test_picks_shorter_boundary(self):
+        """Test that cross-aisle routes use the cheaper boundary rack."""
+        start, target = Coordinate(2, 10), Coordinate(7, 19)
+
+        self.assertEqual(self.table.distance(start, target), 10 + 5 + 1)
+        self.assertEqual(self.table.waypoints(start, target),
+                         [start, Coordinate(2, 20), Coordinate(7, 20), target])
+        # Equal cost either way: the boundary nearest the start wins
+        self.assertEqual(self.table.waypoints(Coordinate(1, 10), Coordinate(2, 11))[1], Coordinate(1, 1))
+
+        print("✅ Route table boundary choice test passed")
+
+    def test_path_distance(self):
+        """Test total distance over a sequence of stops."""
+        stops = [Coordinate(1, 1), Coordinate(3, 5), Coordinate(3, 2), Coordinate(1, 1)]
+
+        self.assertEqual(self.table.path_distance(stops), 6 + 3 + 3)
+        self.assertEqual(self.table.path_distance(stops[:1]), 0)
+
+        print("✅ Route table path distance test passed")
+
+    def test_shared_per_layout(self):
+        """Test that the layout manager and planners share one table."""
+        self.assertIs(WarehouseLayoutManager().get_route_table(), self.table)
+        self.assertIs(get_route_table(25, 20), self.table)
+
+        small = RouteTable(3, 4)
+        self.assertEqual(small.distances.shape, (12, 12))
+        with self.assertRaises(ValueError):
+            RouteTable(0, 20)
+
+        print("✅ Route table sharing test passed")
+
+    def test_disk_cache_round_trip(self):
+        """Test saving, loading and cache files keyed by dimensions."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir, RouteTable.cache_filename(25, 20))
+            self.table.save(path)
+            loaded = RouteTable.load(path)
+
+            self.assertEqual((loaded.max_aisle, loaded.max_rack), (25, 20))
+            self.assertTrue((loaded.distances == self.table.distances).all())
+            self.assertEqual(loaded.route(Coordinate(2, 10), Coordinate(7, 19)),
+                             self.table.route(Coordinate(2, 10), Coordinate(7, 19)))
+
+            table = get_route_table(6, 7, cache_dir=cache_dir)
+            self.assertTrue(os.path.exists(os.path.join(cache_dir, "route_table_6x7_v1.npz")))
+            self.assertEqual(table.distance(Coordinate(1, 1), Coordinate(6, 7)), 11)
+
+        print("✅ Route table disk cache test passed")
+
+
+class TestRouteTableIntegration(unittest.TestCase):
+    """Test planners and trackers that read from the route table."""
+
+    def test_engine_paths_use_shortest_routes(self):
+        """Test that engine warehouse paths follow the route table."""
+        engine = SimulationEngine()
+        start, target = Coordinate(2, 10), Coordinate(7, 19)
+
+        path = engine._calculate_warehouse_path(start, target)
+
+        self.assertEqual(path, engine.route_table.route(start, target))
+        self.assertEqual(engine._calculate_warehouse_path(start, start), [])
+
+        print("✅ Engine route table path test passed")
+
+    def test_distance_tracker_uses_route_distance(self):
+        """Test that optimal path distances respect the boundary-rack rule."""
+        from core.layout.distance_tracker import DistanceTracker
+        tracker = DistanceTracker()
+
+        # Manhattan distance is 6, but crossing aisles requires a boundary rack
+        self.assertEqual(tracker.calculate_optimal_path_distance(Coordinate(3, 10), Coordinate(4, 15)), 16)
+
+        print("✅ Distance tracker route distance test passed")
+
+
+class TestRouteTablePerformance(unittest.TestCase):
+    """Benchmark route table lookups against per-call path building."""
+
+    def test_lookup_speed(self):
+        """Test that distance lookups are much cheaper than building paths."""
+        table = get_route_table(25, 20)
+        engine = SimulationEngine()
+        pairs = [(Coordinate(1 + i % 25, 1 + (i * 7) % 20), Coordinate(1 + (i * 3) % 25, 1 + (i * 11) % 20))
+                 for i in range(2000)]
+
+        start = time.perf_counter()
+        for origin, target in pairs:
+            table.distance(origin, target)
+        lookup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for origin, target in pairs:
+            len(engine._calculate_warehouse_path(origin, target))
+        routed = time.perf_counter() - start
+
+        build_start = time.perf_counter()
+        RouteTable(25, 20)
+        build = time.perf_counter() - build_start
+
+        print(f"📊 Route table: build {build * 1e3:.1f}ms, distance {lookup / len(pairs) * 1e6:.2f}µs, "
+              f"route {routed / len(pairs) * 1e6:.2f}µs per pair")
+        self.assertLess(lookup, routed)
+
+        print("✅ Route table lookup benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
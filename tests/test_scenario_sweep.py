@@ -0,0 +1,196 @@
+"""
+Test suite for parallel scenario sweeps.
+Tests grid expansion, scenario ids, KPI rows from pool workers, resuming from a
+partial results file, failed scenarios, configuration overrides, and sweep time
+against running the scenarios one at a time.
+"""
+
+import csv
+import sys
+import os
+import tempfile
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.determinism import seed_simulation
+from core.main_config import get_config
+from core.sweep import KPI_COLUMNS, ScenarioSweep, expand_grid, run_scenario, scenario_id
+
+
+class TestSweepGrid(unittest.TestCase):
+    """Test grid expansion and scenario identity."""
+
+    def test_expand_grid(self):
+        """Test combinations in grid order, with scalars used as single values."""
+        scenarios = expand_grid({"movement_speed": [1.0, 2.0], "max_items_per_order": [2, 3], "order_limit": 5})
+        self.assertEqual(len(scenarios), 4)
+        self.assertEqual(scenarios[0], {"movement_speed": 1.0, "max_items_per_order": 2, "order_limit": 5})
+        self.assertEqual(scenarios[1]["max_items_per_order"], 3)
+
+        print("✅ Grid expansion test passed")
+
+    def test_scenarios_and_validation(self):
+        """Test ids per replicate, shared replicate seeds, and rejected settings."""
+        with tempfile.TemporaryDirectory() as directory:
+            sweep = ScenarioSweep({"movement_speed": [1.0, 2.0]}, os.path.join(directory, "results.csv"),
+                                  replicates=2, seed=10)
+            scenarios = sweep.scenarios()
+
+        self.assertEqual([scenario["seed"] for scenario in scenarios], [10, 10, 11, 11])
+        self.assertEqual(len({scenario["scenario_id"] for scenario in scenarios}), 4)
+        self.assertEqual(scenarios[0]["scenario_id"], scenario_id({"movement_speed": 1.0}, 0, 10))
+        self.assertEqual(sweep.columns[:5], ["scenario_id", "replicate", "seed", "movement_speed", "status"])
+
+        with self.assertRaises(ValueError):
+            ScenarioSweep({"robot_speed": [1.0]}, "results.csv")
+        with self.assertRaises(ValueError):
+            ScenarioSweep({}, "results.csv")
+        with self.assertRaises(ValueError):
+            ScenarioSweep({"movement_speed": [1.0]}, "results.csv", replicates=0)
+
+        print("✅ Scenario validation test passed")
+
+
+class TestScenarioRun(unittest.TestCase):
+    """Test running single scenarios in-process."""
+
+    def tearDown(self):
+        """Go back to unseeded wall-clock runs."""
+        seed_simulation(None)
+
+    def test_kpis_and_reproducibility(self):
+        """Test KPI values, identical repeats, and parameters that change the outcome."""
+        slow = run_scenario({"movement_speed": 1.0}, seed=3, sim_seconds=300.0)
+        again = run_scenario({"movement_speed": 1.0}, seed=3, sim_seconds=300.0)
+        fast = run_scenario({"aisle_traversal_time": 9.5}, seed=3, sim_seconds=300.0)  # 19 racks: 2.0 units/s
+
+        self.assertEqual(set(slow), set(KPI_COLUMNS))
+        for key in ("orders_completed", "mean_cycle_time", "total_distance", "route_distance",
+                    "rolling_orders_per_hour", "direction_changes"):
+            self.assertEqual(slow[key], again[key])
+        self.assertGreater(slow["orders_completed"], 0)
+        self.assertGreater(slow["total_distance"], 0.0)
+        # The DistanceTracker counts route moves between the waypoints the engine reached
+        self.assertAlmostEqual(slow["route_distance"], slow["total_distance"], delta=0.05 * slow["total_distance"])
+        self.assertGreater(slow["rolling_orders_per_hour"], 0.0)
+        self.assertAlmostEqual(slow["throughput_per_hour"], slow["orders_completed"] * 12.0)
+        self.assertLessEqual(slow["mean_cycle_time"], slow["p95_cycle_time"])
+        self.assertLess(fast["mean_cycle_time"], slow["mean_cycle_time"])
+
+        print("✅ Scenario KPI test passed")
+
+    def test_config_overrides_are_restored(self):
+        """Test that section.key overrides apply to the run and are undone afterwards."""
+        config_manager = get_config()
+        limit = config_manager.get_value("orders", "order_limit", 10)
+        kpis = run_scenario({"orders.order_limit": 2, "generation_interval": 20}, seed=1, sim_seconds=120.0)
+
+        self.assertEqual(kpis["orders_generated"], 2)
+        self.assertEqual(config_manager.get_value("orders", "order_limit", 10), limit)
+
+        with self.assertRaises(ValueError):
+            run_scenario({"min_items_per_order": 3, "max_items_per_order": 2}, seed=1, sim_seconds=10.0)
+
+        print("✅ Configuration override test passed")
+
+
+class TestScenarioSweep(unittest.TestCase):
+    """Test sweeps across a process pool."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.results_path = os.path.join(self.temp_dir.name, "sweeps", "results.csv")
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self.temp_dir.cleanup()
+
+    def read_rows(self):
+        with open(self.results_path, newline="") as results:
+            return list(csv.DictReader(results))
+
+    def test_sweep_writes_rows_and_resumes(self):
+        """Test one row per scenario, progress callbacks, and resuming after a torn row."""
+        grid = {"movement_speed": [1.0, 2.0], "max_items_per_order": [2, 4]}
+        sweep = ScenarioSweep(grid, self.results_path, sim_seconds=120.0, workers=2)
+        progress = []
+        report = sweep.run(progress=lambda done, total, row: progress.append((done, total)))
+
+        rows = self.read_rows()
+        self.assertEqual((report["run"], report["failed"]), (4, 0))
+        self.assertEqual(progress[-1], (4, 4))
+        self.assertEqual({row["status"] for row in rows}, {"ok"})
+        self.assertEqual({row["scenario_id"] for row in rows}, {s["scenario_id"] for s in sweep.scenarios()})
+        self.assertTrue(all(float(row["sim_seconds"]) > 119.9 for row in rows))
+
+        # A crash mid-write leaves a torn last row: that scenario runs again
+        with open(self.results_path) as results:
+            content = results.read()
+        with open(self.results_path, "w") as results:
+            results.write(content[:content.rindex("\n", 0, len(content) - 1) + 1] + rows[-1]["scenario_id"] + ",0")
+        self.assertEqual(len(sweep.completed()), 3)
+
+        report = ScenarioSweep(grid, self.results_path, sim_seconds=120.0, workers=2).run()
+        self.assertEqual((report["skipped"], report["run"]), (3, 1))
+
+        with self.assertRaises(ValueError):
+            ScenarioSweep({"movement_speed": [1.0]}, self.results_path).run()
+
+        print("✅ Sweep resume test passed")
+
+    def test_failed_scenarios_are_retried(self):
+        """Test that a failing scenario is recorded with its error and retried on the next run."""
+        grid = {"min_items_per_order": [1, 3], "max_items_per_order": [2]}
+        report = ScenarioSweep(grid, self.results_path, sim_seconds=30.0, workers=2).run()
+        self.assertEqual(report["failed"], 1)
+        failed = [row for row in self.read_rows() if row["status"] == "error"]
+        self.assertIn("min_items_per_order", failed[0]["error"])
+
+        report = ScenarioSweep(grid, self.results_path, sim_seconds=30.0, workers=2).run()
+        self.assertEqual((report["skipped"], report["run"], report["failed"]), (1, 1, 1))
+
+        print("✅ Failed scenario test passed")
+
+
+class TestSweepBenchmark(unittest.TestCase):
+    """Compare a pooled sweep with running the scenarios one at a time."""
+
+    def tearDown(self):
+        """Go back to unseeded wall-clock runs."""
+        seed_simulation(None)
+
+    def test_sweep_throughput(self):
+        """Report sweep time against a serial loop, and check the pool gives the same KPIs."""
+        grid = {"movement_speed": [0.5, 1.0, 1.5, 2.0], "max_items_per_order": [2, 4]}
+        workers = max(2, min(os.cpu_count() or 1, 4))
+        with tempfile.TemporaryDirectory() as directory:
+            sweep = ScenarioSweep(grid, os.path.join(directory, "results.csv"), sim_seconds=600.0, workers=workers)
+            start = time.perf_counter()
+            serial = {scenario["scenario_id"]: run_scenario(scenario["parameters"], scenario["seed"], 600.0)
+                      for scenario in sweep.scenarios()}
+            serial_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            report = sweep.run()
+            pooled_seconds = time.perf_counter() - start
+            rows = sweep.load_results()
+
+        self.assertEqual(report["failed"], 0)
+        for row in rows:
+            expected = serial[row["scenario_id"]]
+            self.assertEqual(int(row["orders_completed"]), expected["orders_completed"])
+            self.assertAlmostEqual(float(row["total_distance"]), expected["total_distance"])
+
+        print(f"📊 {len(rows)} scenarios x 600 simulated seconds: {serial_seconds:.2f}s one at a time, "
+              f"{pooled_seconds:.2f}s with {workers} workers on {os.cpu_count()} cores")
+        self.assertLess(pooled_seconds, serial_seconds * 3 + 2.0)
+
+        print("✅ Sweep benchmark passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Test suite for the discrete-event scheduler and event-driven engine runs.
+Tests agenda ordering, cancellation, clock advancement and engine integration.
+"""
+
+import asyncio
+import time
+import unittest
+import sys
+import os
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.scheduler import DiscreteEventScheduler, ScheduledEventKind
+from core.engine import SimulationEngine, RobotState
+
+
+class TestDiscreteEventScheduler(unittest.TestCase):
+    """Test DiscreteEventScheduler agenda behavior."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.scheduler = DiscreteEventScheduler()
+        self.fired = []
+    
+    def _record(self, event):
+        self.fired.append((self.scheduler.now, event.data["name"]))
+    
+    def test_events_fire_in_time_order(self):
+        """Test that events fire by time, then by scheduling order."""
+        self.scheduler.schedule(5.0, ScheduledEventKind.CUSTOM, self._record, {"name": "c"})
+        self.scheduler.schedule(1.0, ScheduledEventKind.CUSTOM, self._record, {"name": "a"})
+        self.scheduler.schedule(1.0, ScheduledEventKind.CUSTOM, self._record, {"name": "b"})
+        
+        fired = self.scheduler.run_until(10.0)
+        
+        self.assertEqual(fired, 3)
+        self.assertEqual(self.fired, [(1.0, "a"), (1.0, "b"), (5.0, "c")])
+        self.assertEqual(self.scheduler.now, 10.0)
+        
+        print("✅ Scheduler ordering test passed")
+    
+    def test_run_until_stops_at_end_time(self):
+        """Test that events after end_time stay pending."""
+        self.scheduler.schedule(2.0, ScheduledEventKind.CUSTOM, self._record, {"name": "early"})
+        self.scheduler.schedule(8.0, ScheduledEventKind.CUSTOM, self._record, {"name": "late"})
+        
+        self.scheduler.run_until(5.0)
+        
+        self.assertEqual(self.fired, [(2.0, "early")])
+        self.assertEqual(len(self.scheduler), 1)
+        self.assertEqual(self.scheduler.peek_time(), 8.0)
+        
+        print("✅ Scheduler end time test passed")
+    
+    def test_handlers_can_schedule_follow_up_events(self):
+        """Test chained scheduling from within a handler."""
+        def chain(event):
+            self._record(event)
+            if event.data["name"] < 3:
+                self.scheduler.schedule_in(1.0, ScheduledEventKind.CUSTOM, chain,
+                                           {"name": event.data["name"] + 1})
+        
+        self.scheduler.schedule(0.0, ScheduledEventKind.CUSTOM, chain, {"name": 0})
+        self.scheduler.run_until(100.0)
+        
+        self.assertEqual(self.fired, [(0.0, 0), (1.0, 1), (2.0, 2), (3.0, 3)])
+        
+        print("✅ Scheduler chaining test passed")
+    
+    def test_cancel(self):
+        """Test lazy cancellation."""
+        keep = self.scheduler.schedule(1.0, ScheduledEventKind.CUSTOM, self._record, {"name": "keep"})
+        drop = self.scheduler.schedule(0.5, ScheduledEventKind.CUSTOM, self._record, {"name": "drop"})
+        
+        self.assertTrue(self.scheduler.cancel(drop))
+        self.assertFalse(self.scheduler.cancel(drop))
+        self.assertEqual(len(self.scheduler), 1)
+        self.assertEqual(self.scheduler.peek_time(), 1.0)
+        
+        self.scheduler.run_until(2.0)
+        self.assertEqual(self.fired, [(1.0, "keep")])
+        self.assertFalse(self.scheduler.cancel(keep))
+        
+        print("✅ Scheduler cancellation test passed")
+    
+    def test_schedule_in_past_rejected(self):
+        """Test that events cannot be scheduled before the current time."""
+        self.scheduler.run_until(10.0)
+        with self.assertRaises(ValueError):
+            self.scheduler.schedule(5.0, ScheduledEventKind.CUSTOM, self._record)
+        
+        print("✅ Scheduler past event rejection test passed")
+    
+    def test_on_advance_listener(self):
+        """Test that the clock listener sees every time advance."""
+        seen = []
+        scheduler = DiscreteEventScheduler(on_advance=seen.append)
+        scheduler.schedule(3.0, ScheduledEventKind.CUSTOM, lambda event: None)
+        scheduler.run_until(4.0)
+        
+        self.assertEqual(seen, [3.0, 4.0])
+        
+        print("✅ Scheduler clock listener test passed")
+
+
+class TestEventDrivenEngine(unittest.TestCase):
+    """Test event-driven headless runs of SimulationEngine."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.engine = SimulationEngine()
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        if self.engine.is_running:
+            asyncio.run(self.engine.stop())
+    
+    def test_event_driven_run_processes_orders(self):
+        """Test that an event-driven run generates and completes orders."""
+        report = asyncio.run(self.engine.run_for(1800.0, event_driven=True))
+        
+        self.assertTrue(report["event_driven"])
+        self.assertEqual(report["frames"], 0)
+        self.assertGreater(report["scheduled_events"], 0)
+        self.assertAlmostEqual(self.engine.simulation_time, 1800.0, places=6)
+        self.assertGreaterEqual(report["orders_completed"], 1)
+        
+        stats = self.engine.scheduler.get_statistics()
+        self.assertGreater(stats["events_by_kind"]["waypoint_reached"], 0)
+        self.assertGreater(stats["events_by_kind"]["pick_complete"], 0)
+        
+        print("✅ Event-driven order processing test passed")
+    
+    def test_event_driven_matches_fixed_step(self):
+        """Test that both modes pick the same items for the same order."""
+        fixed_engine = SimulationEngine()
+        items = ["ITEM_C_05", "ITEM_F_12"]
+        for engine in (self.engine, fixed_engine):
+            engine.add_order({"id": "ORDER_FIXED", "items": list(items), "status": "pending",
+                              "created_time": time.time()})
+        
+        event_report = asyncio.run(self.engine.run_for(200.0, event_driven=True))
+        fixed_report = asyncio.run(fixed_engine.run_for(200.0, time_step=0.05))
+        asyncio.run(fixed_engine.stop())
+        
+        self.assertEqual(self.engine.orders[0]["status"], "completed")
+        self.assertEqual(fixed_engine.orders[0]["status"], "completed")
+        self.assertEqual(sorted(self.engine.orders[0]["items_picked"]), sorted(items))
+        self.assertGreater(event_report["sim_seconds_per_wall_second"],
+                           fixed_report["sim_seconds_per_wall_second"])
+        
+        print("✅ Event-driven vs fixed-step consistency test passed")
+    
+    def test_lazy_robot_position(self):
+        """Test lazy interpolation of the robot position between waypoints."""
+        self.engine.add_order({"id": "ORDER_LAZY", "items": ["ITEM_A_10"], "status": "pending",
+                               "created_time": time.time()})
+        asyncio.run(self.engine.run_for(3.5, event_driven=True))
+        
+        robot = self.engine.robot
+        self.assertEqual(robot.state, RobotState.MOVING)
+        position = self.engine.get_robot_position()
+        self.assertEqual(position.aisle, 1.0)
+        self.assertGreater(position.rack, robot.position.rack)
+        self.assertLess(position.rack, robot.movement_target.rack)
+        
+        print("✅ Lazy robot position test passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
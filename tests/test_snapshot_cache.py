@@ -0,0 +1,265 @@
+"""
+Test suite for the tick-scoped snapshot cache.
+Tests that each topic is computed and encoded once per tick, expiry by tick
+and age, content ETags, ETag/If-None-Match on the REST endpoints, and that
+socket fan-out encodes each frame once however many clients are connected.
+"""
+
+import json
+import sys
+import os
+import threading
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from web_interface.server.snapshot_cache import SnapshotCache, encode_json
+from web_interface.server.state_delta import snapshot_topics
+from web_interface.server.websocket_handler import WebSocketHandler
+
+TOPICS = ('simulation_state', 'robot_data', 'order_data', 'kpi_data', 'inventory_data', 'warehouse_data')
+
+
+class CountingDataBridge:
+    """DataBridge stand-in counting getter calls, with a manual engine tick."""
+
+    def __init__(self, orders=200):
+        self.tick = 0
+        self.calls = {topic: 0 for topic in TOPICS}
+        self.orders = [{'id': f'ORD_{index:04d}', 'items': ['ITEM_A1'], 'status': 'pending'} for index in range(orders)]
+        self.snapshot_cache = SnapshotCache({topic: self._producer(topic) for topic in TOPICS},
+                                            tick_source=lambda: self.tick, max_age=60.0)
+
+    def _producer(self, topic):
+        def produce():
+            self.calls[topic] += 1
+            return getattr(self, f'get_{topic}')()
+        return produce
+
+    def get_simulation_state(self):
+        return {'status': 'running', 'time': float(self.tick), 'speed': 1.0}
+
+    def get_robot_data(self):
+        return [{'id': 'ROBOT_001', 'position': f'B{self.tick % 20 + 1}', 'state': 'MOVING'}]
+
+    def get_order_data(self):
+        return {'pending': len(self.orders), 'in_progress': 0, 'completed': 0, 'total': len(self.orders),
+                'orders': self.orders, 'completed_orders': []}
+
+    def get_kpi_data(self):
+        return {'queue_length': len(self.orders)}
+
+    def get_inventory_data(self):
+        return {'inventory': {}, 'total_items': 0}
+
+    def get_warehouse_data(self):
+        return {'grid_size': {'width': 25, 'height': 20}}
+
+    def get_snapshot(self, topic):
+        return self.snapshot_cache.get(topic)
+
+    def get_state_topics(self):
+        cache = self.snapshot_cache
+        return snapshot_topics(cache.data('simulation_state'), cache.data('robot_data'), cache.data('order_data'),
+                               cache.data('kpi_data'), cache.data('inventory_data'))
+
+
+class RecordingSocket:
+    """Socket keeping the last message sent."""
+
+    def __init__(self):
+        self.sent = 0
+        self.last = None
+
+    def send(self, message):
+        self.sent += 1
+        self.last = message
+
+
+class TestSnapshotCache(unittest.TestCase):
+    """Test per-tick caching."""
+
+    def setUp(self):
+        self.bridge = CountingDataBridge()
+        self.cache = self.bridge.snapshot_cache
+
+    def test_computed_once_per_tick(self):
+        """Test that repeated reads in a tick share one snapshot."""
+        first = self.cache.get('robot_data')
+        self.assertIs(self.cache.get('robot_data'), first)
+        self.assertEqual(self.bridge.calls['robot_data'], 1)
+        self.assertEqual(json.loads(first.body), first.data)
+
+        self.bridge.tick += 1
+        second = self.cache.get('robot_data')
+        self.assertIsNot(second, first)
+        self.assertEqual(self.bridge.calls['robot_data'], 2)
+        self.assertEqual(self.cache.stats['hits'], 1)
+
+        print("✅ Computed once per tick test passed")
+
+    def test_etag_follows_content(self):
+        """Test that the ETag only changes when the encoded content does."""
+        kpis = self.cache.get('kpi_data')
+        self.bridge.tick += 1
+        self.assertEqual(self.cache.get('kpi_data').etag, kpis.etag)
+        self.assertNotEqual(self.cache.get('robot_data').etag, kpis.etag)
+
+        print("✅ Content ETag test passed")
+
+    def test_max_age_and_invalidate(self):
+        """Test expiry by age within a tick and explicit invalidation."""
+        cache = SnapshotCache({'clock': time.monotonic}, max_age=0.0)
+        first = cache.get('clock')
+        time.sleep(0.001)
+        self.assertIsNot(cache.get('clock'), first)
+
+        self.cache.get('kpi_data')
+        self.cache.invalidate()
+        self.cache.get('kpi_data')
+        self.assertEqual(self.bridge.calls['kpi_data'], 2)
+
+        with self.assertRaises(ValueError):
+            SnapshotCache({}, max_age=-1)
+        with self.assertRaises(KeyError):
+            self.cache.get('unknown')
+
+        print("✅ Max age and invalidation test passed")
+
+    def test_concurrent_readers_compute_once(self):
+        """Test that simultaneous readers of a stale topic wait for one computation."""
+        def slow_orders():
+            time.sleep(0.05)
+            return self.bridge.get_order_data()
+
+        cache = SnapshotCache({'order_data': slow_orders}, max_age=60.0)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get('order_data'))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(cache.stats['misses'], 1)
+        self.assertEqual(len({id(snapshot) for snapshot in results}), 1)
+
+        print("✅ Concurrent readers test passed")
+
+    def test_non_json_values_are_encoded(self):
+        """Test that values json cannot encode natively become strings."""
+        self.assertEqual(encode_json({'total': 3, 'ids': ['A1']}), b'{"total":3,"ids":["A1"]}')
+        self.assertEqual(json.loads(encode_json({'id': object})), {'id': str(object)})
+
+        print("✅ Non-JSON value encoding test passed")
+
+
+class TestSocketFanOut(unittest.TestCase):
+    """Test that broadcasting cost does not grow with encoding per client."""
+
+    def make_handler(self, clients):
+        bridge = CountingDataBridge(orders=1000)
+        handler = WebSocketHandler(bridge)
+        sockets = [RecordingSocket() for _ in range(clients)]
+        for index, socket in enumerate(sockets):
+            handler.register_client(f'client-{index}', socket)
+        return bridge, handler, sockets
+
+    def test_frame_encoded_once_for_all_clients(self):
+        """Test that clients at the same base receive the same encoded message."""
+        bridge, handler, sockets = self.make_handler(clients=20)
+        encoded = []
+        encode_message = handler.encode_message
+        handler.encode_message = lambda *args: encoded.append(args[0]) or encode_message(*args)
+
+        handler.broadcast_updates()
+        self.assertTrue(handler.flush())
+        self.assertEqual(encoded, ['state_delta'])
+        self.assertEqual(len({socket.last for socket in sockets}), 1)
+        self.assertEqual(bridge.calls['order_data'], 1)  # Initial data and the broadcast share it
+
+        print("✅ Encode-once fan-out test passed")
+
+    def test_initial_data_reuses_snapshot_bodies(self):
+        """Test that connecting clients get the cached bodies without re-encoding them."""
+        bridge, handler, sockets = self.make_handler(clients=1)
+        encoded = []
+        handler.encode_message = lambda *args: encoded.append(args[0])
+        received = []
+        socket = RecordingSocket()
+        socket.send = lambda message: received.append(json.loads(message))
+        for index in range(1, 4):
+            handler.register_client(f'client-{index}', socket)
+        self.assertTrue(handler.flush())
+
+        self.assertEqual(encoded, [])
+        self.assertEqual(len(received), 3 * len(TOPICS))
+        self.assertEqual({message['type'] for message in received}, set(TOPICS))
+        orders = [message for message in received if message['type'] == 'order_data']
+        self.assertEqual(orders[0]['data'], json.loads(bridge.get_snapshot('order_data').body))
+        self.assertIsInstance(orders[0]['timestamp'], float)
+        self.assertEqual(bridge.calls['order_data'], 1)
+
+        print("✅ Initial data snapshot reuse test passed")
+
+    def test_broadcast_cost_with_many_clients(self):
+        """Benchmark a broadcast tick with 1 and 100 connected clients."""
+        timings = {}
+        for clients in (1, 100):
+            bridge, handler, sockets = self.make_handler(clients)
+            handler.broadcast_updates()
+            for index in range(clients):
+                handler.handle_client_message(f'client-{index}', {
+                    'type': 'state_ack', 'data': {'version': handler.state_stream.version}})
+
+            ticks = 20
+            start = time.perf_counter()
+            for _ in range(ticks):
+                bridge.tick += 1
+                handler.broadcast_updates()
+                for index in range(clients):
+                    handler.handle_client_message(f'client-{index}', {
+                        'type': 'state_ack', 'data': {'version': handler.state_stream.version}})
+            timings[clients] = (time.perf_counter() - start) * 1000 / ticks
+            self.assertEqual(bridge.calls['order_data'], ticks + 1)
+
+        print(f"📊 Broadcast tick: {timings[1]:.2f}ms with 1 client, {timings[100]:.2f}ms with 100 clients")
+        print("✅ Broadcast cost benchmark passed")
+
+
+class TestRestETags(unittest.TestCase):
+    """Test conditional REST responses from the snapshot cache."""
+
+    def setUp(self):
+        from web_interface.server.web_server import WebServer
+        self.server = WebServer()
+        self.server.data_bridge = CountingDataBridge()
+        self.client = self.server.app.test_client()
+
+    def test_if_none_match_returns_304(self):
+        """Test ETag headers, 304 revalidation and shared computation."""
+        response = self.client.get('/api/robots')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), self.server.data_bridge.get_robot_data())
+        etag = response.headers['ETag']
+
+        cached = self.client.get('/api/robots', headers={'If-None-Match': etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.data, b'')
+
+        self.server.data_bridge.tick += 1
+        changed = self.client.get('/api/robots', headers={'If-None-Match': etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers['ETag'], etag)
+
+        for path in ('/api/orders', '/api/kpis', '/api/status', '/api/warehouse'):
+            self.assertEqual(self.client.get(path).status_code, 200)
+            self.assertIn('ETag', self.client.get(path).headers)
+        self.assertEqual(self.server.data_bridge.calls['order_data'], 1)
+
+        print("✅ REST ETag test passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
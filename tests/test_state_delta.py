@@ -0,0 +1,327 @@
+"""
+Test suite for delta-encoded state streaming.
+Tests topic diffs, per-client deltas against the last acknowledged version,
+keyframes (new clients, resync, lagging clients, periodic), the
+WebSocketHandler wiring, and that frame size follows the change volume
+rather than the total state size.
+"""
+
+import json
+import random
+import sys
+import os
+import time
+import unittest
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from web_interface.server.snapshot_cache import SnapshotCache
+from web_interface.server.state_delta import StateDeltaEncoder, diff_topic, snapshot_topics
+from web_interface.server.websocket_handler import WebSocketHandler
+
+
+def apply_frame(client_state, frame):
+    """Apply a frame the way main.js does; returns the new client state."""
+    if not frame['keyframe']:
+        assert client_state['version'] is not None and client_state['version'] >= frame['base']
+    topics = {} if frame['keyframe'] else {topic: dict(values) for topic, values in client_state['topics'].items()}
+    for topic, change in frame['topics'].items():
+        values = topics.setdefault(topic, {})
+        for key in change['del']:
+            values.pop(key, None)
+        values.update(change['set'])
+    return {'version': frame['version'], 'topics': topics}
+
+
+def make_topics(robot_rack=1, orders=10, items=50, completed=0):
+    """Warehouse state shaped like the DataBridge getters."""
+    order_list = [{'id': f'ORD_{index:04d}', 'items': [f'ITEM_{index}'],
+                   'status': 'completed' if index < completed else 'pending'} for index in range(orders)]
+    return snapshot_topics(
+        {'status': 'running', 'time': float(robot_rack), 'speed': 1.0},
+        [{'id': 'ROBOT_001', 'position': f'B{robot_rack}', 'state': 'MOVING'}],
+        {'pending': orders - completed, 'in_progress': 0, 'completed': completed, 'total': orders,
+         'orders': order_list, 'completed_orders': order_list[:completed]},
+        {'orders_per_hour': float(completed), 'queue_length': orders - completed},
+        {'inventory': {f'ITEM_{index}': {'item_id': f'ITEM_{index}', 'quantity': 10} for index in range(items)},
+         'total_items': items})
+
+
+class TestStateDeltaEncoder(unittest.TestCase):
+    """Test versioning, deltas and keyframes."""
+
+    def setUp(self):
+        self.encoder = StateDeltaEncoder(keyframe_interval=50)
+
+    def test_diff_topic(self):
+        """Test changed, added and removed entries."""
+        self.assertIsNone(diff_topic({'a': 1}, {'a': 1}))
+        self.assertEqual(diff_topic({'a': 1, 'b': 2}, {'a': 3, 'c': 4}), {'set': {'a': 3, 'c': 4}, 'del': ['b']})
+
+        print("✅ Topic diff test passed")
+
+    def test_first_frame_is_keyframe_then_deltas(self):
+        """Test that a new client gets a keyframe, then only what changed."""
+        self.encoder.commit(make_topics())
+        keyframe = self.encoder.frame_for('client')
+        self.assertTrue(keyframe['keyframe'])
+        self.assertEqual(len(keyframe['topics']['inventory']['set']), 50)
+
+        self.encoder.acknowledge('client', keyframe['version'])
+        self.encoder.commit(make_topics(robot_rack=2))
+        delta = self.encoder.frame_for('client')
+        self.assertFalse(delta['keyframe'])
+        self.assertEqual(delta['base'], keyframe['version'])
+        self.assertEqual(set(delta['topics']), {'simulation', 'robots'})
+        self.assertEqual(delta['topics']['robots']['set']['ROBOT_001']['position'], 'B2')
+
+        print("✅ Keyframe then delta test passed")
+
+    def test_unchanged_state_sends_nothing(self):
+        """Test that idle ticks keep the version and send no frame."""
+        version = self.encoder.commit(make_topics())
+        self.encoder.acknowledge('client', self.encoder.frame_for('client')['version'])
+
+        self.assertEqual(self.encoder.commit(make_topics()), version)
+        self.assertIsNone(self.encoder.frame_for('client'))
+
+        print("✅ Unchanged state test passed")
+
+    def test_delta_against_last_acknowledged_version(self):
+        """Test that an unacknowledged client gets changes merged since its ack."""
+        self.encoder.commit(make_topics(orders=10))
+        self.encoder.acknowledge('client', self.encoder.frame_for('client')['version'])
+        acked = self.encoder.version
+
+        self.encoder.commit(make_topics(orders=11))
+        self.encoder.frame_for('client')  # Sent but never acknowledged
+        self.encoder.commit(make_topics(orders=12, completed=1))
+        delta = self.encoder.frame_for('client')
+
+        self.assertEqual(delta['base'], acked)
+        self.assertEqual(set(delta['topics']['orders']['set']), {'ORD_0000', 'ORD_0010', 'ORD_0011'})
+        self.assertEqual(delta['topics']['order_summary']['set'],
+                         {'pending': 11, 'completed': 1, 'total': 12})
+
+        print("✅ Delta against acknowledged version test passed")
+
+    def test_removed_then_readded_entries(self):
+        """Test merging a delete followed by a set of the same key."""
+        self.encoder.commit(make_topics(items=3))
+        self.encoder.acknowledge('client', self.encoder.frame_for('client')['version'])
+        self.encoder.commit(make_topics(items=2))
+        self.encoder.commit(make_topics(items=1))
+        self.encoder.commit(make_topics(items=2))
+
+        inventory = self.encoder.frame_for('client')['topics']['inventory']
+        self.assertEqual(set(inventory['set']), {'ITEM_1'})
+        self.assertEqual(inventory['del'], ['ITEM_2'])
+
+        print("✅ Removed and re-added entries test passed")
+
+    def test_resync_and_lagging_clients_get_keyframes(self):
+        """Test keyframes on request and when history no longer covers the client."""
+        encoder = StateDeltaEncoder(keyframe_interval=100, history=3)
+        encoder.commit(make_topics())
+        encoder.acknowledge('client', encoder.frame_for('client')['version'])
+
+        encoder.commit(make_topics(robot_rack=2))
+        encoder.request_keyframe('client')
+        self.assertTrue(encoder.frame_for('client')['keyframe'])
+        encoder.acknowledge('client', encoder.version)
+
+        for rack in range(3, 8):
+            encoder.commit(make_topics(robot_rack=rack))
+        self.assertTrue(encoder.frame_for('client')['keyframe'])
+        self.assertEqual(encoder.stats['resyncs'], 1)
+
+        print("✅ Resync and lagging client test passed")
+
+    def test_periodic_keyframes(self):
+        """Test that a client gets a keyframe every keyframe_interval versions."""
+        encoder = StateDeltaEncoder(keyframe_interval=5)
+        keyframes = []
+        for rack in range(1, 13):
+            encoder.commit(make_topics(robot_rack=rack))
+            frame = encoder.frame_for('client')
+            encoder.acknowledge('client', frame['version'])
+            if frame['keyframe']:
+                keyframes.append(frame['version'])
+
+        self.assertEqual(keyframes, [1, 6, 11])
+
+        print("✅ Periodic keyframe test passed")
+
+    def test_clients_rebuild_state_despite_lost_acks(self):
+        """Test that applied frames always rebuild the server state exactly."""
+        rng = random.Random(7)
+        clients = {name: {'version': None, 'topics': {}} for name in ('fast', 'lossy', 'late')}
+        for step in range(200):
+            self.encoder.commit(make_topics(robot_rack=rng.randint(1, 20), orders=10 + step // 4,
+                                            items=rng.randint(40, 50), completed=step // 8))
+            for name, client_state in clients.items():
+                frame = self.encoder.frame_for(name)
+                if frame is None:
+                    continue
+                clients[name] = client_state = apply_frame(client_state, frame)
+                if name == 'fast' or (name == 'lossy' and rng.random() < 0.3) or (name == 'late' and step % 7 == 0):
+                    self.encoder.acknowledge(name, client_state['version'])
+
+        for client_state in clients.values():
+            self.assertEqual(client_state['version'], self.encoder.version)
+            self.assertEqual(client_state['topics'], self.encoder._state)
+
+        print("✅ Client state reconstruction test passed")
+
+    def test_frames_shared_by_base(self):
+        """Test that clients at the same base share one frame per version."""
+        self.encoder.commit(make_topics())
+        for name in ('a', 'b'):
+            self.encoder.acknowledge(name, self.encoder.frame_for(name)['version'])
+        self.encoder.commit(make_topics(robot_rack=2))
+
+        self.assertIs(self.encoder.frame_for('a'), self.encoder.frame_for('b'))
+
+        print("✅ Shared frame test passed")
+
+    def test_invalid_settings(self):
+        """Test that nonsensical settings are rejected."""
+        with self.assertRaises(ValueError):
+            StateDeltaEncoder(keyframe_interval=0)
+        with self.assertRaises(ValueError):
+            StateDeltaEncoder(history=0)
+
+        print("✅ Invalid settings test passed")
+
+    def test_bandwidth_follows_change_volume(self):
+        """Benchmark full-snapshot JSON against delta frames for one moving robot."""
+        ticks = 100
+        full_bytes = delta_bytes = 0
+        full_seconds = delta_seconds = 0.0
+        self.encoder.commit(make_topics(orders=1000, items=500))
+        self.encoder.acknowledge('client', self.encoder.frame_for('client')['version'])
+
+        for tick in range(ticks):
+            topics = make_topics(robot_rack=tick % 20 + 2, orders=1000, items=500, completed=tick // 10)
+
+            start = time.perf_counter()
+            full_bytes += len(json.dumps(topics))
+            full_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            self.encoder.commit(topics)
+            frame = self.encoder.frame_for('client')
+            delta_bytes += len(json.dumps(frame))
+            delta_seconds += time.perf_counter() - start
+            self.encoder.acknowledge('client', frame['version'])
+
+        self.assertLess(delta_bytes * 20, full_bytes)
+        print(f"📊 {ticks} ticks: full snapshots {full_bytes / ticks:.0f} B/tick ({full_seconds * 1000 / ticks:.2f}ms), "
+              f"deltas {delta_bytes / ticks:.0f} B/tick ({delta_seconds * 1000 / ticks:.2f}ms)")
+        print("✅ Delta bandwidth benchmark passed")
+
+
+class FakeSocket:
+    """Socket recording sent messages."""
+
+    def __init__(self):
+        self.messages = []
+
+    def send(self, message):
+        self.messages.append(json.loads(message))
+
+
+class FakeDataBridge:
+    """DataBridge stand-in returning fixed getter results."""
+
+    def __init__(self):
+        self.robot_rack = 1
+        self.snapshot_cache = SnapshotCache({topic: getattr(self, f'get_{topic}') for topic in (
+            'simulation_state', 'robot_data', 'order_data', 'kpi_data', 'inventory_data', 'warehouse_data')},
+            tick_source=lambda: self.robot_rack)
+
+    def get_simulation_state(self):
+        return {'status': 'running', 'time': float(self.robot_rack), 'speed': 1.0}
+
+    def get_robot_data(self):
+        return [{'id': 'ROBOT_001', 'position': f'B{self.robot_rack}', 'state': 'MOVING'}]
+
+    def get_order_data(self):
+        return {'pending': 0, 'in_progress': 0, 'completed': 0, 'total': 0, 'orders': [], 'completed_orders': []}
+
+    def get_kpi_data(self):
+        return {'queue_length': 0}
+
+    def get_inventory_data(self):
+        return {'inventory': {'ITEM_A1': {'quantity': 5}}, 'total_items': 1}
+
+    def get_warehouse_data(self):
+        return {'grid_size': {'width': 25, 'height': 20}}
+
+    def get_snapshot(self, topic):
+        return self.snapshot_cache.get(topic)
+
+    def get_state_topics(self):
+        return snapshot_topics(self.get_simulation_state(), self.get_robot_data(), self.get_order_data(),
+                               self.get_kpi_data(), self.get_inventory_data())
+
+
+class TestWebSocketHandlerDeltas(unittest.TestCase):
+    """Test delta streaming through WebSocketHandler."""
+
+    def setUp(self):
+        self.bridge = FakeDataBridge()
+        self.handler = WebSocketHandler(self.bridge)
+        self.socket = FakeSocket()
+        self.handler.register_client('client', self.socket)
+        self.assertTrue(self.handler.flush())
+        self.socket.messages.clear()
+
+    def broadcast(self):
+        """Broadcast and wait for the client's outbox to send it."""
+        self.handler.broadcast_updates()
+        self.assertTrue(self.handler.flush())
+
+    def state_frames(self):
+        return [message['data'] for message in self.socket.messages if message['type'] == 'state_delta']
+
+    def test_broadcast_sends_keyframe_then_deltas(self):
+        """Test keyframe, acknowledgement, delta and resync messages."""
+        self.broadcast()
+        (keyframe,) = self.state_frames()
+        self.assertTrue(keyframe['keyframe'])
+
+        self.handler.handle_client_message('client', {'type': 'state_ack', 'data': {'version': keyframe['version']}})
+        self.broadcast()
+        self.assertEqual(len(self.state_frames()), 1)  # Nothing changed
+
+        self.bridge.robot_rack = 2
+        self.broadcast()
+        delta = self.state_frames()[-1]
+        self.assertFalse(delta['keyframe'])
+        self.assertEqual(set(delta['topics']), {'simulation', 'robots'})
+
+        self.handler.handle_client_message('client', {'type': 'state_resync', 'data': {}})
+        self.bridge.robot_rack = 3
+        self.broadcast()
+        self.assertTrue(self.state_frames()[-1]['keyframe'])
+        self.assertEqual(self.handler.get_status()['state_stream']['resyncs'], 1)
+
+        print("✅ WebSocketHandler delta streaming test passed")
+
+    def test_unregister_forgets_client(self):
+        """Test that a reconnecting client starts from a keyframe."""
+        self.broadcast()
+        self.handler.handle_client_message('client', {'type': 'state_ack', 'data': {'version': 1}})
+        self.handler.unregister_client('client')
+        self.handler.register_client('client', self.socket)
+
+        self.broadcast()
+        self.assertTrue(self.state_frames()[-1]['keyframe'])
+
+        print("✅ Client unregister test passed")
+
+
+if __name__ == '__main__':
+    unittest.main()
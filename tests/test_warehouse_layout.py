@@ -5,8 +5,9 @@ Tests singleton pattern, grid management, coordinate validation, and state manag
 """
 
 import unittest
+import numpy as np
 from core.layout.warehouse_layout import (
-    WarehouseLayoutManager, GridState, warehouse_layout
+    WarehouseLayout, WarehouseLayoutManager, GridState, warehouse_layout
 )
 from core.layout.coordinate import Coordinate, CoordinateError
 
@@ -275,5 +276,94 @@ class TestWarehouseLayoutManager(unittest.TestCase):
         self.assertEqual(stats['empty_positions'], 498)  # 500 - 2 (packout + coord2)
 
 
+class TestWarehouseLayout(unittest.TestCase):
+    """Test cases for independent, array-backed WarehouseLayout instances."""
+    
+    def test_layouts_are_independent(self):
+        """Test that each layout has its own grid state."""
+        first = WarehouseLayout()
+        second = WarehouseLayout()
+        
+        self.assertIsNot(first, second)
+        self.assertIsNot(first, warehouse_layout)
+        first.set_grid_state(Coordinate(5, 5), GridState.OCCUPIED)
+        
+        self.assertTrue(first.is_position_occupied(Coordinate(5, 5)))
+        self.assertFalse(second.is_position_occupied(Coordinate(5, 5)))
+        self.assertEqual(repr(first), "WarehouseLayout(dimensions=(25, 20))")
+    
+    def test_custom_dimensions(self):
+        """Test smaller layouts and dimension validation."""
+        layout = WarehouseLayout(6, 7)
+        
+        self.assertEqual(layout.get_grid_dimensions(), (6, 7))
+        self.assertEqual(layout.cells.shape, (42,))
+        self.assertEqual(layout.cells.dtype, np.uint8)
+        self.assertEqual(len(layout.get_available_positions()), 41)
+        self.assertFalse(layout.is_valid_coordinate(Coordinate(7, 1)))
+        self.assertFalse(layout.is_position_occupied(Coordinate(7, 1)))
+        with self.assertRaises(CoordinateError):
+            layout.set_grid_state(Coordinate(6, 8), GridState.OCCUPIED)
+        with self.assertRaises(ValueError):
+            WarehouseLayout(26, 20)
+    
+    def test_cell_ids_match_route_table(self):
+        """Test that cells are numbered like RouteTable cells."""
+        layout = WarehouseLayout(6, 7)
+        table = layout.get_route_table()
+        
+        for cell_id in range(6 * 7):
+            coord = layout.coordinate(cell_id)
+            self.assertEqual(layout.cell_id(coord), cell_id)
+            self.assertEqual(table.cell_id(coord), cell_id)
+    
+    def test_bulk_updates_and_queries(self):
+        """Test bulk state updates, counts and the dictionary views."""
+        layout = WarehouseLayout()
+        coords = [Coordinate(aisle, 10) for aisle in range(1, 26)]
+        
+        self.assertEqual(layout.set_grid_states(coords, GridState.OCCUPIED), 25)
+        layout.set_grid_state(Coordinate(3, 3), GridState.RESERVED)
+        
+        counts = layout.get_state_counts()
+        self.assertEqual(counts[GridState.OCCUPIED], 25)
+        self.assertEqual(counts[GridState.RESERVED], 1)
+        self.assertEqual(counts[GridState.PACKOUT], 1)
+        self.assertEqual(layout.get_grid_statistics()['occupied_positions'], 26)
+        self.assertEqual(len(layout.get_available_positions()), 500 - 27)
+        self.assertEqual(layout.get_occupied_positions()[:2], [Coordinate(1, 1), Coordinate(1, 10)])
+        self.assertEqual(layout.grid_state[Coordinate(3, 3)], GridState.RESERVED)
+        self.assertEqual(layout.occupied_positions, set(layout.get_occupied_positions()))
+        
+        # An invalid coordinate rejects the whole update
+        with self.assertRaises(CoordinateError):
+            layout.set_grid_states([Coordinate(4, 4), _Cell(0, 1)], GridState.OCCUPIED)
+        self.assertEqual(layout.get_grid_state(Coordinate(4, 4)), GridState.EMPTY)
+    
+    def test_snapshot_round_trip(self):
+        """Test that snapshots move state between layouts and bad ones change nothing."""
+        source = WarehouseLayout()
+        source.set_grid_states([Coordinate(2, 4), Coordinate(9, 9)], GridState.OCCUPIED)
+        source.set_grid_state(Coordinate(12, 1), GridState.RESERVED)
+        snapshot = source.get_grid_snapshot()
+        
+        target = WarehouseLayout()
+        self.assertTrue(target.load_grid_snapshot(snapshot))
+        np.testing.assert_array_equal(target.cells, source.cells)
+        self.assertEqual(len(snapshot['occupied_positions']), 3)
+        
+        bad = {'dimensions': snapshot['dimensions'], 'grid_state': {'5,5': 'occupied', '30,1': 'empty'}}
+        self.assertFalse(target.load_grid_snapshot(bad))
+        np.testing.assert_array_equal(target.cells, source.cells)
+
+
+class _Cell:
+    """Coordinate-like object that bypasses Coordinate validation."""
+    
+    def __init__(self, aisle, rack):
+        self.aisle = aisle
+        self.rack = rack
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -5,12 +5,16 @@ This package contains utility functions and helpers:
 - Timing utilities for smooth animations
 - Math utilities for calculations
 - Helper functions for common operations
+- Level-gated, rate-limited logging helpers
 """
 
 from .timing import TimingManager, fps_to_interval, smooth_lerp
+from .logging_utils import ThrottledLogger, configure_logging
 
 __all__ = [
     'TimingManager',
     'fps_to_interval', 
-    'smooth_lerp'
+    'smooth_lerp',
+    'ThrottledLogger',
+    'configure_logging'
 ] 
\ No newline at end of file
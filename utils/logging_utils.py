@@ -0,0 +1,161 @@
+"""
+Logging utilities for level-gated, low-overhead simulation diagnostics.
+
+This module provides helpers that keep diagnostic logging out of the frame
+budget:
+- ThrottledLogger: per-call-site sampling and rate limiting for hot loops
+- configure_logging: per-module log levels driven by config/simulation.json
+
+All helpers check the logger level before doing any work, so a disabled
+debug call costs a single method call and a level comparison. Messages use
+lazy %-style arguments and are only formatted if a record is emitted.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+# Modules whose diagnostics are controlled by engine.debug_prints
+SIMULATION_LOGGERS = (
+    "core.engine",
+    "core.events",
+    "web_interface.server.data_bridge",
+    "entities.order_analytics",
+    "entities.order_generator",
+    "entities.order_management_integration",
+    "entities.order_queue_manager",
+    "entities.order_status_tracker",
+)
+
+
+class ThrottledLogger:
+    """
+    Wraps a logger with per-key sampling and rate limiting.
+
+    Keys identify a call site (e.g. "robot_update"), so one noisy message
+    cannot suppress an unrelated one.
+    """
+
+    def __init__(self, logger: logging.Logger, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize throttled logger.
+
+        Args:
+            logger: Underlying logger
+            clock: Time source used for rate limiting
+        """
+        self.logger = logger
+        self.clock = clock
+        self._counts: Dict[str, int] = {}
+        self._last_emit: Dict[str, float] = {}
+        self._suppressed: Dict[str, int] = {}
+
+    def sampled(self, level: int, key: str, every_n: int, msg: str, *args: Any) -> None:
+        """
+        Log the first and then every n-th call for a key.
+
+        Args:
+            level: Logging level
+            key: Call-site key
+            every_n: Sampling period in calls
+            msg: %-style message
+            *args: Message arguments (formatted lazily)
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        if every_n <= 1 or count % every_n == 0:
+            self.logger.log(level, msg, *args)
+
+    def throttled(self, level: int, key: str, interval: float, msg: str, *args: Any) -> None:
+        """
+        Log at most once per interval for a key, reporting suppressed calls.
+
+        Args:
+            level: Logging level
+            key: Call-site key
+            interval: Minimum seconds between records
+            msg: %-style message
+            *args: Message arguments (formatted lazily)
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+
+        now = self.clock()
+        last = self._last_emit.get(key)
+        if last is not None and 0 <= now - last < interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return
+
+        self._last_emit[key] = now
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            self.logger.log(level, msg + " (%d similar suppressed)", *args, suppressed)
+        else:
+            self.logger.log(level, msg, *args)
+
+    def debug_sampled(self, key: str, every_n: int, msg: str, *args: Any) -> None:
+        """Sampled DEBUG record."""
+        # Checked here too so a disabled call does not repack its arguments
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.sampled(logging.DEBUG, key, every_n, msg, *args)
+
+    def debug_throttled(self, key: str, interval: float, msg: str, *args: Any) -> None:
+        """Rate-limited DEBUG record."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.throttled(logging.DEBUG, key, interval, msg, *args)
+
+    def reset(self) -> None:
+        """Forget all sampling and rate-limiting state."""
+        self._counts.clear()
+        self._last_emit.clear()
+        self._suppressed.clear()
+
+
+def _parse_level(level: Any, default: int) -> int:
+    """Convert a level name or number to a logging level."""
+    if isinstance(level, int):
+        return level
+    if isinstance(level, str):
+        value = logging.getLevelName(level.upper())
+        if isinstance(value, int):
+            return value
+    return default
+
+
+def configure_logging(config_manager: Optional[Any] = None) -> Dict[str, int]:
+    """
+    Apply per-module log levels from configuration.
+
+    engine.debug_prints selects DEBUG (True) or INFO (False) for the simulation
+    loggers. An optional "logging" section can override individual modules:
+
+        "logging": {"modules": {"core.engine": "WARNING"}}
+
+    Args:
+        config_manager: Configuration manager (default: global instance)
+
+    Returns:
+        Mapping of logger name to applied level
+    """
+    if config_manager is None:
+        from core.main_config import get_config
+        config_manager = get_config()
+
+    debug_prints = config_manager.get_value("engine", "debug_prints", True)
+    base_level = logging.DEBUG if debug_prints else logging.INFO
+
+    logging_section = config_manager.get_section("logging") or {}
+    base_level = _parse_level(logging_section.get("level"), base_level)
+
+    levels = {name: base_level for name in SIMULATION_LOGGERS}
+    for name, level in (logging_section.get("modules") or {}).items():
+        levels[name] = _parse_level(level, base_level)
+
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+    return levels
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Change-driven push for Roibot Warehouse Visualization Interface
+Replaces fixed-interval polling: producers mark topics as changed and one
+worker thread pushes each changed topic at most max_rate times per second,
+coalescing the changes that arrive in between. While nothing changes the
+worker sleeps without a timeout, so an idle simulation costs no CPU, and the
+delay from a change to its push is bounded by the topic's interval plus the
+push itself (and recorded per topic).
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class ChangePusher:
+    """Rate-limited, coalescing push of changed topics to one callback."""
+
+    def __init__(self, push: Callable[[Set[str]], None], max_rates: Optional[Dict[str, float]] = None,
+                 default_rate: float = 10.0):
+        """
+        Initialize change pusher.
+
+        Args:
+            push: Called on the worker thread with the set of topics due
+            max_rates: Topic -> maximum pushes per second
+            default_rate: Maximum pushes per second for other topics
+
+        Raises:
+            ValueError: If a rate is not positive
+        """
+        self.push = push
+        self._intervals: Dict[str, float] = {}
+        self._default_interval = self._interval(default_rate)
+        for topic, rate in (max_rates or {}).items():
+            self.set_max_rate(topic, rate)
+
+        self._condition = threading.Condition()
+        self._dirty: Dict[str, float] = {}  # Topic -> time.monotonic() of its first unpushed change
+        self._last_push: Dict[str, float] = {}
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def _interval(rate: float) -> float:
+        if rate <= 0:
+            raise ValueError(f"Push rate must be positive, got {rate}")
+        return 1.0 / rate
+
+    def set_max_rate(self, topic: str, rate: float) -> None:
+        """Set a topic's maximum pushes per second."""
+        self._intervals[topic] = self._interval(rate)
+
+    @property
+    def is_running(self) -> bool:
+        """True while the worker thread runs."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def notify(self, topic: str, since: Optional[float] = None) -> None:
+        """
+        Mark a topic as changed (any thread).
+
+        Args:
+            topic: Changed topic
+            since: time.monotonic() of the change (default: now)
+        """
+        with self._condition:
+            stats = self._topic_stats(topic)
+            stats['notifications'] += 1
+            if topic not in self._dirty:
+                self._dirty[topic] = since if since is not None else time.monotonic()
+                self._condition.notify()
+
+    def start(self) -> bool:
+        """Start the worker thread; returns False if it was already running."""
+        if self.is_running:
+            return False
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="ChangePusher", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the worker thread (pending changes are dropped)."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get push statistics.
+
+        Returns:
+            Dictionary with running status, pending topics and per-topic
+            notification and push counts, maximum rate and push latency
+        """
+        with self._condition:
+            topics = {}
+            for topic, stats in self._stats.items():
+                pushes = stats['pushes']
+                topics[topic] = {
+                    'notifications': int(stats['notifications']),
+                    'pushes': int(pushes),
+                    'max_rate': 1.0 / self._intervals.get(topic, self._default_interval),
+                    'avg_latency_ms': stats['latency_total'] / pushes * 1000 if pushes else 0.0,
+                    'max_latency_ms': stats['latency_max'] * 1000
+                }
+            return {'is_running': self.is_running, 'pending': sorted(self._dirty), 'topics': topics}
+
+    def _topic_stats(self, topic: str) -> Dict[str, float]:
+        stats = self._stats.get(topic)
+        if stats is None:
+            stats = self._stats[topic] = {'notifications': 0, 'pushes': 0, 'latency_total': 0.0, 'latency_max': 0.0}
+        return stats
+
+    def _take_due(self) -> Optional[Dict[str, float]]:
+        """Wait for topics that are due and take them (None when stopped)."""
+        with self._condition:
+            while self._running:
+                now = time.monotonic()
+                due = {}
+                wait = None
+                for topic, since in self._dirty.items():
+                    ready_at = self._last_push.get(topic, float('-inf')) + self._intervals.get(topic, self._default_interval)
+                    if ready_at <= now:
+                        due[topic] = since
+                    elif wait is None or ready_at - now < wait:
+                        wait = ready_at - now
+                if due:
+                    for topic in due:
+                        del self._dirty[topic]
+                        self._last_push[topic] = now
+                    return due
+                self._condition.wait(wait)
+            return None
+
+    def _run(self) -> None:
+        """Worker thread: push due topics until stopped."""
+        while True:
+            due = self._take_due()
+            if due is None:
+                return
+            try:
+                self.push(set(due))
+            except Exception as e:
+                logger.error(f"❌ Error pushing {sorted(due)}: {e}")
+            done = time.monotonic()
+            with self._condition:
+                for topic, since in due.items():
+                    stats = self._topic_stats(topic)
+                    latency = done - since
+                    stats['pushes'] += 1
+                    stats['latency_total'] += latency
+                    stats['latency_max'] = max(stats['latency_max'], latency)
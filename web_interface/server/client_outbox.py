@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Per-client outbound queues for Roibot Warehouse Visualization Interface
+Decouples broadcasting from socket writes: each client gets a bounded queue
+drained by its own sender thread, so a slow browser only delays itself.
+
+Messages with a key (e.g. 'state_delta', 'robot_data') are snapshots that a
+newer message of the same key makes stale: queuing one replaces the unsent
+older one, and keyed messages are sent at most max_rate times per second.
+Messages without a key (command responses, pongs) are never dropped for
+staleness and are sent as soon as possible. When the queue is full the
+oldest keyed message is dropped (the oldest message if none is keyed).
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ClientOutbox:
+    """Bounded, coalescing, rate-limited outbound queue with its own sender thread."""
+
+    def __init__(self, send: Callable[[Any], None], max_size: int = 32, max_rate: Optional[float] = None,
+                 on_drop: Optional[Callable[[str, Any], None]] = None, slow_send: float = 0.5,
+                 name: str = "client"):
+        """
+        Initialize client outbox.
+
+        Args:
+            send: Writes one message to the client (runs on the sender thread)
+            max_size: Maximum queued messages
+            max_rate: Maximum keyed messages per second (None: unlimited)
+            on_drop: Called as on_drop(key, meta) for each keyed message
+                dropped unsent
+            slow_send: Seconds after which a single send marks the client slow
+            name: Client name for the thread and log messages
+
+        Raises:
+            ValueError: If max_size is less than 1 or max_rate is not positive
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+
+        self.send = send
+        self.max_size = max_size
+        self.on_drop = on_drop
+        self.slow_send = slow_send
+        self.name = name
+        self._interval = 0.0
+        self.set_max_rate(max_rate)
+
+        self._queue: deque = deque()  # [key, message, meta]
+        self._condition = threading.Condition()
+        self._sending = False
+        self._closed = False
+        self._last_rated_send = float('-inf')
+        self.slow = False
+        self.stats = {'queued': 0, 'sent': 0, 'superseded': 0, 'overflowed': 0,
+                      'send_errors': 0, 'max_send_ms': 0.0}
+
+        self._thread = threading.Thread(target=self._run, name=f"outbox-{name}", daemon=True)
+        self._thread.start()
+
+    @property
+    def max_rate(self) -> Optional[float]:
+        """Maximum keyed messages per second (None: unlimited)."""
+        return 1.0 / self._interval if self._interval else None
+
+    def set_max_rate(self, max_rate: Optional[float]) -> None:
+        """Set the maximum keyed messages per second (None: unlimited)."""
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError(f"max_rate must be positive, got {max_rate}")
+        self._interval = 1.0 / max_rate if max_rate else 0.0
+
+    def put(self, message: Any, key: Optional[str] = None, meta: Any = None) -> bool:
+        """
+        Queue a message without blocking.
+
+        Args:
+            message: Encoded message passed to send
+            key: Staleness key; replaces an unsent message with the same key
+            meta: Passed to on_drop if the message is dropped
+
+        Returns:
+            False if the outbox is closed
+        """
+        dropped = []
+        with self._condition:
+            if self._closed:
+                return False
+            self.stats['queued'] += 1
+            stale = None
+            if key is not None:
+                stale = next((item for item in self._queue if item[0] == key), None)
+            if stale is not None:
+                # Keep the queue position, send the newer content
+                dropped.append((key, stale[2]))
+                stale[1], stale[2] = message, meta
+                self.stats['superseded'] += 1
+            else:
+                if len(self._queue) >= self.max_size:
+                    dropped.append(self._drop_oldest())
+                self._queue.append([key, message, meta])
+            self._condition.notify_all()
+
+        self._report_drops(dropped)
+        return True
+
+    def peek(self, key: str) -> Any:
+        """Meta of the unsent message with a key (None if there is none)."""
+        with self._condition:
+            return next((item[2] for item in self._queue if item[0] == key), None)
+
+    def take(self, key: str) -> Any:
+        """Remove the unsent message with a key; returns its meta (None if there is none)."""
+        with self._condition:
+            for item in self._queue:
+                if item[0] == key:
+                    self._queue.remove(item)
+                    self.stats['superseded'] += 1
+                    self._condition.notify_all()
+                    return item[2]
+        return None
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait until every queued message is sent; returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self._queue or self._sending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closed:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def close(self) -> None:
+        """Stop the sender thread; unsent messages are discarded."""
+        with self._condition:
+            self._closed = True
+            self._queue.clear()
+            self._condition.notify_all()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get outbox statistics.
+
+        Returns:
+            Dictionary with queue length, slow flag, max rate and counters
+        """
+        with self._condition:
+            return {'queue_length': len(self._queue), 'slow': self.slow, 'max_rate': self.max_rate, **self.stats}
+
+    def _drop_oldest(self) -> Tuple[Optional[str], Any]:
+        """Drop the oldest keyed message, or the oldest message if none is keyed."""
+        victim = next((item for item in self._queue if item[0] is not None), self._queue[0])
+        self._queue.remove(victim)
+        self.stats['overflowed'] += 1
+        if not self.slow:
+            self.slow = True
+            logger.warning(f"🐢 Client {self.name} is slow: outbound queue full, dropping stale messages")
+        return victim[0], victim[2]
+
+    def _report_drops(self, dropped: List[Tuple[Optional[str], Any]]) -> None:
+        if self.on_drop is None:
+            return
+        for key, meta in dropped:
+            if key is not None:
+                try:
+                    self.on_drop(key, meta)
+                except Exception as e:
+                    logger.error(f"❌ Drop callback failed for client {self.name}: {e}")
+
+    def _next_item(self, now: float) -> Tuple[Optional[list], Optional[float]]:
+        """First sendable item, or None and the seconds until a keyed item is due."""
+        wait = None
+        for item in self._queue:
+            if item[0] is None:
+                return item, None
+            due = self._last_rated_send + self._interval
+            if due <= now:
+                return item, None
+            wait = due - now
+        return None, wait
+
+    def _run(self) -> None:
+        """Sender thread: send queued messages until closed."""
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        return
+                    now = time.monotonic()
+                    item, wait = self._next_item(now)
+                    if item is not None:
+                        self._queue.remove(item)
+                        self._sending = True
+                        if item[0] is not None:
+                            self._last_rated_send = now
+                        break
+                    self._condition.wait(wait)
+
+            start = time.monotonic()
+            try:
+                self.send(item[1])
+                failed = False
+            except Exception as e:
+                logger.error(f"❌ Error sending to client {self.name}: {e}")
+                failed = True
+            duration = time.monotonic() - start
+
+            with self._condition:
+                self._sending = False
+                self.stats['send_errors' if failed else 'sent'] += 1
+                self.stats['max_send_ms'] = max(self.stats['max_send_ms'], duration * 1000)
+                if duration > self.slow_send and not self.slow:
+                    self.slow = True
+                    logger.warning(f"🐢 Client {self.name} is slow: a send took {duration * 1000:.0f}ms")
+                elif self.slow and not self._queue and duration <= self.slow_send:
+                    self.slow = False
+                    logger.info(f"✅ Client {self.name} caught up")
+                self._condition.notify_all()
@@ -23,6 +23,39 @@ sys.path.insert(0, str(project_root))
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+from utils.logging_utils import ThrottledLogger
+from core.engine_bridge import EngineThread, StateChannel
+from web_interface.server.change_pusher import ChangePusher
+from web_interface.server.robot_wire import RobotWireEncoder
+from web_interface.server.snapshot_cache import SnapshotCache
+from web_interface.server.state_delta import snapshot_topics
+
+# Polling getters run on every update tick; rate-limit their debug output
+POLL_LOG_INTERVAL = 1.0
+poll_logger = ThrottledLogger(logger)
+
+# Bridge topics affected by each engine change topic (see core.engine.CHANGE_TOPICS)
+CHANGE_TOPIC_MAP = {
+    'robots': ('robot_data', 'robot_frame', 'kpi_data'),
+    'orders': ('order_data', 'robot_data', 'kpi_data', 'simulation_state'),
+    'items': ('robot_data', 'inventory_data', 'kpi_data'),
+    'kpis': ('kpi_data',),
+    'simulation': ('simulation_state', 'kpi_data')
+}
+
+# Maximum pushes per second for each bridge topic
+PUSH_MAX_RATES = {
+    'robot_data': 10.0,
+    'robot_frame': 30.0,  # Binary robot positions (see robot_wire.py)
+    'order_data': 5.0,
+    'inventory_data': 2.0,
+    'simulation_state': 2.0,
+    'kpi_data': 1.0
+}
+
+# Snapshots are invalidated by pushes; this only bounds staleness of state no push covers
+SNAPSHOT_MAX_AGE = 1.0
+
 class DataBridge:
     """Bridge between web interface and simulation engine"""
     
@@ -54,6 +87,29 @@ class DataBridge:
         # SocketIO integration
         self.socketio = None
         
+        # Engine thread and the state deltas it publishes
+        self.state_channel = StateChannel(capacity=1024)
+        self.state_reader = self.state_channel.reader("data_bridge")
+        self.engine_thread = None
+        self._engine_run = None
+        self._channel_lock = threading.Lock()
+        self._robot_positions = {}
+        
+        # Each topic is computed and JSON-encoded once per change, shared by REST and sockets
+        self.snapshot_cache = SnapshotCache({
+            'simulation_state': self.get_simulation_state,
+            'robot_data': self.get_robot_data,
+            'order_data': self.get_order_data,
+            'kpi_data': self.get_kpi_data,
+            'inventory_data': self.get_inventory_data,
+            'warehouse_data': self.get_warehouse_data
+        }, max_age=SNAPSHOT_MAX_AGE)
+        
+        # Engine changes are pushed to listeners per topic, at most PUSH_MAX_RATES per second
+        self.push_listeners: List[Callable] = []
+        self.robot_wire = RobotWireEncoder()
+        self.change_pusher = ChangePusher(self._push_topics, PUSH_MAX_RATES)
+        
         # Initialize components
         self.initialize_components()
         
@@ -64,46 +120,101 @@ class DataBridge:
         """Start the simulation engine to generate data"""
         try:
             if self.simulation_engine:
-                print("🚀 [DEBUG] Starting simulation engine...")
+                logger.debug("🚀 Starting simulation engine...")
                 # Start the simulation engine
                 if hasattr(self.simulation_engine, 'start'):
-                    print("🚀 [DEBUG] Simulation engine has start method, calling it...")
-                    # Run in a separate thread to avoid blocking
-                    import threading
-                    def start_and_run_engine():
-                        try:
-                            print("🚀 [DEBUG] Starting engine in background thread...")
-                            # First start the engine
-                            asyncio.run(self.simulation_engine.start())
-                            print("✅ [DEBUG] Engine start completed")
-                            
-                            # Then run the main loop
-                            print("🔄 [DEBUG] Starting main simulation loop...")
-                            asyncio.run(self.simulation_engine.run())
-                            print("✅ [DEBUG] Main simulation loop completed")
-                        except Exception as e:
-                            print(f"❌ [DEBUG] Error in simulation engine: {e}")
-                    
-                    engine_thread = threading.Thread(target=start_and_run_engine, daemon=True)
-                    engine_thread.start()
-                    print("✅ [DEBUG] Simulation engine started in background thread")
+                    logger.debug("🚀 Simulation engine has start method, running it on the engine thread...")
+                    self._run_engine()
                 else:
-                    print("🚀 [DEBUG] Simulation engine has no start method, setting is_running=True")
+                    logger.debug("🚀 Simulation engine has no start method, setting is_running=True")
                     self.simulation_engine.is_running = True
-                    print("✅ [DEBUG] Simulation engine marked as running")
+                    logger.debug("✅ Simulation engine marked as running")
             else:
-                print("❌ [DEBUG] No simulation engine to start")
+                logger.error("❌ No simulation engine to start")
         except Exception as e:
-            print(f"❌ [DEBUG] Error in start_simulation_engine: {e}")
-            logger.error(f"Error starting simulation engine: {e}")
+            logger.error("❌ Error in start_simulation_engine: %s", e)
+    
+    def _run_engine(self):
+        """Start the engine thread if needed and run the engine on it (once at a time)"""
+        if self.engine_thread is None:
+            self.engine_thread = EngineThread(self.simulation_engine, self.state_channel,
+                                              publish_interval=self.update_interval)
+            self.engine_thread.add_change_listener(self._on_engine_changes)
+        self.change_pusher.start()
+        if not self.engine_thread.is_alive:
+            self.engine_thread.start(run_engine=False)
+        if self._engine_run is None or self._engine_run.done():
+            self._engine_run = self.engine_thread.run_engine()
+            logger.debug("✅ Simulation engine started on engine thread")
+    
+    def _send_engine_command(self, name: str, *args):
+        """Run an engine method on the engine thread without waiting for it"""
+        method = getattr(self.simulation_engine, name)
+        if self.engine_thread is None or not self.engine_thread.is_alive:
+            # Engine was never started: nothing runs concurrently, call directly
+            result = method(*args)
+            if asyncio.iscoroutine(result):
+                asyncio.run(result)
+            self.snapshot_cache.invalidate()  # No engine thread publishes the change
+            self._notify_push_listeners(set(PUSH_MAX_RATES))
+            return
+        if asyncio.iscoroutinefunction(method):
+            self.engine_thread.submit(method(*args))
+        else:
+            self.engine_thread.call(method, *args)
+    
+    def drain_state_channel(self):
+        """Apply state deltas published by the engine thread to the bridge caches"""
+        if not self._channel_lock.acquire(blocking=False):
+            return  # Another request thread is already draining
+        try:
+            for _, topic, delta in self.state_reader.poll():
+                if topic == 'robots':
+                    for robot in delta:
+                        self._robot_positions[robot['robot_id']] = (robot['aisle'], robot['rack'])
+        finally:
+            self._channel_lock.release()
+    
+    def subscribe_pushes(self, listener: Callable):
+        """Call listener(topics) whenever changed bridge topics are pushed"""
+        if listener not in self.push_listeners:
+            self.push_listeners.append(listener)
+    
+    def unsubscribe_pushes(self, listener: Callable) -> bool:
+        """Remove a push listener; returns False if it was not subscribed"""
+        if listener in self.push_listeners:
+            self.push_listeners.remove(listener)
+            return True
+        return False
+    
+    def _on_engine_changes(self, topics, since: float):
+        """Engine thread listener: mark the bridge topics affected by engine changes"""
+        for topic in topics:
+            for bridge_topic in CHANGE_TOPIC_MAP.get(topic, ()):
+                self.change_pusher.notify(bridge_topic, since)
+    
+    def _push_topics(self, topics):
+        """Change pusher callback: refresh the changed topics and notify push listeners"""
+        self.drain_state_channel()
+        for topic in topics:
+            self.snapshot_cache.invalidate(topic)
+        self._notify_push_listeners(topics)
+    
+    def _notify_push_listeners(self, topics):
+        """Call every push listener with the changed topics"""
+        for listener in list(self.push_listeners):
+            try:
+                listener(topics)
+            except Exception as e:
+                logger.error(f"❌ Push listener failed: {e}")
     
     def initialize_components(self):
         """Initialize simulation components with real integration"""
         try:
-            print("🔧 Starting component initialization...")
+            logger.info("🔧 Starting component initialization...")
             
             # Import simulation components
-            print("📦 Importing simulation components...")
+            logger.info("📦 Importing simulation components...")
             from core.engine import SimulationEngine
             from core.events import EventSystem, EventType
             from core.main_config import get_config
@@ -124,20 +235,20 @@ class DataBridge:
             from core.analytics.order_analytics import OrderAnalytics as CoreOrderAnalytics
             from core.analytics.robot_analytics import RobotAnalytics
             from core.analytics.system_performance import SystemPerformanceMonitor
-            print("✅ All imports successful")
+            logger.info("✅ All imports successful")
             
             # Initialize configuration
-            print("⚙️  Initializing configuration...")
+            logger.info("⚙️  Initializing configuration...")
             self.config_manager = get_config()
-            print("✅ Configuration initialized")
+            logger.info("✅ Configuration initialized")
             
             # Initialize event system
-            print("🔌 Initializing event system...")
+            logger.info("🔌 Initializing event system...")
             self.event_system = EventSystem()
-            print("✅ Event system initialized")
+            logger.info("✅ Event system initialized")
             
             # Initialize simulation engine
-            print("🚀 Initializing simulation engine...")
+            logger.info("🚀 Initializing simulation engine...")
             self.simulation_engine = SimulationEngine()
             
             # Connect event system to simulation engine
@@ -145,33 +256,33 @@ class DataBridge:
                 # Replace the engine's event system with our data bridge event system
                 # so all events go through the same system
                 self.simulation_engine.event_system = self.event_system
-                print("✅ Event system connected to simulation engine")
+                logger.info("✅ Event system connected to simulation engine")
             else:
-                print("⚠️  Simulation engine does not have event_system attribute")
+                logger.warning("⚠️  Simulation engine does not have event_system attribute")
             
-            print("✅ Simulation engine initialized")
+            logger.info("✅ Simulation engine initialized")
             
             # Initialize warehouse layout first (needed by other components)
-            print("🏗️  Initializing warehouse layout...")
+            logger.info("🏗️  Initializing warehouse layout...")
             from core.layout.warehouse_layout import WarehouseLayoutManager
             self.warehouse_layout = WarehouseLayoutManager()
-            print("✅ Warehouse layout initialized")
+            logger.info("✅ Warehouse layout initialized")
             
             # Initialize order management system
-            print("📋 Initializing order management system...")
+            logger.info("📋 Initializing order management system...")
             self.order_generator = OrderGenerator(self.warehouse_layout)
-            print("✅ Order generator initialized")
+            logger.info("✅ Order generator initialized")
             self.order_queue_manager = OrderQueueManager()
-            print("✅ Order queue manager initialized")
+            logger.info("✅ Order queue manager initialized")
             self.robot_order_assigner = RobotOrderAssigner()
-            print("✅ Robot order assigner initialized")
+            logger.info("✅ Robot order assigner initialized")
             self.order_status_tracker = OrderStatusTracker(self.robot_order_assigner, self.order_queue_manager)
-            print("✅ Order status tracker initialized")
+            logger.info("✅ Order status tracker initialized")
             self.order_analytics = OrderAnalytics(self.order_status_tracker, self.robot_order_assigner, self.order_queue_manager)
-            print("✅ Order analytics initialized")
+            logger.info("✅ Order analytics initialized")
             
             # Initialize robot system with proper configuration
-            print("🤖 Initializing robot system...")
+            logger.info("🤖 Initializing robot system...")
             robot_config = {
                 'movement': {
                     'movement_speed': 2.0  # seconds per aisle
@@ -180,48 +291,50 @@ class DataBridge:
                     'collection_time': 5.0  # seconds per item
                 }
             }
-            print(f"🔧 Initializing robot with config: {robot_config}")
+            logger.info("🔧 Initializing robot with config: %s", robot_config)
             self.robot = Robot(robot_config)
-            print("✅ Robot initialized")
+            logger.info("✅ Robot initialized")
             # Robot components are already initialized as part of the Robot class
             # We don't need to create separate instances
-            print("✅ Robot components initialized (movement, navigation, collection, orders, events)")
+            logger.info("✅ Robot components initialized (movement, navigation, collection, orders, events)")
             
             # Initialize inventory system
-            print("📦 Initializing inventory system...")
+            logger.info("📦 Initializing inventory system...")
             self.inventory_manager = InventoryManager()
-            print("✅ Inventory manager initialized")
+            logger.info("✅ Inventory manager initialized")
             self.inventory_sync = InventorySyncManager(self.inventory_manager)
-            print("✅ Inventory sync initialized")
+            logger.info("✅ Inventory sync initialized")
             
             # Initialize analytics system
-            print("📊 Initializing analytics system...")
-            self.analytics_engine = AnalyticsEngine()
+            logger.info("📊 Initializing analytics system...")
+            self.analytics_engine = AnalyticsEngine(clock=self.simulation_engine.clock)
             self.analytics_engine.set_event_system(self.event_system)
-            print("✅ Analytics engine initialized")
+            logger.info("✅ Analytics engine initialized")
             self.core_order_analytics = CoreOrderAnalytics(self.analytics_engine)
-            print("✅ Core order analytics initialized")
+            logger.info("✅ Core order analytics initialized")
             self.robot_analytics = RobotAnalytics(self.analytics_engine)
-            print("✅ Robot analytics initialized")
+            logger.info("✅ Robot analytics initialized")
             self.system_performance = SystemPerformanceMonitor(self.analytics_engine)
-            print("✅ System performance monitor initialized")
+            logger.info("✅ System performance monitor initialized")
+
+            # Inventory and analytics buffers are saved and restored with engine checkpoints
+            self.simulation_engine.register_checkpoint_component("inventory", self.inventory_manager)
+            self.simulation_engine.register_checkpoint_component("analytics", self.analytics_engine)
             
             # Set up event subscriptions
-            print("🔗 Setting up event subscriptions...")
+            logger.info("🔗 Setting up event subscriptions...")
             self.setup_event_subscriptions()
-            print("✅ Event subscriptions set up")
+            logger.info("✅ Event subscriptions set up")
             
-            print("🎉 All simulation components initialized successfully!")
+            logger.info("🎉 All simulation components initialized successfully!")
             logger.info("✅ Real simulation components initialized successfully")
             
         except ImportError as e:
-            print(f"❌ Import error: {e}")
-            logger.warning(f"⚠️  Could not import simulation components: {e}")
+            logger.error("❌ Import error: %s", e)
             logger.info("Running in mock mode with simulated data")
             self.create_mock_components()
         except Exception as e:
-            print(f"❌ Unexpected error during initialization: {e}")
-            logger.error(f"❌ Error initializing components: {e}")
+            logger.error("❌ Unexpected error during initialization: %s", e)
             self.create_mock_components()
     
     def setup_event_subscriptions(self):
@@ -511,8 +624,8 @@ class DataBridge:
             value = event_data.get('value', 0.0)
             timestamp = event_data.get('timestamp', time.time())
             
-            print(f"�� KPI Update - Type: {kpi_type}, Value: {value}, Timestamp: {timestamp}")
-            print(f"🔧 Current last_kpi_data keys: {list(self.last_kpi_data.keys()) if hasattr(self, 'last_kpi_data') else 'No last_kpi_data'}")
+            logger.debug("�� KPI Update - Type: %s, Value: %s, Timestamp: %s", kpi_type, value, timestamp)
+            logger.debug("🔧 Current last_kpi_data keys: %s", list(self.last_kpi_data.keys()) if hasattr(self, 'last_kpi_data') else 'No last_kpi_data')
             
             # Initialize last_kpi_data if it doesn't exist
             if not hasattr(self, 'last_kpi_data'):
@@ -527,7 +640,7 @@ class DataBridge:
                 'timestamp': timestamp
             })
             
-            print(f"🔧 Updated last_kpi_data[{kpi_type}]: {self.last_kpi_data[kpi_type]}")
+            logger.debug("🔧 Updated last_kpi_data[%s]: %s", kpi_type, self.last_kpi_data[kpi_type])
             
             # Keep only last 100 values for each KPI
             if len(self.last_kpi_data[kpi_type]) > 100:
@@ -538,8 +651,7 @@ class DataBridge:
                 self.update_callbacks['kpi_data'](self.get_kpi_data())
                 
         except Exception as e:
-            logger.error(f"❌ Error handling KPI update: {e}")
-            print(f"❌ Exception in handle_kpi_update: {e}")
+            logger.error("❌ Exception in handle_kpi_update: %s", e)
             import traceback
             traceback.print_exc()
     
@@ -752,26 +864,33 @@ class DataBridge:
             }
         
         try:
-            is_running = getattr(self.simulation_engine, 'is_running', False)
-            simulation_time = getattr(self.simulation_engine, 'simulation_time', 0)
-            simulation_speed = getattr(self.simulation_engine, 'simulation_speed', 1.0)
+            # Prefer the status the engine thread published over reading engine attributes
+            status = self.state_channel.latest('simulation')
+            if status is not None:
+                is_running = status['is_running'] and not status['is_paused']
+                simulation_time = status['simulation_time']
+                simulation_speed = status['speed']
+            else:
+                is_running = getattr(self.simulation_engine, 'is_running', False)
+                simulation_time = getattr(self.simulation_engine, 'simulation_time', 0)
+                simulation_speed = getattr(self.simulation_engine, 'simulation_speed', 1.0)
             
             # Calculate total orders with multiple fallback methods
             total_orders = 0
             if self.analytics_engine and hasattr(self.analytics_engine, 'get_total_orders_created'):
                 try:
                     total_orders = self.analytics_engine.get_total_orders_created()
-                    print(f"🔍 [DEBUG] Analytics engine total orders: {total_orders}")
+                    poll_logger.debug_throttled("get_simulation_state.1", POLL_LOG_INTERVAL, "🔍 Analytics engine total orders: %s", total_orders)
                 except Exception as e:
-                    print(f"❌ [DEBUG] Error getting total orders from analytics: {e}")
+                    logger.error("❌ Error getting total orders from analytics: %s", e)
             
             # Fallback to direct order count from simulation engine
             if total_orders == 0 and self.simulation_engine:
                 orders = getattr(self.simulation_engine, 'orders', [])
                 total_orders = len(orders)
-                print(f"🔍 [DEBUG] Fallback - Direct order count from engine: {total_orders}")
+                poll_logger.debug_throttled("get_simulation_state.2", POLL_LOG_INTERVAL, "🔍 Fallback - Direct order count from engine: %s", total_orders)
             
-            print(f"🔍 [DEBUG] Final total_orders value: {total_orders}")
+            poll_logger.debug_throttled("get_simulation_state.3", POLL_LOG_INTERVAL, "🔍 Final total_orders value: %s", total_orders)
 
             # Add debug info
             debug_info = {
@@ -807,77 +926,134 @@ class DataBridge:
     def get_robot_data(self) -> List[Dict[str, Any]]:
         """Get robot data"""
         if not self.simulation_engine:
-            print("🔍 [DEBUG] No simulation engine, returning empty robot data")
+            logger.debug("🔍 No simulation engine, returning empty robot data")
             return []
         
         try:
-            print("🔍 [DEBUG] Getting robot data from single robot")
+            poll_logger.debug_throttled("get_robot_data.1", POLL_LOG_INTERVAL, "🔍 Getting robot data from engine")
             robot = getattr(self.simulation_engine, 'robot', None)
             if not robot:
-                print("❌ [DEBUG] No robot found in simulation engine")
+                logger.error("❌ No robot found in simulation engine")
                 return []
             
-            # Get robot position - handle both SmoothCoordinate and tuple formats
-            if hasattr(robot, 'position') and robot.position:
-                if hasattr(robot.position, 'aisle') and hasattr(robot.position, 'rack'):
-                    # SmoothCoordinate format
-                    aisle = int(robot.position.aisle)
-                    rack = int(robot.position.rack)
-                elif isinstance(robot.position, (tuple, list)) and len(robot.position) >= 2:
-                    # Tuple format
-                    aisle = int(robot.position[0])
-                    rack = int(robot.position[1])
-                else:
-                    aisle, rack = 1, 1
-                    
-                # Convert to grid position (A1, B2, etc.)
-                column = chr(ord('A') + aisle - 1)  # A=1, B=2, etc.
-                grid_position = f"{column}{rack}"
-            else:
-                aisle, rack = 1, 1
-                grid_position = "A1"
-            
-            print(f"🔍 [DEBUG] Robot found: position=({aisle:.2f}, {rack:.2f}), state={robot.state}")
+            robot_data_list = [self._build_robot_data(fleet_robot, position)
+                               for fleet_robot, position in self._robot_positions_now(robot)]
             
-            # Get robot state as string
-            state_str = str(robot.state).replace('RobotState.', '') if hasattr(robot, 'state') else 'IDLE'
-            
-            # Get robot order information
-            current_order = getattr(robot, 'current_order', None)
-            target_items = getattr(robot, 'target_items', [])
-            collected_items = getattr(robot, 'collected_items', [])
-            
-            # Calculate items held (same as collected_items)
-            items_held = collected_items.copy() if collected_items else []
-            
-            robot_data = {
-                'id': 'ROBOT_001',
-                'position': grid_position,
-                'state': state_str,
-                'current_order': current_order,
-                'path': [],  # Path not needed for frontend display
-                'direction': getattr(robot, 'direction', 'forward'),
-                'items_held': items_held,
-                'target_items': target_items,
-                'movement_progress': getattr(robot, 'movement_progress', 0.0),
-                'total_distance': getattr(robot, 'total_distance', 0.0),
-                'battery_level': 100,  # Assume full battery
-                'efficiency': 85  # Sample efficiency
-            }
-            
-            print(f"🔍 [DEBUG] Robot data: {robot_data}")
+            poll_logger.debug_throttled("get_robot_data.3", POLL_LOG_INTERVAL, "🔍 Robot data: %s", robot_data_list[0])
             
             # Update cache
-            self.last_robot_data = [robot_data]
+            self.last_robot_data = robot_data_list
             
-            print(f"🔍 [DEBUG] Returning 1 robots")
-            return [robot_data]
+            poll_logger.debug_throttled("get_robot_data.4", POLL_LOG_INTERVAL, "🔍 Returning %s robots", len(robot_data_list))
+            return robot_data_list
             
         except Exception as e:
-            print(f"❌ [DEBUG] Error getting robot data: {e}")
-            logger.error(f"Error getting robot data: {e}")
+            logger.error("❌ Error getting robot data: %s", e)
             return []
     
+    def _robot_positions_now(self, robot) -> List[tuple]:
+        """Every robot with its latest position (engine thread publishes first)"""
+        # Fleet engines expose every robot; fleet positions live in the engine's arrays
+        robots = getattr(self.simulation_engine, 'robots', None)
+        if not isinstance(robots, list) or not robots:
+            robots = [robot]
+        use_fleet_positions = getattr(self.simulation_engine, 'fleet', None) is not None
+        
+        # Positions published by the engine thread avoid racing its updates
+        self.drain_state_channel()
+        published_positions = self._robot_positions
+        
+        positions = []
+        for fleet_robot in robots:
+            position = published_positions.get(getattr(fleet_robot, 'robot_id', None))
+            if position is None:
+                position = getattr(fleet_robot, 'position', None)
+                if use_fleet_positions:
+                    position = self.simulation_engine.get_robot_position(fleet_robot.robot_id)
+            positions.append((fleet_robot, position))
+        return positions
+    
+    def get_robot_kinematics(self) -> List[Dict[str, Any]]:
+        """Get each robot's continuous position and state for the binary robot stream"""
+        robot = getattr(self.simulation_engine, 'robot', None) if self.simulation_engine else None
+        if not robot:
+            return []
+        
+        try:
+            kinematics = []
+            for fleet_robot, position in self._robot_positions_now(robot):
+                if hasattr(position, 'aisle') and hasattr(position, 'rack'):
+                    x, y = position.aisle, position.rack
+                elif isinstance(position, (tuple, list)) and len(position) >= 2:
+                    x, y = position[0], position[1]
+                else:
+                    x, y = 1.0, 1.0
+                kinematics.append({
+                    'id': getattr(fleet_robot, 'robot_id', 'ROBOT_001'),
+                    'x': float(x),
+                    'y': float(y),
+                    'state': getattr(fleet_robot, 'state', 'IDLE')
+                })
+            return kinematics
+        except Exception as e:
+            logger.error(f"❌ Error getting robot kinematics: {e}")
+            return []
+    
+    def get_robot_frame(self, with_ids: bool = False) -> bytes:
+        """Get robot kinematics as one binary frame (see robot_wire.py)"""
+        simulation_time = getattr(self.simulation_engine, 'simulation_time', 0.0) if self.simulation_engine else 0.0
+        return self.robot_wire.encode(self.get_robot_kinematics(), simulation_time or 0.0, with_ids)
+    
+    def _build_robot_data(self, robot, position) -> Dict[str, Any]:
+        """Convert a robot and its position into the frontend robot format."""
+        # Get robot position - handle both SmoothCoordinate and tuple formats
+        if position:
+            if hasattr(position, 'aisle') and hasattr(position, 'rack'):
+                # SmoothCoordinate format
+                aisle = int(position.aisle)
+                rack = int(position.rack)
+            elif isinstance(position, (tuple, list)) and len(position) >= 2:
+                # Tuple format
+                aisle = int(position[0])
+                rack = int(position[1])
+            else:
+                aisle, rack = 1, 1
+                
+            # Convert to grid position (A1, B2, etc.)
+            column = chr(ord('A') + aisle - 1)  # A=1, B=2, etc.
+            grid_position = f"{column}{rack}"
+        else:
+            aisle, rack = 1, 1
+            grid_position = "A1"
+        
+        poll_logger.debug_throttled("get_robot_data.2", POLL_LOG_INTERVAL, "🔍 Robot found: position=(%.2f, %.2f), state=%s", aisle, rack, robot.state)
+        
+        # Get robot state as string
+        state_str = str(robot.state).replace('RobotState.', '') if hasattr(robot, 'state') else 'IDLE'
+        
+        # Get robot order information
+        current_order = getattr(robot, 'current_order', None)
+        target_items = getattr(robot, 'target_items', [])
+        collected_items = getattr(robot, 'collected_items', [])
+        
+        # Calculate items held (same as collected_items)
+        items_held = collected_items.copy() if collected_items else []
+        
+        return {
+            'id': getattr(robot, 'robot_id', 'ROBOT_001'),
+            'position': grid_position,
+            'state': state_str,
+            'current_order': current_order,
+            'path': [],  # Path not needed for frontend display
+            'direction': getattr(robot, 'direction', 'forward'),
+            'items_held': items_held,
+            'target_items': target_items,
+            'movement_progress': getattr(robot, 'movement_progress', 0.0),
+            'total_distance': getattr(robot, 'total_distance', 0.0),
+            'battery_level': 100,  # Assume full battery
+            'efficiency': 85  # Sample efficiency
+        }
+    
     def _convert_robot_state_to_string(self, state) -> str:
         """Convert robot state to string"""
         if hasattr(state, 'name'):
@@ -903,7 +1079,7 @@ class DataBridge:
     def get_order_data(self) -> Dict[str, Any]:
         """Get order data"""
         if not self.simulation_engine:
-            print("🔍 [DEBUG] No simulation engine, returning empty order data")
+            logger.debug("🔍 No simulation engine, returning empty order data")
             return {
                 'pending': 0,
                 'in_progress': 0,
@@ -916,7 +1092,7 @@ class DataBridge:
         try:
             # Get orders from simulation engine
             orders = getattr(self.simulation_engine, 'orders', [])
-            print(f"🔍 [DEBUG] Found {len(orders)} orders in simulation engine")
+            poll_logger.debug_throttled("get_order_data.1", POLL_LOG_INTERVAL, "🔍 Found %s orders in simulation engine", len(orders))
             
             # Convert orders to frontend format
             def order_to_dict(order):
@@ -970,17 +1146,16 @@ class DataBridge:
                 'completed_orders': completed_orders
             }
             
-            print(f"🔍 [DEBUG] Order data: pending={pending}, in_progress={in_progress}, completed={completed}, total={len(orders)}")
-            print(f"🔍 [DEBUG] Order statuses: {[o['status'] for o in formatted_orders]}")
-            print(f"📦 [DEBUG] Order data being sent to frontend: {order_data}")
+            poll_logger.debug_throttled("get_order_data.2", POLL_LOG_INTERVAL, "🔍 Order data: pending=%s, in_progress=%s, completed=%s, total=%s", pending, in_progress, completed, len(orders))
+            poll_logger.debug_throttled("get_order_data.3", POLL_LOG_INTERVAL, "🔍 Order statuses: %s", [o['status'] for o in formatted_orders])
+            poll_logger.debug_throttled("get_order_data.4", POLL_LOG_INTERVAL, "📦 Order data being sent to frontend: %s", order_data)
             
             # Update cache
             self.last_order_data = order_data
             return order_data
             
         except Exception as e:
-            print(f"❌ [DEBUG] Error getting order data: {e}")
-            logger.error(f"Error getting order data: {e}")
+            logger.error("❌ Error getting order data: %s", e)
             return {
                 'pending': 0,
                 'in_progress': 0,
@@ -993,7 +1168,7 @@ class DataBridge:
     def get_kpi_data(self) -> Dict[str, Any]:
         """Get KPI data for dashboard"""
         try:
-            print(f"🔍 get_kpi_data called")
+            poll_logger.debug_throttled("get_kpi_data.1", POLL_LOG_INTERVAL, "🔍 get_kpi_data called")
             
             # Start with default values
             kpis = {
@@ -1016,7 +1191,7 @@ class DataBridge:
                     robot = getattr(self.simulation_engine, 'robot', None)
                     simulation_time = getattr(self.simulation_engine, 'simulation_time', 0)
                     
-                    print(f"🔍 [DEBUG] KPI Calculation - Total orders: {len(orders)}")
+                    poll_logger.debug_throttled("get_kpi_data.2", POLL_LOG_INTERVAL, "🔍 KPI Calculation - Total orders: %s", len(orders))
                     
                     # Calculate completed orders, total orders, and order status counts
                     completed_orders = [o for o in orders if o.get('status') == 'completed']
@@ -1028,7 +1203,7 @@ class DataBridge:
                     pending_count = len(pending_orders)
                     in_progress_count = len(in_progress_orders)
                     
-                    print(f"🔍 [DEBUG] KPI Calculation - Completed: {completed_count}, Pending: {pending_count}, In Progress: {in_progress_count}")
+                    poll_logger.debug_throttled("get_kpi_data.3", POLL_LOG_INTERVAL, "🔍 KPI Calculation - Completed: %s, Pending: %s, In Progress: %s", completed_count, pending_count, in_progress_count)
                     
                     # Update KPIs with actual calculated values
                     kpis['total_orders'] = total_orders
@@ -1058,7 +1233,7 @@ class DataBridge:
                         if valid_orders > 0:
                             avg_seconds = total_time_seconds / valid_orders
                             kpis['average_order_time'] = avg_seconds
-                            print(f"🔍 [DEBUG] Average order time: {avg_seconds:.1f} seconds")
+                            poll_logger.debug_throttled("get_kpi_data.4", POLL_LOG_INTERVAL, "🔍 Average order time: %.1f seconds", avg_seconds)
                         else:
                             kpis['average_order_time'] = 0.0
                     else:
@@ -1105,10 +1280,10 @@ class DataBridge:
                             # Base efficiency when no active order
                             kpis['robot_efficiency'] = 20.0 if collected_items else 0.0
                     
-                    print(f"🔍 [DEBUG] Final calculated KPIs: {kpis}")
+                    poll_logger.debug_throttled("get_kpi_data.5", POLL_LOG_INTERVAL, "🔍 Final calculated KPIs: %s", kpis)
                     
                 except Exception as e:
-                    print(f"❌ [DEBUG] Error calculating KPIs from simulation engine: {e}")
+                    logger.error("❌ Error calculating KPIs from simulation engine: %s", e)
                     import traceback
                     traceback.print_exc()
             
@@ -1120,8 +1295,7 @@ class DataBridge:
             return kpis
             
         except Exception as e:
-            logger.error(f"❌ Error getting KPI data: {e}")
-            print(f"❌ Exception in get_kpi_data: {e}")
+            logger.error("❌ Exception in get_kpi_data: %s", e)
             import traceback
             traceback.print_exc()
             
@@ -1207,6 +1381,16 @@ class DataBridge:
             logger.error(f"❌ Error getting inventory data: {e}")
             return {'inventory': {}, 'total_items': 0}
     
+    def get_snapshot(self, topic: str):
+        """Get a topic's data and JSON bytes, computed once per engine tick"""
+        return self.snapshot_cache.get(topic)
+    
+    def get_state_topics(self) -> Dict[str, Dict[str, Any]]:
+        """Get the streamed state as keyed topic maps for delta encoding"""
+        cache = self.snapshot_cache
+        return snapshot_topics(cache.data('simulation_state'), cache.data('robot_data'), cache.data('order_data'),
+                               cache.data('kpi_data'), cache.data('inventory_data'))
+    
     def execute_command(self, command: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Execute simulation command"""
         if not self.simulation_engine:
@@ -1215,7 +1399,7 @@ class DataBridge:
         try:
             if command == 'play':
                 # Handle play command based on current simulation state
-                print("🎮 Executing play command...")
+                logger.info("🎮 Executing play command...")
                 
                 # Check current simulation state
                 is_running = getattr(self.simulation_engine, 'is_running', False)
@@ -1223,128 +1407,73 @@ class DataBridge:
                 if hasattr(self.simulation_engine, 'state') and hasattr(self.simulation_engine.state, 'is_paused'):
                     is_paused = self.simulation_engine.state.is_paused()
                 
-                print(f"🔍 [DEBUG] Current state - is_running: {is_running}, is_paused: {is_paused}")
+                logger.debug("🔍 Current state - is_running: %s, is_paused: %s", is_running, is_paused)
                 
                 if is_paused:
                     # Resume from pause
-                    print("▶️ Resuming simulation from pause...")
+                    logger.info("▶️ Resuming simulation from pause...")
                     if hasattr(self.simulation_engine, 'resume'):
-                        # Run async method in a thread
-                        import threading
-                        def resume_engine():
-                            try:
-                                asyncio.run(self.simulation_engine.resume())
-                                print("✅ [DEBUG] Engine resume completed")
-                            except Exception as e:
-                                print(f"❌ Error resuming engine: {e}")
-                        
-                        resume_thread = threading.Thread(target=resume_engine, daemon=True)
-                        resume_thread.start()
-                        print("✅ Simulation engine resume called")
+                        self._send_engine_command('resume')
+                        logger.info("✅ Simulation engine resume called")
                     else:
                         self.simulation_engine.is_running = True
-                        print("✅ Simulation engine marked as running")
+                        logger.info("✅ Simulation engine marked as running")
                 elif is_running:
                     # Already running, do nothing
-                    print("⚠️ Simulation is already running")
+                    logger.warning("⚠️ Simulation is already running")
                 else:
                     # Start fresh simulation
-                    print("🚀 Starting fresh simulation...")
+                    logger.info("🚀 Starting fresh simulation...")
                     if hasattr(self.simulation_engine, 'start'):
-                        # Run in a separate thread to avoid blocking
-                        import threading
-                        def start_and_run_engine():
-                            try:
-                                # First start the engine
-                                asyncio.run(self.simulation_engine.start())
-                                print("✅ [DEBUG] Engine start completed")
-                                
-                                # Then run the main loop
-                                asyncio.run(self.simulation_engine.run())
-                                print("✅ [DEBUG] Main simulation loop completed")
-                            except Exception as e:
-                                print(f"❌ [DEBUG] Error in simulation engine: {e}")
-                        
-                        engine_thread = threading.Thread(target=start_and_run_engine, daemon=True)
-                        engine_thread.start()
-                        print("✅ Simulation engine started in background thread")
+                        self._run_engine()
+                        logger.info("✅ Simulation engine started on engine thread")
                     else:
                         self.simulation_engine.is_running = True
-                        print("✅ Simulation engine marked as running")
+                        logger.info("✅ Simulation engine marked as running")
                 
                 logger.info("Simulation play command processed")
                 return {'status': 'running'}
             
             elif command == 'pause':
                 # Pause simulation engine
-                print("⏸️ Executing pause command...")
+                logger.info("⏸️ Executing pause command...")
                 if hasattr(self.simulation_engine, 'pause'):
-                    # Run async method in a thread
-                    import threading
-                    def pause_engine():
-                        try:
-                            asyncio.run(self.simulation_engine.pause())
-                            print("✅ [DEBUG] Engine pause completed")
-                        except Exception as e:
-                            print(f"❌ Error pausing engine: {e}")
-                    
-                    pause_thread = threading.Thread(target=pause_engine, daemon=True)
-                    pause_thread.start()
-                    print("✅ Simulation engine pause called")
+                    self._send_engine_command('pause')
+                    logger.info("✅ Simulation engine pause called")
                 else:
                     self.simulation_engine.is_running = False
-                    print("✅ Simulation engine marked as paused")
+                    logger.info("✅ Simulation engine marked as paused")
                 logger.info("Simulation paused")
                 return {'status': 'paused'}
             
             elif command == 'resume':
                 # Resume simulation engine
-                print("▶️ Executing resume command...")
+                logger.info("▶️ Executing resume command...")
                 if hasattr(self.simulation_engine, 'resume'):
-                    # Run async method in a thread
-                    import threading
-                    def resume_engine():
-                        try:
-                            asyncio.run(self.simulation_engine.resume())
-                            print("✅ [DEBUG] Engine resume completed")
-                        except Exception as e:
-                            print(f"❌ Error resuming engine: {e}")
-                    
-                    resume_thread = threading.Thread(target=resume_engine, daemon=True)
-                    resume_thread.start()
-                    print("✅ Simulation engine resume called")
+                    self._send_engine_command('resume')
+                    logger.info("✅ Simulation engine resume called")
                 else:
                     self.simulation_engine.is_running = True
-                    print("✅ Simulation engine marked as running")
+                    logger.info("✅ Simulation engine marked as running")
                 logger.info("Simulation resumed")
                 return {'status': 'running'}
             
             elif command == 'reset':
                 # Reset simulation engine
-                print("🔄 Executing reset command...")
+                logger.info("🔄 Executing reset command...")
                 
                 # Stop the simulation first if it's running
                 if hasattr(self.simulation_engine, 'stop'):
                     try:
-                        # Run async method in a thread
-                        import threading
-                        def stop_engine():
-                            try:
-                                asyncio.run(self.simulation_engine.stop())
-                                print("✅ [DEBUG] Engine stop completed")
-                            except Exception as e:
-                                print(f"❌ Error stopping engine: {e}")
-                        
-                        stop_thread = threading.Thread(target=stop_engine, daemon=True)
-                        stop_thread.start()
-                        print("✅ Simulation engine stop called")
+                        self._send_engine_command('stop')
+                        logger.info("✅ Simulation engine stop called")
                     except Exception as e:
-                        print(f"❌ Error during engine stop: {e}")
+                        logger.error("❌ Error during engine stop: %s", e)
                 
-                # Reset the simulation
+                # Reset the simulation (queued behind the stop on the engine thread)
                 if hasattr(self.simulation_engine, 'reset_simulation'):
-                    self.simulation_engine.reset_simulation()
-                    print("✅ Called engine reset_simulation method")
+                    self._send_engine_command('reset_simulation')
+                    logger.info("✅ Called engine reset_simulation method")
                 else:
                     # Manual reset if no method available
                     self.simulation_engine.simulation_time = 0
@@ -1354,7 +1483,7 @@ class DataBridge:
                             self.simulation_engine.state.reset()
                         elif hasattr(self.simulation_engine.state, 'frame_count'):
                             self.simulation_engine.state.frame_count = 0
-                    print("✅ Manual simulation reset completed")
+                    logger.info("✅ Manual simulation reset completed")
                 
                 logger.info("Simulation reset")
                 return {'status': 'reset'}
@@ -1362,10 +1491,10 @@ class DataBridge:
             elif command == 'step':
                 # Execute simulation step
                 if hasattr(self.simulation_engine, 'step'):
-                    self.simulation_engine.step()
-                elif hasattr(self.simulation_engine, '_main_loop'):
-                    # Trigger a single update
-                    asyncio.create_task(self.simulation_engine._main_loop())
+                    self._send_engine_command('step')
+                elif hasattr(self.simulation_engine, 'update'):
+                    # Trigger a single frame update
+                    self._send_engine_command('update', 1.0 / 60.0)
                 logger.info("Simulation step executed")
                 return {'status': 'stepped'}
             
@@ -1373,7 +1502,7 @@ class DataBridge:
                 # Change simulation speed
                 speed = params.get('speed', 1.0)
                 if hasattr(self.simulation_engine, 'set_simulation_speed'):
-                    self.simulation_engine.set_simulation_speed(speed)
+                    self._send_engine_command('set_simulation_speed', speed)
                 else:
                     self.simulation_engine.simulation_speed = speed
                 logger.info(f"Simulation speed changed to {speed}x")
@@ -1382,7 +1511,7 @@ class DataBridge:
             elif command == 'stop':
                 # Stop simulation engine
                 if hasattr(self.simulation_engine, 'stop'):
-                    asyncio.create_task(self.simulation_engine.stop())
+                    self._send_engine_command('stop')
                 else:
                     self.simulation_engine.is_running = False
                 logger.info("Simulation stopped")
@@ -1397,42 +1526,44 @@ class DataBridge:
             return {'error': str(e)}
     
     def start_update_loop(self):
-        """Start periodic update loop"""
+        """Send changed data to the update callbacks whenever the engine pushes a change"""
         self.is_running = True
         
-        def update_loop():
-            while self.is_running:
-                try:
-                    # Check if simulation engine is running and start it if needed
-                    if self.simulation_engine and not getattr(self.simulation_engine, 'is_running', False):
-                        print("🔄 Simulation engine not running, attempting to start...")
-                        self.start_simulation_engine()
-                    
-                    # Trigger update callbacks
-                    for data_type, callback in self.update_callbacks.items():
-                        if callback:
-                            try:
-                                data = callback()
-                                logger.debug(f"Updated {data_type}: {len(str(data))} bytes")
-                            except Exception as e:
-                                logger.error(f"Error in {data_type} update: {e}")
-                    
-                    time.sleep(self.update_interval)
-                    
-                except Exception as e:
-                    logger.error(f"Error in update loop: {e}")
-                    time.sleep(1)  # Wait before retrying
+        # Check if simulation engine is running and start it if needed
+        if self.simulation_engine and not getattr(self.simulation_engine, 'is_running', False):
+            logger.info("🔄 Simulation engine not running, attempting to start...")
+            self.start_simulation_engine()
         
-        # Start update loop in separate thread
-        update_thread = threading.Thread(target=update_loop, daemon=True)
-        update_thread.start()
+        self.subscribe_pushes(self._run_update_callbacks)
+        self.change_pusher.start()
         logger.info("✅ Update loop started")
     
+    def _run_update_callbacks(self, topics):
+        """Push listener: call the update callback of each changed topic with its data"""
+        for data_type in topics:
+            callback = self.update_callbacks.get(data_type)
+            if callback:
+                try:
+                    snapshot = self.get_snapshot(data_type)
+                    callback(snapshot.data)
+                    logger.debug(f"Updated {data_type}: {len(snapshot.body)} bytes")
+                except Exception as e:
+                    logger.error(f"Error in {data_type} update: {e}")
+    
     def stop_update_loop(self):
         """Stop the update loop"""
         self.is_running = False
+        self.unsubscribe_pushes(self._run_update_callbacks)
         logger.info("🛑 Update loop stopped")
     
+    def shutdown(self):
+        """Stop the update loop, the engine and the engine thread"""
+        self.stop_update_loop()
+        self.change_pusher.stop()
+        if self.engine_thread is not None:
+            self.engine_thread.stop()
+        logger.info("🛑 Data bridge shut down")
+    
     def get_cached_data(self, data_type: str) -> Dict[str, Any]:
         """Get cached data by type"""
         if data_type == 'simulation_state':
@@ -1461,7 +1592,9 @@ class DataBridge:
             'event_system_connected': self.event_system is not None,
             'registered_callbacks': list(self.update_callbacks.keys()),
             'cached_data_types': ['simulation_state', 'robot_data', 'order_data', 'kpi_data', 'inventory_data', 'warehouse_data'],
-            'event_subscriptions': len(self.event_subscriptions) if hasattr(self, 'event_subscriptions') else 0
+            'event_subscriptions': len(self.event_subscriptions) if hasattr(self, 'event_subscriptions') else 0,
+            'engine_thread': self.engine_thread.get_statistics() if self.engine_thread else None,
+            'push': self.change_pusher.get_statistics()
         }
     
     def export_data(self, data_type: str = 'all') -> Dict[str, Any]:
@@ -1495,12 +1628,10 @@ def main():
     # Create data bridge
     bridge = DataBridge()
     
-    # Register update callbacks
-    bridge.register_update_callback('simulation_state', bridge.get_simulation_state)
-    bridge.register_update_callback('robot_data', bridge.get_robot_data)
-    bridge.register_update_callback('order_data', bridge.get_order_data)
-    bridge.register_update_callback('kpi_data', bridge.get_kpi_data)
-    bridge.register_update_callback('warehouse_data', bridge.get_warehouse_data) # Register warehouse data callback
+    # Register update callbacks (called with each pushed topic's data)
+    for data_type in ('simulation_state', 'robot_data', 'order_data', 'kpi_data', 'inventory_data'):
+        bridge.register_update_callback(data_type, lambda data, data_type=data_type: print(
+            f"📡 {data_type} pushed: {len(json.dumps(data, default=str))} bytes"))
     
     # Start update loop
     bridge.start_update_loop()
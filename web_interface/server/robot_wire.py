@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Binary robot position frames for Roibot Warehouse Visualization Interface
+Packs robot kinematics into one frame per tick of fixed-width binary records
+for high-rate position streams, instead of JSON text with nested dicts.
+Browsers decode frames with decodeRobotFrame() in static/js/robot.js; the
+two layouts must change together (bump WIRE_VERSION).
+
+Frame layout (little-endian):
+    header    magic b'RB' (2s), wire version (u8), flags (u8),
+              sequence (u32), simulation time (f64), robot count (u16)
+    id table  only if flags & FLAG_ID_TABLE: per robot, in index order,
+              the UTF-8 robot id prefixed with its length (u8)
+    records   per robot: index (u16), x (f32), y (f32), state (u8),
+              reserved (u8), heading in hundredths of a degree (u16)
+
+x and y are the continuous aisle and rack coordinates. Heading is the
+direction of the last movement (0 = +aisle, 90 = +rack). The id table is only
+sent when robots are added or a receiver asks for it (e.g. a new client);
+receivers keep the last table and map each record's index through it.
+"""
+
+import math
+import struct
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b'RB'
+WIRE_VERSION = 1
+FLAG_ID_TABLE = 0x01
+
+HEADER = struct.Struct('<2sBBIdH')
+RECORD = struct.Struct('<HffBBH')
+
+# State codes; index = code sent on the wire
+STATE_CODES = ('IDLE', 'MOVING', 'PICKING', 'COLLECTING', 'RETURNING', 'COMPLETED')
+UNKNOWN_STATE = 255
+
+_STATE_INDEX = {state: code for code, state in enumerate(STATE_CODES)}
+_MAX_ROBOTS = 0xFFFF
+
+
+def state_code(state: Any) -> int:
+    """Wire code of a robot state (RobotState, its value or its name)."""
+    name = getattr(state, 'name', None) or str(getattr(state, 'value', state))
+    return _STATE_INDEX.get(name.upper(), UNKNOWN_STATE)
+
+
+class RobotWireEncoder:
+    """
+    Encodes robot kinematics into binary frames.
+
+    Keeps the robot id table and each robot's last position and heading, so
+    one encoder should produce the stream all receivers of a frame share.
+    """
+
+    def __init__(self):
+        self.sequence = 0
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._last: Dict[str, Tuple[float, float, int]] = {}  # Robot id -> (x, y, heading)
+        self._lock = threading.Lock()
+        self.stats = {'frames': 0, 'bytes': 0, 'id_tables': 0}
+
+    @property
+    def robot_ids(self) -> List[str]:
+        """Robot ids in record index order."""
+        return list(self._ids)
+
+    def encode(self, robots: Iterable[Dict[str, Any]], simulation_time: float = 0.0,
+               with_ids: bool = False) -> bytes:
+        """
+        Encode one frame.
+
+        Args:
+            robots: Robot kinematics, each {'id', 'x', 'y', 'state'}
+            simulation_time: Simulation time of the frame
+            with_ids: Include the id table even if no robot was added
+
+        Returns:
+            Frame bytes
+
+        Raises:
+            ValueError: If there are more than 65535 robots or an id is
+                longer than 255 bytes
+        """
+        robots = list(robots)
+        if len(robots) > _MAX_ROBOTS:
+            raise ValueError(f"At most {_MAX_ROBOTS} robots per frame, got {len(robots)}")
+
+        with self._lock:
+            new_ids = [robot['id'] for robot in robots if robot['id'] not in self._index]
+            for robot_id in new_ids:
+                if len(self._ids) >= _MAX_ROBOTS:
+                    raise ValueError(f"At most {_MAX_ROBOTS} robot ids per stream")
+                self._index[robot_id] = len(self._ids)
+                self._ids.append(robot_id)
+
+            flags = 0
+            parts = []
+            if new_ids or with_ids:
+                flags |= FLAG_ID_TABLE
+                parts.append(self._encode_id_table())
+                self.stats['id_tables'] += 1
+
+            records = bytearray(RECORD.size * len(robots))
+            for slot, robot in enumerate(robots):
+                robot_id = robot['id']
+                x, y = float(robot['x']), float(robot['y'])
+                heading = self._heading(robot_id, x, y)
+                RECORD.pack_into(records, slot * RECORD.size, self._index[robot_id], x, y,
+                                 state_code(robot.get('state')), 0, heading)
+            parts.append(bytes(records))
+
+            self.sequence = (self.sequence + 1) & 0xFFFFFFFF
+            frame = HEADER.pack(MAGIC, WIRE_VERSION, flags, self.sequence, float(simulation_time),
+                                len(robots)) + b''.join(parts)
+            self.stats['frames'] += 1
+            self.stats['bytes'] += len(frame)
+            return frame
+
+    def _encode_id_table(self) -> bytes:
+        table = bytearray(struct.pack('<H', len(self._ids)))
+        for robot_id in self._ids:
+            encoded = robot_id.encode('utf-8')
+            if len(encoded) > 255:
+                raise ValueError(f"Robot id longer than 255 bytes: {robot_id[:32]}...")
+            table.append(len(encoded))
+            table += encoded
+        return bytes(table)
+
+    def _heading(self, robot_id: str, x: float, y: float) -> int:
+        """Heading of the move since the last frame; unchanged while stationary."""
+        last = self._last.get(robot_id)
+        heading = last[2] if last is not None else 0
+        if last is not None and (x != last[0] or y != last[1]):
+            degrees = math.degrees(math.atan2(y - last[1], x - last[0])) % 360.0
+            heading = int(round(degrees * 100)) % 36000
+        self._last[robot_id] = (x, y, heading)
+        return heading
+
+
+def decode_robot_frame(data: bytes, robot_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Decode a frame (the Python counterpart of decodeRobotFrame() in robot.js).
+
+    Args:
+        data: Frame bytes
+        robot_ids: Id table from an earlier frame, used if this one has none
+
+    Returns:
+        {'sequence', 'time', 'robot_ids', 'robots': [{'id', 'x', 'y', 'state', 'heading'}]}
+
+    Raises:
+        ValueError: If the frame is malformed or of another wire version
+    """
+    view = memoryview(data)
+    if len(view) < HEADER.size:
+        raise ValueError(f"Robot frame too short: {len(view)} bytes")
+    magic, version, flags, sequence, simulation_time, count = HEADER.unpack_from(view, 0)
+    if magic != MAGIC or version != WIRE_VERSION:
+        raise ValueError(f"Not a version {WIRE_VERSION} robot frame")
+
+    offset = HEADER.size
+    ids = list(robot_ids or [])
+    try:
+        if flags & FLAG_ID_TABLE:
+            (id_count,) = struct.unpack_from('<H', view, offset)
+            offset += 2
+            ids = []
+            for _ in range(id_count):
+                length = view[offset]
+                ids.append(bytes(view[offset + 1:offset + 1 + length]).decode('utf-8'))
+                offset += 1 + length
+
+        robots = []
+        for index, x, y, code, _, heading in RECORD.iter_unpack(view[offset:offset + count * RECORD.size]):
+            robots.append({
+                'id': ids[index] if index < len(ids) else None,
+                'x': x,
+                'y': y,
+                'state': STATE_CODES[code] if code < len(STATE_CODES) else 'UNKNOWN',
+                'heading': heading / 100.0
+            })
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Truncated robot frame: {e}") from e
+    if len(robots) != count:
+        raise ValueError(f"Truncated robot frame: {len(robots)} of {count} records")
+
+    return {'sequence': sequence, 'time': simulation_time, 'robot_ids': ids, 'robots': robots}
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tick-scoped snapshot cache for Roibot Warehouse Visualization Interface
+Computes each streamed topic (robots, orders, KPIs, ...) and encodes it to
+JSON bytes at most once per engine tick, so REST requests and every socket
+client share one copy instead of rebuilding it per caller.
+
+A tick is identified by a tick source (e.g. the head sequence of the engine
+thread's StateChannel, which moves whenever the engine publishes new state),
+or entries are dropped with invalidate() when their topic is pushed as
+changed. Entries also expire after max_age seconds so state nothing reports
+(e.g. analytics) is never staler than that.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+
+class TopicSnapshot(NamedTuple):
+    """One topic's data, its JSON encoding and a content ETag."""
+    data: Any
+    body: bytes
+    etag: str
+    tick: Any
+    created: float
+
+
+def encode_json(data: Any) -> bytes:
+    """Encode data as compact JSON bytes (non-JSON values become strings)."""
+    return json.dumps(data, separators=(',', ':'), default=str).encode('utf-8')
+
+
+class SnapshotCache:
+    """
+    Per-tick cache of topic data and its encoded bytes.
+
+    get() computes a topic on the first call of a tick and returns the same
+    TopicSnapshot to every later caller of that tick. The ETag depends only on
+    the content, so a client revalidating across ticks in which nothing
+    changed still gets a match.
+    """
+
+    def __init__(self, producers: Dict[str, Callable[[], Any]],
+                 tick_source: Optional[Callable[[], Any]] = None, max_age: float = 0.1):
+        """
+        Initialize snapshot cache.
+
+        Args:
+            producers: Topic name -> function computing the topic's data
+            tick_source: Function returning the current tick id (None: entries
+                only expire by age)
+            max_age: Seconds an entry stays valid within one tick
+
+        Raises:
+            ValueError: If max_age is negative
+        """
+        if max_age < 0:
+            raise ValueError(f"max_age must not be negative, got {max_age}")
+
+        self.producers = dict(producers)
+        self.tick_source = tick_source
+        self.max_age = max_age
+        self._entries: Dict[str, TopicSnapshot] = {}
+        self._locks = {topic: threading.Lock() for topic in self.producers}
+        self.stats = {'hits': 0, 'misses': 0, 'encoded_bytes': 0}
+
+    def get(self, topic: str) -> TopicSnapshot:
+        """
+        Current snapshot of a topic.
+
+        Raises:
+            KeyError: If the topic has no producer
+        """
+        producer = self.producers[topic]
+        snapshot = self._entries.get(topic)
+        if snapshot is not None and self._is_fresh(snapshot):
+            self.stats['hits'] += 1
+            return snapshot
+
+        # One thread computes a stale topic; concurrent callers wait and reuse it
+        with self._locks[topic]:
+            snapshot = self._entries.get(topic)
+            if snapshot is not None and self._is_fresh(snapshot):
+                self.stats['hits'] += 1
+                return snapshot
+
+            tick = self._tick()
+            data = producer()
+            body = encode_json(data)
+            etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+            snapshot = TopicSnapshot(data, body, etag, tick, time.monotonic())
+            self._entries[topic] = snapshot
+            self.stats['misses'] += 1
+            self.stats['encoded_bytes'] += len(body)
+            return snapshot
+
+    def data(self, topic: str) -> Any:
+        """Current data of a topic (shared: treat as read-only)."""
+        return self.get(topic).data
+
+    def invalidate(self, topic: Optional[str] = None) -> None:
+        """Drop one topic, or every topic, so the next get() recomputes it."""
+        if topic is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(topic, None)
+
+    def _tick(self) -> Any:
+        return self.tick_source() if self.tick_source is not None else None
+
+    def _is_fresh(self, snapshot: TopicSnapshot) -> bool:
+        return snapshot.tick == self._tick() and time.monotonic() - snapshot.created <= self.max_age
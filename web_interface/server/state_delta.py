@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Delta-encoded state streaming for Roibot Warehouse Visualization Interface
+Keeps a versioned model of the state shown to web clients and produces, per
+client, the changes since the last version that client acknowledged instead
+of a full snapshot on every tick.
+
+State is held as topics, each a flat map of key -> value:
+    simulation      simulation state fields
+    robots          robot id -> robot data
+    orders          order id -> order data
+    order_summary   order status counts
+    kpis            KPI name -> value
+    inventory       item id -> stock data
+
+Frame format (JSON-serializable):
+    {'version': 12, 'base': 10, 'keyframe': False,
+     'topics': {'robots': {'set': {'ROBOT_001': {...}}, 'del': []}, ...}}
+
+A keyframe ('keyframe': True, 'base': None) carries every topic in full and
+replaces the client's state. A delta applies to any client state at a version
+between 'base' and 'version': set values are absolute and deletes idempotent,
+so re-applying changes the client already has is harmless. Clients may
+receive only some topics; their frames then leave the other topics out.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+TOPICS = ('simulation', 'robots', 'orders', 'order_summary', 'kpis', 'inventory')
+
+_MISSING = object()
+
+
+def snapshot_topics(simulation_state: Dict[str, Any], robot_data: List[Dict[str, Any]],
+                    order_data: Dict[str, Any], kpi_data: Dict[str, Any],
+                    inventory_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Convert DataBridge getter results into keyed topic maps.
+
+    Args:
+        simulation_state: get_simulation_state() result
+        robot_data: get_robot_data() result
+        order_data: get_order_data() result
+        kpi_data: get_kpi_data() result
+        inventory_data: get_inventory_data() result
+
+    Returns:
+        Topic name -> flat map of key -> value
+    """
+    orders = order_data.get('orders', [])
+    return {
+        'simulation': dict(simulation_state),
+        'robots': {robot['id']: robot for robot in robot_data},
+        'orders': {order['id']: order for order in orders},
+        'order_summary': {key: order_data.get(key, 0) for key in ('pending', 'in_progress', 'completed', 'total')},
+        'kpis': dict(kpi_data),
+        'inventory': dict(inventory_data.get('inventory', {})),
+    }
+
+
+def diff_topic(old: Dict[str, Any], new: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Changes turning one topic map into another.
+
+    Returns:
+        {'set': changed or added entries, 'del': removed keys}, or None if equal
+    """
+    changed = {key: value for key, value in new.items() if old.get(key, _MISSING) != value}
+    removed = [key for key in old if key not in new]
+    if not changed and not removed:
+        return None
+    return {'set': changed, 'del': removed}
+
+
+class StateDeltaEncoder:
+    """
+    Versioned state model producing per-client deltas.
+
+    commit() records a new version holding only the topics that changed since
+    the previous one. frame_for() returns, for one client, the merged changes
+    since the version it last acknowledged, or a keyframe when the client has
+    no usable base: it is new, asked to resync, fell behind the retained
+    history, or has not had a keyframe for keyframe_interval versions.
+    Clients that already hold the current version get nothing, so idle ticks
+    cost no bandwidth.
+    """
+
+    def __init__(self, keyframe_interval: int = 100, history: Optional[int] = None):
+        """
+        Initialize state delta encoder.
+
+        Args:
+            keyframe_interval: Versions between periodic keyframes per client
+            history: Versions of changes retained for lagging clients
+                (default: keyframe_interval)
+
+        Raises:
+            ValueError: If keyframe_interval or history is less than 1
+        """
+        if keyframe_interval < 1:
+            raise ValueError(f"keyframe_interval must be at least 1, got {keyframe_interval}")
+        if history is None:
+            history = keyframe_interval
+        if history < 1:
+            raise ValueError(f"history must be at least 1, got {history}")
+
+        self.keyframe_interval = keyframe_interval
+        self.version = 0
+        self._state: Dict[str, Dict[str, Any]] = {topic: {} for topic in TOPICS}
+        self._history = deque(maxlen=history)  # (version, {topic: change})
+        self._clients: Dict[str, Dict[str, Optional[int]]] = {}
+        # Frames for the current version by (base, topics)
+        self._frames: Dict[Tuple[Optional[int], Optional[FrozenSet[str]]], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.stats = {'versions': 0, 'keyframes': 0, 'deltas': 0, 'resyncs': 0, 'dropped': 0}
+
+    def commit(self, topics: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Record the current state.
+
+        Args:
+            topics: Topic name -> map (see snapshot_topics()); topics left
+                out are unchanged
+
+        Returns:
+            Current version (unchanged if nothing changed)
+        """
+        with self._lock:
+            changes = {}
+            for topic, values in topics.items():
+                change = diff_topic(self._state.get(topic, {}), values)
+                if change is not None:
+                    changes[topic] = change
+                    self._state[topic] = values
+            if changes:
+                self.version += 1
+                self._history.append((self.version, changes))
+                self._frames = {}
+                self.stats['versions'] += 1
+            return self.version
+
+    def frame_for(self, client_id: str, topics: Optional[FrozenSet[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Next frame for a client.
+
+        Unknown clients are registered and get a keyframe.
+
+        Args:
+            client_id: Client to build the frame for
+            topics: Topics the client receives (None: all); changing a
+                client's topics needs request_keyframe()
+
+        Returns:
+            Frame dict, or None if the client already has the current version
+            of its topics
+        """
+        with self._lock:
+            client = self._clients.setdefault(client_id, {'acked': None, 'sent': None, 'keyframe': None})
+            if client['sent'] == self.version:
+                return None
+
+            base = client['acked']
+            if base is None:
+                # Until the first ack arrives, build on the keyframe just sent
+                base = client['keyframe']
+            keyframe_due = client['keyframe'] is None or self.version - client['keyframe'] >= self.keyframe_interval
+            if base is None or keyframe_due or not self._covers(base):
+                base = None
+
+            frame = self._frames.get((base, topics))
+            if frame is None:
+                frame = self._frames.get((base, None))
+                if frame is None:
+                    frame = self._frames[(base, None)] = self._build_frame(base)
+                if topics is not None:
+                    frame = dict(frame, topics={topic: change for topic, change in frame['topics'].items()
+                                                if topic in topics})
+                    self._frames[(base, topics)] = frame
+            client['sent'] = self.version
+
+            if base is not None and not frame['topics']:
+                # None of the client's topics changed: it already holds this version
+                if base == client['acked']:
+                    client['acked'] = self.version
+                return None
+            if base is None:
+                client['keyframe'] = self.version
+                self.stats['keyframes'] += 1
+            else:
+                self.stats['deltas'] += 1
+            return frame
+
+    def frame_dropped(self, client_id: str, frame: Dict[str, Any]) -> None:
+        """
+        Record that a frame from frame_for() was never sent to a client.
+
+        The client's next frame is then built again from what it holds; a
+        dropped keyframe is replaced by a new keyframe.
+        """
+        with self._lock:
+            client = self._clients.get(client_id)
+            if client is None:
+                return
+            if frame['keyframe'] and client['keyframe'] == frame['version']:
+                client['keyframe'] = None
+            client['sent'] = None
+            self.stats['dropped'] += 1
+
+    def acknowledge(self, client_id: str, version: int) -> None:
+        """Record that a client has applied every frame up to version."""
+        with self._lock:
+            client = self._clients.get(client_id)
+            if client is None or not isinstance(version, int) or version > self.version:
+                return
+            if client['acked'] is None or version > client['acked']:
+                client['acked'] = version
+
+    def request_keyframe(self, client_id: str) -> None:
+        """Send a keyframe to a client on its next frame (resync)."""
+        with self._lock:
+            self._clients[client_id] = {'acked': None, 'sent': None, 'keyframe': None}
+            self.stats['resyncs'] += 1
+
+    def remove_client(self, client_id: str) -> None:
+        """Forget a disconnected client."""
+        with self._lock:
+            self._clients.pop(client_id, None)
+
+    def _covers(self, base: int) -> bool:
+        """True if the retained history holds every change after base."""
+        if base == self.version:
+            return True
+        return bool(self._history) and self._history[0][0] <= base + 1
+
+    def _build_frame(self, base: Optional[int]) -> Dict[str, Any]:
+        """Keyframe (base None) or merged changes since base."""
+        if base is None:
+            topics = {topic: {'set': values, 'del': []} for topic, values in self._state.items()}
+            return {'version': self.version, 'base': None, 'keyframe': True, 'topics': topics}
+
+        merged: Dict[str, Dict[str, Any]] = {}
+        for version, changes in self._history:
+            if version <= base:
+                continue
+            for topic, change in changes.items():
+                topic_changes = merged.setdefault(topic, {'set': {}, 'del': set()})
+                for key in change['del']:
+                    topic_changes['set'].pop(key, None)
+                    topic_changes['del'].add(key)
+                for key, value in change['set'].items():
+                    topic_changes['del'].discard(key)
+                    topic_changes['set'][key] = value
+
+        topics = {topic: {'set': change['set'], 'del': sorted(change['del'])} for topic, change in merged.items()}
+        return {'version': self.version, 'base': base, 'keyframe': False, 'topics': topics}
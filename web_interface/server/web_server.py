@@ -14,7 +14,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-from flask import Flask, render_template, jsonify, request, send_from_directory, send_file
+from flask import Flask, Response, render_template, jsonify, request, send_from_directory, send_file
 from flask_socketio import SocketIO, emit, disconnect
 import psutil
 
@@ -22,6 +22,8 @@ import psutil
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from web_interface.server.state_delta import StateDeltaEncoder
+
 # Import simulation components
 try:
     from core.engine import SimulationEngine
@@ -98,6 +100,15 @@ class WebServer:
         self.connected_clients = set()
         self.last_update = time.time()
         
+        # Versioned state: clients get changes since their last acknowledged version
+        self.state_stream = StateDeltaEncoder(keyframe_interval=100)
+        
+        # Clients receiving robot positions as binary frames, and those still needing the id table
+        # (guarded by robot_frame_lock: socket handlers and the push listener run on different threads)
+        self.robot_frame_clients = set()
+        self.robot_frame_new_clients = set()
+        self.robot_frame_lock = threading.Lock()
+        
         # Setup routes and WebSocket handlers
         self.setup_routes()
         self.setup_websocket_handlers()
@@ -122,27 +133,27 @@ class WebServer:
         @self.app.route('/api/status')
         def get_status():
             """Get current simulation status"""
-            return jsonify(self.get_simulation_status())
+            return self.snapshot_response('simulation_state', self.get_simulation_status)
         
         @self.app.route('/api/robots')
         def get_robots():
             """Get robot data"""
-            return jsonify(self.get_robot_data())
+            return self.snapshot_response('robot_data', self.get_robot_data)
         
         @self.app.route('/api/orders')
         def get_orders():
             """Get order data"""
-            return jsonify(self.get_order_data())
+            return self.snapshot_response('order_data', self.get_order_data)
         
         @self.app.route('/api/kpis')
         def get_kpis():
             """Get KPI data"""
-            return jsonify(self.get_kpi_data())
+            return self.snapshot_response('kpi_data', self.get_kpi_data)
         
         @self.app.route('/api/warehouse')
         def get_warehouse():
             """Get warehouse layout data"""
-            return jsonify(self.get_warehouse_data())
+            return self.snapshot_response('warehouse_data', self.get_warehouse_data)
         
         @self.app.route('/api/command', methods=['POST'])
         def handle_command():
@@ -295,8 +306,36 @@ class WebServer:
             """Handle client disconnection"""
             client_id = request.sid
             self.connected_clients.discard(client_id)
+            self.state_stream.remove_client(client_id)
+            with self.robot_frame_lock:
+                self.robot_frame_clients.discard(client_id)
+                self.robot_frame_new_clients.discard(client_id)
             print(f"Client disconnected: {client_id}")
         
+        @self.socketio.on('state_ack')
+        def handle_state_ack(data):
+            """Handle a client confirming it applied state frames up to a version"""
+            self.state_stream.acknowledge(request.sid, (data or {}).get('version'))
+        
+        @self.socketio.on('state_resync')
+        def handle_state_resync(data=None):
+            """Handle a client asking for a full state keyframe"""
+            self.state_stream.request_keyframe(request.sid)
+            print(f"🔄 Client {request.sid} requested a state keyframe")
+        
+        @self.socketio.on('robot_stream')
+        def handle_robot_stream(data=None):
+            """Handle a client choosing binary ('binary') or JSON ('json') robot positions"""
+            client_id = request.sid
+            with self.robot_frame_lock:
+                if (data or {}).get('format') == 'binary':
+                    # (Re)sends the id table, also used by clients that lost it
+                    self.robot_frame_clients.add(client_id)
+                    self.robot_frame_new_clients.add(client_id)
+                else:
+                    self.robot_frame_clients.discard(client_id)
+                    self.robot_frame_new_clients.discard(client_id)
+        
         @self.socketio.on('command')
         def handle_command(data):
             """Handle client commands"""
@@ -336,6 +375,17 @@ class WebServer:
             print(f"❌ Failed to initialize simulation: {e}")
             return False
     
+    def snapshot_response(self, topic: str, fallback) -> Response:
+        """JSON response from the per-tick snapshot cache, answering If-None-Match with 304"""
+        if not getattr(self, 'data_bridge', None):
+            return jsonify(fallback())
+        
+        snapshot = self.data_bridge.get_snapshot(topic)
+        response = Response(snapshot.body, mimetype='application/json')
+        response.set_etag(snapshot.etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
+    
     def get_simulation_status(self) -> Dict[str, Any]:
         """Get current simulation status"""
         if not self.data_bridge:
@@ -346,14 +396,14 @@ class WebServer:
                 'error': 'Data bridge not connected'
             }
         
-        return self.data_bridge.get_simulation_state()
+        return self.data_bridge.get_snapshot('simulation_state').data
     
     def get_robot_data(self) -> List[Dict[str, Any]]:
         """Get robot data for visualization"""
         if not self.data_bridge:
             return []
         
-        return self.data_bridge.get_robot_data()
+        return self.data_bridge.get_snapshot('robot_data').data
     
     def get_order_data(self) -> Dict[str, Any]:
         """Get order data for visualization"""
@@ -366,7 +416,7 @@ class WebServer:
                 'orders': []
             }
         
-        return self.data_bridge.get_order_data()
+        return self.data_bridge.get_snapshot('order_data').data
     
     def get_kpi_data(self) -> Dict[str, Any]:
         """Get KPI data for dashboard"""
@@ -379,7 +429,7 @@ class WebServer:
                 'queue_length': 0
             }
         
-        return self.data_bridge.get_kpi_data()
+        return self.data_bridge.get_snapshot('kpi_data').data
     
     def get_warehouse_data(self) -> Dict[str, Any]:
         """Get warehouse layout data"""
@@ -391,7 +441,7 @@ class WebServer:
                 'racks': list(range(1, 21))
             }
         
-        return self.data_bridge.get_warehouse_data()
+        return self.data_bridge.get_snapshot('warehouse_data').data
     
     def execute_command(self, command: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Execute simulation command"""
@@ -408,17 +458,41 @@ class WebServer:
         else:
             print(f"⚠️  No connected clients to broadcast {event_type}")
     
+    def broadcast_state_deltas(self):
+        """Send each connected client the state changes since its last acknowledged version"""
+        self.state_stream.commit(self.data_bridge.get_state_topics())
+        
+        # Clients at the same base share a frame; emit it once so it is encoded once
+        recipients = {}
+        for client_id in list(self.connected_clients):
+            frame = self.state_stream.frame_for(client_id)
+            if frame is not None:
+                recipients.setdefault(id(frame), (frame, []))[1].append(client_id)
+        for frame, client_ids in recipients.values():
+            self.socketio.emit('state_delta', frame, to=client_ids)
+    
     def start_update_loop(self):
-        """Start periodic update loop"""
+        """Start pushing updates to clients"""
+        if getattr(self, 'data_bridge', None) and hasattr(self.data_bridge, 'subscribe_pushes'):
+            # Push-driven: the data bridge reports changed topics at their max rates,
+            # so nothing is sent while the simulation is idle
+            self.data_bridge.subscribe_pushes(self.handle_pushed_topics)
+            self.data_bridge.change_pusher.start()
+            return
+        
         def update_loop():
             while not self.shutdown_event.is_set():
                 try:
                     # Broadcast updates every 100ms (10 FPS)
-                    self.broadcast_update('simulation_state', self.get_simulation_status())
-                    self.broadcast_update('robot_data', self.get_robot_data())
-                    self.broadcast_update('order_data', self.get_order_data())
-                    self.broadcast_update('kpi_data', self.get_kpi_data())
-                    self.broadcast_update('warehouse_data', self.get_warehouse_data())
+                    if getattr(self, 'data_bridge', None):
+                        # Warehouse layout is static and sent on connect
+                        self.broadcast_state_deltas()
+                    else:
+                        self.broadcast_update('simulation_state', self.get_simulation_status())
+                        self.broadcast_update('robot_data', self.get_robot_data())
+                        self.broadcast_update('order_data', self.get_order_data())
+                        self.broadcast_update('kpi_data', self.get_kpi_data())
+                        self.broadcast_update('warehouse_data', self.get_warehouse_data())
                     
                     time.sleep(0.1)  # 100ms interval
                     
@@ -429,6 +503,30 @@ class WebServer:
         self.simulation_thread = threading.Thread(target=update_loop, daemon=True)
         self.simulation_thread.start()
     
+    def broadcast_robot_frame(self):
+        """Send robot positions as one binary frame to the clients that chose binary frames"""
+        # Swap out the pending id table requests and snapshot the recipients together,
+        # so a client subscribing meanwhile is not dropped from both
+        with self.robot_frame_lock:
+            new_client_ids, self.robot_frame_new_clients = self.robot_frame_new_clients, set()
+            client_ids = list(self.robot_frame_clients)
+        if not client_ids:
+            return
+        
+        # One frame for everyone; it carries the id table while any client still needs it
+        with_ids = bool(new_client_ids)
+        frame = self.data_bridge.get_robot_frame(with_ids=with_ids)
+        self.socketio.emit('robot_frame', frame, to=client_ids)
+    
+    def handle_pushed_topics(self, topics):
+        """Data bridge push listener: send clients the state that changed"""
+        if not self.connected_clients:
+            return
+        if 'robot_frame' in topics:
+            self.broadcast_robot_frame()
+        if any(topic != 'robot_frame' for topic in topics):
+            self.broadcast_state_deltas()
+    
     def start(self):
         """Start the web server"""
         print(f"🚀 Starting Roibot Web Server on {self.host}:{self.port}")
@@ -464,6 +562,10 @@ class WebServer:
         if self.simulation_thread:
             self.simulation_thread.join(timeout=5)
         
+        data_bridge = getattr(self, 'data_bridge', None)
+        if data_bridge is not None and hasattr(data_bridge, 'shutdown'):
+            data_bridge.shutdown()
+        
         print("✅ Web server shutdown complete")
 
 def main():
@@ -5,17 +5,35 @@ Provides real-time data streaming with efficient updates and error handling
 """
 
 import json
+import sys
 import time
 import asyncio
 import threading
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
 from datetime import datetime
 import logging
 
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from web_interface.server.client_outbox import ClientOutbox
+from web_interface.server.state_delta import StateDeltaEncoder
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Data types clients can subscribe to, and the state topics (see state_delta.py) each covers
+SUBSCRIPTION_TOPICS = {
+    'simulation_state': ('simulation',),
+    'robot_data': ('robots',),
+    'order_data': ('orders', 'order_summary'),
+    'kpi_data': ('kpis',),
+    'inventory_data': ('inventory',)
+}
+
 class WebSocketHandler:
     """WebSocket handler for real-time data streaming"""
     
@@ -28,6 +46,12 @@ class WebSocketHandler:
         self.max_clients = 100
         self.heartbeat_interval = 30  # 30 seconds
         
+        # Per-client outbound queues: a slow client only delays itself
+        self.max_queue_size = 32
+        self.slow_send_threshold = 0.5  # Seconds for one send before a client counts as slow
+        self.client_outboxes: Dict[str, ClientOutbox] = {}
+        self._stats_lock = threading.Lock()
+        
         # Performance tracking
         self.message_count = 0
         self.last_performance_check = time.time()
@@ -40,6 +64,9 @@ class WebSocketHandler:
         
         # Client socket storage
         self.client_sockets = {}
+        
+        # Versioned state: clients get changes since their last acknowledged version
+        self.state_stream = StateDeltaEncoder(keyframe_interval=100)
     
     def register_client(self, client_id: str, socket):
         """Register a new client connection"""
@@ -51,6 +78,12 @@ class WebSocketHandler:
             self.connected_clients.add(client_id)
             self.client_subscriptions[client_id] = set()
             self.client_sockets[client_id] = socket
+            self.client_outboxes[client_id] = ClientOutbox(
+                lambda message: self.deliver(client_id, socket, message),
+                max_size=self.max_queue_size,
+                on_drop=lambda key, frame: self._on_message_dropped(client_id, key, frame),
+                slow_send=self.slow_send_threshold,
+                name=client_id)
             
             # Update performance stats
             self.performance_stats['clients_connected'] = len(self.connected_clients)
@@ -73,6 +106,10 @@ class WebSocketHandler:
                 del self.client_subscriptions[client_id]
             if client_id in self.client_sockets:
                 del self.client_sockets[client_id]
+            outbox = self.client_outboxes.pop(client_id, None)
+            if outbox is not None:
+                outbox.close()
+            self.state_stream.remove_client(client_id)
             
             # Update performance stats
             self.performance_stats['clients_connected'] = len(self.connected_clients)
@@ -85,29 +122,15 @@ class WebSocketHandler:
     def send_initial_data(self, client_id: str, socket):
         """Send initial data to new client"""
         try:
-            # Send simulation state
-            simulation_state = self.data_bridge.get_simulation_state()
-            self.send_message(socket, 'simulation_state', simulation_state)
-            
-            # Send robot data
-            robot_data = self.data_bridge.get_robot_data()
-            self.send_message(socket, 'robot_data', robot_data)
-            
-            # Send order data
-            order_data = self.data_bridge.get_order_data()
-            self.send_message(socket, 'order_data', order_data)
-            
-            # Send KPI data
-            kpi_data = self.data_bridge.get_kpi_data()
-            self.send_message(socket, 'kpi_data', kpi_data)
-            
-            # Send warehouse data
-            warehouse_data = self.data_bridge.get_warehouse_data()
-            self.send_message(socket, 'warehouse_data', warehouse_data)
-            
-            # Send inventory data
-            inventory_data = self.data_bridge.get_inventory_data()
-            self.send_message(socket, 'inventory_data', inventory_data)
+            # Snapshots are shared with every other client and REST request of this tick,
+            # and their encoded bodies are reused as is
+            outbox = self.client_outboxes.get(client_id)
+            if outbox is None:
+                return
+            for event_type in ('simulation_state', 'robot_data', 'order_data', 'kpi_data',
+                               'warehouse_data', 'inventory_data'):
+                outbox.put(self.encode_snapshot_message(event_type, self.data_bridge.get_snapshot(event_type)),
+                           key=event_type)
             
             logger.info(f"✅ Initial data sent to client {client_id}")
             
@@ -117,28 +140,78 @@ class WebSocketHandler:
     def send_message(self, socket, event_type: str, data: Dict[str, Any]):
         """Send message to client"""
         try:
-            # Convert data to JSON-serializable format
-            serializable_data = self._make_json_serializable(data)
-            
-            message = {
-                'type': event_type,
-                'data': serializable_data,
-                'timestamp': time.time()
-            }
-            
-            message_json = json.dumps(message)
-            socket.send(message_json)
-            
-            # Update performance stats
+            self.send_encoded(socket, self.encode_message(event_type, data))
+        except Exception as e:
+            logger.error(f"❌ Error sending message to client: {e}")
+            self.performance_stats['error_count'] += 1
+    
+    def encode_message(self, event_type: str, data: Dict[str, Any]) -> str:
+        """Encode a message once so it can be sent to any number of clients"""
+        # Convert data to JSON-serializable format
+        serializable_data = self._make_json_serializable(data)
+        
+        message = {
+            'type': event_type,
+            'data': serializable_data,
+            'timestamp': time.time()
+        }
+        
+        return json.dumps(message)
+    
+    def encode_snapshot_message(self, event_type: str, snapshot) -> str:
+        """Wrap a cached snapshot's JSON body in a message without serializing its data again"""
+        return (f'{{"type": {json.dumps(event_type)}, "data": {snapshot.body.decode("utf-8")}, '
+                f'"timestamp": {time.time()!r}}}')
+    
+    def send_encoded(self, socket, message_json: str):
+        """Send an already encoded message to client"""
+        socket.send(message_json)
+        
+        # Update performance stats (sender threads of several clients share them)
+        with self._stats_lock:
             self.message_count += 1
             self.performance_stats['messages_sent'] += 1
             self.performance_stats['average_message_size'] = (
                 (self.performance_stats['average_message_size'] * (self.message_count - 1) + len(message_json)) / self.message_count
             )
-            
+    
+    def deliver(self, client_id: str, socket, message_json: str):
+        """Send a queued message (runs on the client's outbox thread)"""
+        try:
+            self.send_encoded(socket, message_json)
         except Exception as e:
-            logger.error(f"❌ Error sending message to client: {e}")
-            self.performance_stats['error_count'] += 1
+            logger.error(f"❌ Error sending to client {client_id}: {e}")
+            with self._stats_lock:
+                self.performance_stats['error_count'] += 1
+    
+    def queue_message(self, client_id: str, event_type: str, data: Dict[str, Any], key: Optional[str] = None):
+        """Queue a message for one client; a newer message with the same key replaces it if unsent"""
+        outbox = self.client_outboxes.get(client_id)
+        if outbox is not None:
+            outbox.put(self.encode_message(event_type, data), key=key)
+    
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait until every client's queued messages are sent; returns False on timeout"""
+        deadline = time.monotonic() + timeout
+        return all(outbox.flush(max(0.0, deadline - time.monotonic()))
+                   for outbox in list(self.client_outboxes.values()))
+    
+    def wants(self, client_id: str, data_type: str) -> bool:
+        """True if a client receives a data type (clients without subscriptions receive all)"""
+        subscriptions = self.client_subscriptions.get(client_id)
+        return not subscriptions or data_type not in SUBSCRIPTION_TOPICS or data_type in subscriptions
+    
+    def get_state_topics_for(self, client_id: str):
+        """State topics a client receives (None: all)"""
+        subscriptions = self.client_subscriptions.get(client_id)
+        if not subscriptions:
+            return None
+        return frozenset(topic for data_type in subscriptions for topic in SUBSCRIPTION_TOPICS[data_type])
+    
+    def _on_message_dropped(self, client_id: str, key: str, frame):
+        """Outbox drop callback: a dropped state frame must be rebuilt from what the client holds"""
+        if key == 'state_delta' and frame is not None:
+            self.state_stream.frame_dropped(client_id, frame)
     
     def _make_json_serializable(self, obj):
         """Convert object to JSON-serializable format"""
@@ -156,7 +229,7 @@ class WebSocketHandler:
             return obj
     
     def broadcast_message(self, event_type: str, data: Dict[str, Any]):
-        """Broadcast message to all connected clients"""
+        """Queue a message for every connected client subscribed to its data type"""
         if not self.connected_clients:
             return
         
@@ -169,19 +242,15 @@ class WebSocketHandler:
         message_json = json.dumps(message)
         disconnected_clients = set()
         
-        for client_id in self.connected_clients:
-            try:
-                # Get socket from client_id (this would need to be implemented based on your WebSocket framework)
-                # For now, we'll use a placeholder
-                socket = self.get_socket_for_client(client_id)
-                if socket:
-                    socket.send(message_json)
-                else:
-                    disconnected_clients.add(client_id)
-                    
-            except Exception as e:
-                logger.error(f"❌ Error broadcasting to client {client_id}: {e}")
+        for client_id in list(self.connected_clients):
+            if not self.wants(client_id, event_type):
+                continue
+            outbox = self.client_outboxes.get(client_id)
+            if outbox is None or not self.get_socket_for_client(client_id):
                 disconnected_clients.add(client_id)
+                continue
+            # Only the newest message of a data type is worth sending
+            outbox.put(message_json, key=event_type)
         
         # Clean up disconnected clients
         for client_id in disconnected_clients:
@@ -198,15 +267,20 @@ class WebSocketHandler:
             data = message.get('data', {})
             
             if message_type == 'subscribe':
-                # Handle subscription to specific data types
-                data_types = data.get('data_types', [])
+                # Handle subscription to specific data types, optionally with a max update rate
+                data_types = self._valid_data_types(client_id, data.get('data_types', []))
                 self.client_subscriptions[client_id].update(data_types)
+                if 'max_rate' in data:
+                    self.set_client_max_rate(client_id, data['max_rate'])
+                # Topics changed: the next state frame is a keyframe of the new topics
+                self.state_stream.request_keyframe(client_id)
                 logger.info(f"Client {client_id} subscribed to: {data_types}")
                 
             elif message_type == 'unsubscribe':
                 # Handle unsubscription from specific data types
-                data_types = data.get('data_types', [])
+                data_types = self._valid_data_types(client_id, data.get('data_types', []))
                 self.client_subscriptions[client_id].difference_update(data_types)
+                self.state_stream.request_keyframe(client_id)
                 logger.info(f"Client {client_id} unsubscribed from: {data_types}")
                 
             elif message_type == 'command':
@@ -217,23 +291,28 @@ class WebSocketHandler:
                 result = self.data_bridge.execute_command(command, params)
                 
                 # Send command response back to client
-                socket = self.get_socket_for_client(client_id)
-                if socket:
-                    self.send_message(socket, 'command_response', {
-                        'command': command,
-                        'result': result,
-                        'timestamp': time.time()
-                    })
+                self.queue_message(client_id, 'command_response', {
+                    'command': command,
+                    'result': result,
+                    'timestamp': time.time()
+                })
                 
                 logger.info(f"Client {client_id} executed command: {command}")
                 
+            elif message_type == 'state_ack':
+                # Client applied every state frame up to this version
+                self.state_stream.acknowledge(client_id, data.get('version'))
+                
+            elif message_type == 'state_resync':
+                # Client lost track of the state; its next frame is a keyframe
+                self.state_stream.request_keyframe(client_id)
+                logger.info(f"Client {client_id} requested a state keyframe")
+                
             elif message_type == 'ping':
                 # Handle ping for connection health
-                socket = self.get_socket_for_client(client_id)
-                if socket:
-                    self.send_message(socket, 'pong', {
-                        'timestamp': time.time()
-                    })
+                self.queue_message(client_id, 'pong', {
+                    'timestamp': time.time()
+                })
                 
             else:
                 logger.warning(f"Unknown message type from client {client_id}: {message_type}")
@@ -241,18 +320,39 @@ class WebSocketHandler:
         except Exception as e:
             logger.error(f"❌ Error handling message from client {client_id}: {e}")
     
+    def _valid_data_types(self, client_id: str, data_types) -> List[str]:
+        """Subscribable data types among those a client sent (others are ignored)"""
+        unknown = [data_type for data_type in data_types if data_type not in SUBSCRIPTION_TOPICS]
+        if unknown:
+            logger.warning(f"Client {client_id} sent unknown data types: {unknown}")
+        return [data_type for data_type in data_types if data_type in SUBSCRIPTION_TOPICS]
+    
+    def set_client_max_rate(self, client_id: str, max_rate: Optional[float]):
+        """Limit a client to max_rate updates per second (None: no limit)"""
+        outbox = self.client_outboxes.get(client_id)
+        if outbox is None:
+            return
+        try:
+            outbox.set_max_rate(float(max_rate) if max_rate is not None else None)
+            logger.info(f"Client {client_id} max update rate: {max_rate}")
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Client {client_id} sent an invalid max rate {max_rate!r}: {e}")
+    
     def start_update_loop(self):
         """Start the update loop for real-time data streaming"""
         self.is_running = True
         
+        if hasattr(self.data_bridge, 'subscribe_pushes'):
+            # Push-driven: broadcast only when the data bridge reports changed topics
+            self.data_bridge.subscribe_pushes(self.handle_pushed_topics)
+            logger.info("✅ WebSocket updates subscribed to data bridge pushes")
+            return
+        
         def update_loop():
             while self.is_running:
                 try:
                     # Update performance stats
-                    current_time = time.time()
-                    if current_time - self.last_performance_check >= 60:  # Every minute
-                        self.update_performance_stats()
-                        self.last_performance_check = current_time
+                    self.check_performance_stats()
                     
                     # Broadcast updates to all clients
                     self.broadcast_updates()
@@ -272,24 +372,57 @@ class WebSocketHandler:
     def stop_update_loop(self):
         """Stop the update loop"""
         self.is_running = False
+        if hasattr(self.data_bridge, 'unsubscribe_pushes'):
+            self.data_bridge.unsubscribe_pushes(self.handle_pushed_topics)
         logger.info("🛑 WebSocket update loop stopped")
     
+    def handle_pushed_topics(self, topics: Set[str]):
+        """Data bridge push listener: broadcast the state that changed"""
+        if not self.is_running or topics == {'robot_frame'}:
+            return  # Binary robot frames are only streamed over Socket.IO
+        self.check_performance_stats()
+        self.broadcast_updates()
+    
+    def check_performance_stats(self):
+        """Update performance stats once a minute"""
+        current_time = time.time()
+        if current_time - self.last_performance_check >= 60:  # Every minute
+            self.update_performance_stats()
+            self.last_performance_check = current_time
+    
     def broadcast_updates(self):
         """Broadcast real-time updates to all clients"""
         try:
-            # Get current data from data bridge
-            simulation_state = self.data_bridge.get_simulation_state()
-            robot_data = self.data_bridge.get_robot_data()
-            order_data = self.data_bridge.get_order_data()
-            kpi_data = self.data_bridge.get_kpi_data()
-            inventory_data = self.data_bridge.get_inventory_data()
+            # Record the current state as a new version (if anything changed)
+            self.state_stream.commit(self.data_bridge.get_state_topics())
             
-            # Broadcast to all clients
-            self.broadcast_message('simulation_state', simulation_state)
-            self.broadcast_message('robot_data', robot_data)
-            self.broadcast_message('order_data', order_data)
-            self.broadcast_message('kpi_data', kpi_data)
-            self.broadcast_message('inventory_data', inventory_data)
+            # Queue for each client the changes to its topics since its last acknowledged
+            # version; clients at the same base and topics share a frame, encoded once.
+            # An unsent older frame is stale: drop it and build the new one from what
+            # the client holds, so slow clients skip frames instead of stalling the loop
+            disconnected_clients = set()
+            encoded_frames = {}
+            for client_id in list(self.connected_clients):
+                outbox = self.client_outboxes.get(client_id)
+                if outbox is None or not self.get_socket_for_client(client_id):
+                    disconnected_clients.add(client_id)
+                    continue
+                queued = outbox.peek('state_delta')
+                if queued is not None and queued['version'] == self.state_stream.version:
+                    continue  # The unsent frame is still current
+                stale = outbox.take('state_delta')
+                if stale is not None:
+                    self.state_stream.frame_dropped(client_id, stale)
+                frame = self.state_stream.frame_for(client_id, self.get_state_topics_for(client_id))
+                if frame is None:
+                    continue
+                message_json = encoded_frames.get(id(frame))
+                if message_json is None:
+                    message_json = encoded_frames[id(frame)] = self.encode_message('state_delta', frame)
+                outbox.put(message_json, key='state_delta', meta=frame)
+            
+            for client_id in disconnected_clients:
+                self.unregister_client(client_id)
             
         except Exception as e:
             logger.error(f"❌ Error broadcasting updates: {e}")
@@ -312,10 +445,16 @@ class WebSocketHandler:
             'max_clients': self.max_clients,
             'update_interval': self.update_interval,
             'performance_stats': self.performance_stats.copy(),
+            'state_stream': {'version': self.state_stream.version, **self.state_stream.stats},
             'client_subscriptions': {
                 client_id: list(subscriptions) 
                 for client_id, subscriptions in self.client_subscriptions.items()
-            }
+            },
+            'client_outboxes': {
+                client_id: outbox.get_statistics()
+                for client_id, outbox in list(self.client_outboxes.items())
+            },
+            'slow_clients': [client_id for client_id, outbox in list(self.client_outboxes.items()) if outbox.slow]
         }
     
     def handle_robot_update(self, robot_data: Dict[str, Any]):
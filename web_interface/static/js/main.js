@@ -26,6 +26,14 @@ class RoibotApp {
         this.socket = null; // Socket.IO client
         this.connected = false;
         
+        // Delta-encoded state: version and topic maps (see state_delta.py)
+        this.stateVersion = null;
+        this.stateTopics = {};
+        
+        // Robot positions as binary frames (see robot_wire.py); ids come in the frames' id table
+        this.useBinaryRobotFrames = typeof DataView !== 'undefined';
+        this.robotIds = [];
+        
         // Performance tracking
         this.frameCount = 0;
         this.lastFpsUpdate = 0;
@@ -227,6 +235,9 @@ class RoibotApp {
                 console.log('✅ Socket.IO connected');
                 this.connected = true;
                 this.updateConnectionStatus(true);
+                if (this.useBinaryRobotFrames) {
+                    this.socket.emit('robot_stream', { format: 'binary' });
+                }
             });
 
             this.socket.on('disconnect', () => {
@@ -251,6 +262,12 @@ class RoibotApp {
             this.socket.on('simulation_state', (data) => {
                 this.updateSimulationState(data);
             });
+            this.socket.on('state_delta', (frame) => {
+                this.applyStateDelta(frame);
+            });
+            this.socket.on('robot_frame', (buffer) => {
+                this.applyRobotFrame(buffer);
+            });
             this.socket.on('warehouse_data', (data) => {
                 // Warehouse layout is static, no need for real-time updates
                 // this.warehouse.update(data); // Removed - warehouse doesn't have update method
@@ -555,6 +572,69 @@ class RoibotApp {
         }
     }
 
+    /**
+     * Apply a state delta or keyframe, acknowledge it and refresh changed views
+     */
+    applyStateDelta(frame) {
+        if (!frame.keyframe && (this.stateVersion === null || this.stateVersion < frame.base)) {
+            // Missing the changes this delta builds on
+            console.warn('⚠️ [Main] State delta out of sequence, requesting keyframe');
+            this.socket.emit('state_resync', {});
+            return;
+        }
+        if (frame.keyframe) {
+            this.stateTopics = {};
+        }
+        
+        for (const [topic, change] of Object.entries(frame.topics)) {
+            const values = this.stateTopics[topic] || (this.stateTopics[topic] = {});
+            for (const key of change.del) {
+                delete values[key];
+            }
+            Object.assign(values, change.set);
+        }
+        this.stateVersion = frame.version;
+        this.socket.emit('state_ack', { version: frame.version });
+        
+        const changed = frame.topics;
+        const topics = this.stateTopics;
+        if (changed.robots && this.robot) {
+            this.robot.update(Object.values(topics.robots));
+        }
+        if ((changed.orders || changed.order_summary) && this.orders) {
+            const orders = Object.values(topics.orders || {});
+            this.orders.update({
+                ...(topics.order_summary || {}),
+                orders: orders,
+                completed_orders: orders.filter(order => order.status === 'completed')
+            });
+        }
+        if (changed.kpis && this.kpis) {
+            this.kpis.update(topics.kpis);
+        }
+        if (changed.simulation) {
+            this.updateSimulationState(topics.simulation);
+        }
+    }
+
+    /**
+     * Decode a binary robot frame and move the robot
+     */
+    applyRobotFrame(buffer) {
+        let frame;
+        try {
+            frame = decodeRobotFrame(buffer, this.robotIds);
+        } catch (error) {
+            console.warn('⚠️ [Main] Invalid robot frame, switching to JSON positions:', error);
+            this.useBinaryRobotFrames = false;
+            if (this.robot) this.robot.binaryPositions = false;
+            this.socket.emit('robot_stream', { format: 'json' });
+            return;
+        }
+        this.robotIds = frame.robotIds;
+        if (this.robot) this.robot.updateFromFrame(frame);
+    }
+
     /**
      * Format time in HH:MM:SS
      */
@@ -5,6 +5,66 @@
  * direction indicators, and path visualization.
  */
 
+// Binary robot frame layout; must match web_interface/server/robot_wire.py
+const ROBOT_FRAME_VERSION = 1;
+const ROBOT_FRAME_FLAG_ID_TABLE = 0x01;
+const ROBOT_FRAME_HEADER_SIZE = 18;
+const ROBOT_FRAME_RECORD_SIZE = 14;
+const ROBOT_FRAME_STATES = ['IDLE', 'MOVING', 'PICKING', 'COLLECTING', 'RETURNING', 'COMPLETED'];
+
+/**
+ * Decode a binary robot frame (ArrayBuffer or typed array)
+ * 
+ * Returns { sequence, time, robotIds, robots: [{ id, x, y, state, heading }] };
+ * robotIds is the frame's id table, or the one passed in if it has none.
+ */
+function decodeRobotFrame(buffer, robotIds = []) {
+    const view = ArrayBuffer.isView(buffer)
+        ? new DataView(buffer.buffer, buffer.byteOffset, buffer.byteLength)
+        : new DataView(buffer);
+    if (view.byteLength < ROBOT_FRAME_HEADER_SIZE ||
+        view.getUint8(0) !== 0x52 || view.getUint8(1) !== 0x42 ||  // 'RB'
+        view.getUint8(2) !== ROBOT_FRAME_VERSION) {
+        throw new Error(`Not a version ${ROBOT_FRAME_VERSION} robot frame`);
+    }
+    
+    const flags = view.getUint8(3);
+    const sequence = view.getUint32(4, true);
+    const time = view.getFloat64(8, true);
+    const count = view.getUint16(16, true);
+    let offset = ROBOT_FRAME_HEADER_SIZE;
+    
+    let ids = robotIds;
+    if (flags & ROBOT_FRAME_FLAG_ID_TABLE) {
+        const decoder = new TextDecoder();
+        const idCount = view.getUint16(offset, true);
+        offset += 2;
+        ids = [];
+        for (let i = 0; i < idCount; i++) {
+            const length = view.getUint8(offset);
+            ids.push(decoder.decode(new Uint8Array(view.buffer, view.byteOffset + offset + 1, length)));
+            offset += 1 + length;
+        }
+    }
+    
+    if (offset + count * ROBOT_FRAME_RECORD_SIZE > view.byteLength) {
+        throw new Error(`Truncated robot frame: ${count} records expected`);
+    }
+    const robots = new Array(count);
+    for (let i = 0; i < count; i++, offset += ROBOT_FRAME_RECORD_SIZE) {
+        const index = view.getUint16(offset, true);
+        robots[i] = {
+            id: index < ids.length ? ids[index] : null,
+            x: view.getFloat32(offset + 2, true),
+            y: view.getFloat32(offset + 6, true),
+            state: ROBOT_FRAME_STATES[view.getUint8(offset + 10)] || 'UNKNOWN',
+            heading: view.getUint16(offset + 12, true) / 100
+        };
+    }
+    
+    return { sequence, time, robotIds: ids, robots };
+}
+
 class RobotVisualizer {
     constructor(warehouseVisualizer) {
         this.warehouse = warehouseVisualizer;
@@ -39,6 +99,9 @@ class RobotVisualizer {
             ERROR: '#F44336'        // Red
         };
         
+        // Set once binary robot frames arrive; JSON updates then leave the position alone
+        this.binaryPositions = false;
+        
         // Animation configuration
         this.animationSpeed = 0.05; // Movement speed (0-1)
         this.stateTransitionDuration = 200; // ms
@@ -132,7 +195,9 @@ class RobotVisualizer {
         if (!robotInfo) return;
         
         // Update position - handle different position formats
-        if (robotInfo.position) {
+        if (this.binaryPositions) {
+            // Positions come from binary robot frames (updateFromFrame)
+        } else if (robotInfo.position) {
             if (Array.isArray(robotInfo.position)) {
                 // Array format [x, y] - convert to grid coordinates
                 const gridX = robotInfo.position[0];
@@ -567,6 +632,28 @@ class RobotVisualizer {
         }
     }
     
+    /**
+     * Update robot position from a decoded binary robot frame
+     */
+    updateFromFrame(frame) {
+        const robotInfo = frame.robots[0];
+        if (!robotInfo) return;
+        
+        // Frames carry continuous aisle/rack coordinates (1-based); the grid is 0-based
+        this.binaryPositions = true;
+        this.robot.x = robotInfo.x - 1;
+        this.robot.y = robotInfo.y - 1;
+        this.robot.targetX = this.robot.x;
+        this.robot.targetY = this.robot.y;
+        this.robot.isMoving = false;
+        this.robot.direction = robotInfo.heading;
+        if (robotInfo.state !== 'UNKNOWN') {
+            this.setRobotState(robotInfo.state);
+        }
+        
+        this.render();
+    }
+    
     /**
      * Simulate robot movement for testing
      */
@@ -631,4 +718,5 @@ class RobotVisualizer {
 // Export for use in main application
 if (typeof module !== 'undefined' && module.exports) {
     module.exports = RobotVisualizer;
+    module.exports.decodeRobotFrame = decodeRobotFrame;
 } 
\ No newline at end of file